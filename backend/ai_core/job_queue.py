@@ -0,0 +1,208 @@
+"""Claiming and wake-up plumbing for the local AI Worker queue.
+
+Workers long-poll ``AiWorkerClaimView``: the request claims immediately when a
+job is pending and otherwise waits up to ``wait_seconds`` for one.  On
+PostgreSQL the wait blocks on ``LISTEN`` and job writers ``NOTIFY`` after
+commit; other databases fall back to a cheap ``exists()`` poll.  Claims use
+``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent workers never queue behind
+each other's row locks.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from production.ai_metrics import SHANGHAI_TZ
+
+from .models import AiJob
+from .quality_daily import QUALITY_DAILY_TRIGGER
+
+LOGGER = logging.getLogger(__name__)
+
+AI_JOB_NOTIFY_CHANNEL = 'wj_ai_jobs'
+STALE_RECOVERY_CACHE_KEY = 'ai_core:stale-job-recovery'
+CLAIMABLE_JOB_TYPES = {
+    AiJob.JOB_TYPE_PRODUCTION_DAILY,
+    AiJob.JOB_TYPE_PRODUCTION_MACHINE,
+    AiJob.JOB_TYPE_QUALITY_IMAGE,
+}
+
+
+def ai_job_timeout_seconds():
+    return int(getattr(settings, 'AI_JOB_TIMEOUT_SECONDS', 600) or 600)
+
+
+def ai_job_claim_max_wait_seconds():
+    return max(0, int(getattr(settings, 'AI_JOB_CLAIM_MAX_WAIT_SECONDS', 20) or 0))
+
+
+def ai_job_claim_poll_seconds():
+    return max(0.05, float(getattr(settings, 'AI_JOB_CLAIM_POLL_SECONDS', 1.0) or 1.0))
+
+
+def ai_job_stale_recovery_interval_seconds():
+    return max(1, int(getattr(settings, 'AI_JOB_STALE_RECOVERY_INTERVAL_SECONDS', 60) or 60))
+
+
+def supports_listen_notify() -> bool:
+    return connection.vendor == 'postgresql'
+
+
+def notify_ai_jobs_available() -> None:
+    """Wake long-polling workers once the current transaction commits."""
+
+    if not supports_listen_notify():
+        return
+
+    def send():
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_notify(%s, %s)', [AI_JOB_NOTIFY_CHANNEL, ''])
+        except Exception:
+            # Workers still pick the job up on their next claim request.
+            LOGGER.warning('AI job notification failed.', exc_info=True)
+
+    transaction.on_commit(send)
+
+
+def recover_stale_ai_jobs(now=None) -> int:
+    """Return claimed/running jobs whose worker went silent to the queue."""
+
+    now = now or timezone.now()
+    stale_before = now - timedelta(seconds=ai_job_timeout_seconds())
+    recovered = AiJob.objects.filter(
+        status__in=[AiJob.STATUS_CLAIMED, AiJob.STATUS_RUNNING],
+        updated_at__lt=stale_before,
+    ).update(
+        status=AiJob.STATUS_PENDING,
+        claimed_by='',
+        claimed_at=None,
+        started_at=None,
+        updated_at=now,
+    )
+    if recovered:
+        LOGGER.info('Recovered %s stale AI jobs.', recovered)
+        notify_ai_jobs_available()
+    return recovered
+
+
+def recover_stale_ai_jobs_if_due() -> int:
+    """Run stale recovery at most once per interval per cache backend.
+
+    The periodic task is the primary path; this keeps deployments without a
+    scheduler from stranding jobs while staying off the per-claim hot path.
+    """
+
+    if not cache.add(STALE_RECOVERY_CACHE_KEY, 1, ai_job_stale_recovery_interval_seconds()):
+        return 0
+    return recover_stale_ai_jobs()
+
+
+def _pending_jobs(eligible_job_types: Q):
+    return AiJob.objects.filter(status=AiJob.STATUS_PENDING).filter(eligible_job_types)
+
+
+def claim_ai_jobs(*, worker_name: str, eligible_job_types: Q, limit: int) -> list[AiJob]:
+    now = timezone.now()
+    local_today = now.astimezone(SHANGHAI_TZ).date().isoformat()
+    with transaction.atomic():
+        queryset = (
+            _pending_jobs(eligible_job_types)
+            .select_for_update(skip_locked=True)
+            .annotate(
+                trigger_priority=Case(
+                    When(
+                        scope__trigger=QUALITY_DAILY_TRIGGER,
+                        scope__date=local_today,
+                        then=Value(0),
+                    ),
+                    When(scope__trigger=QUALITY_DAILY_TRIGGER, then=Value(1)),
+                    When(scope__trigger='hourly', then=Value(2)),
+                    default=Value(3),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by('trigger_priority', 'created_at', 'id')[:limit]
+        )
+        jobs = list(queryset)
+        for job in jobs:
+            job.status = AiJob.STATUS_CLAIMED
+            job.claimed_by = worker_name
+            job.claimed_at = now
+            job.save(update_fields=['status', 'claimed_by', 'claimed_at', 'updated_at'])
+    return jobs
+
+
+class _PollingListener:
+    """Portable wait: sleep one poll interval, then let the caller re-check."""
+
+    notify_driven = False
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(max(0.0, min(timeout, ai_job_claim_poll_seconds())))
+
+
+class _PostgresListener:
+    notify_driven = True
+
+    def __init__(self, pg_connection):
+        self.pg_connection = pg_connection
+
+    def wait(self, timeout: float) -> None:
+        for _notify in self.pg_connection.notifies(timeout=max(0.0, timeout), stop_after=1):
+            break
+
+
+@contextmanager
+def ai_job_listener():
+    if not supports_listen_notify() or connection.in_atomic_block:
+        # LISTEN only takes effect on commit, so an enclosing transaction
+        # would never see a notification.
+        yield _PollingListener()
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'LISTEN {AI_JOB_NOTIFY_CHANNEL}')
+    try:
+        yield _PostgresListener(connection.connection)
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f'UNLISTEN {AI_JOB_NOTIFY_CHANNEL}')
+
+
+def long_poll_claim_ai_jobs(
+    *,
+    worker_name: str,
+    eligible_job_types: Q,
+    limit: int,
+    wait_seconds: float,
+) -> list[AiJob]:
+    """Claim pending jobs, waiting up to ``wait_seconds`` for one to appear."""
+
+    jobs = claim_ai_jobs(worker_name=worker_name, eligible_job_types=eligible_job_types, limit=limit)
+    wait_seconds = min(float(wait_seconds or 0), ai_job_claim_max_wait_seconds())
+    if jobs or wait_seconds <= 0:
+        return jobs
+
+    deadline = time.monotonic() + wait_seconds
+    with ai_job_listener() as listener:
+        # Re-check once listening so a job committed between the first
+        # claim and LISTEN is not missed.
+        if _pending_jobs(eligible_job_types).exists():
+            jobs = claim_ai_jobs(worker_name=worker_name, eligible_job_types=eligible_job_types, limit=limit)
+        while not jobs:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            listener.wait(remaining)
+            if _pending_jobs(eligible_job_types).exists():
+                jobs = claim_ai_jobs(worker_name=worker_name, eligible_job_types=eligible_job_types, limit=limit)
+    return jobs
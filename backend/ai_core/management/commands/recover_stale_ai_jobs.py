@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ai_core.job_queue import recover_stale_ai_jobs
+
+
+class Command(BaseCommand):
+    help = 'Return AI jobs claimed by silent workers to the pending queue.'
+
+    def handle(self, *args, **options):
+        recovered = recover_stale_ai_jobs()
+        self.stdout.write(self.style.SUCCESS(f'Recovered {recovered} stale AI job(s).'))
@@ -142,6 +142,8 @@ class AiJobClaimSerializer(serializers.Serializer):
         required=False,
         allow_empty=True,
     )
+    # Long-poll window; the server caps it with AI_JOB_CLAIM_MAX_WAIT_SECONDS.
+    wait_seconds = serializers.IntegerField(required=False, min_value=0, max_value=60)
 
 
 class AiJobCompleteSerializer(serializers.Serializer):
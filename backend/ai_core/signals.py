@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .job_queue import CLAIMABLE_JOB_TYPES, notify_ai_jobs_available
+from .models import AiJob
+
+
+@receiver(post_save, sender=AiJob)
+def wake_workers_for_pending_job(sender, instance, **kwargs):
+    """New or re-queued jobs wake long-polling workers after commit."""
+
+    if instance.status == AiJob.STATUS_PENDING and instance.job_type in CLAIMABLE_JOB_TYPES:
+        notify_ai_jobs_available()
@@ -0,0 +1,13 @@
+"""
+AI 작업 큐 관리를 위한 Celery 태스크 정의
+"""
+
+from celery import shared_task
+
+
+@shared_task
+def recover_stale_ai_jobs():
+    """응답이 끊긴 Worker가 잡고 있던 AI 작업을 다시 대기열로 돌려놓습니다."""
+    from .job_queue import recover_stale_ai_jobs as recover
+
+    return {'recovered': recover()}
@@ -0,0 +1,124 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from .job_queue import STALE_RECOVERY_CACHE_KEY
+from .models import AiJob
+
+
+CLAIM_URL = '/api/ai/jobs/claim/'
+
+
+def make_job(**kwargs):
+    defaults = {
+        'job_type': AiJob.JOB_TYPE_PRODUCTION_DAILY,
+        'scope': {'date': '2026-05-15', 'language': 'ko', 'trigger': 'hourly'},
+    }
+    defaults.update(kwargs)
+    return AiJob.objects.create(**defaults)
+
+
+@override_settings(
+    AI_WORKER_TOKEN='test-worker-token',
+    AI_JOB_CLAIM_MAX_WAIT_SECONDS=1,
+    AI_JOB_CLAIM_POLL_SECONDS=0.2,
+)
+class AiJobLongPollClaimTests(APITestCase):
+    def setUp(self):
+        cache.delete(STALE_RECOVERY_CACHE_KEY)
+
+    def claim(self, **payload):
+        return self.client.post(
+            CLAIM_URL,
+            {
+                'worker_name': 'test-worker',
+                'worker_version': 'production-ai-worker-v2',
+                'limit': 1,
+                **payload,
+            },
+            format='json',
+            HTTP_X_AI_WORKER_TOKEN='test-worker-token',
+        )
+
+    def test_long_poll_claims_a_job_queued_while_waiting(self):
+        queued = []
+
+        def enqueue_during_wait(listener, timeout):
+            if not queued:
+                queued.append(make_job())
+
+        with mock.patch('ai_core.job_queue._PollingListener.wait', autospec=True, side_effect=enqueue_during_wait) as wait:
+            started = time.monotonic()
+            response = self.claim(wait_seconds=30)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([job['id'] for job in response.data['jobs']], [queued[0].id])
+        self.assertEqual(wait.call_count, 1)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_idle_long_poll_only_runs_cheap_existence_checks(self):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.monotonic()
+            response = self.claim(wait_seconds=30)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['jobs'], [])
+        # The request is capped by AI_JOB_CLAIM_MAX_WAIT_SECONDS.
+        self.assertGreaterEqual(elapsed, 1)
+        self.assertLess(elapsed, 2)
+        selects = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('SELECT')]
+        # One stale sweep, one claim attempt, then one existence probe per poll.
+        self.assertLessEqual(len(selects), 8)
+
+    def test_claim_without_wait_returns_immediately(self):
+        started = time.monotonic()
+        response = self.claim()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['jobs'], [])
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_stale_recovery_runs_at_most_once_per_interval(self):
+        stale_at = timezone.now() - timedelta(hours=1)
+        first = make_job(status=AiJob.STATUS_RUNNING, claimed_by='gone-worker')
+        AiJob.objects.filter(pk=first.pk).update(updated_at=stale_at)
+
+        response = self.claim()
+        self.assertEqual([job['id'] for job in response.data['jobs']], [first.id])
+
+        second = make_job(status=AiJob.STATUS_CLAIMED, claimed_by='gone-worker')
+        AiJob.objects.filter(pk=second.pk).update(updated_at=stale_at)
+        response = self.claim()
+        self.assertEqual(response.data['jobs'], [])
+        second.refresh_from_db()
+        self.assertEqual(second.status, AiJob.STATUS_CLAIMED)
+
+        output = StringIO()
+        call_command('recover_stale_ai_jobs', stdout=output)
+        self.assertIn('Recovered 1 stale AI job(s).', output.getvalue())
+        second.refresh_from_db()
+        self.assertEqual(second.status, AiJob.STATUS_PENDING)
+        self.assertEqual(second.claimed_by, '')
+
+
+class AiJobNotificationTests(TestCase):
+    def test_pending_claimable_jobs_wake_workers(self):
+        with mock.patch('ai_core.signals.notify_ai_jobs_available') as notify:
+            make_job()
+            AiJob.objects.create(
+                job_type='worker_heartbeat',
+                status=AiJob.STATUS_COMPLETED,
+                scope={'trigger': 'worker_heartbeat'},
+            )
+
+        self.assertEqual(notify.call_count, 1)
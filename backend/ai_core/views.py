@@ -3,7 +3,7 @@ from datetime import timedelta
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import status
@@ -21,6 +21,7 @@ from production.ai_types import (
     PRODUCTION_AI_MODEL_IDS,
 )
 
+from .job_queue import long_poll_claim_ai_jobs, recover_stale_ai_jobs_if_due
 from .models import AiJob
 from .model_registry import QUALITY_DAILY_MODEL_ID
 from .quality_daily import (
@@ -71,10 +72,6 @@ def ai_job_claim_limit():
     return int(getattr(settings, 'AI_JOB_CLAIM_LIMIT', 1) or 1)
 
 
-def ai_job_timeout_seconds():
-    return int(getattr(settings, 'AI_JOB_TIMEOUT_SECONDS', 600) or 600)
-
-
 def visible_jobs_for_user(user):
     return (
         AiJob.objects
@@ -530,9 +527,7 @@ class AiWorkerPeriodicEnqueueView(APIView):
         quality_job = quality_enqueue.get('job')
         from quality.classification_audit import enqueue_stale_quality_report_audits
 
-        quality_audit_enqueue = enqueue_stale_quality_report_audits(
-            bounded_scan=True,
-        )
+        quality_audit_enqueue = enqueue_stale_quality_report_audits()
         created_count += int(quality_audit_enqueue.get('created_count') or 0)
 
         return Response({
@@ -596,42 +591,13 @@ class AiWorkerClaimView(APIView):
                     else Q(pk__in=[])
                 )
             )
-        now = timezone.now()
-        local_today = now.astimezone(SHANGHAI_TZ).date().isoformat()
-        stale_before = now - timedelta(seconds=ai_job_timeout_seconds())
-
-        with transaction.atomic():
-            AiJob.objects.filter(
-                status__in=[AiJob.STATUS_CLAIMED, AiJob.STATUS_RUNNING],
-                updated_at__lt=stale_before,
-            ).update(status=AiJob.STATUS_PENDING, claimed_by='', claimed_at=None, started_at=None)
-
-            queryset = (
-                AiJob.objects
-                .select_for_update()
-                .filter(status=AiJob.STATUS_PENDING)
-                .filter(eligible_job_types)
-                .annotate(
-                    trigger_priority=Case(
-                        When(
-                            scope__trigger=QUALITY_DAILY_TRIGGER,
-                            scope__date=local_today,
-                            then=Value(0),
-                        ),
-                        When(scope__trigger=QUALITY_DAILY_TRIGGER, then=Value(1)),
-                        When(scope__trigger='hourly', then=Value(2)),
-                        default=Value(3),
-                        output_field=IntegerField(),
-                    )
-                )
-                .order_by('trigger_priority', 'created_at', 'id')[:limit]
-            )
-            jobs = list(queryset)
-            for job in jobs:
-                job.status = AiJob.STATUS_CLAIMED
-                job.claimed_by = worker_name
-                job.claimed_at = now
-                job.save(update_fields=['status', 'claimed_by', 'claimed_at', 'updated_at'])
+        recover_stale_ai_jobs_if_due()
+        jobs = long_poll_claim_ai_jobs(
+            worker_name=worker_name,
+            eligible_job_types=eligible_job_types,
+            limit=limit,
+            wait_seconds=serializer.validated_data.get('wait_seconds') or 0,
+        )
 
         return Response({'jobs': AiJobSerializer(jobs, many=True).data})
 
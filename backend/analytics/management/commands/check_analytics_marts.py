@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from analytics.services import check_production_mart_consistency, parse_business_date
+
+
+class Command(BaseCommand):
+    help = 'Compare persisted production marts with a full rebuild without saving the rebuild.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', dest='date', default=None, help='Business date in YYYY-MM-DD format.')
+        parser.add_argument('--from', dest='date_from', default=None, help='First business date (inclusive).')
+        parser.add_argument('--to', dest='date_to', default=None, help='Last business date (inclusive).')
+        parser.add_argument(
+            '--language',
+            dest='language',
+            default='ko',
+            choices=['ko', 'zh'],
+            help='Calculation basis language used for the rebuild.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options.get('date_from') or options.get('date_to'):
+                date_from = parse_business_date(options.get('date_from') or options.get('date_to'))
+                date_to = parse_business_date(options.get('date_to') or options.get('date_from'))
+            else:
+                date_from = date_to = parse_business_date(options.get('date') or timezone.localdate().isoformat())
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        if date_from > date_to:
+            raise CommandError('--from must not be after --to.')
+
+        mismatched = 0
+        current = date_from
+        while current <= date_to:
+            report = check_production_mart_consistency(current, language=options['language'])
+            if report['is_consistent']:
+                self.stdout.write(f"{report['business_date']} consistent")
+            else:
+                mismatched += 1
+                self.stdout.write(self.style.WARNING(
+                    f"{report['business_date']} differences={len(report['differences'])}"
+                ))
+                for difference in report['differences']:
+                    fields = ','.join(difference.get('fields', []))
+                    self.stdout.write(
+                        f"  {difference['section']} {difference['key']} {difference['issue']} {fields}".rstrip()
+                    )
+            current += timedelta(days=1)
+
+        if mismatched:
+            raise CommandError(f'{mismatched} business date(s) differ from a full rebuild.')
+        self.stdout.write(self.style.SUCCESS('Persisted production marts match a full rebuild.'))
@@ -1,7 +1,7 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
-from analytics.services import parse_business_date, refresh_production_marts
+from analytics.services import parse_business_date, refresh_dirty_production_marts, refresh_production_marts
 
 
 class Command(BaseCommand):
@@ -23,8 +23,41 @@ class Command(BaseCommand):
             choices=['ko', 'zh'],
             help='Calculation basis language for persisted evidence.',
         )
+        parser.add_argument(
+            '--dirty',
+            action='store_true',
+            help='Recompute only the partitions marked dirty by source writes instead of one full date.',
+        )
+        parser.add_argument(
+            '--max-dates',
+            dest='max_dates',
+            type=int,
+            default=None,
+            help='With --dirty, limit how many business dates are refreshed in this run.',
+        )
 
     def handle(self, *args, **options):
+        if options['dirty']:
+            if options.get('date'):
+                raise CommandError('--dirty cannot be combined with --date.')
+            result = refresh_dirty_production_marts(
+                language=options['language'],
+                limit_dates=options.get('max_dates'),
+            )
+            for row in result['dates']:
+                self.stdout.write(
+                    f"{row['business_date']} mode={row['mode']} "
+                    f"injection={row['injection']} machining={row['machining']} "
+                    f"partitions={row['partition_count']} duration_ms={row['duration_ms']}"
+                )
+            self.stdout.write(self.style.SUCCESS(
+                'Refreshed dirty production analytics partitions '
+                f"(dates={len(result['dates'])}, "
+                f"partitions={result['partition_count']}, "
+                f"duration_ms={result['duration_ms']})"
+            ))
+            return
+
         date_value = options.get('date') or timezone.localdate().isoformat()
         try:
             target_date = parse_business_date(date_value)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-19 01:16
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MartDirtyPartition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('business_date', models.DateField()),
+                ('process', models.CharField(max_length=20)),
+                ('equipment_key', models.CharField(blank=True, default='', max_length=50)),
+                ('reason', models.CharField(blank=True, default='', max_length=50)),
+                ('marked_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['business_date', 'process', 'equipment_key'],
+                'unique_together': {('business_date', 'process', 'equipment_key')},
+            },
+        ),
+    ]
@@ -159,3 +159,24 @@ class FactExceptionEvent(models.Model):
 
     def __str__(self):
         return f'{self.business_date} {self.exception_type} {self.equipment_label or self.part_no}'
+
+
+class MartDirtyPartition(models.Model):
+    """(business_date, process, equipment) slices whose source rows changed.
+
+    An empty ``equipment_key`` marks the whole process of that business date
+    dirty, e.g. after a plan upload.
+    """
+
+    business_date = models.DateField()
+    process = models.CharField(max_length=20)
+    equipment_key = models.CharField(max_length=50, blank=True, default='')
+    reason = models.CharField(max_length=50, blank=True, default='')
+    marked_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        unique_together = ('business_date', 'process', 'equipment_key')
+        ordering = ['business_date', 'process', 'equipment_key']
+
+    def __str__(self):
+        return f'{self.business_date} {self.process} {self.equipment_key or "*"}'
@@ -0,0 +1,184 @@
+"""Dirty-partition bookkeeping for the production analytics marts.
+
+Source writers call the ``mark_*`` helpers in the same transaction as their
+own writes.  ``refresh_dirty_production_marts`` then recomputes only the
+(business_date, process, equipment) slices recorded here instead of rebuilding
+every business date on a schedule.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import MartDirtyPartition
+
+PROCESS_WIDE = ''
+INJECTION = 'injection'
+MACHINING = 'machining'
+
+
+def business_date_for_timestamp(value: datetime) -> date:
+    from production.ai_metrics import SHANGHAI_TZ
+
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return (value.astimezone(SHANGHAI_TZ) - timedelta(hours=8)).date()
+
+
+def _as_date(value: Any) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value or '')[:10])
+    except ValueError:
+        return None
+
+
+def _current_business_date() -> date:
+    return business_date_for_timestamp(timezone.now())
+
+
+def mark_partitions_dirty(partitions: Iterable[tuple[Any, str, str]], *, reason: str = '') -> int:
+    """Upsert ``(business_date, process, equipment_key)`` tuples as dirty.
+
+    Re-marking an existing partition moves ``marked_at`` forward, so a refresh
+    that started before the write keeps the partition for its next pass.
+    """
+
+    now = timezone.now()
+    unique = set()
+    for business_date, process, equipment_key in partitions:
+        business_date = _as_date(business_date)
+        if business_date and process:
+            unique.add((business_date, process, str(equipment_key or PROCESS_WIDE)))
+    if not unique:
+        return 0
+    MartDirtyPartition.objects.bulk_create(
+        [
+            MartDirtyPartition(
+                business_date=business_date,
+                process=process,
+                equipment_key=equipment_key,
+                reason=reason[:50],
+                marked_at=now,
+            )
+            for business_date, process, equipment_key in sorted(unique)
+        ],
+        update_conflicts=True,
+        unique_fields=['business_date', 'process', 'equipment_key'],
+        update_fields=['reason', 'marked_at'],
+    )
+    return len(unique)
+
+
+def mark_monitoring_dirty(samples: Iterable[tuple[str, datetime]], *, reason: str = 'monitoring') -> int:
+    """Mark injection machines touched by monitoring samples.
+
+    ``samples`` are ``(machine_name, timestamp)`` pairs.  The last sample of a
+    business day is the counter baseline of the next one, so the following
+    business date is marked too when it is not in the future.
+    """
+
+    from production.ai_retrievers import parse_machine_number
+
+    current_business_date = _current_business_date()
+    partitions = set()
+    for machine_name, timestamp in samples:
+        machine_number = parse_machine_number(machine_name)
+        if machine_number is None or timestamp is None:
+            continue
+        business_date = business_date_for_timestamp(timestamp)
+        partitions.add((business_date, INJECTION, str(machine_number)))
+        next_date = business_date + timedelta(days=1)
+        if next_date <= current_business_date:
+            partitions.add((next_date, INJECTION, str(machine_number)))
+    return mark_partitions_dirty(partitions, reason=reason)
+
+
+def mark_machining_dirty(rows: Iterable[tuple[Any, str]], *, reason: str = 'machining') -> int:
+    """Mark machining equipment from ``(business_date, equipment_key)`` pairs."""
+
+    return mark_partitions_dirty(
+        ((business_date, MACHINING, equipment_key) for business_date, equipment_key in rows),
+        reason=reason,
+    )
+
+
+def mark_plans_dirty(plan_keys: Iterable[tuple[Any, str]], *, reason: str = 'plan') -> int:
+    """Mark whole processes from ``(plan_date, plan_type)`` pairs."""
+
+    return mark_partitions_dirty(
+        (
+            (plan_date, plan_type, PROCESS_WIDE)
+            for plan_date, plan_type in plan_keys
+            if plan_type in {INJECTION, MACHINING}
+        ),
+        reason=reason,
+    )
+
+
+DirtyToken = tuple[int, datetime]
+
+
+def dirty_partitions_by_date(
+    cutoff: datetime,
+    *,
+    limit_dates: int | None = None,
+) -> dict[date, tuple[dict[str, set[str]], list[DirtyToken]]]:
+    """Return ``{business_date: ({process: equipment_keys}, tokens)}``.
+
+    A process mapped to an empty set must be recomputed for every equipment.
+    ``tokens`` identify the rows that were read so ``clear_dirty_partitions``
+    never drops a mark that arrived while the refresh was running.
+    """
+
+    grouped: dict[date, tuple[dict[str, set[str]], list[DirtyToken]]] = {}
+    process_wide: set[tuple[date, str]] = set()
+    rows = (
+        MartDirtyPartition.objects
+        .filter(marked_at__lte=cutoff)
+        .order_by('business_date', 'process', 'equipment_key')
+        .values_list('id', 'marked_at', 'business_date', 'process', 'equipment_key')
+    )
+    for pk, marked_at, business_date, process, equipment_key in rows:
+        if business_date not in grouped:
+            if limit_dates is not None and len(grouped) >= limit_dates:
+                break
+            grouped[business_date] = ({}, [])
+        processes, tokens = grouped[business_date]
+        tokens.append((pk, marked_at))
+        keys = processes.setdefault(process, set())
+        # The empty key sorts first, so later keys of a process-wide
+        # partition are simply absorbed by it.
+        if equipment_key == PROCESS_WIDE:
+            process_wide.add((business_date, process))
+        elif (business_date, process) not in process_wide:
+            keys.add(equipment_key)
+    return grouped
+
+
+def dirty_tokens_for_date(business_date: date) -> list[DirtyToken]:
+    return list(
+        MartDirtyPartition.objects
+        .filter(business_date=business_date)
+        .values_list('id', 'marked_at')
+    )
+
+
+def clear_dirty_partitions(tokens: list[DirtyToken]) -> int:
+    """Delete the partitions in ``tokens`` unless they were re-marked since."""
+
+    deleted = 0
+    for offset in range(0, len(tokens), 200):
+        condition = Q()
+        for pk, marked_at in tokens[offset:offset + 200]:
+            condition |= Q(pk=pk, marked_at=marked_at)
+        count, _ = MartDirtyPartition.objects.filter(condition).delete()
+        deleted += count
+    return deleted
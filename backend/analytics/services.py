@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import time
 from collections import defaultdict
 from datetime import date
 from typing import Any
 
 from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.dateparse import parse_date
 
 from production.ai_context import build_calculation_basis, build_process_summary, build_used_data
-from production.ai_retrievers import get_daily_production_context
-from production.ai_metrics import DELAY_THRESHOLD_PERCENTAGE_POINT
+from production.ai_retrievers import (
+    apply_machining_time_progress,
+    get_daily_production_context,
+    get_injection_summary,
+    get_machining_summary,
+)
+from production.ai_metrics import DELAY_THRESHOLD_PERCENTAGE_POINT, safe_rate
 
 from .models import (
     FactExceptionEvent,
@@ -18,6 +26,7 @@ from .models import (
     MartPartDailyProgress,
     MartProductionDailyProgress,
 )
+from .partitions import clear_dirty_partitions, dirty_partitions_by_date, dirty_tokens_for_date
 
 
 def parse_business_date(value: str | date | None) -> date:
@@ -422,46 +431,80 @@ def build_production_progress_snapshot(target_date: date, language: str = 'ko')
     }
 
 
-def _upsert_exception(record: dict[str, Any], now) -> FactExceptionEvent:
-    event, created = FactExceptionEvent.objects.get_or_create(
-        source_key=record['source_key'],
-        defaults={
-            **record,
-            'status': 'open',
-            'detected_at': now,
-        },
+EXCEPTION_UPDATE_FIELDS = [
+    'business_date',
+    'process',
+    'exception_type',
+    'severity',
+    'equipment_key',
+    'equipment_label',
+    'part_no',
+    'title',
+    'detail',
+    'source_payload',
+]
+EQUIPMENT_RECORD_FIELDS = [
+    field.name
+    for field in MartEquipmentDailyProgress._meta.concrete_fields
+    if field.name not in {'id', 'generated_at'}
+]
+PART_RECORD_FIELDS = [
+    field.name
+    for field in MartPartDailyProgress._meta.concrete_fields
+    if field.name not in {'id', 'generated_at'}
+]
+UPSERT_BATCH_SIZE = 500
+
+
+def _upsert_exceptions(records: list[dict[str, Any]], now) -> list[str]:
+    """Insert new exception events and refresh existing ones in bulk."""
+    source_keys = [record['source_key'] for record in records]
+    existing: dict[str, FactExceptionEvent] = {}
+    for offset in range(0, len(source_keys), UPSERT_BATCH_SIZE):
+        for event in FactExceptionEvent.objects.filter(
+            source_key__in=source_keys[offset:offset + UPSERT_BATCH_SIZE],
+        ):
+            existing[event.source_key] = event
+
+    to_create = []
+    to_update = []
+    for record in records:
+        event = existing.get(record['source_key'])
+        if event is None:
+            to_create.append(FactExceptionEvent(**record, status='open', detected_at=now))
+            continue
+        for field in EXCEPTION_UPDATE_FIELDS:
+            setattr(event, field, record[field])
+        if event.status in ['resolved', 'ignored']:
+            event.status = 'open'
+            event.resolved_at = None
+            event.detected_at = now
+        event.updated_at = now
+        to_update.append(event)
+
+    FactExceptionEvent.objects.bulk_create(to_create, batch_size=UPSERT_BATCH_SIZE)
+    FactExceptionEvent.objects.bulk_update(
+        to_update,
+        EXCEPTION_UPDATE_FIELDS + ['status', 'resolved_at', 'detected_at', 'updated_at'],
+        batch_size=UPSERT_BATCH_SIZE,
     )
-    if created:
-        return event
-
-    for field in [
-        'business_date',
-        'process',
-        'exception_type',
-        'severity',
-        'equipment_key',
-        'equipment_label',
-        'part_no',
-        'title',
-        'detail',
-        'source_payload',
-    ]:
-        setattr(event, field, record[field])
-    if event.status in ['resolved', 'ignored']:
-        event.status = 'open'
-        event.resolved_at = None
-        event.detected_at = now
-    event.save()
-    return event
+    return source_keys
 
 
-@transaction.atomic
-def refresh_production_marts(target_date: date, language: str = 'ko') -> dict[str, Any]:
-    snapshot = build_production_progress_snapshot(target_date, language=language)
-    business_date = parse_business_date(snapshot['scope']['business_date'])
-    now = timezone.now()
+def _save_exceptions(business_date: date, records: list[dict[str, Any]], now) -> None:
+    generated_exception_keys = _upsert_exceptions(records, now)
+    stale_events = FactExceptionEvent.objects.filter(
+        business_date=business_date,
+        source='production_mart',
+        status__in=['open', 'acknowledged'],
+    )
+    if generated_exception_keys:
+        stale_events = stale_events.exclude(source_key__in=generated_exception_keys)
+    stale_events.update(status='resolved', resolved_at=now)
 
-    for record in snapshot['daily']:
+
+def _save_daily_records(business_date: date, records: list[dict[str, Any]]) -> None:
+    for record in records:
         MartProductionDailyProgress.objects.update_or_create(
             business_date=business_date,
             process=record['process'],
@@ -486,35 +529,194 @@ def refresh_production_marts(target_date: date, language: str = 'ko') -> dict[st
             },
         )
 
-    MartEquipmentDailyProgress.objects.filter(business_date=business_date).delete()
-    MartEquipmentDailyProgress.objects.bulk_create([
-        MartEquipmentDailyProgress(**record)
-        for record in snapshot['equipment']
-    ])
 
-    MartPartDailyProgress.objects.filter(business_date=business_date).delete()
-    MartPartDailyProgress.objects.bulk_create([
-        MartPartDailyProgress(**record)
-        for record in snapshot['parts']
-    ])
+def _replace_partition_rows(
+    business_date: date,
+    process: str | None,
+    equipment_keys: set[str] | None,
+    equipment_records: list[dict[str, Any]],
+    part_records: list[dict[str, Any]],
+) -> None:
+    """Swap the mart rows of one partition; ``None`` means the whole scope."""
+    equipment_queryset = MartEquipmentDailyProgress.objects.filter(business_date=business_date)
+    part_queryset = MartPartDailyProgress.objects.filter(business_date=business_date)
+    if process is not None:
+        equipment_queryset = equipment_queryset.filter(process=process)
+        part_queryset = part_queryset.filter(process=process)
+    if equipment_keys is not None:
+        equipment_queryset = equipment_queryset.filter(equipment_key__in=equipment_keys)
+        part_queryset = part_queryset.filter(equipment_key__in=equipment_keys)
+    equipment_queryset.delete()
+    part_queryset.delete()
+    MartEquipmentDailyProgress.objects.bulk_create(
+        [MartEquipmentDailyProgress(**record) for record in equipment_records],
+        batch_size=UPSERT_BATCH_SIZE,
+    )
+    MartPartDailyProgress.objects.bulk_create(
+        [MartPartDailyProgress(**record) for record in part_records],
+        batch_size=UPSERT_BATCH_SIZE,
+    )
 
-    generated_exception_keys = []
-    for record in snapshot['exceptions']:
-        event = _upsert_exception(record, now)
-        generated_exception_keys.append(event.source_key)
 
-    stale_events = FactExceptionEvent.objects.filter(
-        business_date=business_date,
-        source='production_mart',
-        status__in=['open', 'acknowledged'],
-    )
-    if generated_exception_keys:
-        stale_events = stale_events.exclude(source_key__in=generated_exception_keys)
-    stale_events.update(status='resolved', resolved_at=now)
+@transaction.atomic
+def refresh_production_marts(target_date: date, language: str = 'ko') -> dict[str, Any]:
+    business_date = parse_business_date(target_date)
+    dirty_tokens = dirty_tokens_for_date(business_date)
+    snapshot = build_production_progress_snapshot(business_date, language=language)
+    now = timezone.now()
+
+    _save_daily_records(business_date, snapshot['daily'])
+    _replace_partition_rows(business_date, None, None, snapshot['equipment'], snapshot['parts'])
+    _save_exceptions(business_date, snapshot['exceptions'], now)
+    clear_dirty_partitions(dirty_tokens)
 
     return get_saved_production_progress_payload(business_date)
 
 
+def _process_totals_from_marts(business_date: date, process: str) -> dict[str, Any]:
+    """Aggregate the persisted equipment rows of one process in SQL."""
+    queryset = MartEquipmentDailyProgress.objects.filter(business_date=business_date, process=process)
+    totals = queryset.aggregate(
+        planned_qty=Coalesce(Sum('planned_qty'), 0),
+        actual_qty=Coalesce(Sum('actual_qty'), 0),
+    )
+    planned_qty = int(totals['planned_qty'])
+    actual_qty = int(totals['actual_qty'])
+    result = {
+        'planned_qty': planned_qty,
+        'actual_qty': actual_qty,
+        'progress_rate': safe_rate(actual_qty, planned_qty),
+        'gap_qty': actual_qty - planned_qty,
+        'active_equipment_count': queryset.filter(actual_qty__gt=0).values('equipment_label').distinct().count(),
+    }
+    if process == 'injection':
+        result['running_equipment_count'] = queryset.filter(is_running=True).count()
+    else:
+        result['total_equipment_count'] = (
+            queryset.filter(planned_qty__gt=0).values('equipment_label').distinct().count()
+        )
+    return result
+
+
+def _saved_partition_records(business_date: date) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    equipment_records = list(
+        MartEquipmentDailyProgress.objects
+        .filter(business_date=business_date)
+        .order_by('process', 'equipment_key')
+        .values(*EQUIPMENT_RECORD_FIELDS)
+    )
+    part_records = list(
+        MartPartDailyProgress.objects
+        .filter(business_date=business_date)
+        .order_by('process', 'equipment_key', 'sequence', 'id')
+        .values(*PART_RECORD_FIELDS)
+    )
+    return equipment_records, part_records
+
+
+@transaction.atomic
+def _refresh_dirty_date(
+    business_date: date,
+    processes: dict[str, set[str]],
+    tokens: list,
+    language: str,
+) -> dict[str, Any]:
+    stored_injection = (
+        MartProductionDailyProgress.objects
+        .filter(business_date=business_date, process='injection')
+        .first()
+    )
+    if stored_injection is None or not MartProductionDailyProgress.objects.filter(
+        business_date=business_date,
+        process='machining',
+    ).exists():
+        refresh_production_marts(business_date, language=language)
+        return {'business_date': business_date.isoformat(), 'mode': 'full', 'injection': 'all', 'machining': True}
+
+    injection_keys = processes.get('injection')
+    if injection_keys is None:
+        machine_numbers: set[int] | None = set()
+    elif injection_keys:
+        machine_numbers = {int(key) for key in injection_keys if key.isdigit()}
+    else:
+        machine_numbers = None
+    injection = get_injection_summary(business_date, machine_numbers=machine_numbers)
+    if machine_numbers is not None and injection['reference_time'] != stored_injection.reference_time:
+        # A moving reference time shifts the recent-shot window of every
+        # machine, so the partial result is not reusable.
+        machine_numbers = None
+        injection = get_injection_summary(business_date)
+
+    context = {
+        'business_date': business_date,
+        'range_start': injection['range_start'],
+        'range_end': injection['range_end'],
+        'reference_time': injection['reference_time'],
+        'injection': injection,
+        'machining': {'rows': []},
+    }
+    if machine_numbers is None or machine_numbers:
+        equipment_records, part_records = _build_injection_equipment_and_parts(context)
+        _replace_partition_rows(
+            business_date,
+            'injection',
+            None if machine_numbers is None else {str(number) for number in machine_numbers},
+            equipment_records,
+            part_records,
+        )
+
+    # Machining actuals come from a day-level reconciliation of manual
+    # reports against MES records, so the process is rebuilt as a whole.
+    machining_dirty = 'machining' in processes
+    machining = get_machining_summary(business_date, include_rows=machining_dirty)
+    apply_machining_time_progress(machining, float(injection.get('time_progress_rate') or 0))
+    if machining_dirty:
+        context['machining'] = machining
+        equipment_records, part_records = _build_machining_equipment_and_parts(context)
+        _replace_partition_rows(business_date, 'machining', None, equipment_records, part_records)
+
+    injection.update(_process_totals_from_marts(business_date, 'injection'))
+    machining.update(_process_totals_from_marts(business_date, 'machining'))
+    context['injection'] = injection
+    context['machining'] = machining
+    daily_records = _build_daily_records(context, language)
+    _save_daily_records(business_date, daily_records)
+
+    equipment_records, part_records = _saved_partition_records(business_date)
+    exception_records = _build_exception_records(context, daily_records, equipment_records, part_records)
+    _save_exceptions(business_date, exception_records, timezone.now())
+    clear_dirty_partitions(tokens)
+    return {
+        'business_date': business_date.isoformat(),
+        'mode': 'incremental',
+        'injection': 'all' if machine_numbers is None else sorted(machine_numbers),
+        'machining': machining_dirty,
+    }
+
+
+def refresh_dirty_production_marts(language: str = 'ko', limit_dates: int | None = None) -> dict[str, Any]:
+    """Recompute only the mart partitions marked dirty by source writers.
+
+    Dates without persisted marts are built in full.  Each date commits on
+    its own so a failure leaves the remaining partitions marked.
+    """
+    started = time.monotonic()
+    cutoff = timezone.now()
+    dirty = dirty_partitions_by_date(cutoff, limit_dates=limit_dates)
+    results = []
+    for business_date, (processes, tokens) in sorted(dirty.items()):
+        date_started = time.monotonic()
+        result = _refresh_dirty_date(business_date, processes, tokens, language)
+        result['partition_count'] = len(tokens)
+        result['duration_ms'] = int((time.monotonic() - date_started) * 1000)
+        results.append(result)
+    return {
+        'dates': results,
+        'partition_count': sum(result['partition_count'] for result in results),
+        'duration_ms': int((time.monotonic() - started) * 1000),
+    }
+
+
 def _serialize_daily(row: MartProductionDailyProgress) -> dict[str, Any]:
     return {
         'business_date': row.business_date.isoformat(),
@@ -646,3 +848,71 @@ def get_or_build_production_progress_payload(target_date: date, language: str =
     snapshot = build_production_progress_snapshot(target_date, language=language)
     snapshot['warnings'] = sorted(set(snapshot.get('warnings', [])) | {'analytics_mart_missing_computed_live'})
     return json_safe(snapshot)
+
+
+class _RollbackRebuild(Exception):
+    pass
+
+
+_CONSISTENCY_SECTIONS = {
+    'daily': ('process',),
+    'equipment': ('process', 'equipment_key'),
+    'parts': ('process', 'equipment_key', 'part_no', 'lot_no', 'sequence'),
+    'exceptions': ('source_key',),
+}
+_CONSISTENCY_IGNORED_FIELDS = {'id', 'generated_at', 'detected_at', 'resolved_at'}
+
+
+def _comparable_sections(payload: dict[str, Any] | None) -> dict[str, dict[tuple, dict[str, Any]]]:
+    sections = {}
+    for section, key_fields in _CONSISTENCY_SECTIONS.items():
+        rows = (payload or {}).get(section) or []
+        sections[section] = {
+            tuple(row.get(field) for field in key_fields): {
+                field: value
+                for field, value in row.items()
+                if field not in _CONSISTENCY_IGNORED_FIELDS
+            }
+            for row in rows
+        }
+    return sections
+
+
+def check_production_mart_consistency(target_date: date, language: str = 'ko') -> dict[str, Any]:
+    """Compare the persisted marts with a full rebuild that is rolled back."""
+    business_date = parse_business_date(target_date)
+    persisted = _comparable_sections(get_saved_production_progress_payload(business_date))
+    rebuilt: dict[str, dict[tuple, dict[str, Any]]] = {}
+    try:
+        with transaction.atomic():
+            rebuilt = _comparable_sections(refresh_production_marts(business_date, language=language))
+            raise _RollbackRebuild
+    except _RollbackRebuild:
+        pass
+
+    differences = []
+    for section in _CONSISTENCY_SECTIONS:
+        left = persisted[section]
+        right = rebuilt[section]
+        for key in sorted(set(left) | set(right), key=str):
+            if key not in right:
+                differences.append({'section': section, 'key': list(key), 'issue': 'only_incremental'})
+            elif key not in left:
+                differences.append({'section': section, 'key': list(key), 'issue': 'only_rebuild'})
+            else:
+                changed = sorted(
+                    field for field in set(left[key]) | set(right[key])
+                    if left[key].get(field) != right[key].get(field)
+                )
+                if changed:
+                    differences.append({
+                        'section': section,
+                        'key': list(key),
+                        'issue': 'changed',
+                        'fields': changed,
+                    })
+    return {
+        'business_date': business_date.isoformat(),
+        'is_consistent': not differences,
+        'differences': differences,
+    }
@@ -1,18 +1,33 @@
 from datetime import datetime, timedelta
+from io import StringIO
 
 import pytz
 from django.contrib.auth import get_user_model
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 from rest_framework.test import APIClient
 
 from injection.models import InjectionMonitoringRecord
 from production.models import ProductionMesReportRecord, ProductionPartCavity, ProductionPlan
 
-from .models import FactExceptionEvent, MartEquipmentDailyProgress, MartPartDailyProgress, MartProductionDailyProgress
+from .models import (
+    FactExceptionEvent,
+    MartDirtyPartition,
+    MartEquipmentDailyProgress,
+    MartPartDailyProgress,
+    MartProductionDailyProgress,
+)
+from .partitions import (
+    clear_dirty_partitions,
+    dirty_partitions_by_date,
+    mark_machining_dirty,
+    mark_monitoring_dirty,
+    mark_plans_dirty,
+)
+from .services import check_production_mart_consistency, refresh_dirty_production_marts, refresh_production_marts
 
 
-class AnalyticsProductionMartTests(TestCase):
+class ProductionMartFixtureMixin:
     def setUp(self):
         self.target_date = datetime(2026, 5, 18).date()
         self.user = get_user_model().objects.create_user(
@@ -22,6 +37,7 @@ class AnalyticsProductionMartTests(TestCase):
         )
         tz = pytz.timezone('Asia/Shanghai')
         start = tz.localize(datetime(2026, 5, 18, 8, 0))
+        self.start = start
 
         ProductionPlan.objects.create(
             plan_date=self.target_date,
@@ -95,6 +111,8 @@ class AnalyticsProductionMartTests(TestCase):
             raw_payload={},
         )
 
+
+class AnalyticsProductionMartTests(ProductionMartFixtureMixin, TestCase):
     def test_refresh_command_persists_production_marts_and_exceptions(self):
         call_command('refresh_analytics_marts', date=self.target_date.isoformat(), scope='production')
 
@@ -154,3 +172,133 @@ class AnalyticsProductionMartTests(TestCase):
         self.assertTrue(payload['used_data'])
         self.assertTrue(payload['calculation_basis'])
         self.assertTrue(any(item['exception_type'] == 'mes_only' for item in payload['exceptions']))
+
+
+class AnalyticsIncrementalMartTests(ProductionMartFixtureMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        refresh_production_marts(self.target_date)
+        MartDirtyPartition.objects.all().delete()
+
+    def add_monitoring(self, machine_number, minutes, capacity):
+        record = InjectionMonitoringRecord.objects.create(
+            machine_name=f'{machine_number}호기',
+            device_code=f'inj-{machine_number}',
+            timestamp=self.start + timedelta(minutes=minutes),
+            capacity=capacity,
+        )
+        mark_monitoring_dirty([(record.machine_name, record.timestamp)])
+        return record
+
+    def assert_consistent(self):
+        report = check_production_mart_consistency(self.target_date)
+        self.assertTrue(report['is_consistent'], report['differences'])
+
+    def test_monitoring_write_refreshes_only_the_touched_machine(self):
+        ProductionPlan.objects.create(
+            plan_date=self.target_date,
+            plan_type='injection',
+            machine_name='850T-2',
+            part_no='PART-C',
+            planned_quantity=10,
+            sequence=1,
+        )
+        refresh_production_marts(self.target_date)
+        machine_two = MartEquipmentDailyProgress.objects.get(
+            business_date=self.target_date,
+            process='injection',
+            equipment_key='2',
+        )
+        self.add_monitoring(1, 30, 135)
+
+        result = refresh_dirty_production_marts()
+
+        [row] = [row for row in result['dates'] if row['business_date'] == self.target_date.isoformat()]
+        self.assertEqual(row['mode'], 'incremental')
+        self.assertEqual(row['injection'], [1])
+        self.assertFalse(row['machining'])
+        injection_daily = MartProductionDailyProgress.objects.get(business_date=self.target_date, process='injection')
+        self.assertGreater(injection_daily.actual_qty, 50)
+        self.assertEqual(injection_daily.source_row_counts['monitoring_row_count'], 3)
+        # The untouched machine row was not rewritten.
+        self.assertEqual(
+            MartEquipmentDailyProgress.objects.get(pk=machine_two.pk).generated_at,
+            machine_two.generated_at,
+        )
+        self.assertFalse(MartDirtyPartition.objects.filter(business_date=self.target_date).exists())
+        self.assert_consistent()
+
+    def test_machining_and_plan_changes_match_full_rebuild(self):
+        ProductionMesReportRecord.objects.create(
+            report_record_detail_id=9002,
+            report_record_id=902,
+            report_record_code='R-9002',
+            business_date=self.target_date,
+            plan_type='machining',
+            process_code='JG',
+            report_time=self.start + timedelta(hours=3),
+            equipment_name='A LINE',
+            equipment_key='A',
+            part_no='PART-M',
+            material_name='Machining A',
+            report_qty=80,
+            raw_payload={},
+        )
+        mark_machining_dirty([(self.target_date, 'A')])
+        ProductionPlan.objects.filter(plan_type='injection', part_no='PART-B').delete()
+        mark_plans_dirty([(self.target_date.isoformat(), 'injection')])
+
+        result = refresh_dirty_production_marts()
+
+        self.assertEqual(result['dates'][0]['injection'], 'all')
+        self.assertTrue(result['dates'][0]['machining'])
+        self.assertFalse(MartPartDailyProgress.objects.filter(part_no='PART-B').exists())
+        self.assertTrue(FactExceptionEvent.objects.filter(
+            exception_type='plan_only',
+            part_no='PART-M',
+            status='resolved',
+        ).exists())
+        machining_daily = MartProductionDailyProgress.objects.get(business_date=self.target_date, process='machining')
+        self.assertEqual(machining_daily.actual_qty, 92)
+        self.assert_consistent()
+
+    def test_dates_without_marts_are_built_in_full(self):
+        next_date = self.target_date + timedelta(days=1)
+        mark_plans_dirty([(next_date, 'injection')])
+
+        result = refresh_dirty_production_marts()
+
+        self.assertEqual(
+            [(row['business_date'], row['mode']) for row in result['dates']],
+            [(next_date.isoformat(), 'full')],
+        )
+        self.assertTrue(MartProductionDailyProgress.objects.filter(business_date=next_date).exists())
+
+    def test_marks_written_during_refresh_are_kept(self):
+        mark_monitoring_dirty([('1호기', self.start + timedelta(minutes=5))])
+        cutoff = MartDirtyPartition.objects.get(business_date=self.target_date).marked_at
+        processes, tokens = dirty_partitions_by_date(cutoff)[self.target_date]
+        self.assertEqual(processes, {'injection': {'1'}})
+        MartDirtyPartition.objects.filter(business_date=self.target_date).update(
+            marked_at=cutoff + timedelta(seconds=1),
+        )
+
+        self.assertEqual(clear_dirty_partitions(tokens), 0)
+        self.assertTrue(MartDirtyPartition.objects.filter(business_date=self.target_date).exists())
+
+    def test_consistency_command_reports_drift(self):
+        MartEquipmentDailyProgress.objects.filter(
+            business_date=self.target_date,
+            equipment_key='1',
+        ).update(actual_qty=1)
+        output = StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command('check_analytics_marts', date=self.target_date.isoformat(), stdout=output)
+
+        self.assertIn("equipment ['injection', '1'] changed actual_qty", output.getvalue())
+        # The rebuild used for comparison is rolled back.
+        self.assertEqual(
+            MartEquipmentDailyProgress.objects.get(business_date=self.target_date, equipment_key='1').actual_qty,
+            1,
+        )
@@ -1,4 +1,7 @@
 from django.contrib import admin
+
+from injection.part_catalog import refresh_part_catalog
+
 from .models import AssemblyReport, DefectHistory
 
 
@@ -38,6 +41,17 @@ class AssemblyReportAdmin(admin.ModelAdmin):
         }),
     )
 
+    # 보고서 삭제는 signal 로 품목 카탈로그를 갱신하지 않으므로 직접 갱신
+    def delete_model(self, request, obj):
+        part_no = obj.part_no
+        super().delete_model(request, obj)
+        refresh_part_catalog([part_no])
+
+    def delete_queryset(self, request, queryset):
+        part_nos = set(queryset.values_list('part_no', flat=True))
+        super().delete_queryset(request, queryset)
+        refresh_part_catalog(part_nos)
+
 
 @admin.register(DefectHistory)
 class DefectHistoryAdmin(admin.ModelAdmin):
@@ -6,6 +6,9 @@ from .models import AssemblyReport, DefectHistory
 from .serializers import (
     AssemblyReportSerializer,
 )
+from config.csv_import import BulkCsvImporter, CsvRowError, iter_csv_rows, query_param_flag
+from config.parse_pool import DiskUploadMixin
+from injection.part_catalog import refresh_part_catalog
 from injection.permissions import AssemblyPermission
 import csv
 import io
@@ -21,7 +24,74 @@ from django.db import models
 class CharInFilter(filters.BaseInFilter, filters.CharFilter):
     pass
 
-class AssemblyReportViewSet(viewsets.ModelViewSet):
+INCOMING_DETAIL_KEYS = ['scratch','black_dot','eaten_meat','air_mark','deform','short_shot','broken_pillar','flow_mark','sink_mark','whitening','other']
+PROCESSING_DETAIL_KEYS = ['scratch','printing','rework','other']
+ASSEMBLY_REPORT_IMPORT_KEY = ('date', 'line_no', 'part_no', 'model')
+ASSEMBLY_REPORT_IMPORT_REQUIRED = ['Date', 'Line No', 'Part No', 'Model', 'Plan Qty', 'Actual Qty']
+
+
+def _csv_detail_counts(row, prefix, keys):
+    detail = {}
+    for key in keys:
+        col_name = f"{prefix} {key}"
+        if col_name in row:
+            try:
+                detail[key] = int(row[col_name] or 0)
+            except ValueError:
+                detail[key] = 0
+    return detail
+
+
+def parse_assembly_report_csv_row(row, row_num):
+    """가공 생산 기록 CSV 한 행을 AssemblyReport 필드 값으로 변환"""
+
+    def text(name):
+        return (row.get(name) or '').strip()
+
+    # 필수 필드 확인
+    missing_fields = [field for field in ASSEMBLY_REPORT_IMPORT_REQUIRED if not text(field)]
+    if missing_fields:
+        raise CsvRowError(f"행 {row_num}: 필수 필드 누락 - {missing_fields}")
+
+    # 날짜 형식 검증
+    try:
+        date_obj = dt.datetime.strptime(text('Date'), '%Y-%m-%d').date()
+    except ValueError:
+        raise CsvRowError(f"행 {row_num}: 잘못된 날짜 형식 - {row['Date']}")
+
+    # 숫자 필드 검증
+    try:
+        numbers = {
+            'plan_qty': int(row['Plan Qty']),
+            'actual_qty': int(row['Actual Qty']),
+            'input_qty': int(row.get('Input Qty', 0) or 0),
+            'rework_qty': int(row.get('Rework Qty', 0) or 0),
+            'injection_defect': int(row.get('Injection Defect', 0) or 0),
+            'outsourcing_defect': int(row.get('Outsourcing Defect', 0) or 0),
+            'processing_defect': int(row.get('Processing Defect', 0) or 0),
+            'total_time': int(row.get('Total Time', 0) or row.get('총시간', 0) or 0),
+            'idle_time': int(row.get('Idle Time', 0) or row.get('부동시간', 0) or 0),
+            'operation_time': int(row.get('Operation Time', 0) or row.get('가동시간', 0) or 0),
+            'workers': int(row.get('Workers', 1) or row.get('작업인원', 1) or 1),
+        }
+    except (ValueError, TypeError):
+        raise CsvRowError(f"행 {row_num}: 숫자 필드 형식 오류")
+
+    return {
+        'date': date_obj,
+        'line_no': text('Line No'),
+        # bulk 저장은 save() 를 거치지 않으므로 여기서 대문자로 정규화
+        'part_no': text('Part No').upper(),
+        'model': text('Model'),
+        'supply_type': text('Supply Type'),
+        'incoming_defects_detail': _csv_detail_counts(row, 'Inc', INCOMING_DETAIL_KEYS),
+        'processing_defects_detail': _csv_detail_counts(row, 'Proc', PROCESSING_DETAIL_KEYS),
+        'note': text('Note'),
+        **numbers,
+    }
+
+
+class AssemblyReportViewSet(DiskUploadMixin, viewsets.ModelViewSet):
     queryset = AssemblyReport.objects.all()
     serializer_class = AssemblyReportSerializer
     permission_classes = [AssemblyPermission]
@@ -30,6 +100,12 @@ class AssemblyReportViewSet(viewsets.ModelViewSet):
     ordering_fields = ['date', 'line_no', 'model', 'part_no', 'plan_qty', 'actual_qty', 'total_time', 'idle_time']
     search_fields = ['line_no', 'model', 'part_no', 'note']
 
+    def perform_destroy(self, instance):
+        part_no = instance.part_no
+        instance.delete()
+        # 보고서 삭제는 signal 로 품목 카탈로그를 갱신하지 않으므로 직접 갱신
+        refresh_part_catalog([part_no])
+
     @action(detail=False, methods=['get'], url_path='trend-data')
     def trend_data(self, request):
         """
@@ -101,8 +177,8 @@ class AssemblyReportViewSet(viewsets.ModelViewSet):
         writer = csv.writer(buffer)
 
         # 헤더 작성 (상세 불량 포함)
-        incoming_detail_keys = ['scratch','black_dot','eaten_meat','air_mark','deform','short_shot','broken_pillar','flow_mark','sink_mark','whitening','other']
-        processing_detail_keys = ['scratch','printing','rework','other']
+        incoming_detail_keys = INCOMING_DETAIL_KEYS
+        processing_detail_keys = PROCESSING_DETAIL_KEYS
 
         writer.writerow([
             'ID', 'Date', 'Line No', 'Part No', 'Model', 'Plan Qty', 'Input Qty', 'Actual Qty',
@@ -151,7 +227,7 @@ class AssemblyReportViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'], url_path='bulk-import')
     def bulk_import(self, request):
-        """CSV 파일을 업로드하여 대량 가공 생산 기록 생성"""
+        """CSV 파일을 업로드하여 대량 가공 생산 기록 생성 (``?dry_run=1``: 저장 없이 검증)"""
         csv_file = request.FILES.get('file')
         if not csv_file:
             return Response({'detail': 'CSV 파일이 필요합니다.'}, status=400)
@@ -159,121 +235,36 @@ class AssemblyReportViewSet(viewsets.ModelViewSet):
         if not csv_file.name.endswith('.csv'):
             return Response({'detail': 'CSV 파일만 업로드 가능합니다.'}, status=400)
 
-        results = {
-            'created': 0,
-            'skipped': 0,
-            'errors': 0,
-            'error_details': []
-        }
+        dry_run = query_param_flag(request.query_params.get('dry_run'))
+        part_nos = set()
 
-        try:
-            # 파일 읽기
-            decoded_file = csv_file.read().decode('utf-8-sig')  # BOM 제거
-            reader = csv.DictReader(io.StringIO(decoded_file))
-
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # 필수 필드 확인
-                    required_fields = ['Date', 'Line No', 'Part No', 'Model', 'Plan Qty', 'Actual Qty']
-                    missing_fields = [field for field in required_fields if not row.get(field, '').strip()]
-
-                    if missing_fields:
-                        results['errors'] += 1
-                        results['error_details'].append(f"행 {row_num}: 필수 필드 누락 - {missing_fields}")
-                        continue
-
-                    # 날짜 형식 검증
-                    try:
-                        date_obj = dt.datetime.strptime(row['Date'].strip(), '%Y-%m-%d').date()
-                    except ValueError:
-                        results['errors'] += 1
-                        results['error_details'].append(f"행 {row_num}: 잘못된 날짜 형식 - {row['Date']}")
-                        continue
-
-                    # 숫자 필드 검증
-                    try:
-                        plan_qty = int(row['Plan Qty'])
-                        actual_qty = int(row['Actual Qty'])
-                        input_qty = int(row.get('Input Qty', 0) or 0)
-                        rework_qty = int(row.get('Rework Qty', 0) or 0)
-                        injection_defect = int(row.get('Injection Defect', 0) or 0)
-                        outsourcing_defect = int(row.get('Outsourcing Defect', 0) or 0)
-                        processing_defect = int(row.get('Processing Defect', 0) or 0)
-                        total_time = int(row.get('Total Time', 0) or row.get('총시간', 0) or 0)
-                        idle_time = int(row.get('Idle Time', 0) or row.get('부동시간', 0) or 0)
-                        operation_time = int(row.get('Operation Time', 0) or row.get('가동시간', 0) or 0)
-                        workers = int(row.get('Workers', 1) or row.get('작업인원', 1) or 1)
-                    except (ValueError, TypeError):
-                        results['errors'] += 1
-                        results['error_details'].append(f"행 {row_num}: 숫자 필드 형식 오류")
-                        continue
-
-                    # 중복 체크
-                    existing = AssemblyReport.objects.filter(
-                        date=date_obj,
-                        line_no=row['Line No'].strip(),
-                        part_no=row['Part No'].strip(),
-                        model=row['Model'].strip()
-                    ).first()
-
-                    if existing:
-                        results['skipped'] += 1
-                        continue
-
-                    # 상세 불량 데이터 처리
-                    incoming_detail_keys = ['scratch','black_dot','eaten_meat','air_mark','deform','short_shot','broken_pillar','flow_mark','sink_mark','whitening','other']
-                    processing_detail_keys = ['scratch','printing','rework','other']
-
-                    incoming_defects_detail = {}
-                    for key in incoming_detail_keys:
-                        col_name = f"Inc {key}"
-                        if col_name in row:
-                            try:
-                                incoming_defects_detail[key] = int(row[col_name] or 0)
-                            except ValueError:
-                                incoming_defects_detail[key] = 0
-
-                    processing_defects_detail = {}
-                    for key in processing_detail_keys:
-                        col_name = f"Proc {key}"
-                        if col_name in row:
-                            try:
-                                processing_defects_detail[key] = int(row[col_name] or 0)
-                            except ValueError:
-                                processing_defects_detail[key] = 0
-
-                    # AssemblyReport 생성
-                    report = AssemblyReport.objects.create(
-                        date=date_obj,
-                        line_no=row['Line No'].strip(),
-                        part_no=row['Part No'].strip(),
-                        model=row['Model'].strip(),
-                        plan_qty=plan_qty,
-                        input_qty=input_qty,
-                        actual_qty=actual_qty,
-                        rework_qty=rework_qty,
-                        supply_type=row.get('Supply Type', '').strip(),
-                        injection_defect=injection_defect,
-                        outsourcing_defect=outsourcing_defect,
-                        processing_defect=processing_defect,
-                        incoming_defects_detail=incoming_defects_detail,
-                        processing_defects_detail=processing_defects_detail,
-                        total_time=total_time,
-                        idle_time=idle_time,
-                        operation_time=operation_time,
-                        workers=workers,
-                        note=row.get('Note', '').strip()
-                    )
-                    results['created'] += 1
-
-                except Exception as e:
-                    results['errors'] += 1
-                    results['error_details'].append(f"행 {row_num}: {str(e)}")
+        def parse_row(row, row_num):
+            values = parse_assembly_report_csv_row(row, row_num)
+            part_nos.add(values['part_no'])
+            return values
 
+        try:
+            importer = BulkCsvImporter(
+                AssemblyReport,
+                key_fields=ASSEMBLY_REPORT_IMPORT_KEY,
+                parse_row=parse_row,
+                format_db_error=lambda row_num, exc: f"행 {row_num}: {exc}",
+            )
+            result = importer.run(iter_csv_rows(csv_file), dry_run=dry_run)
         except Exception as e:
             return Response({'detail': f'CSV 파일 처리 중 오류: {str(e)}'}, status=400)
 
-        return Response(results)
+        if not dry_run:
+            # bulk 저장은 signal 을 보내지 않으므로 품목 카탈로그를 직접 갱신
+            refresh_part_catalog(part_nos)
+
+        return Response({
+            'created': result.created,
+            'skipped': result.skipped,
+            'errors': len(result.errors),
+            'error_details': result.errors,
+            'metrics': result.metrics(),
+        })
 
     @action(detail=False, methods=['get'], url_path='historical-performance')
     def historical_performance(self, request):
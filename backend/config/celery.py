@@ -27,6 +27,13 @@ app.conf.beat_schedule = {
             'expires': 115,
         }
     },
+    'recover-stale-ai-jobs-every-minute': {
+        'task': 'ai_core.tasks.recover_stale_ai_jobs',
+        'schedule': 60.0,
+        'options': {
+            'expires': 55,
+        }
+    },
     'capture-finished-goods-morning': {
         'task': 'inventory.tasks.capture_finished_goods_morning',
         'schedule': crontab(hour=8, minute=0),
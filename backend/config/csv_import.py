@@ -0,0 +1,242 @@
+"""
+Chunked CSV import engine for report uploads.
+
+``BulkCsvImporter`` streams an uploaded CSV, hands every row to a parser that
+returns model field values, and writes valid rows in chunks: one query
+resolves the existing natural keys of a chunk, then new rows go through
+``bulk_create`` and changed rows through ``bulk_update`` of just the fields
+that differ.  Unchanged rows are counted but not written.
+
+    importer = BulkCsvImporter(
+        InjectionReport,
+        key_fields=('date', 'machine_no', 'part_no'),
+        parse_row=parse_injection_row,
+        update_fields=[...],          # None: rows whose key exists are skipped
+    )
+    result = importer.run(iter_csv_rows(request.FILES['file']), dry_run=False)
+
+The parser raises ``CsvRowError`` with the message that should be shown for
+that row.  A chunk the database rejects is retried row by row so the failure
+is reported against the offending row and the rest of the chunk is kept.
+A dry run performs the same writes inside a transaction that is rolled back,
+so its counts and errors match a real import.
+
+Bulk writes bypass ``Model.save`` and ``post_save``; parsers normalise values
+themselves and callers refresh whatever the signals would have maintained.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CSV_IMPORT_CHUNK_SIZE = 500
+# ``bulk_update`` emits one CASE per field with a branch per row; smaller
+# batches keep that expression cheap to evaluate.
+CSV_IMPORT_UPDATE_BATCH_SIZE = 100
+
+
+class CsvRowError(ValueError):
+    """A row that cannot be imported; ``str(error)`` is the user-facing message."""
+
+
+def iter_csv_rows(uploaded_file, encoding: str = 'utf-8-sig') -> Iterator[dict[str, str]]:
+    """Yield ``csv.DictReader`` rows without decoding the whole upload at once."""
+
+    uploaded_file.seek(0)
+    text = io.TextIOWrapper(getattr(uploaded_file, 'file', uploaded_file), encoding=encoding, newline='')
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        # The upload owns the binary stream; don't let the wrapper close it.
+        text.detach()
+
+
+def query_param_flag(value: str | None) -> bool:
+    return str(value or '').strip().lower() in {'1', 'true', 'yes', 'on'}
+
+
+@dataclass
+class CsvImportResult:
+    dry_run: bool = False
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    errors: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float | None:
+        if not self.duration_ms:
+            return None
+        return round(self.rows / (self.duration_ms / 1000), 1)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            'dry_run': self.dry_run,
+            'rows': self.rows,
+            'duration_ms': round(self.duration_ms, 1),
+            'rows_per_second': self.rows_per_second,
+        }
+
+
+@dataclass
+class _PendingRow:
+    row_num: int
+    values: dict[str, Any]
+
+
+class BulkCsvImporter:
+    def __init__(
+        self,
+        model,
+        *,
+        key_fields: Sequence[str],
+        parse_row: Callable[[dict[str, str], int], dict[str, Any]],
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int = CSV_IMPORT_CHUNK_SIZE,
+        format_db_error: Callable[[int, Exception], str] | None = None,
+    ):
+        self.model = model
+        self.key_fields = tuple(key_fields)
+        self.parse_row = parse_row
+        self.update_fields = list(update_fields) if update_fields is not None else None
+        self.chunk_size = max(1, chunk_size)
+        self.format_db_error = format_db_error or (lambda row_num, exc: f'Row {row_num}: {exc}')
+        # ``bulk_update`` leaves ``auto_now`` columns alone unless told to write them.
+        self._auto_now_fields = [
+            f.name for f in model._meta.concrete_fields if getattr(f, 'auto_now', False)
+        ]
+
+    def _key(self, values: dict[str, Any]) -> tuple:
+        return tuple(values.get(name) for name in self.key_fields)
+
+    def run(self, rows: Iterable[dict[str, str]], *, dry_run: bool = False) -> CsvImportResult:
+        result = CsvImportResult(dry_run=dry_run)
+        started = time.perf_counter()
+        with transaction.atomic():
+            chunk: list[_PendingRow] = []
+            for row_num, row in enumerate(rows, 1):
+                result.rows += 1
+                try:
+                    chunk.append(_PendingRow(row_num, self.parse_row(row, row_num)))
+                except CsvRowError as exc:
+                    result.errors.append(str(exc))
+                    continue
+                if len(chunk) >= self.chunk_size:
+                    self._flush(chunk, result)
+                    chunk = []
+            if chunk:
+                self._flush(chunk, result)
+            if dry_run:
+                transaction.set_rollback(True)
+        result.duration_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            'CSV import into %s: rows=%s created=%s updated=%s skipped=%s errors=%s rows/s=%s dry_run=%s',
+            self.model._meta.label, result.rows, result.created, result.updated,
+            result.skipped, len(result.errors), result.rows_per_second, dry_run,
+        )
+        return result
+
+    def _existing_by_key(self, keys: Iterable[tuple]) -> dict[tuple, list]:
+        keys = set(keys)
+        if not keys:
+            return {}
+        # Per-field IN lists (plus IS NULL) keep the query small and index
+        # friendly; the exact key match happens below.
+        condition = Q()
+        for index, name in enumerate(self.key_fields):
+            values = {key[index] for key in keys}
+            field_condition = Q(**{f'{name}__in': values - {None}}) if values - {None} else Q(pk__in=[])
+            if None in values:
+                field_condition |= Q(**{f'{name}__isnull': True})
+            condition &= field_condition
+        existing: dict[tuple, list] = {}
+        for obj in self.model.objects.filter(condition).order_by('pk'):
+            key = tuple(getattr(obj, name) for name in self.key_fields)
+            if key in keys:
+                existing.setdefault(key, []).append(obj)
+        return existing
+
+    def _flush(self, chunk: list[_PendingRow], result: CsvImportResult) -> None:
+        try:
+            with transaction.atomic():
+                counts = self._write(chunk)
+        except DatabaseError:
+            logger.warning('Bulk write of %s rows failed; retrying row by row', len(chunk), exc_info=True)
+            counts = {'created': 0, 'updated': 0, 'skipped': 0}
+            for pending in chunk:
+                try:
+                    with transaction.atomic():
+                        row_counts = self._write([pending])
+                except DatabaseError as exc:
+                    result.errors.append(self.format_db_error(pending.row_num, exc))
+                    continue
+                for name, value in row_counts.items():
+                    counts[name] += value
+        result.created += counts['created']
+        result.updated += counts['updated']
+        result.skipped += counts['skipped']
+
+    def _write(self, chunk: list[_PendingRow]) -> dict[str, int]:
+        counts = {'created': 0, 'updated': 0, 'skipped': 0}
+        existing = self._existing_by_key(self._key(pending.values) for pending in chunk)
+        to_create: dict[tuple, Any] = {}
+        to_update: dict[int, tuple[Any, set[str]]] = {}
+        for pending in chunk:
+            key = self._key(pending.values)
+            if self.update_fields is None:
+                # Keys written by earlier chunks are already in ``existing``.
+                if key in existing or key in to_create:
+                    counts['skipped'] += 1
+                else:
+                    to_create[key] = self.model(**pending.values)
+                    counts['created'] += 1
+                continue
+
+            if key in existing:
+                for obj in existing[key]:
+                    changed = to_update.get(obj.pk, (obj, set()))[1]
+                    for name in self.update_fields:
+                        value = pending.values.get(name)
+                        if getattr(obj, name) != value:
+                            setattr(obj, name, value)
+                            changed.add(name)
+                    # Re-imported history is mostly unchanged; only write real changes.
+                    if changed:
+                        to_update[obj.pk] = (obj, changed)
+                counts['updated'] += 1
+            elif key in to_create:
+                # A later row for the same key replaces the pending insert.
+                to_create[key] = self.model(**pending.values)
+                counts['updated'] += 1
+            else:
+                to_create[key] = self.model(**pending.values)
+                counts['created'] += 1
+
+        if to_create:
+            self.model.objects.bulk_create(list(to_create.values()), batch_size=self.chunk_size)
+        if to_update:
+            now = timezone.now()
+            by_fields: dict[tuple, list] = {}
+            for obj, changed in to_update.values():
+                for name in self._auto_now_fields:
+                    setattr(obj, name, now)
+                by_fields.setdefault(tuple(sorted(changed)), []).append(obj)
+            for changed, objs in by_fields.items():
+                self.model.objects.bulk_update(
+                    objs,
+                    [*changed, *self._auto_now_fields],
+                    batch_size=CSV_IMPORT_UPDATE_BATCH_SIZE,
+                )
+        return counts
@@ -0,0 +1,121 @@
+"""
+Declarative HTTP caching for read-mostly API views.
+
+``NoCacheAPIMiddleware`` marks every ``/api/`` response ``no-store``.  A view
+handler decorated with ``cache_policy`` opts out of that: its successful
+responses carry ``Cache-Control: <scope>, max-age=<n>`` and an ETag derived
+from a cheap version key, and a matching ``If-None-Match`` is answered with
+``304 Not Modified`` before the handler builds the body.
+
+    @cache_policy(max_age=60, scope=PUBLIC, version=latest_plan_version)
+    def get(self, request, *args, **kwargs):
+        ...
+
+``version`` receives ``(request, *args, **kwargs)`` and should run at most one
+small aggregate query.  Returning ``None`` means the data has no stable
+version right now and leaves the response uncached.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable
+
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+PRIVATE = 'private'
+PUBLIC = 'public'
+
+# Set on responses whose headers come from a policy so the no-store
+# middleware leaves them alone.
+POLICY_ATTRIBUTE = '_http_cache_policy'
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int
+    scope: str = PRIVATE
+    version: Callable[..., Any] | None = None
+
+    def __post_init__(self):
+        if self.scope not in {PRIVATE, PUBLIC}:
+            raise ValueError(f'Unknown cache scope: {self.scope}')
+
+    @property
+    def cache_control(self) -> str:
+        return f'{self.scope}, max-age={max(0, int(self.max_age))}'
+
+    def etag_for(self, view, request, version: Any) -> str:
+        parts = {
+            'view': f'{type(view).__module__}.{type(view).__qualname__}',
+            'path': request.get_full_path(),
+            'media_type': getattr(request, 'accepted_media_type', ''),
+            'version': version,
+        }
+        if self.scope == PRIVATE:
+            # Private bodies may depend on the caller's permissions.
+            parts['user'] = getattr(request.user, 'pk', None)
+        digest = hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()[:32]
+        return f'W/"{digest}"'
+
+    def apply(self, response, etag: str | None) -> None:
+        response['Cache-Control'] = self.cache_control
+        if etag:
+            response['ETag'] = etag
+        vary = ['Accept']
+        if self.scope == PRIVATE:
+            vary += ['Authorization', 'Cookie']
+        patch_vary_headers(response, vary)
+        setattr(response, POLICY_ATTRIBUTE, self)
+
+
+def etag_matches(request, etag: str) -> bool:
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    if '*' in candidates:
+        return True
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    opaque = etag.removeprefix('W/')
+    return any(candidate.removeprefix('W/') == opaque for candidate in candidates)
+
+
+def cache_policy(max_age: int, *, scope: str = PRIVATE, version: Callable[..., Any] | None = None):
+    """Decorate a DRF view handler (``get``/``list``) with an HTTP caching policy.
+
+    The handler runs after authentication and permission checks, so a 304 is
+    only ever returned to callers who could have received the full body.
+    """
+
+    policy = CachePolicy(max_age=max_age, scope=scope, version=version)
+
+    def decorator(handler):
+        @wraps(handler)
+        def wrapped(view, request, *args, **kwargs):
+            etag = None
+            if policy.version is not None:
+                version_key = policy.version(request, *args, **kwargs)
+                if version_key is None:
+                    return handler(view, request, *args, **kwargs)
+                etag = policy.etag_for(view, request, version_key)
+                if etag_matches(request, etag):
+                    response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                    policy.apply(response, etag)
+                    return response
+            response = handler(view, request, *args, **kwargs)
+            if status.is_success(response.status_code) and not getattr(response, 'streaming', False):
+                policy.apply(response, etag)
+            return response
+
+        wrapped.cache_policy = policy
+        return wrapped
+
+    return decorator
@@ -5,6 +5,8 @@ from django.conf import settings
 from django.http import JsonResponse
 from django.utils.cache import patch_vary_headers
 
+from .http_cache import POLICY_ATTRIBUTE
+
 
 
 
@@ -36,6 +38,7 @@ class APINotFoundMiddleware:
 class NoCacheAPIMiddleware:
     """
     Middleware to add no-cache headers to all API responses
+    except those produced under a ``config.http_cache.cache_policy``
     """
     def __init__(self, get_response):
         self.get_response = get_response
@@ -44,7 +47,7 @@ class NoCacheAPIMiddleware:
         response = self.get_response(request)
         
         # Add no-cache headers to API responses
-        if request.path.startswith('/api/'):
+        if request.path.startswith('/api/') and not getattr(response, POLICY_ATTRIBUTE, None):
             response['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
             response['Pragma'] = 'no-cache'
             response['Expires'] = '0'
@@ -0,0 +1,608 @@
+"""
+Bounded local process pool for CPU-heavy upload parsing.
+
+Workbook parsing is pandas/openpyxl/Pillow work that holds the GIL,
+so a large upload parsed inside a gthread request worker stalls every other
+request that worker serves, dashboard polling included.  Parse jobs run in a
+child process instead and the request thread waits without holding the GIL:
+
+    job = submit_parse_job(
+        'injection.plan_processing.parse_plan_upload', upload,
+        owner=request.user, plan_type='injection', target_date='2026-07-16',
+    )
+    parsed = job.wait().result()      # re-raises the parser's own exception
+
+The upload is copied chunk by chunk to ``<PARSE_POOL_ROOT>/<job id>/source``
+and the child opens that file, so upload bytes are never held in request
+memory.  Each child gets an address-space budget of
+``PARSE_POOL_JOB_MEMORY_MB`` on top of what it inherits and is killed after
+``PARSE_POOL_JOB_TIMEOUT_SECONDS``.  At most ``PARSE_POOL_MAX_WORKERS``
+children run per web process and ``PARSE_POOL_MAX_QUEUED`` more jobs may
+wait; beyond that ``submit_parse_job`` raises ``ParsePoolBusy`` (503 with
+``Retry-After``) rather than queueing without bound.
+
+Job state is a small JSON file next to the upload, so ``get_parse_job`` works
+from any web process on the host.  A job submitted with ``finish=`` runs
+``finish(job, **finish_params)`` in the pool thread as soon as parsing ends
+and stores the ``(http_status, body)`` it returns; polling only reads it.
+
+Parsers receive an open binary file plus keyword arguments, must not touch
+the database and return a picklable value.  Database work stays in the web
+process.  ``PARSE_POOL_ENABLED=False`` runs parsers inline in the calling
+thread, as before the pool existed; so does a daemonic process, which may not
+start children.
+
+CSV bulk imports do not use the pool: parsing them is cheap, and shipping
+every parsed row back would hold the whole file in the web process instead
+of streaming it through ``BulkCsvImporter`` in chunks.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import re
+import shutil
+import signal
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+POOL_DIRECTORY_NAME = 'wj-parse-jobs'
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_QUEUED = 4
+DEFAULT_JOB_TIMEOUT_SECONDS = 120
+DEFAULT_JOB_MEMORY_MB = 1024
+DEFAULT_JOB_TTL_SECONDS = 6 * 60 * 60
+BUSY_RETRY_AFTER_SECONDS = 5
+SPOOL_CHUNK_SIZE = 1024 * 1024
+# A job whose web process died is reported lost this long after its deadline:
+# the latest it should have started (queued), parsed (running) or been saved.
+LOST_JOB_GRACE_SECONDS = 30
+PURGE_INTERVAL_SECONDS = 5 * 60
+JOB_NICENESS = 10
+FORKSERVER_PRELOAD = ['config.parse_pool_preload', 'config.parse_pool']
+
+QUEUED = 'queued'
+RUNNING = 'running'
+PARSED = 'parsed'
+FINISHING = 'finishing'
+COMPLETED = 'completed'
+FAILED = 'failed'
+DONE = frozenset({PARSED, COMPLETED, FAILED})
+PENDING = frozenset({QUEUED, RUNNING, FINISHING})
+
+SOURCE_NAME = 'source'
+STATE_NAME = 'state.json'
+RESULT_NAME = 'result.pickle'
+ERROR_NAME = 'error.pickle'
+_JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+
+class ParseJobError(Exception):
+    """A parse job the pool could not run to completion."""
+
+    def __init__(self, code: str, message: str, http_status: int = status.HTTP_500_INTERNAL_SERVER_ERROR):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.http_status = http_status
+
+    def __reduce__(self):
+        return type(self), (self.code, self.message, self.http_status)
+
+
+class ParsePoolBusy(ParseJobError):
+    def __init__(self, code: str = 'parse_pool_busy', message: str = '', http_status: int = status.HTTP_503_SERVICE_UNAVAILABLE):
+        super().__init__(
+            code,
+            message or 'Too many uploads are being processed. Retry shortly.',
+            http_status,
+        )
+
+
+def parse_job_error_response(exc: ParseJobError) -> Response:
+    response = Response({'code': exc.code, 'error': exc.message}, status=exc.http_status)
+    if isinstance(exc, ParsePoolBusy):
+        response['Retry-After'] = str(BUSY_RETRY_AFTER_SECONDS)
+    return response
+
+
+class DiskUploadMixin:
+    """Stream multipart files to temporary files regardless of their size."""
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
+
+def _setting(name: str, default):
+    value = getattr(settings, name, None)
+    return default if value in (None, '') else value
+
+
+def pool_enabled() -> bool:
+    return bool(_setting('PARSE_POOL_ENABLED', True))
+
+
+def pool_root() -> Path:
+    configured = _setting('PARSE_POOL_ROOT', '')
+    return Path(configured) if configured else Path(tempfile.gettempdir()) / POOL_DIRECTORY_NAME
+
+
+def _job_limits() -> tuple[int, int]:
+    timeout = max(1, int(_setting('PARSE_POOL_JOB_TIMEOUT_SECONDS', DEFAULT_JOB_TIMEOUT_SECONDS)))
+    memory_mb = max(0, int(_setting('PARSE_POOL_JOB_MEMORY_MB', DEFAULT_JOB_MEMORY_MB)))
+    return timeout, memory_mb
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    partial = path.with_name(f'.{path.name}.{uuid.uuid4().hex}.partial')
+    with open(partial, 'wb') as handle:
+        handle.write(content)
+    os.replace(partial, path)
+
+
+def _portable_error(exc: BaseException) -> BaseException:
+    """``exc`` if it survives a pickle round trip, else a ``ParseJobError`` copy."""
+
+    try:
+        pickle.loads(pickle.dumps(exc))
+        return exc
+    except Exception:
+        return ParseJobError('parse_failed', f'{type(exc).__name__}: {exc}')
+
+
+def _address_space_bytes() -> int:
+    try:
+        with open('/proc/self/statm') as handle:
+            return int(handle.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _apply_limits(memory_mb: int, cpu_seconds: int) -> None:
+    try:
+        import resource
+    except ImportError:  # Windows development servers run without limits.
+        return
+    if memory_mb:
+        # The child inherits the forkserver's preloaded modules; budget on top of them.
+        limit = _address_space_bytes() + memory_mb * 1024 * 1024
+        _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    if cpu_seconds:
+        _soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        if hard == resource.RLIM_INFINITY or hard > cpu_seconds:
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, hard))
+
+
+def _execute(directory: Path, parser: str, params: dict[str, Any]) -> None:
+    """Run ``parser`` on the spooled source and store its value or exception."""
+
+    try:
+        func = import_string(parser)
+        with open(directory / SOURCE_NAME, 'rb') as source:
+            value = func(source, **params)
+        _write_atomic(directory / RESULT_NAME, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except MemoryError:
+        error = ParseJobError(
+            'parse_memory_limit',
+            'The upload needs more memory to parse than one job may use.',
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+        _write_atomic(directory / ERROR_NAME, pickle.dumps(error))
+    except Exception as exc:
+        _write_atomic(directory / ERROR_NAME, pickle.dumps(_portable_error(exc)))
+
+
+def _child_main(directory: str, parser: str, params: dict[str, Any], memory_mb: int, cpu_seconds: int) -> None:
+    _apply_limits(memory_mb, cpu_seconds)
+    if hasattr(os, 'nice'):
+        # Parsing is background work: the scheduler favours request threads.
+        os.nice(JOB_NICENESS)
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+    _execute(Path(directory), parser, params)
+
+
+class ParseJob:
+    def __init__(self, job_id: str, directory: Path):
+        self.id = job_id
+        self.directory = directory
+
+    def __repr__(self):
+        return f'<ParseJob {self.id}>'
+
+    def state(self) -> dict[str, Any]:
+        try:
+            state = json.loads((self.directory / STATE_NAME).read_text(encoding='utf-8'))
+        except (OSError, ValueError) as exc:
+            raise ParseJobError('parse_job_not_found', 'Parse job not found.', status.HTTP_404_NOT_FOUND) from exc
+        deadline = state.get('deadline')
+        if state['status'] in PENDING and deadline and time.time() > deadline + LOST_JOB_GRACE_SECONDS:
+            state.update(
+                status=FAILED,
+                error={'code': 'parse_worker_lost', 'error': 'The web process running this job stopped.'},
+            )
+        return state
+
+    def _update(self, **changes) -> dict[str, Any]:
+        state = json.loads((self.directory / STATE_NAME).read_text(encoding='utf-8'))
+        state.update(changes, updated_at=time.time())
+        _write_atomic(self.directory / STATE_NAME, json.dumps(state, cls=DjangoJSONEncoder).encode('utf-8'))
+        return state
+
+    @property
+    def status(self) -> str:
+        return self.state()['status']
+
+    def wait(self, timeout: float | None = None, poll_interval: float = 0.2) -> 'ParseJob':
+        """Block until the job, including its ``finish`` step, is done (or ``timeout`` passes)."""
+
+        future = _local_future(self.id)
+        if future is not None:
+            try:
+                future.result(timeout)
+            except TimeoutError:
+                pass
+            except Exception:
+                logger.exception('Parse job %s runner failed', self.id)
+            return self
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.status not in DONE:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+        return self
+
+    def result(self) -> Any:
+        """The parser's return value; re-raises its exception or the pool's."""
+
+        state = self.state()
+        if state['status'] in {QUEUED, RUNNING}:
+            raise ParseJobError('parse_job_pending', 'The upload is still being parsed.', status.HTTP_409_CONFLICT)
+        error_path = self.directory / ERROR_NAME
+        result_path = self.directory / RESULT_NAME
+        if error_path.exists():
+            raise pickle.loads(error_path.read_bytes())
+        if result_path.exists():
+            return pickle.loads(result_path.read_bytes())
+        error = state.get('error') or {}
+        if error:
+            raise ParseJobError(error['code'], error['error'], error.get('http_status', status.HTTP_500_INTERNAL_SERVER_ERROR))
+        raise ParseJobError('parse_job_expired', 'The parsed upload is no longer available.', status.HTTP_410_GONE)
+
+    def outcome(self) -> tuple[int, Any] | None:
+        """``(http_status, body)`` stored by the ``finish`` step, else ``None``."""
+
+        state = self.state()
+        if state['status'] != COMPLETED:
+            return None
+        return state['http_status'], state['result']
+
+    def _finish(self, finish: str, finish_params: dict[str, Any]) -> None:
+        """Run the ``finish`` step on the parse outcome and store its response."""
+
+        self._update(status=FINISHING, deadline=time.time() + _job_limits()[0])
+        try:
+            http_status, body = import_string(finish)(self, **finish_params)
+        except Exception:
+            logger.exception('Parse job %s finish step failed', self.id)
+            self._update(
+                status=FAILED,
+                finished_at=time.time(),
+                error={'code': 'parse_finish_failed', 'error': 'The parsed upload could not be saved.'},
+            )
+            return
+        self._update(status=COMPLETED, finished_at=time.time(), http_status=http_status, result=body)
+        for name in (RESULT_NAME, ERROR_NAME):
+            (self.directory / name).unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def visible_to(self, user) -> bool:
+        owner_id = self.state().get('owner_id')
+        return bool(user and user.is_authenticated and (user.is_staff or owner_id == user.pk))
+
+    def describe(self) -> dict[str, Any]:
+        state = self.state()
+        payload = {
+            'id': self.id,
+            'status': state['status'],
+            'created_at': state['created_at'],
+            'started_at': state.get('started_at'),
+            'finished_at': state.get('finished_at'),
+        }
+        if state['status'] == COMPLETED:
+            payload.update(http_status=state['http_status'], result=state['result'])
+        elif state.get('error'):
+            payload['error'] = {key: state['error'][key] for key in ('code', 'error')}
+        return payload
+
+
+class _Pool:
+    def __init__(self, max_workers: int, max_queued: int):
+        self.pid = os.getpid()
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='parse-pool')
+        self.slots = threading.BoundedSemaphore(max_workers + max_queued)
+        self.futures: dict[str, Future] = {}
+        self.lock = threading.Lock()
+
+
+_pool: _Pool | None = None
+_pool_lock = threading.Lock()
+_context = None
+_last_purge = 0.0
+
+
+def _get_pool() -> _Pool:
+    global _pool
+    with _pool_lock:
+        # A forked web worker must not reuse its parent's threads.
+        if _pool is None or _pool.pid != os.getpid():
+            _pool = _Pool(
+                max(1, int(_setting('PARSE_POOL_MAX_WORKERS', DEFAULT_MAX_WORKERS))),
+                max(0, int(_setting('PARSE_POOL_MAX_QUEUED', DEFAULT_MAX_QUEUED))),
+            )
+        return _pool
+
+
+def _mp_context():
+    global _context
+    with _pool_lock:
+        if _context is None:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                # Forking the threaded web process itself is unsafe; the
+                # forkserver is a clean single-threaded parent for children.
+                _context = multiprocessing.get_context('forkserver')
+                _context.set_forkserver_preload(FORKSERVER_PRELOAD)
+            else:
+                _context = multiprocessing.get_context('spawn')
+        return _context
+
+
+def _local_future(job_id: str) -> Future | None:
+    pool = _pool
+    if pool is None or pool.pid != os.getpid():
+        return None
+    with pool.lock:
+        return pool.futures.get(job_id)
+
+
+def _run_in_child(job: ParseJob, parser: str, params: dict[str, Any]) -> None:
+    timeout, memory_mb = _job_limits()
+    started = time.time()
+    job._update(status=RUNNING, started_at=started, deadline=started + timeout)
+    error = None
+    process = None
+    try:
+        process = _mp_context().Process(
+            target=_child_main,
+            args=(str(job.directory), parser, params, memory_mb, timeout + 1),
+            name=f'parse-job-{job.id}',
+            daemon=True,
+        )
+        process.start()
+        process.join(timeout)
+        if process.is_alive():
+            process.kill()
+            process.join()
+            error = ParseJobError(
+                'parse_time_limit',
+                f'Parsing did not finish within {timeout} seconds.',
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        elif (job.directory / RESULT_NAME).exists() or (job.directory / ERROR_NAME).exists():
+            pass
+        elif process.exitcode == -getattr(signal, 'SIGXCPU', 0):
+            error = ParseJobError(
+                'parse_time_limit',
+                f'Parsing used more than {timeout} seconds of CPU.',
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        else:
+            error = ParseJobError('parse_worker_crashed', f'The parser process exited with code {process.exitcode}.')
+    except Exception as exc:
+        logger.exception('Parse job %s could not start', job.id)
+        error = ParseJobError('parse_worker_crashed', f'The parser process could not run: {exc}')
+    finally:
+        if process is not None:
+            process.close()
+    _record_outcome(job, error)
+
+
+def _record_outcome(job: ParseJob, error: ParseJobError | None) -> None:
+    (job.directory / SOURCE_NAME).unlink(missing_ok=True)
+    if error is not None:
+        _write_atomic(job.directory / ERROR_NAME, pickle.dumps(error))
+        logger.warning('Parse job %s failed: %s', job.id, error.code)
+    state = job.state()
+    if state.get('finish'):
+        # ``finish`` sees parse errors through ``job.result()`` and answers them itself.
+        job._update(parsed_at=time.time())
+        job._finish(state['finish'], state.get('finish_params', {}))
+        return
+    if error is None and (job.directory / RESULT_NAME).exists():
+        job._update(status=PARSED, parsed_at=time.time())
+        return
+    stored = error
+    if stored is None:
+        try:
+            stored = pickle.loads((job.directory / ERROR_NAME).read_bytes())
+        except Exception:
+            stored = None
+    job._update(
+        status=FAILED,
+        parsed_at=time.time(),
+        error={
+            'code': getattr(stored, 'code', 'parse_failed'),
+            'error': getattr(stored, 'message', str(stored)),
+            'http_status': getattr(stored, 'http_status', status.HTTP_400_BAD_REQUEST),
+        },
+    )
+
+
+def _pool_task(job: ParseJob, parser: str, params: dict[str, Any], pool: _Pool) -> None:
+    try:
+        _run_in_child(job, parser, params)
+    finally:
+        # ``finish`` steps query the database from this pool thread.
+        connections.close_all()
+        with pool.lock:
+            pool.futures.pop(job.id, None)
+        pool.slots.release()
+
+
+def _spool(upload, target: Path) -> int:
+    size = 0
+    with open(target, 'wb') as handle:
+        if hasattr(upload, 'chunks'):
+            for block in upload.chunks(chunk_size=SPOOL_CHUNK_SIZE):
+                handle.write(block)
+                size += len(block)
+        else:
+            upload.seek(0)
+            while block := upload.read(SPOOL_CHUNK_SIZE):
+                handle.write(block)
+                size += len(block)
+    return size
+
+
+def purge_parse_jobs(max_age_seconds: int | None = None) -> int:
+    """Remove job directories older than ``PARSE_POOL_JOB_TTL_SECONDS``."""
+
+    if max_age_seconds is None:
+        max_age_seconds = int(_setting('PARSE_POOL_JOB_TTL_SECONDS', DEFAULT_JOB_TTL_SECONDS))
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    root = pool_root()
+    if not root.is_dir():
+        return 0
+    for directory in root.iterdir():
+        try:
+            if _JOB_ID_PATTERN.match(directory.name) and directory.stat().st_mtime < cutoff:
+                shutil.rmtree(directory)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _maybe_purge() -> None:
+    global _last_purge
+    now = time.monotonic()
+    if now - _last_purge < PURGE_INTERVAL_SECONDS:
+        return
+    _last_purge = now
+    try:
+        purge_parse_jobs()
+    except OSError:
+        logger.warning('Could not purge old parse jobs', exc_info=True)
+
+
+def _queue_wait_seconds(pool: _Pool | None) -> int:
+    """Longest a job can wait for the jobs queued ahead of it to time out."""
+
+    timeout = _job_limits()[0]
+    if pool is None:
+        return timeout
+    return timeout * (1 + math.ceil(pool.max_queued / pool.max_workers))
+
+
+def submit_parse_job(
+    parser: str,
+    upload,
+    *,
+    owner=None,
+    finish: str | None = None,
+    finish_params: dict[str, Any] | None = None,
+    **params,
+) -> ParseJob:
+    """Spool ``upload`` to disk and queue ``parser(source, **params)``.
+
+    ``upload`` is a Django ``UploadedFile`` or any readable binary file.
+    Raises ``ParsePoolBusy`` when the pool and its queue are full.
+    """
+
+    _maybe_purge()
+    # Daemonic processes (e.g. ``manage.py test --parallel`` workers) may not
+    # start children of their own; parse inline there.
+    use_pool = pool_enabled() and not multiprocessing.current_process().daemon
+    pool = _get_pool() if use_pool else None
+    if pool is not None and not pool.slots.acquire(blocking=False):
+        raise ParsePoolBusy()
+    try:
+        job_id = uuid.uuid4().hex
+        directory = pool_root() / job_id
+        directory.mkdir(parents=True)
+        job = ParseJob(job_id, directory)
+        now = time.time()
+        state = {
+            'id': job_id,
+            'status': QUEUED,
+            'deadline': now + _queue_wait_seconds(pool),
+            'parser': parser,
+            'owner_id': getattr(owner, 'pk', None),
+            'finish': finish,
+            'finish_params': finish_params or {},
+            'created_at': now,
+            'updated_at': now,
+        }
+        _write_atomic(directory / STATE_NAME, json.dumps(state, cls=DjangoJSONEncoder).encode('utf-8'))
+        job._update(source_bytes=_spool(upload, directory / SOURCE_NAME))
+    except Exception:
+        if pool is not None:
+            pool.slots.release()
+        raise
+
+    if pool is None:
+        job._update(status=RUNNING, started_at=time.time())
+        _execute(directory, parser, params)
+        _record_outcome(job, None)
+        return job
+    with pool.lock:
+        pool.futures[job_id] = pool.executor.submit(_pool_task, job, parser, params, pool)
+    return job
+
+
+def get_parse_job(job_id: str) -> ParseJob:
+    directory = pool_root() / str(job_id)
+    if not _JOB_ID_PATTERN.match(str(job_id)) or not (directory / STATE_NAME).exists():
+        raise ParseJobError('parse_job_not_found', 'Parse job not found.', status.HTTP_404_NOT_FOUND)
+    return ParseJob(str(job_id), directory)
+
+
+def run_parse_job(parser: str, upload, **params) -> Any:
+    """Parse ``upload`` in the pool, wait for it and return the parser's value."""
+
+    job = submit_parse_job(parser, upload, **params).wait()
+    try:
+        return job.result()
+    finally:
+        job.discard()
@@ -0,0 +1,34 @@
+"""Imported once by the parse pool's forkserver so forked parse jobs start warm.
+
+Every job is forked from that server, so Django's app registry, the view
+modules that define row parsers and the workbook libraries are loaded here
+instead of once per job.
+
+The forkserver imports this module before it applies the web process's
+``sys.path`` (it finds ``config`` through its working directory), so the
+paths ``manage.py`` adds for the ``backend.config.settings`` layout are put
+back here first.
+"""
+import sys
+from pathlib import Path
+
+# settings.BASE_DIR; settings themselves cannot be imported until it is on sys.path.
+BASE_DIR = Path(__file__).resolve().parent.parent
+for entry in (str(BASE_DIR), str(BASE_DIR.parent)):
+    if entry not in sys.path:
+        sys.path.append(entry)
+
+import django  # noqa: E402
+
+django.setup()
+
+import openpyxl  # noqa: E402,F401
+import pandas  # noqa: E402,F401
+from django.urls import get_resolver  # noqa: E402
+from PIL import Image  # noqa: E402,F401
+
+get_resolver().url_patterns
+
+# Forked children inherit unflushed buffers and would repeat setup output.
+sys.stdout.flush()
+sys.stderr.flush()
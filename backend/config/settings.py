@@ -336,6 +336,42 @@ MES_ACCESS_TOKEN = os.getenv('MES_ACCESS_TOKEN', '')
 AI_WORKER_TOKEN = os.getenv('AI_WORKER_TOKEN', '')
 AI_JOB_CLAIM_LIMIT = int(os.getenv('AI_JOB_CLAIM_LIMIT', '1') or 1)
 AI_JOB_TIMEOUT_SECONDS = int(os.getenv('AI_JOB_TIMEOUT_SECONDS', '600') or 600)
+# Long-poll claims hold a web thread; keep this below the gunicorn timeout.
+AI_JOB_CLAIM_MAX_WAIT_SECONDS = int(os.getenv('AI_JOB_CLAIM_MAX_WAIT_SECONDS', '20') or 0)
+AI_JOB_CLAIM_POLL_SECONDS = float(os.getenv('AI_JOB_CLAIM_POLL_SECONDS', '1') or 1)
+AI_JOB_STALE_RECOVERY_INTERVAL_SECONDS = int(os.getenv('AI_JOB_STALE_RECOVERY_INTERVAL_SECONDS', '60') or 60)
+PRODUCTION_AI_CONTEXT_CACHE_SECONDS = int(os.getenv('PRODUCTION_AI_CONTEXT_CACHE_SECONDS', '600') or 0)
+
+# Staged quality-import images (quality/import_spool.py).  Required outside
+# DEBUG: point it at a persistent disk, never the instance's temporary disk.
+QUALITY_IMPORT_SPOOL_ROOT = os.getenv('QUALITY_IMPORT_SPOOL_ROOT', '')
+
+# Upload parsing runs in child processes (config/parse_pool.py).  Workers and
+# queue slots are per gunicorn worker; the memory budget is per parse job.
+# CI runs the suite with PARSE_POOL_ENABLED=false; pool tests enable it themselves.
+PARSE_POOL_ENABLED = os.getenv('PARSE_POOL_ENABLED', 'true').strip().lower() not in {'0', 'false', 'no', 'off'}
+PARSE_POOL_MAX_WORKERS = int(os.getenv('PARSE_POOL_MAX_WORKERS', '2') or 2)
+PARSE_POOL_MAX_QUEUED = int(os.getenv('PARSE_POOL_MAX_QUEUED', '4') or 0)
+PARSE_POOL_JOB_TIMEOUT_SECONDS = int(os.getenv('PARSE_POOL_JOB_TIMEOUT_SECONDS', '120') or 120)
+PARSE_POOL_JOB_MEMORY_MB = int(os.getenv('PARSE_POOL_JOB_MEMORY_MB', '1024') or 0)
+PARSE_POOL_ROOT = os.getenv('PARSE_POOL_ROOT', '')
+
+# gunicorn workers only share cached values through a cross-process backend.
+# ``database`` needs ``python manage.py createcachetable`` before first use.
+DJANGO_CACHE_BACKEND = os.getenv('DJANGO_CACHE_BACKEND', 'locmem').strip().lower()
+if DJANGO_CACHE_BACKEND == 'database':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
 
 
 from datetime import timedelta
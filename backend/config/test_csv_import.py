@@ -0,0 +1,135 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from assembly.models import AssemblyReport
+from injection.models import InjectionReport, PartCatalogEntry
+
+INJECTION_HEADER = 'date,machine_no,tonnage,model,section,part_no,plan_qty,actual_qty,reported_defect,actual_defect,total_time,operation_time,note'
+ASSEMBLY_HEADER = 'Date,Line No,Part No,Model,Plan Qty,Actual Qty,Inc scratch,Proc printing,Note'
+
+
+def csv_upload(header, lines, name='reports.csv'):
+    content = '\ufeff' + '\n'.join([header, *lines]) + '\n'
+    return SimpleUploadedFile(name, content.encode('utf-8'), content_type='text/csv')
+
+
+class ReportCsvImportTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username='importer', password='pw', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def post_injection(self, lines, query=''):
+        return self.client.post(
+            f'/api/injection/reports/bulk-import/{query}',
+            {'file': csv_upload(INJECTION_HEADER, lines)},
+            format='multipart',
+        )
+
+    def post_assembly(self, lines, query=''):
+        return self.client.post(
+            f'/api/assembly/reports/bulk-import/{query}',
+            {'file': csv_upload(ASSEMBLY_HEADER, lines)},
+            format='multipart',
+        )
+
+    def test_injection_import_upserts_by_date_machine_and_part(self):
+        existing = InjectionReport.objects.create(
+            date=date(2026, 9, 1), machine_no=1, tonnage='850T', model='OLD', section='C/A',
+            plan_qty=1, actual_qty=1, reported_defect=0, actual_defect=0, part_no='ACQ30001',
+        )
+
+        response = self.post_injection([
+            '2026-09-01,1,850T,MODEL-A,C/A,acq30001,100,90,1,2,1440,1200,updated',
+            '2026-09-01,2,650T,MODEL-B,B/C,ACQ30002,50,50,0,0,1440,1440,',
+            '2026-09-01,2,650T,MODEL-B,B/C,ACQ30002,60,55,0,0,1440,1440,second wins',
+        ])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.json()['created'], response.json()['skipped']), (1, 2))
+        self.assertEqual(response.json()['metrics']['rows'], 3)
+        existing.refresh_from_db()
+        self.assertEqual((existing.model, existing.actual_qty, existing.idle_time), ('MODEL-A', 90, 240))
+        self.assertEqual(
+            InjectionReport.objects.get(machine_no=2).note,
+            'second wins',
+        )
+        self.assertTrue(PartCatalogEntry.objects.filter(part_no='ACQ30002').exists())
+
+    def test_injection_import_reports_row_errors_and_keeps_valid_rows(self):
+        response = self.post_injection([
+            ',1,850T,MODEL-A,C/A,ACQ30001,100,90,0,0,1440,1440,',
+            '2026-09-01,x,850T,MODEL-A,C/A,ACQ30001,100,90,0,0,1440,1440,',
+            '2026-09-01,1,850T,MODEL-A,C/A,ACQ30001,100,90,0,0,1440,1440,',
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['errors']
+        self.assertEqual(errors[0], 'Row 1: Date is required.')
+        self.assertTrue(errors[1].startswith('Row 2: Invalid data format'))
+        self.assertEqual(InjectionReport.objects.count(), 1)
+
+    def test_dry_run_counts_without_writing(self):
+        response = self.post_injection(
+            ['2026-09-01,1,850T,MODEL-A,C/A,ACQ30001,100,90,0,0,1440,1440,'],
+            query='?dry_run=1',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['created'], 1)
+        self.assertTrue(response.json()['metrics']['dry_run'])
+        self.assertFalse(InjectionReport.objects.exists())
+        self.assertFalse(PartCatalogEntry.objects.exists())
+
+    def test_assembly_import_skips_existing_and_repeated_keys(self):
+        AssemblyReport.objects.create(
+            date=date(2026, 9, 1), line_no='L1', part_no='ACQ30001', model='MODEL-A',
+            plan_qty=1, actual_qty=1,
+        )
+
+        response = self.post_assembly([
+            '2026-09-01,L1,acq30001,MODEL-A,100,90,1,2,exists',
+            '2026-09-01,L2,ACQ30001,MODEL-A,100,90,3,0,new',
+            '2026-09-01,L2,ACQ30001,MODEL-A,100,90,0,0,repeat',
+            '2026/09/01,L3,ACQ30001,MODEL-A,100,90,0,0,bad date',
+            '2026-09-01,L4,ACQ30001,MODEL-A,many,90,0,0,bad qty',
+        ])
+
+        body = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((body['created'], body['skipped'], body['errors']), (1, 2, 2))
+        self.assertEqual(body['error_details'], [
+            '행 4: 잘못된 날짜 형식 - 2026/09/01',
+            '행 5: 숫자 필드 형식 오류',
+        ])
+        created = AssemblyReport.objects.get(line_no='L2')
+        self.assertEqual(created.incoming_defects_detail, {'scratch': 3})
+        self.assertEqual(created.processing_defects_detail, {'printing': 0})
+
+    def test_query_count_does_not_grow_per_row(self):
+        lines = [
+            f'2026-09-{day:02d},{machine},850T,MODEL-A,C/A,ACQ3{machine:04d},100,90,0,0,1440,1440,'
+            for day in range(1, 21)
+            for machine in range(1, 11)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_injection(lines)
+
+        self.assertEqual(response.json()['created'], 200)
+        # One key lookup for the chunk; the inserts are batched by the backend's
+        # parameter limit.  The part catalog refresh is not counted.
+        report_queries = [
+            query['sql'] for query in queries.captured_queries
+            if InjectionReport._meta.db_table in query['sql']
+            and PartCatalogEntry._meta.db_table not in query['sql']
+            and 'MAX(' not in query['sql']
+        ]
+        self.assertEqual(sum(sql.startswith('SELECT') for sql in report_queries), 1)
+        self.assertLess(len(report_queries), 10)
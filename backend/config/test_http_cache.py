@@ -0,0 +1,119 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.views import APIView
+
+from config.http_cache import cache_policy
+from production.models import ProductionPlan, ProductionPlanPart
+
+
+class CachePolicyTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        ProductionPlan.objects.create(
+            plan_date=date(2026, 9, 1),
+            plan_type='injection',
+            machine_name='1호기',
+            part_no='ACQ30001',
+            planned_quantity=100,
+        )
+
+    def test_policy_replaces_no_store_and_sets_etag(self):
+        response = self.client.get('/api/production/plan-dates/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertFalse(response.has_header('Pragma'))
+
+    def test_matching_if_none_match_returns_304_before_building_body(self):
+        etag = self.client.get('/api/production/plan-dates/')['ETag']
+
+        # One aggregate for the version key; the date queries never run.
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/production/plan-dates/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+
+    def test_write_changes_etag(self):
+        etag = self.client.get('/api/production/plan-dates/')['ETag']
+        ProductionPlan.objects.create(
+            plan_date=date(2026, 9, 2),
+            plan_type='injection',
+            machine_name='2호기',
+            part_no='ACQ30002',
+            planned_quantity=50,
+        )
+
+        response = self.client.get('/api/production/plan-dates/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['injection'], ['2026-09-01', '2026-09-02'])
+
+    def test_etag_covers_query_string(self):
+        first = self.client.get('/api/injection/monitoring-dates/?limit=10')
+        second = self.client.get('/api/injection/monitoring-dates/?limit=20')
+
+        self.assertNotEqual(first['ETag'], second['ETag'])
+
+
+class PrivateCachePolicyTests(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.alice = user_model.objects.create_user(username='alice', password='pw')
+        self.bob = user_model.objects.create_user(username='bob', password='pw')
+        ProductionPlanPart.objects.create(plan_type='injection', part_no='ACQ30001', model_name='MODEL-A')
+
+    def client_for(self, user=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+        return client
+
+    def test_private_etag_is_per_user(self):
+        url = '/api/production/plan-parts/?search=ACQ'
+        alice_response = self.client_for(self.alice).get(url)
+        bob_response = self.client_for(self.bob).get(url, HTTP_IF_NONE_MATCH=alice_response['ETag'])
+
+        self.assertEqual(alice_response['Cache-Control'], 'private, max-age=300')
+        self.assertIn('Authorization', alice_response['Vary'])
+        self.assertEqual(bob_response.status_code, 200)
+        self.assertNotEqual(bob_response['ETag'], alice_response['ETag'])
+
+    def test_anonymous_request_is_rejected_not_revalidated(self):
+        url = '/api/production/plan-parts/?search=ACQ'
+        etag = self.client_for(self.alice).get(url)['ETag']
+
+        response = self.client_for().get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertIn('no-store', response['Cache-Control'])
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_auth_sensitive_endpoint_stays_uncached(self):
+        response = self.client_for(self.alice).get('/api/injection/user/me/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-store', response['Cache-Control'])
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_missing_version_leaves_response_uncached(self):
+        class UnversionedView(APIView):
+            permission_classes = []
+
+            @cache_policy(max_age=60, version=lambda request: None)
+            def get(self, request):
+                return Response({'ok': True})
+
+        response = UnversionedView.as_view()(APIRequestFactory().get('/api/unversioned/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Cache-Control'))
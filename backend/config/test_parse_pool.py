@@ -0,0 +1,196 @@
+import multiprocessing
+import os
+import tempfile
+import time
+from io import BytesIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from config import parse_pool
+from config.parse_pool import (
+    ParseJobError,
+    ParsePoolBusy,
+    get_parse_job,
+    parse_job_error_response,
+    run_parse_job,
+    submit_parse_job,
+)
+
+
+# Parsers run in a forked child, so they must be importable module attributes.
+def echo_parser(source, *, suffix=''):
+    return {'pid': os.getpid(), 'text': source.read().decode('utf-8') + suffix}
+
+
+def failing_parser(source):
+    raise ValueError('row 3: bad quantity')
+
+
+class UnpicklableError(Exception):
+    def __init__(self, code, detail):
+        super().__init__(detail)
+
+
+def unpicklable_error_parser(source):
+    raise UnpicklableError('x', 'lost in transit')
+
+
+def sleeping_parser(source):
+    time.sleep(30)
+
+
+def hungry_parser(source):
+    return bytearray(512 * 1024 * 1024)
+
+
+def finish_echo(job, *, label):
+    try:
+        value = job.result()
+    except ValueError as exc:
+        return 400, {'error': str(exc)}
+    return 201, {'label': label, 'text': value['text']}
+
+
+class ParsePoolTestMixin:
+    def setUp(self):
+        super().setUp()
+        if multiprocessing.current_process().daemon:
+            self.skipTest('--parallel test workers are daemonic and cannot start parse jobs.')
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        root_settings = override_settings(PARSE_POOL_ENABLED=True, PARSE_POOL_ROOT=self.root.name)
+        root_settings.enable()
+        self.addCleanup(root_settings.disable)
+        # Each test sizes its own pool from the settings it overrides.
+        pool_patch = mock.patch.object(parse_pool, '_pool', None)
+        pool_patch.start()
+        self.addCleanup(pool_patch.stop)
+
+
+class ParsePoolTests(ParsePoolTestMixin, SimpleTestCase):
+    def test_parser_runs_in_a_child_process_on_the_spooled_upload(self):
+        upload = SimpleUploadedFile('plan.csv', b'a,b\n1,2\n')
+
+        result = run_parse_job('config.test_parse_pool.echo_parser', upload, suffix='!')
+
+        self.assertNotEqual(result['pid'], os.getpid())
+        self.assertEqual(result['text'], 'a,b\n1,2\n!')
+        self.assertEqual(os.listdir(self.root.name), [])
+
+    @override_settings(PARSE_POOL_ENABLED=False)
+    def test_disabled_pool_parses_inline(self):
+        result = run_parse_job('config.test_parse_pool.echo_parser', BytesIO(b'inline'))
+
+        self.assertEqual(result, {'pid': os.getpid(), 'text': 'inline'})
+
+    def test_daemonic_processes_parse_inline(self):
+        with mock.patch.object(parse_pool.multiprocessing, 'current_process', return_value=mock.Mock(daemon=True)):
+            result = run_parse_job('config.test_parse_pool.echo_parser', BytesIO(b'inline'))
+
+        self.assertEqual(result, {'pid': os.getpid(), 'text': 'inline'})
+
+    def test_parser_exceptions_are_reraised_in_the_caller(self):
+        with self.assertRaisesMessage(ValueError, 'row 3: bad quantity'):
+            run_parse_job('config.test_parse_pool.failing_parser', BytesIO(b''))
+
+        with self.assertRaises(ParseJobError) as raised:
+            run_parse_job('config.test_parse_pool.unpicklable_error_parser', BytesIO(b''))
+        self.assertEqual(raised.exception.code, 'parse_failed')
+        self.assertIn('UnpicklableError: lost in transit', raised.exception.message)
+
+    @override_settings(PARSE_POOL_MAX_WORKERS=1, PARSE_POOL_MAX_QUEUED=0, PARSE_POOL_JOB_TIMEOUT_SECONDS=1)
+    def test_time_limit_kills_the_job_and_a_full_pool_rejects_submissions(self):
+        started = time.monotonic()
+        job = submit_parse_job('config.test_parse_pool.sleeping_parser', BytesIO(b''))
+
+        with self.assertRaises(ParsePoolBusy) as raised:
+            submit_parse_job('config.test_parse_pool.echo_parser', BytesIO(b''))
+        response = parse_job_error_response(raised.exception)
+        self.assertEqual((response.status_code, response['Retry-After']), (503, '5'))
+
+        with self.assertRaises(ParseJobError) as raised:
+            job.wait(timeout=20).result()
+        self.assertEqual((raised.exception.code, raised.exception.http_status), ('parse_time_limit', 413))
+        self.assertLess(time.monotonic() - started, 15)
+        self.assertEqual(job.describe()['error']['code'], 'parse_time_limit')
+
+        self.assertEqual(run_parse_job('config.test_parse_pool.echo_parser', BytesIO(b'ok'))['text'], 'ok')
+
+    @override_settings(PARSE_POOL_JOB_MEMORY_MB=64)
+    def test_memory_limit_fails_the_job(self):
+        with self.assertRaises(ParseJobError) as raised:
+            run_parse_job('config.test_parse_pool.hungry_parser', BytesIO(b''))
+
+        self.assertEqual((raised.exception.code, raised.exception.http_status), ('parse_memory_limit', 413))
+
+    def test_jobs_left_queued_by_a_stopped_web_process_are_reported_lost(self):
+        # The web process stops before a pool thread picks the job up.
+        with mock.patch.object(parse_pool.ThreadPoolExecutor, 'submit'):
+            job = submit_parse_job('config.test_parse_pool.echo_parser', BytesIO(b''))
+        self.assertEqual(job.status, 'queued')
+        self.assertGreater(job.state()['deadline'], time.time())
+
+        job._update(deadline=time.time() - parse_pool.LOST_JOB_GRACE_SECONDS - 1)
+
+        self.assertEqual((job.status, job.describe()['error']['code']), ('failed', 'parse_worker_lost'))
+
+    def test_unknown_job_ids_are_not_found(self):
+        for job_id in ('0' * 32, '../etc', 'not-a-job'):
+            with self.subTest(job_id), self.assertRaises(ParseJobError) as raised:
+                get_parse_job(job_id)
+            self.assertEqual(raised.exception.http_status, 404)
+
+
+class ParseJobPollingTests(ParsePoolTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = get_user_model().objects.create_user(username='uploader', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def poll(self, job, client=None):
+        for _ in range(100):
+            response = (client or self.client).get(f'/api/parse-jobs/{job.id}/')
+            if response.status_code != 200 or response.data['status'] in {'completed', 'failed'}:
+                return response
+            time.sleep(0.1)
+        self.fail('parse job did not finish')
+
+    def test_finish_step_runs_once_parsing_ends_and_polls_only_read_it(self):
+        job = submit_parse_job(
+            'config.test_parse_pool.echo_parser',
+            BytesIO(b'rows'),
+            owner=self.owner,
+            finish='config.test_parse_pool.finish_echo',
+            finish_params={'label': 'plan'},
+        ).wait()
+
+        self.assertEqual(job.outcome(), (201, {'label': 'plan', 'text': 'rows'}))
+        with mock.patch.object(parse_pool, 'import_string', side_effect=AssertionError('finished twice')):
+            response = self.poll(job)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual((response.data['http_status'], response.data['result']), (201, {'label': 'plan', 'text': 'rows'}))
+
+    def test_parse_errors_go_through_the_finish_step(self):
+        job = submit_parse_job(
+            'config.test_parse_pool.failing_parser',
+            BytesIO(b''),
+            owner=self.owner,
+            finish='config.test_parse_pool.finish_echo',
+            finish_params={'label': 'plan'},
+        )
+
+        response = self.poll(job)
+
+        self.assertEqual((response.data['http_status'], response.data['result']), (400, {'error': 'row 3: bad quantity'}))
+
+    def test_other_users_cannot_poll_a_job(self):
+        job = submit_parse_job('config.test_parse_pool.echo_parser', BytesIO(b''), owner=self.owner).wait()
+        other = APIClient()
+        other.force_authenticate(get_user_model().objects.create_user(username='other', password='pw'))
+
+        self.assertEqual(self.poll(job, other).status_code, 404)
@@ -25,6 +25,7 @@ api_urlpatterns = [
     path('api/production/', include('production.urls')),
     path('api/ai/', include('ai_core.urls')),
     path('api/analytics/', include('analytics.urls')),
+    path('api/parse-jobs/<str:job_id>/', views.ParseJobDetailView.as_view(), name='parse-job-detail'),
     path('api/health/', views.health_check, name='health_check'),
     path('api/health', views.health_check, name='health_check_no_slash'),
     path('api/signup-request/', SignupRequestView.as_view(), name='signup_request'),
@@ -4,6 +4,12 @@ Health check and utility views
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .parse_pool import ParseJobError, get_parse_job, parse_job_error_response
 
 
 @csrf_exempt
@@ -17,3 +23,21 @@ def health_check(request):
         "status": "healthy",
         "service": "wj_reporting_backend",
     })
+
+
+class ParseJobDetailView(APIView):
+    """Poll an upload submitted with ``?async=1``."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        try:
+            job = get_parse_job(job_id)
+            if not job.visible_to(request.user):
+                return Response(
+                    {'code': 'parse_job_not_found', 'error': 'Parse job not found.'},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            return Response(job.describe())
+        except ParseJobError as exc:
+            return parse_job_error_response(exc)
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import (
+    MonitoringSnapshotRun,
     MouldDataSnapshot,
     MouldUsageConfirmation,
     UserRegistrationRequest,
@@ -70,6 +71,27 @@ class MouldDataSnapshotAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(MonitoringSnapshotRun)
+class MonitoringSnapshotRunAdmin(admin.ModelAdmin):
+    list_display = [
+        'started_at', 'status', 'duration_ms', 'mes_call_count', 'records_written',
+        'devices_failed', 'coalesced_runs', 'trigger',
+    ]
+    list_filter = ['status', 'trigger', 'started_at']
+    date_hierarchy = 'started_at'
+    readonly_fields = [
+        'started_at', 'finished_at', 'target_timestamp', 'trigger', 'status', 'duration_ms',
+        'stage_ms', 'mes_call_count', 'devices_failed', 'records_written', 'rollup_rows',
+        'compacted_rows', 'coalesced_runs', 'error',
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(MouldUsageConfirmation)
 class MouldUsageConfirmationAdmin(admin.ModelAdmin):
     list_display = [
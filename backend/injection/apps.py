@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class InjectionConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'injection'
\ No newline at end of file
+    name = 'injection'
+
+    def ready(self):
+        from . import signals  # noqa: F401
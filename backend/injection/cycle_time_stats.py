@@ -0,0 +1,100 @@
+"""Cycle-time statistics shared by the report, part spec and setup endpoints.
+
+Every answer is a single aggregate query.  Report lookups match on the first
+nine characters of the Part No. (the family prefix) and are served by
+``inj_report_part_date_idx`` on ``(part_no, date)``.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from django.db.models import Avg, Count, F, Sum
+from django.db.models.functions import Length, Substr
+from django.utils import timezone
+
+from .models import CycleTimeSetup, InjectionReport, PartSpec
+
+PART_PREFIX_LENGTH = 9
+CYCLE_TIME_WINDOW_DAYS = 30
+# 불량률 10% 이하 보고서만 양품 기준 평균에 포함
+GOOD_REPORT_MAX_DEFECT_RATIO = 0.1
+CYCLE_TIME_CALCULATION_METHOD = 'operation_time / actual_qty'
+
+
+def part_prefix(part_no: str | None) -> str:
+    return (part_no or '').strip().upper()[:PART_PREFIX_LENGTH]
+
+
+def report_cycle_time_stats(
+    part_no: str,
+    *,
+    machine_no: int | None = None,
+    days: int = CYCLE_TIME_WINDOW_DAYS,
+    today: date | None = None,
+) -> dict[str, Any]:
+    """양품기준 평균 사이클 타임(초) = 총 가동시간(분) / 총 생산량 * 60."""
+
+    since = (today or timezone.now().date()) - timedelta(days=days)
+    reports = InjectionReport.objects.filter(
+        part_no__startswith=part_prefix(part_no),
+        date__gte=since,
+        actual_qty__gt=0,
+        actual_defect__lte=F('actual_qty') * GOOD_REPORT_MAX_DEFECT_RATIO,
+    )
+    if machine_no is not None:
+        reports = reports.filter(machine_no=machine_no)
+
+    totals = reports.aggregate(
+        sample_count=Count('id'),
+        total_operation_time=Sum(F('total_time') - F('idle_time')),
+        total_production=Sum('actual_qty'),
+    )
+    total_production = totals['total_production'] or 0
+    avg_cycle_time = (
+        round((totals['total_operation_time'] / total_production) * 60, 1)
+        if total_production else None
+    )
+    return {
+        'avg_cycle_time': avg_cycle_time,
+        'sample_count': totals['sample_count'],
+        'total_operation_time': totals['total_operation_time'] or 0,
+        'total_production': total_production,
+    }
+
+
+def resolve_standard_cycle_time(part_no: str) -> tuple[int | None, str | None]:
+    """표준 사이클 타임과 출처: 최신 PartSpec → 최근 승인된 셋업 평균 → 없음."""
+
+    spec_cycle_time = (
+        PartSpec.objects.filter(part_no=part_no)
+        .order_by('-valid_from')
+        .values_list('cycle_time_sec', flat=True)
+        .first()
+    )
+    if spec_cycle_time:
+        return spec_cycle_time, 'spec'
+
+    setup_cycle_time = (
+        CycleTimeSetup.objects.filter(part_no=part_no, status='APPROVED', mean_cycle_time__isnull=False)
+        .order_by('-approved_at')
+        .values_list('mean_cycle_time', flat=True)
+        .first()
+    )
+    if setup_cycle_time is not None:
+        return setup_cycle_time, 'setup'
+    return None, None
+
+
+def setup_target_cycle_time_by_prefix(setups) -> dict[str, int]:
+    """셋업 queryset 의 Part No. 앞 9자리별 평균 target_cycle_time (반올림)."""
+
+    rows = (
+        setups.order_by()
+        .annotate(part_length=Length('part_no'), prefix=Substr('part_no', 1, PART_PREFIX_LENGTH))
+        .filter(part_length__gte=PART_PREFIX_LENGTH)
+        .values('prefix')
+        .annotate(avg_ct=Avg('target_cycle_time'))
+    )
+    return {row['prefix']: round(row['avg_ct']) for row in rows if row['avg_ct']}
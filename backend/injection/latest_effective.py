@@ -0,0 +1,198 @@
+"""Latest-effective PartSpec and CycleTimeSetup rows per key.
+
+Screens that only need the current spec of a part (or the current setup of a
+machine/part pair) used to read every historical row and keep the first one
+in Python.  These lookups let the database pick one row per key: ``DISTINCT
+ON`` on PostgreSQL and a ``ROW_NUMBER()`` window elsewhere.
+
+Results are memoised in a small per-process LRU whose key includes a table
+version.  The version lives in the Django cache so every worker sees a write
+(without a readable version the LRU is bypassed):
+``post_save``/``post_delete`` receivers bump it, and writers that bypass
+signals (``bulk_create``) call ``bump_part_spec_version`` /
+``bump_cycle_time_setup_version`` themselves.  Returned rows are plain dicts
+shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Iterable
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .models import CycleTimeSetup, PartSpec
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_PREFIX = 'injection:latest-effective'
+PART_SPEC_VERSION_KEY = f'{VERSION_CACHE_PREFIX}:part-spec-version'
+CYCLE_TIME_SETUP_VERSION_KEY = f'{VERSION_CACHE_PREFIX}:cycle-time-setup-version'
+LATEST_EFFECTIVE_LRU_SIZE = 256
+
+PART_SPEC_FIELDS = ('id', 'part_no', 'model_code', 'description', 'valid_from', 'cycle_time_sec', 'cavity')
+CYCLE_TIME_SETUP_FIELDS = (
+    'id',
+    'machine_no',
+    'part_no',
+    'setup_date',
+    'status',
+    'target_cycle_time',
+    'standard_cycle_time',
+    'mean_cycle_time',
+    'personnel_count',
+)
+
+
+class _LRU:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_lookups = _LRU(LATEST_EFFECTIVE_LRU_SIZE)
+
+
+def clear_latest_effective_cache() -> None:
+    _lookups.clear()
+
+
+def table_versions(extra_keys: Iterable[str] = ()) -> dict[str, str]:
+    """Current ``{cache key: version}`` for both tables in one cache read.
+
+    Callers that key their own caches on further revisions kept in the Django
+    cache pass them as ``extra_keys`` to read everything at once.
+    """
+
+    keys = (PART_SPEC_VERSION_KEY, CYCLE_TIME_SETUP_VERSION_KEY, *extra_keys)
+    try:
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                cache.add(key, uuid.uuid4().hex, None)
+                versions[key] = cache.get(key)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        versions = {}
+    return {key: str(versions.get(key) or '') for key in keys}
+
+
+def _bump(key: str) -> None:
+    def _set_new_version():
+        try:
+            cache.set(key, uuid.uuid4().hex, None)
+        except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+            logger.warning('Failed to bump %s', key, exc_info=True)
+
+    # Bump after commit so a concurrent reader cannot cache the old rows under
+    # the new version.
+    transaction.on_commit(_set_new_version)
+
+
+def bump_part_spec_version() -> None:
+    _bump(PART_SPEC_VERSION_KEY)
+
+
+def bump_cycle_time_setup_version() -> None:
+    _bump(CYCLE_TIME_SETUP_VERSION_KEY)
+
+
+def _latest_per_key(queryset, key_fields: tuple[str, ...], order_by: tuple[str, ...], fields: tuple[str, ...]):
+    if connection.vendor == 'postgresql':
+        return queryset.order_by(*key_fields, *order_by).distinct(*key_fields).values(*fields)
+    window_order = [F(name[1:]).desc() if name.startswith('-') else F(name).asc() for name in order_by]
+    return (
+        queryset.annotate(
+            effective_rank=Window(
+                RowNumber(),
+                partition_by=[F(name) for name in key_fields],
+                order_by=window_order,
+            )
+        )
+        .filter(effective_rank=1)
+        .values(*fields)
+    )
+
+
+def _normalize_part_nos(part_nos: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sorted({str(part_no).strip().upper() for part_no in part_nos if part_no}))
+
+
+def latest_part_specs(part_nos: Iterable[str], *, versions: dict[str, str] | None = None) -> dict[str, dict[str, Any]]:
+    """``{part_no: spec}`` for the PartSpec with the latest ``valid_from``."""
+
+    part_nos = _normalize_part_nos(part_nos)
+    if not part_nos:
+        return {}
+    versions = versions if versions is not None else table_versions()
+    version = versions.get(PART_SPEC_VERSION_KEY, '')
+    lru_key = ('part_spec', version, part_nos)
+    cached = _lookups.get(lru_key) if version else None
+    if cached is not None:
+        return cached
+
+    rows = _latest_per_key(
+        PartSpec.objects.filter(part_no__in=part_nos),
+        key_fields=('part_no',),
+        order_by=('-valid_from', '-id'),
+        fields=PART_SPEC_FIELDS,
+    )
+    result = {row['part_no']: row for row in rows}
+    if version:
+        _lookups.set(lru_key, result)
+    return result
+
+
+def latest_cycle_time_setups(
+    machine_nos: Iterable[int],
+    part_nos: Iterable[str],
+    *,
+    versions: dict[str, str] | None = None,
+) -> dict[tuple[int, str], dict[str, Any]]:
+    """``{(machine_no, part_no): setup}`` for the newest setup that was not rejected."""
+
+    machine_nos = tuple(sorted({int(number) for number in machine_nos}))
+    part_nos = _normalize_part_nos(part_nos)
+    if not machine_nos or not part_nos:
+        return {}
+    versions = versions if versions is not None else table_versions()
+    version = versions.get(CYCLE_TIME_SETUP_VERSION_KEY, '')
+    lru_key = ('cycle_time_setup', version, machine_nos, part_nos)
+    cached = _lookups.get(lru_key) if version else None
+    if cached is not None:
+        return cached
+
+    rows = _latest_per_key(
+        CycleTimeSetup.objects.filter(machine_no__in=machine_nos, part_no__in=part_nos).exclude(status='REJECTED'),
+        key_fields=('machine_no', 'part_no'),
+        order_by=('-setup_date', '-id'),
+        fields=CYCLE_TIME_SETUP_FIELDS,
+    )
+    result = {(row['machine_no'], row['part_no']): row for row in rows}
+    if version:
+        _lookups.set(lru_key, result)
+    return result
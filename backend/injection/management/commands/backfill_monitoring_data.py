@@ -6,6 +6,7 @@ import pytz
 import logging
 
 # Django 설정이 로드된 후에 모델과 서비스를 임포트합니다.
+from analytics.partitions import mark_monitoring_dirty
 from injection.models import InjectionMonitoringRecord
 from injection.mes_service import mes_service
 
@@ -132,6 +133,7 @@ class Command(BaseCommand):
                         'power_kwh': latest_record_data.get('power'),
                     }
                 )
+                mark_monitoring_dirty([(machine_name, target_timestamp)], reason='monitoring_backfill')
                 self.stdout.write(self.style.SUCCESS(f'  Successfully saved snapshot for machine {machine_num}.'))
 
             except Exception as e:
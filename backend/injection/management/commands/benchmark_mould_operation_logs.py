@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from injection import mould_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the mould detail operation-log step cold and warm against a simulated "
+        "BLACKLAKE with a fixed per-call latency, in a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logs", type=int, default=mould_service.MAX_LOG_DETAILS)
+        parser.add_argument("--latency-ms", type=float, default=150.0, help="Simulated MES round trip.")
+
+    def handle(self, *args, **options):
+        log_count = max(1, min(options["logs"], mould_service.MAX_LOG_DETAILS))
+        latency = max(0.0, options["latency_ms"]) / 1000
+        instance_code = f"BENCH-{time.time_ns()}"
+
+        def simulated_blacklake(endpoint, body):
+            time.sleep(latency)
+            if endpoint == mould_service.OPERATION_LOG_LIST_ENDPOINT:
+                return {
+                    "code": 200,
+                    "data": {
+                        "list": [
+                            {"logId": f"{instance_code}-{index}", "operationTime": 1_767_225_600_000 + index}
+                            for index in range(log_count)
+                        ]
+                    },
+                }
+            return {"code": 200, "data": {"detailFields": [{"fieldName": "当前位置", "fieldValue": "#1-850T"}]}}
+
+        with transaction.atomic(), patch.object(mould_service, "_post_blacklake", side_effect=simulated_blacklake):
+            for label in ("cold", "warm"):
+                stats: dict = {}
+                started = time.perf_counter()
+                mould_service._fetch_operation_logs(instance_code, stats)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self.stdout.write(
+                    f"{label:<5} logs={log_count} duration_ms={elapsed_ms:.1f} mes_calls={stats['mes_calls']} "
+                    f"detail_cache_hits={stats['detail_cache_hits']} detail_fetches={stats['detail_fetches']}"
+                )
+            # The simulated details must not land in the shared cache.
+            transaction.set_rollback(True)
+        serial_ms = (log_count + 1) * latency * 1000
+        self.stdout.write(self.style.SUCCESS(
+            f"Benchmark finished; serial detail fetching would take ~{serial_ms:.0f} ms cold and warm."
+        ))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from assembly.models import AssemblyReport
+from injection.models import InjectionReport, PartCatalogEntry, PartSpec
+from injection.part_catalog import rebuild_part_catalog, search_part_catalog
+
+
+def seed_part_sources(count: int, *, report_share: float = 0.2) -> None:
+    """Create sources for roughly ``count`` catalog rows.
+
+    Most rows are PartSpec versions; ``report_share`` of them are parts that
+    only appear in assembly or injection reports.
+    """
+
+    report_parts = int(count * report_share)
+    spec_parts = max(1, count - report_parts)
+    PartSpec.objects.bulk_create(
+        [
+            PartSpec(
+                part_no=f"BENCH{index:07d}",
+                model_code=f"MODEL{index % 400:03d}",
+                description=f"COVER ASSY {index % 97}",
+                valid_from=date(2025, 1 + index % 12, 1),
+            )
+            for index in range(spec_parts)
+        ],
+        batch_size=2000,
+    )
+    today = date.today()
+    AssemblyReport.objects.bulk_create(
+        [
+            AssemblyReport(date=today, part_no=f"ASSY{index:07d}", model=f"MODEL{index % 400:03d}", plan_qty=1, actual_qty=1)
+            for index in range(report_parts // 2)
+        ],
+        batch_size=2000,
+    )
+    InjectionReport.objects.bulk_create(
+        [
+            InjectionReport(
+                date=today,
+                tonnage="850T",
+                model=f"MODEL{index % 400:03d}",
+                section="C/A",
+                plan_qty=1,
+                actual_qty=1,
+                reported_defect=0,
+                actual_defect=0,
+                part_no=f"INJ{index:07d}",
+            )
+            for index in range(report_parts - report_parts // 2)
+        ],
+        batch_size=2000,
+    )
+
+
+class Command(BaseCommand):
+    help = "Seed a synthetic part catalog in a rolled-back transaction and time picker searches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5, help="Searches per scenario.")
+
+    def _time_search(self, repeat: int, **kwargs) -> tuple[float, int, int]:
+        timings = []
+        for _ in range(max(1, repeat)):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                total, _rows = search_part_catalog(**kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+        return sorted(timings)[len(timings) // 2], len(queries.captured_queries), total
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            seed_part_sources(max(1, options["rows"]))
+
+            started = time.perf_counter()
+            rebuild_part_catalog()
+            rebuild_ms = (time.perf_counter() - started) * 1000
+            self.stdout.write(
+                f"catalog_rows={PartCatalogEntry.objects.count()} rebuild_ms={rebuild_ms:.1f} (one-off backfill)"
+            )
+
+            scenarios = {
+                "no search page 1": {},
+                "no search page 500": {"page": 500},
+                "part prefix": {"search": "BENCH00012"},
+                "model keystroke": {"search": "model12"},
+                "report-only part": {"search": "INJ0000123"},
+                "model_code filter": {"model_code": "MODEL007"},
+                "miss": {"search": "NOPE"},
+            }
+            for label, kwargs in scenarios.items():
+                median_ms, query_count, matched = self._time_search(options["repeat"], **kwargs)
+                self.stdout.write(f"{label:<20} median_ms={median_ms:.1f} queries={query_count} count={matched}")
+            # Nothing seeded here may outlive the benchmark.
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Benchmark finished; seeded parts were rolled back."))
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from injection.models import PartSpec
+from injection.part_catalog import rebuild_part_catalog
+from injection.partspec_import import (
+    COL_MAP,
+    IMPORT_BATCH_SIZE,
+    apply_partspec_diff,
+    diff_partspecs,
+    normalize_partspec_frame,
+)
+
+WORKBOOK_COLUMNS = {field: column for column, field in COL_MAP.items()}
+
+
+def synthetic_workbook(rows: int, *, seed: int = 7) -> pd.DataFrame:
+    """A c_table-shaped frame with workbook column names and ``rows`` spec versions."""
+
+    rng = np.random.default_rng(seed)
+    index = np.arange(rows)
+    frame = pd.DataFrame({
+        'model_code': [f'mnt {value}' for value in index % 400],
+        'part_no': [f'BENCH{value:07d}' for value in index // 2],
+        'valid_from': pd.to_datetime('2024-01-01') + pd.to_timedelta((index % 2) * 180, unit='D'),
+        'description': [f'COVER ASSY {value}' for value in index % 97],
+        'mold_type': 'T1',
+        'color': 'BLACK',
+        'resin_type': 'ABS',
+        'resin_code': 'R-1',
+        'net_weight_g': rng.uniform(1, 500, rows).round(3),
+        'sr_weight_g': rng.uniform(0, 50, rows).round(3),
+        'tonnage': rng.choice([350, 550, 850, 1300], rows).astype(float),
+        'cycle_time_sec': rng.integers(20, 90, rows).astype(float),
+        'efficiency_rate': rng.uniform(80, 100, rows).round(1),
+        'cavity': rng.integers(1, 4, rows).astype(float),
+        'resin_loss_pct': rng.uniform(0, 5, rows).round(2),
+        'defect_rate_pct': np.where(index % 5 == 0, np.nan, rng.uniform(0, 3, rows).round(2)),
+    })
+    return frame.rename(columns=WORKBOOK_COLUMNS)
+
+
+def legacy_import(workbook: pd.DataFrame) -> None:
+    """The previous delete-everything, iterrows, unbatched bulk_create path."""
+
+    merged = workbook.rename(columns=COL_MAP).dropna(subset=['part_no']).fillna({})
+    PartSpec.objects.all().delete()
+    objs = [PartSpec(**row.dropna().to_dict()) for _, row in merged.iterrows()]
+    PartSpec.objects.bulk_create(objs)
+    rebuild_part_catalog()
+
+
+class Command(BaseCommand):
+    help = "Time the PartSpec workbook import (legacy reload vs diff upsert) in a rolled-back transaction."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=50_000)
+        parser.add_argument("--changed", type=float, default=0.02, help="Share of rows edited for the re-import.")
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+
+    def _timed(self, label: str, func, *args, **kwargs):
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.stdout.write(f"{label:<28} ms={(time.perf_counter() - started) * 1000:.1f}")
+        return result
+
+    def _diff_import(self, workbook: pd.DataFrame, batch_size: int) -> None:
+        frame, dropped = self._timed("  normalize", normalize_partspec_frame, workbook)
+        diff = self._timed("  diff", diff_partspecs, frame, dropped_rows=dropped)
+        summary = diff.summary(sample=0)
+        self.stdout.write(
+            f"  inserts={summary['inserts']} updates={summary['updates']} "
+            f"deletes={summary['deletes']} unchanged={summary['unchanged']}"
+        )
+        timings = apply_partspec_diff(diff, batch_size=batch_size)
+        if timings:
+            self.stdout.write("  " + " ".join(f"{name}={value:.1f}" for name, value in timings.items()))
+
+    def handle(self, *args, **options):
+        rows = max(2, options["rows"])
+        batch_size = max(1, options["batch_size"])
+        workbook = synthetic_workbook(rows)
+        edited = workbook.copy()
+        changed = edited.sample(frac=min(max(options["changed"], 0.0), 1.0), random_state=11).index
+        edited.loc[changed, 'C/T'] = edited.loc[changed, 'C/T'] + 1
+        edited = edited.drop(edited.index[-10:])
+
+        with transaction.atomic():
+            self.stdout.write(f"rows={rows} changed={len(changed)} removed=10 batch_size={batch_size}")
+            self._timed("legacy initial load", legacy_import, workbook)
+            self._timed("legacy re-import", legacy_import, edited)
+            transaction.set_rollback(True)
+
+        with transaction.atomic():
+            self._timed("diff initial load", self._diff_import, workbook, batch_size)
+            self._timed("diff re-import", self._diff_import, edited, batch_size)
+            self._timed("diff unchanged re-import", self._diff_import, edited, batch_size)
+            # Nothing seeded here may outlive the benchmark.
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Benchmark finished; imported specs were rolled back."))
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta
+from io import BytesIO
+
+import pandas as pd
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from openpyxl import Workbook
+
+from injection.plan_processing import SCHEMAS, ProductionPlanProcessor
+
+HEADERS = {
+    "injection": [
+        "設  備  ", "LOT NO", "MODEL ", "SPEC", "成品 P/N", "半成品 P/N", "原料", "COLOR",
+        "IN", "LOT", "END", "余  量",
+    ],
+    "machining": [
+        "設  備  ", "LOT NO", "MODEL ", "SUFFIX", "SPEC", "PART NO", "半成品 P/N", "原料",
+        "IN", "LOT", "余  量",
+    ],
+}
+TONNAGES = (350, 550, 850, 1300, 1600)
+SPECS = ("B/C 完", "C/A", "G/P 外框", "外框", "b/c", None)
+
+
+def _plan_qty(rng: random.Random):
+    roll = rng.random()
+    if roll < 0.45:
+        return None
+    if roll < 0.5:
+        return rng.choice(["试料", " 120 ", "0", "-", 0.4])
+    if roll < 0.6:
+        return rng.randint(1, 40) * 50 + 0.5
+    return rng.randint(1, 60) * 24
+
+
+def build_synthetic_plan_workbook(
+    plan_type: str = "injection",
+    *,
+    sheet_date: date = date(2026, 7, 16),
+    machines: int = 17,
+    days: int = 31,
+    lots_per_machine: int = 4,
+    seed: int = 0,
+) -> bytes:
+    """A plan workbook shaped like the monthly upload.
+
+    Each machine gets ``lots_per_machine`` plan rows (some lots repeat so they
+    aggregate) across ``days`` day columns that start at ``sheet_date`` and
+    roll over into the next month, plus a subtotal row the parser must skip.
+    Quantities mix blanks, integers, halves, zero and text markers.
+    """
+
+    if plan_type not in HEADERS:
+        raise ValueError(plan_type)
+    rng = random.Random(seed)
+    day_numbers = [(sheet_date + timedelta(days=offset)).day for offset in range(days)]
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = f"{sheet_date.month}-{sheet_date.day}"
+    sheet.append([])
+    sheet.append([])
+    sheet.append([*HEADERS[plan_type], *day_numbers])
+
+    for machine_index in range(machines):
+        if plan_type == "injection":
+            machine = f"{TONNAGES[machine_index % len(TONNAGES)]}T-{machine_index // len(TONNAGES) + 1}"
+        else:
+            machine = f"CNC-{machine_index + 1:02d}"
+        for lot_index in range(lots_per_machine):
+            repeat = lot_index and rng.random() < 0.2
+            lot_no = f"L{machine_index:02d}{(lot_index - 1 if repeat else lot_index):02d}"
+            if plan_type == "injection" and rng.random() < 0.1:
+                lot_no = None
+            model = rng.choice([f"MODEL-{machine_index % 6}", 21700 + machine_index % 3, " mnt27 ", None])
+            spec = rng.choice(SPECS)
+            delivery = rng.choice([datetime(2026, 8, 1 + lot_index % 27), "2026-08-15", None, " "])
+            identity = [
+                model,
+                spec,
+                f"FG-{machine_index:02d}{lot_index % 3}" if rng.random() < 0.8 else None,
+            ]
+            if plan_type == "machining":
+                identity.insert(2, rng.choice(["SPEC-A", None, "  "]))
+            meta = [
+                f"SG-{machine_index:02d}{lot_index % 3}",
+                rng.choice(["ABS", "PC+ABS", None]),
+            ]
+            if plan_type == "injection":
+                meta.append(rng.choice(["BLACK", "WHITE", None]))
+            quantities = [delivery, rng.randint(1, 20) * 500]
+            if plan_type == "injection":
+                quantities.append(rng.choice([0, 250.0, None]))
+            quantities.append(rng.randint(0, 20) * 250)
+            sheet.append([
+                machine, lot_no, *identity, *meta, *quantities,
+                *(_plan_qty(rng) for _ in day_numbers),
+            ])
+        sheet.append([
+            "合计", *([None] * (len(HEADERS[plan_type]) - 1)),
+            *(rng.randint(1, 9) * 1000 for _ in day_numbers),
+        ])
+
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def process_plan_workbook(content: bytes, plan_type: str, target_date: str) -> dict:
+    upload = SimpleUploadedFile(
+        "plan.xlsx",
+        content,
+        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+    return ProductionPlanProcessor(upload, plan_type, target_date).process()
+
+
+class Command(BaseCommand):
+    help = "Time ProductionPlanProcessor on synthetic monthly plan workbooks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--plan-type", default="injection", choices=sorted(SCHEMAS))
+        parser.add_argument("--machines", type=int, default=17)
+        parser.add_argument("--days", type=int, default=31)
+        parser.add_argument("--lots", type=int, default=4, help="Plan rows per machine.")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if options["machines"] < 1 or options["days"] < 1 or options["lots"] < 1:
+            raise CommandError("--machines, --days and --lots must be positive.")
+        content = build_synthetic_plan_workbook(
+            options["plan_type"],
+            machines=options["machines"],
+            days=options["days"],
+            lots_per_machine=options["lots"],
+        )
+        timings, read_timings = [], []
+        for _ in range(max(1, options["repeat"])):
+            started = time.perf_counter()
+            pd.ExcelFile(BytesIO(content)).parse(0, header=2)
+            read_timings.append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            result = process_plan_workbook(content, options["plan_type"], "2026-07-16")
+            timings.append((time.perf_counter() - started) * 1000)
+        read_ms = sorted(read_timings)[len(read_timings) // 2]
+        process_ms = sorted(timings)[len(timings) // 2]
+        self.stdout.write(
+            f"plan_type={options['plan_type']} machines={options['machines']} days={options['days']} "
+            f"lots={options['lots']} records={len(result['records'])} plan_long={len(result['plan_long'])}"
+        )
+        self.stdout.write(
+            f"process median_ms={process_ms:.1f} sheet_read median_ms={read_ms:.1f} "
+            f"transform ~ms={process_ms - read_ms:.1f}"
+        )
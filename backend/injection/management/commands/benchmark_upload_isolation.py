@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+
+from config.parse_pool import run_parse_job
+from injection.management.commands.benchmark_plan_processing import build_synthetic_plan_workbook
+
+PLAN_PARSER = 'injection.plan_processing.parse_plan_upload'
+DASHBOARD_URL = '/api/production/dashboard/?date=2026-07-16&plan_type=injection'
+
+
+def _percentile(values: list[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))] if ordered else 0.0
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure production dashboard latency while large plan workbooks are parsed, "
+        "inline in the request thread vs in the parse pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lots", type=int, default=40, help="Plan rows per machine (17 machines x 31 days).")
+        parser.add_argument("--uploads", type=int, default=3, help="Workbooks parsed back to back per mode.")
+        parser.add_argument("--pollers", type=int, default=4, help="Concurrent dashboard polling threads.")
+        parser.add_argument("--interval", type=float, default=0.1, help="Seconds between one poller's requests.")
+        parser.add_argument("--baseline-seconds", type=float, default=3.0)
+
+    def _poll(self, stop: threading.Event, latencies: list[float], failures: list[int]) -> None:
+        client = Client(HTTP_HOST="localhost")
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                response = client.get(DASHBOARD_URL)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    failures.append(response.status_code)
+                    return
+                stop.wait(self.interval)
+        finally:
+            connection.close()
+
+    def _measure(self, label: str, work) -> None:
+        stop = threading.Event()
+        latencies: list[float] = []
+        failures: list[int] = []
+        pollers = [
+            threading.Thread(target=self._poll, args=(stop, latencies, failures), daemon=True)
+            for _ in range(self.pollers)
+        ]
+        for thread in pollers:
+            thread.start()
+        upload_ms = work()
+        stop.set()
+        for thread in pollers:
+            thread.join()
+        if failures:
+            raise CommandError(f"dashboard answered {failures[0]}; is the database migrated?")
+        line = (
+            f"{label:<8} dashboard requests={len(latencies)} p50_ms={_percentile(latencies, 0.5):.1f} "
+            f"p95_ms={_percentile(latencies, 0.95):.1f} max_ms={max(latencies, default=0):.1f}"
+        )
+        if upload_ms:
+            line += f" upload_parse_median_ms={sorted(upload_ms)[len(upload_ms) // 2]:.1f}"
+        self.stdout.write(line)
+
+    def handle(self, *args, **options):
+        if options["lots"] < 1 or options["uploads"] < 1 or options["pollers"] < 1:
+            raise CommandError("--lots, --uploads and --pollers must be positive.")
+        self.pollers = options["pollers"]
+        self.interval = max(0.0, options["interval"])
+        content = build_synthetic_plan_workbook("injection", lots_per_machine=options["lots"])
+        self.stdout.write(
+            f"workbook_bytes={len(content)} lots={options['lots']} uploads={options['uploads']} pollers={self.pollers}"
+        )
+
+        def parse_uploads():
+            timings = []
+            for _ in range(options["uploads"]):
+                started = time.perf_counter()
+                run_parse_job(PLAN_PARSER, BytesIO(content), plan_type="injection", target_date="2026-07-16")
+                timings.append((time.perf_counter() - started) * 1000)
+            return timings
+
+        Client(HTTP_HOST="localhost").get(DASHBOARD_URL)
+        # Start the forkserver before timing so its one-off preload is not measured.
+        run_parse_job(PLAN_PARSER, BytesIO(content), plan_type="injection", target_date="2026-07-16")
+        self._measure("idle", lambda: time.sleep(options["baseline_seconds"]) or [])
+        with override_settings(PARSE_POOL_ENABLED=False):
+            self._measure("inline", parse_uploads)
+        with override_settings(PARSE_POOL_ENABLED=True):
+            self._measure("pool", parse_uploads)
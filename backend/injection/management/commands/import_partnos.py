@@ -1,5 +1,8 @@
 from django.core.management.base import BaseCommand, CommandError
+from injection.latest_effective import bump_part_spec_version
 from injection.models import PartSpec
+from injection.part_catalog import refresh_part_catalog
+from quality.classification_audit import mark_quality_report_audit_states_dirty
 import pandas as pd
 from pathlib import Path
 from datetime import date
@@ -64,4 +67,8 @@ class Command(BaseCommand):
         # 기존 동일 part_no & valid_from(today) 삭제 후 재적재
         PartSpec.objects.filter(part_no__in=[o.part_no for o in objs], valid_from=today).delete()
         PartSpec.objects.bulk_create(objs)
+        # bulk_create 는 signal 을 보내지 않으므로 품질 감사 상태를 직접 갱신 대상으로 표시
+        mark_quality_report_audit_states_dirty(part_nos=[o.part_no for o in objs])
+        refresh_part_catalog(o.part_no for o in objs)
+        bump_part_spec_version()
         self.stdout.write(self.style.SUCCESS(f"{len(objs)}개 PartSpec 저장 완료")) 
\ No newline at end of file
@@ -1,80 +1,68 @@
-from django.core.management.base import BaseCommand, CommandError
-from injection.models import PartSpec
-import pandas as pd
+import time
 from pathlib import Path
 
-COL_MAP = {
-    'Model': 'model_code',
-    'P/N': 'part_no',
-    'start date': 'valid_from',
-    'Desc': 'description',
-    'Mold Type': 'mold_type',
-    'Color': 'color',
-    'Resin(1)': 'resin_type',
-    'Resin(2)': 'resin_code',
-    'Net(g)': 'net_weight_g',
-    'S/R(g)': 'sr_weight_g',
-    'Ton': 'tonnage',
-    'C/T': 'cycle_time_sec',
-    '효율': 'efficiency_rate',
-    'Cavity': 'cavity',
-    'ResinLoss(%)': 'resin_loss_pct',
-    'Defect(%)': 'defect_rate_pct',
-}
+from django.core.management.base import BaseCommand, CommandError
+
+from injection.partspec_import import (
+    IMPORT_BATCH_SIZE,
+    SHEETS,
+    apply_partspec_diff,
+    diff_partspecs,
+    read_partspec_workbook,
+)
 
-SHEETS = ['MNT_modi', 'MNT_modi_2207']
 
 class Command(BaseCommand):
-    help = "c_table.xlsx 파일을 PartSpec 테이블로 불러옵니다."
+    help = "c_table.xlsx 파일과 PartSpec 테이블을 비교해 변경분만 반영합니다."
 
     def add_arguments(self, parser):
         parser.add_argument('excel_path', type=str, nargs='?', default='backend/data/c_table.xlsx', help='엑셀 파일 경로')
+        parser.add_argument('--dry-run', action='store_true', help='변경 내역만 출력하고 저장하지 않습니다.')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help='upsert/delete 배치 크기')
+
+    def _elapsed(self, started: float) -> float:
+        return (time.perf_counter() - started) * 1000
 
     def handle(self, *args, **options):
         excel_path = Path(options['excel_path'])
         if not excel_path.exists():
             raise CommandError(f"파일이 존재하지 않습니다: {excel_path}")
 
-        frames = []
-        for sheet in SHEETS:
-            try:
-                df = pd.read_excel(excel_path, sheet_name=sheet)
-            except ValueError:
-                self.stderr.write(f"시트 {sheet} 를 찾을 수 없습니다. 스킵합니다.")
-                continue
-            df = df.rename(columns=lambda c: COL_MAP.get(str(c).strip(), str(c).strip()))
-            # self.stdout.write is 디버깅용. 필요 시 주석 해제
-            df = df[[col for col in COL_MAP.values() if col in df.columns]]
-
-            # 데이터 타입 변환
-            if 'valid_from' in df.columns:
-                df['valid_from'] = pd.to_datetime(df['valid_from'], errors='coerce')
+        started = time.perf_counter()
+        frame, dropped, missing = read_partspec_workbook(excel_path)
+        read_ms = self._elapsed(started)
+        for sheet in missing:
+            self.stderr.write(f"시트 {sheet} 를 찾을 수 없습니다. 스킵합니다.")
+        if len(missing) == len(SHEETS):
+            raise CommandError('적재할 데이터가 없습니다.')
 
-            # 모델 코드 공백 제거 및 대문자 통일
-            if 'model_code' in df.columns:
-                df['model_code'] = (
-                    df['model_code']
-                    .astype(str)
-                    .str.replace(r"\s+", "", regex=True)
-                    .str.upper()
-                )
-            numeric_cols = [
-                'net_weight_g', 'sr_weight_g', 'tonnage', 'cycle_time_sec',
-                'efficiency_rate', 'cavity', 'resin_loss_pct', 'defect_rate_pct'
-            ]
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            frames.append(df)
+        started = time.perf_counter()
+        diff = diff_partspecs(frame, dropped_rows=dropped)
+        diff_ms = self._elapsed(started)
 
-        if not frames:
-            raise CommandError('적재할 데이터가 없습니다.')
+        summary = diff.summary()
+        self.stdout.write(
+            f"workbook_rows={len(frame)} inserts={summary['inserts']} updates={summary['updates']} "
+            f"deletes={summary['deletes']} unchanged={summary['unchanged']} dropped={summary['dropped_rows']}"
+        )
+        if summary['changed_fields']:
+            fields = ', '.join(f'{name}={count}' for name, count in summary['changed_fields'].items())
+            self.stdout.write(f"changed_fields: {fields}")
+        for kind, keys in summary['samples'].items():
+            if keys:
+                self.stdout.write(f"{kind}: {', '.join(keys)}")
+        timings = {'read_ms': read_ms, 'diff_ms': diff_ms}
 
-        merged = pd.concat(frames, ignore_index=True)
-        merged = merged.dropna(subset=['part_no']).fillna({})
+        if options['dry_run']:
+            self.stdout.write(' '.join(f'{name}={value:.1f}' for name, value in timings.items()))
+            self.stdout.write(self.style.WARNING('dry-run: 저장하지 않았습니다.'))
+            return
 
-        # 기존 데이터 삭제 후 재적재
-        PartSpec.objects.all().delete()
-        objs = [PartSpec(**row.dropna().to_dict()) for _, row in merged.iterrows()]
-        PartSpec.objects.bulk_create(objs)
-        self.stdout.write(self.style.SUCCESS(f"{len(objs)}개 PartSpec 저장 완료")) 
\ No newline at end of file
+        timings.update(apply_partspec_diff(diff, batch_size=max(1, options['batch_size'])))
+        self.stdout.write(' '.join(f'{name}={value:.1f}' for name, value in timings.items()))
+        if not diff.has_changes:
+            self.stdout.write(self.style.SUCCESS('변경 사항이 없습니다.'))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"PartSpec 반영 완료: 추가 {summary['inserts']}개, 수정 {summary['updates']}개, 삭제 {summary['deletes']}개"
+        ))
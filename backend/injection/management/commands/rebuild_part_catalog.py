@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from injection.part_catalog import rebuild_part_catalog, refresh_part_catalog
+
+
+class Command(BaseCommand):
+    help = "Rebuild the part picker catalog from PartSpec and production reports."
+
+    def add_arguments(self, parser):
+        parser.add_argument("part_nos", nargs="*", help="Only refresh these part numbers.")
+
+    def handle(self, *args, **options):
+        part_nos = options["part_nos"]
+        written = refresh_part_catalog(part_nos) if part_nos else rebuild_part_catalog()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} part catalog rows."))
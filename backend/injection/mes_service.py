@@ -9,14 +9,27 @@ import requests
 import pytz
 import logging
 from bisect import bisect_right
+from contextlib import nullcontext
 from typing import Any, List, Dict, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from django.core.cache import cache
 from django.db import connection
 from django.db.models import Q
 from django.db.models.functions import TruncHour
+from analytics.partitions import mark_monitoring_dirty
 from inventory.mes import get_access_token, MES_BASE_URL, MES_ROUTE_BASE
-from injection.models import InjectionMonitoringRecord, InjectionMonitoringRollup, adjust_monitoring_capacity
+from injection.models import (
+    InjectionMonitoringRecord,
+    InjectionMonitoringRollup,
+    MonitoringSnapshotRun,
+    adjust_monitoring_capacity,
+)
+from injection.snapshot_runs import (
+    SnapshotRunRecorder,
+    already_completed,
+    purge_snapshot_runs,
+    skipped_since_last_completion,
+)
 
 
 # BLACKLAKE API 鞐旊摐韽澑韸?
@@ -97,10 +110,12 @@ class MESResourceService:
         page: int = 1,
         size: int = 1000,
         param_types: Optional[List[int]] = [0],
-        max_total_records: int = 10000
+        max_total_records: int = 10000,
+        recorder: Optional[SnapshotRunRecorder] = None,
     ) -> Dict:
         """Fetch resource monitoring data from MES (merges paged results)."""
-        token = get_access_token()
+        with recorder.stage('token') if recorder else nullcontext():
+            token = get_access_token()
         url = f"{self.base_url}{self.endpoint}?access_token={token}"
 
         if not end_time:
@@ -142,10 +157,14 @@ class MESResourceService:
             for _ in range(100):  # Max 100 pages
                 body_page = {**body, 'page': current_page}
                 response = requests.post(url, json=body_page, timeout=30)
+                if recorder:
+                    recorder.count('mes_call_count')
                 if response.status_code == 401:
                     token = get_access_token(force_refresh=True)
                     url_retry = f"{self.base_url}{self.endpoint}?access_token={token}"
                     response = requests.post(url_retry, json=body_page, timeout=30)
+                    if recorder:
+                        recorder.count('mes_call_count')
 
                 response.raise_for_status()
                 result = response.json()
@@ -170,7 +189,8 @@ class MESResourceService:
             }
 
         try:
-            return fetch(request_body)
+            with recorder.stage('fetch') if recorder else nullcontext():
+                return fetch(request_body)
         except Exception as e:
             msg = str(e)
             # If MES rejects power code, retry once without it to keep prod/temp flowing.
@@ -183,7 +203,8 @@ class MESResourceService:
                     request_body["paramCodeList"] = codes
                 else:
                     request_body.pop("paramCodeList", None)
-                return fetch(request_body)
+                with recorder.stage('fetch') if recorder else nullcontext():
+                    return fetch(request_body)
 
             print(f"MES API error for device {device_code}: {msg}")
             raise
@@ -262,6 +283,10 @@ class MESResourceService:
         
         if records_to_create:
             InjectionMonitoringRecord.objects.bulk_create(records_to_create, ignore_conflicts=True)
+            mark_monitoring_dirty(
+                ((record.machine_name, record.timestamp) for record in records_to_create),
+                reason='mes_monitoring_backfill',
+            )
 
     def _build_time_slots(
         self,
@@ -668,6 +693,7 @@ class MESResourceService:
                         timestamp=target_ts.replace(microsecond=0),
                         defaults=defaults
                     )
+                    mark_monitoring_dirty([(defaults['machine_name'], target_ts)], reason='mes_snapshot')
                     print(f"  - Saved snapshot for {machine_num} at {target_ts}.")
 
                 except Exception as e:
@@ -881,6 +907,7 @@ class MESResourceService:
         self,
         target_timestamp: datetime,
         progress_callback: Optional[Callable[[int, int, datetime], None]] = None,
+        recorder: Optional[SnapshotRunRecorder] = None,
     ):
         """
         Helper function to fetch and save the snapshot for a single, specific hour.
@@ -913,7 +940,8 @@ class MESResourceService:
                     begin_time=search_start_time,
                     end_time=search_end_time,
                     size=100,
-                    max_total_records=500
+                    max_total_records=500,
+                    recorder=recorder,
                 )
 
                 data_list = raw_data.get('list', [])
@@ -954,28 +982,40 @@ class MESResourceService:
                 if latest_power is not None:
                     defaults['power_kwh'] = latest_power
 
-                InjectionMonitoringRecord.objects.update_or_create(
-                    device_code=device_code,
-                    timestamp=target_timestamp,
-                    defaults=defaults
-                )
+                with recorder.stage('write') if recorder else nullcontext():
+                    InjectionMonitoringRecord.objects.update_or_create(
+                        device_code=device_code,
+                        timestamp=target_timestamp,
+                        defaults=defaults
+                    )
+                    mark_monitoring_dirty([(machine_name, target_timestamp)], reason='mes_snapshot')
+                if recorder:
+                    recorder.count('records_written')
                 logger.info(f"鉁?Saved snapshot for machine {machine_num} at {target_timestamp.isoformat()}")
 
             except Exception as e:
+                if recorder:
+                    recorder.count('devices_failed')
                 logger.error(f"Failed to update snapshot for machine {machine_num}: {e}", exc_info=True)
             finally:
                 processed_machines += 1
                 if progress_callback:
                     progress_callback(processed_machines, total_machines, target_timestamp)
 
-    def update_hourly_snapshot_from_mes(self):
+    def update_hourly_snapshot_from_mes(self, trigger: str = 'beat'):
         """
         Fetch and store the latest interval snapshot.
+
+        Every execution is written to ``MonitoringSnapshotRun`` with stage
+        timings.  A run that cannot take the snapshot lock is logged as
+        ``skipped``; a run whose target minute was already completed (a
+        duplicate beat delivery) is logged as ``coalesced`` and does no work.
         """
         logger = logging.getLogger(__name__)
         cst = pytz.timezone('Asia/Shanghai')
         now = datetime.now(cst)
         target_timestamp = now.replace(second=0, microsecond=0)
+        recorder = SnapshotRunRecorder(trigger=trigger, target_timestamp=target_timestamp)
 
         logger.info(f"=== Interval snapshot update started at {now.isoformat()} ===")
         logger.info(f"Target timestamp: {target_timestamp.isoformat()}")
@@ -983,6 +1023,7 @@ class MESResourceService:
         lock_token = self._acquire_snapshot_update_lock(lock_timeout_seconds=300)
         if not lock_token:
             logger.warning("Snapshot update skipped because another run is still active.")
+            recorder.finish(MonitoringSnapshotRun.STATUS_SKIPPED, error='snapshot_update_already_running')
             return {
                 "status": "skipped",
                 "timestamp": now.isoformat(),
@@ -990,7 +1031,17 @@ class MESResourceService:
             }
 
         try:
-            self._update_single_hour_snapshot(target_timestamp)
+            if already_completed(target_timestamp):
+                logger.info("Snapshot for %s already completed; coalescing this run.", target_timestamp.isoformat())
+                recorder.finish(MonitoringSnapshotRun.STATUS_COALESCED)
+                return {
+                    "status": "skipped",
+                    "timestamp": now.isoformat(),
+                    "reason": "snapshot_already_completed"
+                }
+            recorder.coalesced_runs = skipped_since_last_completion()
+
+            self._update_single_hour_snapshot(target_timestamp, recorder=recorder)
 
             # Count successful records
             records_count = InjectionMonitoringRecord.objects.filter(timestamp=target_timestamp).count()
@@ -999,14 +1050,26 @@ class MESResourceService:
 
             rollup_start = target_timestamp - timedelta(minutes=60)
             rollup_end = target_timestamp + timedelta(minutes=1)
-            self.upsert_monitoring_rollups(rollup_start, rollup_end, bucket_minutes=5)
-            self.upsert_monitoring_rollups(rollup_start, rollup_end, bucket_minutes=30)
-            self.upsert_monitoring_rollups(rollup_start, rollup_end, bucket_minutes=60)
-            self.compact_monitoring_records(retention_hours=168, hours_to_compact=2)
-            return {"status": "completed", "timestamp": now.isoformat(), "records_saved": records_count}
+            with recorder.stage('rollup'):
+                for bucket_minutes in (5, 30, 60):
+                    recorder.count(
+                        'rollup_rows',
+                        self.upsert_monitoring_rollups(rollup_start, rollup_end, bucket_minutes=bucket_minutes),
+                    )
+            with recorder.stage('compaction'):
+                recorder.count('compacted_rows', self.compact_monitoring_records(retention_hours=168, hours_to_compact=2))
+            run = recorder.finish(MonitoringSnapshotRun.STATUS_COMPLETED)
+            purge_snapshot_runs()
+            return {
+                "status": "completed",
+                "timestamp": now.isoformat(),
+                "records_saved": records_count,
+                "duration_ms": run.duration_ms if run else None,
+            }
 
         except Exception as e:
             logger.error(f"=== Interval snapshot update failed ===", exc_info=True)
+            recorder.finish(MonitoringSnapshotRun.STATUS_FAILED, error=str(e))
             return {"status": "failed", "timestamp": now.isoformat(), "error": str(e)}
         finally:
             self._release_snapshot_update_lock(lock_token)
@@ -1115,12 +1178,14 @@ class MESResourceService:
         finally:
             self._release_snapshot_update_lock(lock_token)
 
-    def compact_monitoring_records(self, retention_hours: int = 168, hours_to_compact: int = 2) -> None:
+    def compact_monitoring_records(self, retention_hours: int = 168, hours_to_compact: int = 2) -> int:
         """
         Keep detailed snapshots for the last retention_hours and compact older data.
+
+        Returns the number of raw records deleted.
         """
         if hours_to_compact <= 0:
-            return
+            return 0
 
         logger = logging.getLogger(__name__)
         cst = pytz.timezone('Asia/Shanghai')
@@ -1134,7 +1199,7 @@ class MESResourceService:
             timestamp__lt=compact_before
         )
         if not candidates.exists():
-            return
+            return 0
 
         self.upsert_monitoring_rollups(compact_start, compact_before, bucket_minutes=5)
         self.upsert_monitoring_rollups(compact_start, compact_before, bucket_minutes=30)
@@ -1166,6 +1231,7 @@ class MESResourceService:
                 compact_before.isoformat(),
                 deleted_total
             )
+        return deleted_total
 
 
 # 靹滊箘鞀?鞚胳姢韯挫姢
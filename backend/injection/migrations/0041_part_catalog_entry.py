@@ -0,0 +1,132 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max
+
+TRIGRAM_INDEXES = (
+    ('part_catalog_search_trgm', 'search_text'),
+    ('part_catalog_model_trgm', 'UPPER(model_code)'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Portable databases keep the B-tree indexes declared on the model.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, expression in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON injection_partcatalogentry '
+            f'USING gin (({expression}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+BATCH_SIZE = 500
+# Frozen copies of injection.part_catalog.SOURCE_RANKS and catalog_search_text.
+SOURCE_RANKS = (
+    ('models', 0),
+    ('mes_report_assembly', 1),
+    ('mes_report_injection', 2),
+)
+
+
+def _search_text(*values):
+    return '\n'.join((value or '').strip() for value in values).casefold()
+
+
+def _latest_report_models(report_model, part_nos):
+    latest_ids = (
+        report_model.objects.filter(part_no__in=part_nos)
+        .values('part_no')
+        .annotate(latest_id=Max('id'))
+        .values('latest_id')
+    )
+    return dict(
+        report_model.objects.filter(id__in=latest_ids).values_list('part_no', 'model')
+    )
+
+
+def backfill_catalog(apps, schema_editor):
+    PartSpec = apps.get_model('injection', 'PartSpec')
+    AssemblyReport = apps.get_model('assembly', 'AssemblyReport')
+    InjectionReport = apps.get_model('injection', 'InjectionReport')
+    PartCatalogEntry = apps.get_model('injection', 'PartCatalogEntry')
+    (spec_source, spec_rank), *report_sources = SOURCE_RANKS
+
+    part_nos = set()
+    for model in (PartSpec, AssemblyReport, InjectionReport):
+        part_nos.update(model.objects.exclude(part_no='').values_list('part_no', flat=True).distinct())
+    part_nos = sorted({part_no.strip() for part_no in part_nos} - {''})
+
+    for offset in range(0, len(part_nos), BATCH_SIZE):
+        chunk = part_nos[offset:offset + BATCH_SIZE]
+        entries = []
+        covered = set()
+        for spec in PartSpec.objects.filter(part_no__in=chunk).order_by('part_no', '-valid_from'):
+            covered.add(spec.part_no)
+            entries.append(PartCatalogEntry(
+                source=spec_source,
+                rank=spec_rank,
+                part_spec_id=spec.pk,
+                part_no=spec.part_no,
+                model_code=spec.model_code or '',
+                description=spec.description or '',
+                valid_from=spec.valid_from,
+                search_text=_search_text(spec.part_no, spec.model_code, spec.description),
+            ))
+        for (source, rank), report_model in zip(report_sources, (AssemblyReport, InjectionReport)):
+            remaining = [part_no for part_no in chunk if part_no not in covered]
+            if not remaining:
+                break
+            for part_no, model in sorted(_latest_report_models(report_model, remaining).items()):
+                covered.add(part_no)
+                entries.append(PartCatalogEntry(
+                    source=source,
+                    rank=rank,
+                    part_no=part_no,
+                    model_code=(model or '')[:100],
+                    search_text=_search_text(part_no, model),
+                ))
+        PartCatalogEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assembly', '0010_defecthistory_delete_assemblypartspec_and_more'),
+        ('injection', '0040_userprofile_can_confirm_moulds_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartCatalogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('models', 'PartSpec'), ('mes_report_assembly', '가공 생산 기록'), ('mes_report_injection', '사출 생산 기록')], max_length=30, verbose_name='출처')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='출처 우선순위')),
+                ('part_no', models.CharField(max_length=100, verbose_name='Part No')),
+                ('model_code', models.CharField(blank=True, max_length=100, verbose_name='모델 코드')),
+                ('description', models.CharField(blank=True, max_length=200, verbose_name='설명')),
+                ('valid_from', models.DateField(blank=True, null=True, verbose_name='유효 시작일')),
+                ('search_text', models.TextField(blank=True, verbose_name='검색 키')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('part_spec', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='injection.partspec')),
+            ],
+            options={
+                'verbose_name': '품목 검색 카탈로그',
+                'verbose_name_plural': '품목 검색 카탈로그',
+                'ordering': ['rank', 'part_no', '-valid_from', 'id'],
+                'indexes': [models.Index(fields=['rank', 'part_no', '-valid_from'], name='part_catalog_order_idx'), models.Index(fields=['part_no'], name='part_catalog_part_no_idx')],
+            },
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+        migrations.RunPython(backfill_catalog, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('injection', '0041_part_catalog_entry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='injectionreport',
+            index=models.Index(fields=['part_no', 'date'], name='inj_report_part_date_idx', opclasses=['varchar_pattern_ops', 'date_ops']),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('injection', '0042_injection_report_part_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MouldOperationLogDetail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('log_id', models.CharField(max_length=64, unique=True, verbose_name='BLACKLAKE 로그 ID')),
+                ('content_hash', models.CharField(db_index=True, max_length=64, verbose_name='내용 해시')),
+                ('payload', models.JSONField(default=dict, verbose_name='로그 상세')),
+                ('fetched_at', models.DateTimeField(auto_now_add=True, verbose_name='수집 시각')),
+            ],
+            options={
+                'verbose_name': '금형 작업 로그 상세',
+                'verbose_name_plural': '금형 작업 로그 상세',
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-19 04:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('injection', '0043_mould_operation_log_detail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonitoringSnapshotRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField(db_index=True, verbose_name='시작 시각')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 시각')),
+                ('target_timestamp', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='대상 시각')),
+                ('trigger', models.CharField(default='beat', max_length=32, verbose_name='실행 경로')),
+                ('status', models.CharField(choices=[('completed', '완료'), ('failed', '실패'), ('skipped', '중복 실행 건너뜀'), ('coalesced', '이미 처리된 시각')], max_length=16, verbose_name='상태')),
+                ('duration_ms', models.PositiveIntegerField(default=0, verbose_name='소요 시간(ms)')),
+                ('stage_ms', models.JSONField(blank=True, default=dict, verbose_name='단계별 소요 시간(ms)')),
+                ('mes_call_count', models.PositiveIntegerField(default=0, verbose_name='MES 호출 수')),
+                ('devices_failed', models.PositiveIntegerField(default=0, verbose_name='실패 설비 수')),
+                ('records_written', models.PositiveIntegerField(default=0, verbose_name='저장 기록 수')),
+                ('rollup_rows', models.PositiveIntegerField(default=0, verbose_name='롤업 행 수')),
+                ('compacted_rows', models.PositiveIntegerField(default=0, verbose_name='압축 삭제 행 수')),
+                ('coalesced_runs', models.PositiveIntegerField(default=0, verbose_name='흡수한 건너뜀 실행 수')),
+                ('error', models.CharField(blank=True, max_length=500, verbose_name='오류')),
+            ],
+            options={
+                'verbose_name': '모니터링 스냅샷 실행 기록',
+                'verbose_name_plural': '모니터링 스냅샷 실행 기록',
+                'ordering': ['-started_at', '-id'],
+                'indexes': [models.Index(fields=['status', 'started_at'], name='inj_snap_run_status_idx')],
+            },
+        ),
+    ]
@@ -73,6 +73,15 @@ class InjectionReport(models.Model):
         verbose_name = '사출 보고서'
         verbose_name_plural = '사출 보고서 목록'
         ordering = ['-date', 'tonnage', 'model']
+        indexes = [
+            # part_no 앞 9자리(startswith) + 기간 조회용. PostgreSQL 에서 LIKE 'X%' 가
+            # 인덱스를 타도록 pattern opclass 를 지정 (다른 DB 에서는 무시됨)
+            models.Index(
+                fields=['part_no', 'date'],
+                name='inj_report_part_date_idx',
+                opclasses=['varchar_pattern_ops', 'date_ops'],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.date} - {self.tonnage} {self.model}"
@@ -173,6 +182,52 @@ class PartSpec(models.Model):
             self.part_no = self.part_no.upper()
         super().save(*args, **kwargs)
 
+
+class PartCatalogEntry(models.Model):
+    """품목 선택기 검색용 통합 카탈로그 (PartSpec + MES 생산 기록).
+
+    ``injection.part_catalog`` 가 원본 테이블에서 part_no 단위로 다시 만든다.
+    같은 part_no 는 우선순위가 가장 높은 출처에서만 노출된다.
+    """
+
+    SOURCE_MODELS = 'models'
+    SOURCE_ASSEMBLY_REPORT = 'mes_report_assembly'
+    SOURCE_INJECTION_REPORT = 'mes_report_injection'
+    SOURCE_CHOICES = [
+        (SOURCE_MODELS, 'PartSpec'),
+        (SOURCE_ASSEMBLY_REPORT, '가공 생산 기록'),
+        (SOURCE_INJECTION_REPORT, '사출 생산 기록'),
+    ]
+
+    source = models.CharField('출처', max_length=30, choices=SOURCE_CHOICES)
+    rank = models.PositiveSmallIntegerField('출처 우선순위')
+    part_spec = models.ForeignKey(
+        PartSpec,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    part_no = models.CharField('Part No', max_length=100)
+    model_code = models.CharField('모델 코드', max_length=100, blank=True)
+    description = models.CharField('설명', max_length=200, blank=True)
+    valid_from = models.DateField('유효 시작일', null=True, blank=True)
+    # part_no / model_code / description 을 소문자로 줄바꿈 연결한 검색 키
+    search_text = models.TextField('검색 키', blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '품목 검색 카탈로그'
+        verbose_name_plural = '품목 검색 카탈로그'
+        ordering = ['rank', 'part_no', '-valid_from', 'id']
+        indexes = [
+            models.Index(fields=['rank', 'part_no', '-valid_from'], name='part_catalog_order_idx'),
+            models.Index(fields=['part_no'], name='part_catalog_part_no_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.part_no} ({self.source})"
+
 # ================================
 # ECO 관리
 # ================================
@@ -522,6 +577,52 @@ class InjectionMonitoringRollup(models.Model):
         return f"{self.bucket_start.strftime('%Y-%m-%d %H:%M')} - {self.machine_name} ({self.bucket_minutes}m)"
 
 
+class MonitoringSnapshotRun(models.Model):
+    """One execution of the MES monitoring snapshot job, with stage timings.
+
+    ``stage_ms`` holds wall-clock milliseconds per stage (``token``,
+    ``fetch``, ``write``, ``rollup``, ``compaction``); runs that never got
+    the snapshot lock are kept as ``skipped`` so overlaps stay visible.
+    """
+
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_SKIPPED = 'skipped'
+    STATUS_COALESCED = 'coalesced'
+    STATUS_CHOICES = [
+        (STATUS_COMPLETED, '완료'),
+        (STATUS_FAILED, '실패'),
+        (STATUS_SKIPPED, '중복 실행 건너뜀'),
+        (STATUS_COALESCED, '이미 처리된 시각'),
+    ]
+
+    started_at = models.DateTimeField('시작 시각', db_index=True)
+    finished_at = models.DateTimeField('종료 시각', null=True, blank=True)
+    target_timestamp = models.DateTimeField('대상 시각', null=True, blank=True, db_index=True)
+    trigger = models.CharField('실행 경로', max_length=32, default='beat')
+    status = models.CharField('상태', max_length=16, choices=STATUS_CHOICES)
+    duration_ms = models.PositiveIntegerField('소요 시간(ms)', default=0)
+    stage_ms = models.JSONField('단계별 소요 시간(ms)', default=dict, blank=True)
+    mes_call_count = models.PositiveIntegerField('MES 호출 수', default=0)
+    devices_failed = models.PositiveIntegerField('실패 설비 수', default=0)
+    records_written = models.PositiveIntegerField('저장 기록 수', default=0)
+    rollup_rows = models.PositiveIntegerField('롤업 행 수', default=0)
+    compacted_rows = models.PositiveIntegerField('압축 삭제 행 수', default=0)
+    coalesced_runs = models.PositiveIntegerField('흡수한 건너뜀 실행 수', default=0)
+    error = models.CharField('오류', max_length=500, blank=True)
+
+    class Meta:
+        verbose_name = '모니터링 스냅샷 실행 기록'
+        verbose_name_plural = '모니터링 스냅샷 실행 기록'
+        ordering = ['-started_at', '-id']
+        indexes = [
+            models.Index(fields=['status', 'started_at'], name='inj_snap_run_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.started_at:%Y-%m-%d %H:%M:%S} {self.status} ({self.duration_ms} ms)"
+
+
 class MouldDataSnapshot(models.Model):
     """Persistent, public-safe BLACKLAKE mould payload cache."""
 
@@ -552,6 +653,22 @@ class MouldDataSnapshot(models.Model):
         return self.snapshot_key
 
 
+class MouldOperationLogDetail(models.Model):
+    """Immutable BLACKLAKE operation-log detail, fetched once per logId."""
+
+    log_id = models.CharField('BLACKLAKE 로그 ID', max_length=64, unique=True)
+    content_hash = models.CharField('내용 해시', max_length=64, db_index=True)
+    payload = models.JSONField('로그 상세', default=dict)
+    fetched_at = models.DateTimeField('수집 시각', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '금형 작업 로그 상세'
+        verbose_name_plural = '금형 작업 로그 상세'
+
+    def __str__(self):
+        return self.log_id
+
+
 class MouldUsageConfirmation(models.Model):
     """Auditable mould-department acknowledgement for a 100k-shot milestone."""
 
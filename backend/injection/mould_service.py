@@ -9,10 +9,13 @@ existing server-side MES token flow.
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import re
+import time
 from collections import Counter, defaultdict
 from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone as datetime_timezone
 from typing import Any
 from urllib.parse import quote
@@ -20,6 +23,7 @@ from zoneinfo import ZoneInfo
 
 import requests
 from django.core.cache import cache
+from django.db import connection
 
 from inventory.mes import (
     MES_BASE_URL,
@@ -28,6 +32,7 @@ from inventory.mes import (
     get_access_token,
 )
 
+from .models import MouldOperationLogDetail
 from .mould_events import (
     MACHINE_LOCATION_CODES,
     classify_location,
@@ -79,6 +84,7 @@ SHANGHAI = ZoneInfo("Asia/Shanghai")
 PAGE_SIZE = 200
 MAX_PAGES = 25
 MAX_LOG_DETAILS = 20
+MAX_LOG_DETAIL_WORKERS = 4
 METADATA_CACHE_KEY = "injection:moulds:MOLD001__c:metadata:v1"
 METADATA_CACHE_SECONDS = 60 * 60
 
@@ -1954,8 +1960,92 @@ def _log_time(record: Mapping[str, Any]) -> int | None:
     return None
 
 
-def _fetch_operation_logs(instance_code: str) -> tuple[list[dict[str, Any]], list[str]]:
-    warnings: list[str] = []
+def _operation_log_detail_request(log_id: str) -> dict[str, Any] | None:
+    try:
+        detail_payload = _post_blacklake(
+            OPERATION_LOG_DETAIL_ENDPOINT,
+            {"logId": int(log_id) if log_id.isdigit() else log_id},
+        )
+    finally:
+        # Runs on a pool thread, which opens its own DB connection when the
+        # token lookup touches the database cache.
+        connection.close()
+    detail_data = _response_data(detail_payload)
+    return dict(detail_data) if isinstance(detail_data, Mapping) else None
+
+
+def _operation_log_details(
+    log_ids: Sequence[str], stats: dict[str, Any]
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """Return ``{logId: detail}`` from the persistent cache, fetching the rest.
+
+    Operation-log entries never change once written, so a fetched detail is
+    stored for good and shared by every worker.  Missing details are fetched
+    with at most ``MAX_LOG_DETAIL_WORKERS`` concurrent MES calls.
+    """
+
+    details = {
+        row.log_id: row.payload
+        for row in MouldOperationLogDetail.objects.filter(log_id__in=list(log_ids)).only(
+            "log_id", "payload"
+        )
+    }
+    missing = [log_id for log_id in dict.fromkeys(log_ids) if log_id not in details]
+    stats["detail_cache_hits"] = len(log_ids) - len(missing)
+    stats["detail_fetches"] = len(missing)
+    if not missing:
+        return details, []
+
+    fetched: dict[str, dict[str, Any]] = {}
+    failed: set[str] = set()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_LOG_DETAIL_WORKERS, len(missing))),
+        thread_name_prefix="mould-log-detail",
+    ) as pool:
+        futures = {pool.submit(_operation_log_detail_request, log_id): log_id for log_id in missing}
+        for future in as_completed(futures):
+            log_id = futures[future]
+            try:
+                detail = future.result()
+            except MouldServiceError:
+                failed.add(log_id)
+                continue
+            if detail is not None:
+                fetched[log_id] = detail
+    stats["mes_calls"] += len(missing)
+
+    if fetched:
+        MouldOperationLogDetail.objects.bulk_create(
+            [
+                MouldOperationLogDetail(
+                    log_id=log_id,
+                    content_hash=hashlib.sha256(
+                        json.dumps(detail, sort_keys=True, default=str).encode("utf-8")
+                    ).hexdigest(),
+                    payload=detail,
+                )
+                for log_id, detail in fetched.items()
+            ],
+            ignore_conflicts=True,
+        )
+        details.update(fetched)
+    warnings = [
+        f"operation_log_detail_unavailable:{log_id}" for log_id in missing if log_id in failed
+    ]
+    return details, warnings
+
+
+def _fetch_operation_logs(
+    instance_code: str, stats: dict[str, Any] | None = None
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """List up to ``MAX_LOG_DETAILS`` logs with their details merged in.
+
+    ``stats``, when given, is filled with the MES call count and detail cache
+    hits/fetches for this page.
+    """
+
+    stats = stats if stats is not None else {}
+    stats.update({"mes_calls": 1, "detail_cache_hits": 0, "detail_fetches": 0})
     payload = _post_blacklake(
         OPERATION_LOG_LIST_ENDPOINT,
         {
@@ -1965,21 +2055,20 @@ def _fetch_operation_logs(instance_code: str) -> tuple[list[dict[str, Any]], lis
         },
     )
     logs, _total = _page_rows(payload)
+    logs = logs[:MAX_LOG_DETAILS]
+    details, warnings = _operation_log_details(
+        [
+            log_id
+            for log in logs
+            if not log.get("detailFields") and (log_id := _log_identifier(log))
+        ],
+        stats,
+    )
     detailed: list[dict[str, Any]] = []
-    for log in logs[:MAX_LOG_DETAILS]:
+    for log in logs:
         log_id = _log_identifier(log)
-        detail_fields = log.get("detailFields")
-        if not detail_fields and log_id:
-            try:
-                detail_payload = _post_blacklake(
-                    OPERATION_LOG_DETAIL_ENDPOINT,
-                    {"logId": int(log_id) if log_id.isdigit() else log_id},
-                )
-                detail_data = _response_data(detail_payload)
-                if isinstance(detail_data, Mapping):
-                    log = {**log, **dict(detail_data)}
-            except MouldServiceError:
-                warnings.append(f"operation_log_detail_unavailable:{log_id}")
+        if not log.get("detailFields") and log_id in details:
+            log = {**log, **details[log_id]}
         canonical = dict(log)
         canonical["logId"] = log_id
         canonical["loggedAt"] = _log_time(log)
@@ -2257,15 +2346,20 @@ def build_mould_detail(instance_id: str) -> dict[str, Any]:
 
     operation_logs: list[dict[str, Any]] = []
     operation_logs_loaded = False
+    operation_log_stats: dict[str, Any] = {}
     if mould.get("mould_code"):
+        log_started = time.perf_counter()
         try:
             operation_logs, log_warnings = _fetch_operation_logs(
-                str(mould["mould_code"])
+                str(mould["mould_code"]), operation_log_stats
             )
             operation_logs_loaded = True
             warnings.extend(log_warnings)
         except MouldServiceError:
             warnings.append("operation_logs_unavailable")
+        operation_log_stats["duration_ms"] = round(
+            (time.perf_counter() - log_started) * 1000, 1
+        )
     else:
         warnings.append("operation_logs_skipped_without_mould_code")
 
@@ -2325,6 +2419,11 @@ def build_mould_detail(instance_id: str) -> dict[str, Any]:
         },
         "resource_enrichment": resource_stats,
         "resource_detail": resource_detail_provenance,
+        "operation_logs": {
+            "source": "blacklake.log._list+log._detail",
+            "detail_cache": "injection.MouldOperationLogDetail",
+            **operation_log_stats,
+        },
         "movement_history": _history_provenance(
             child_info=child_objects.get("movement_history"),
             records=normalized_histories["movement_history"],
@@ -0,0 +1,201 @@
+"""Unified part catalog behind the part picker (``PartSpecViewSet.list``).
+
+The picker searches PartSpec first and falls back to part numbers that only
+appear in assembly or injection production reports.  Instead of scanning all
+three tables and de-duplicating in Python on every keystroke, one
+``PartCatalogEntry`` row per visible result is kept:
+
+* every PartSpec version (rank 0),
+* the latest assembly report model of a part without PartSpec (rank 1),
+* the latest injection report model of a part found in neither (rank 2).
+
+Rows are rebuilt per part_no, so a writer only has to say which part numbers
+changed.  Signals cover single-row writes; bulk writers call
+``refresh_part_catalog`` themselves and ``rebuild_part_catalog`` repairs
+anything else (e.g. a report whose part_no was edited away).
+
+On PostgreSQL ``search_text`` and ``UPPER(model_code)`` carry pg_trgm GIN
+indexes so ``LIKE '%term%'`` stays indexed; other databases fall back to the
+ordering index and a sequential scan of the narrow catalog table.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models import Max
+
+SOURCE_MODELS = 'models'
+SOURCE_ASSEMBLY_REPORT = 'mes_report_assembly'
+SOURCE_INJECTION_REPORT = 'mes_report_injection'
+SOURCE_RANKS = {
+    SOURCE_MODELS: 0,
+    SOURCE_ASSEMBLY_REPORT: 1,
+    SOURCE_INJECTION_REPORT: 2,
+}
+PART_CATALOG_BATCH_SIZE = 500
+# The admin list and the picker preload ask for up to 1000 rows at once.
+PART_CATALOG_MAX_PAGE_SIZE = 1000
+
+
+def _catalog_models():
+    from assembly.models import AssemblyReport
+    from .models import InjectionReport, PartCatalogEntry, PartSpec
+
+    return PartSpec, AssemblyReport, InjectionReport, PartCatalogEntry
+
+
+def catalog_search_text(*values: str | None) -> str:
+    # Newline-separated so a term never matches across two fields.
+    return '\n'.join((value or '').strip() for value in values).casefold()
+
+
+def _latest_report_models(report_model, part_nos: list[str]) -> dict[str, str]:
+    latest_ids = (
+        report_model.objects.filter(part_no__in=part_nos)
+        .values('part_no')
+        .annotate(latest_id=Max('id'))
+        .values('latest_id')
+    )
+    return dict(
+        report_model.objects.filter(id__in=latest_ids).values_list('part_no', 'model')
+    )
+
+
+def _refresh_chunk(part_nos: list[str]) -> int:
+    PartSpec, AssemblyReport, InjectionReport, PartCatalogEntry = _catalog_models()
+    entries = []
+    covered = set()
+    for spec in PartSpec.objects.filter(part_no__in=part_nos).order_by('part_no', '-valid_from'):
+        covered.add(spec.part_no)
+        entries.append(PartCatalogEntry(
+            source=SOURCE_MODELS,
+            rank=SOURCE_RANKS[SOURCE_MODELS],
+            part_spec_id=spec.pk,
+            part_no=spec.part_no,
+            model_code=spec.model_code or '',
+            description=spec.description or '',
+            valid_from=spec.valid_from,
+            search_text=catalog_search_text(spec.part_no, spec.model_code, spec.description),
+        ))
+
+    for source, report_model in (
+        (SOURCE_ASSEMBLY_REPORT, AssemblyReport),
+        (SOURCE_INJECTION_REPORT, InjectionReport),
+    ):
+        remaining = [part_no for part_no in part_nos if part_no not in covered]
+        if not remaining:
+            break
+        for part_no, model in sorted(_latest_report_models(report_model, remaining).items()):
+            covered.add(part_no)
+            entries.append(PartCatalogEntry(
+                source=source,
+                rank=SOURCE_RANKS[source],
+                part_no=part_no,
+                model_code=(model or '')[:100],
+                search_text=catalog_search_text(part_no, model),
+            ))
+
+    PartCatalogEntry.objects.filter(part_no__in=part_nos).delete()
+    PartCatalogEntry.objects.bulk_create(entries, batch_size=PART_CATALOG_BATCH_SIZE)
+    return len(entries)
+
+
+def refresh_part_catalog(part_nos: Iterable[str | None]) -> int:
+    """Rebuild the catalog rows of ``part_nos`` from their sources."""
+
+    part_nos = sorted({(value or '').strip() for value in part_nos} - {''})
+    written = 0
+    with transaction.atomic():
+        for offset in range(0, len(part_nos), PART_CATALOG_BATCH_SIZE):
+            written += _refresh_chunk(part_nos[offset:offset + PART_CATALOG_BATCH_SIZE])
+    return written
+
+
+def rebuild_part_catalog() -> int:
+    """Rebuild every catalog row and drop rows whose part_no has no source left."""
+
+    PartSpec, AssemblyReport, InjectionReport, PartCatalogEntry = _catalog_models()
+    part_nos = set()
+    for model in (PartSpec, AssemblyReport, InjectionReport):
+        part_nos.update(model.objects.exclude(part_no='').values_list('part_no', flat=True).distinct())
+    with transaction.atomic():
+        stale = set(PartCatalogEntry.objects.values_list('part_no', flat=True).distinct()) - part_nos
+        stale = sorted(stale)
+        for offset in range(0, len(stale), PART_CATALOG_BATCH_SIZE):
+            PartCatalogEntry.objects.filter(part_no__in=stale[offset:offset + PART_CATALOG_BATCH_SIZE]).delete()
+        return refresh_part_catalog(part_nos)
+
+
+def _decimal_text(value) -> str:
+    return str(value) if value else ''
+
+
+def _entry_payload(entry) -> dict[str, Any]:
+    spec = entry.part_spec
+    if spec is not None:
+        return {
+            'id': spec.id,
+            'part_no': spec.part_no,
+            'model_code': spec.model_code,
+            'description': spec.description or '',
+            'mold_type': spec.mold_type or '',
+            'color': spec.color or '',
+            'resin_type': spec.resin_type or '',
+            'resin_code': spec.resin_code or '',
+            'net_weight_g': _decimal_text(spec.net_weight_g),
+            'sr_weight_g': _decimal_text(spec.sr_weight_g),
+            'tonnage': spec.tonnage,
+            'cycle_time_sec': spec.cycle_time_sec,
+            'efficiency_rate': _decimal_text(spec.efficiency_rate),
+            'cavity': spec.cavity,
+            'resin_loss_pct': _decimal_text(spec.resin_loss_pct),
+            'defect_rate_pct': _decimal_text(spec.defect_rate_pct),
+            'valid_from': spec.valid_from.strftime('%Y-%m-%d') if spec.valid_from else '',
+            'created_at': spec.created_at.isoformat() if spec.created_at else '',
+            'source': SOURCE_MODELS,
+        }
+    prefix = 'report_assembly' if entry.source == SOURCE_ASSEMBLY_REPORT else 'report_injection'
+    return {
+        'id': f'{prefix}_{entry.part_no}',
+        'part_no': entry.part_no,
+        'model_code': entry.model_code,
+        'description': entry.description,
+        'source': entry.source,
+    }
+
+
+def search_part_catalog(
+    *,
+    search: str = '',
+    model_code: str = '',
+    page: int = 1,
+    page_size: int = 20,
+) -> tuple[int, list[dict[str, Any]]]:
+    """Return ``(total_count, page_rows)`` with two queries.
+
+    Report-only parts are listed only for an actual search, as before.
+    """
+
+    from .models import PartCatalogEntry
+
+    search = (search or '').strip()
+    model_code = (model_code or '').strip()
+    page = max(1, page)
+    page_size = min(max(1, page_size), PART_CATALOG_MAX_PAGE_SIZE)
+
+    queryset = PartCatalogEntry.objects.all()
+    if not (search or model_code):
+        queryset = queryset.filter(source=SOURCE_MODELS)
+    if search:
+        queryset = queryset.filter(search_text__contains=search.casefold())
+    if model_code:
+        queryset = queryset.filter(model_code__icontains=model_code)
+
+    total_count = queryset.count()
+    start = (page - 1) * page_size
+    if start >= total_count:
+        return total_count, []
+    rows = queryset.select_related('part_spec').order_by('rank', 'part_no', '-valid_from', 'id')
+    return total_count, [_entry_payload(entry) for entry in rows[start:start + page_size]]
@@ -0,0 +1,273 @@
+"""Diff-based import of the c_table.xlsx PartSpec workbook.
+
+The workbook is the master copy of every spec version, so an import used to
+delete the whole table and re-insert it.  Here the workbook is normalised with
+vectorised pandas transforms, compared with the current table on the natural
+key ``(part_no, valid_from)`` and only the difference is written: inserts and
+updates as batched upserts, removed versions as batched deletes, all in one
+transaction.  An unchanged workbook writes nothing and leaves the part catalog
+and the spec-version cache untouched.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+from django.db import models, transaction
+
+from .latest_effective import bump_part_spec_version
+from .models import PartSpec
+from .part_catalog import refresh_part_catalog
+
+COL_MAP = {
+    'Model': 'model_code',
+    'P/N': 'part_no',
+    'start date': 'valid_from',
+    'Desc': 'description',
+    'Mold Type': 'mold_type',
+    'Color': 'color',
+    'Resin(1)': 'resin_type',
+    'Resin(2)': 'resin_code',
+    'Net(g)': 'net_weight_g',
+    'S/R(g)': 'sr_weight_g',
+    'Ton': 'tonnage',
+    'C/T': 'cycle_time_sec',
+    '효율': 'efficiency_rate',
+    'Cavity': 'cavity',
+    'ResinLoss(%)': 'resin_loss_pct',
+    'Defect(%)': 'defect_rate_pct',
+}
+
+SHEETS = ['MNT_modi', 'MNT_modi_2207']
+
+KEY_FIELDS = ('part_no', 'valid_from')
+TEXT_FIELDS = ('model_code', 'description', 'mold_type', 'color', 'resin_type', 'resin_code')
+DECIMAL_FIELDS = ('net_weight_g', 'sr_weight_g', 'efficiency_rate', 'resin_loss_pct', 'defect_rate_pct')
+INTEGER_FIELDS = ('tonnage', 'cycle_time_sec', 'cavity')
+DATA_FIELDS = TEXT_FIELDS + DECIMAL_FIELDS + INTEGER_FIELDS
+IMPORT_BATCH_SIZE = 2000
+SAMPLE_KEYS = 10
+
+
+@dataclass
+class PartSpecDiff:
+    inserts: pd.DataFrame
+    updates: pd.DataFrame
+    deletes: pd.DataFrame
+    unchanged: int
+    changed_fields: dict[str, int] = field(default_factory=dict)
+    dropped_rows: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(len(self.inserts) or len(self.updates) or len(self.deletes))
+
+    def affected_part_nos(self) -> list[str]:
+        return sorted(
+            set(self.inserts['part_no']) | set(self.updates['part_no']) | set(self.deletes['part_no'])
+        )
+
+    def summary(self, sample: int = SAMPLE_KEYS) -> dict[str, Any]:
+        def keys(frame: pd.DataFrame) -> list[str]:
+            return [f'{part_no}@{valid_from}' for part_no, valid_from in frame[list(KEY_FIELDS)].head(sample).itertuples(index=False)]
+
+        return {
+            'inserts': len(self.inserts),
+            'updates': len(self.updates),
+            'deletes': len(self.deletes),
+            'unchanged': self.unchanged,
+            'dropped_rows': self.dropped_rows,
+            'changed_fields': dict(self.changed_fields),
+            'samples': {
+                'inserts': keys(self.inserts),
+                'updates': keys(self.updates),
+                'deletes': keys(self.deletes),
+            },
+        }
+
+
+def _max_length(name: str) -> int | None:
+    return PartSpec._meta.get_field(name).max_length
+
+
+def _coerce_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """Cast data columns to the comparison dtypes shared by workbook and table."""
+
+    frame = frame.copy()
+    for name in TEXT_FIELDS:
+        values = frame[name] if name in frame.columns else pd.Series('', index=frame.index)
+        values = values.astype('string').fillna('').str.strip()
+        frame[name] = values.str.slice(0, _max_length(name)).astype(object)
+    for name in DECIMAL_FIELDS:
+        values = frame[name] if name in frame.columns else pd.Series(np.nan, index=frame.index)
+        frame[name] = pd.to_numeric(values, errors='coerce').astype('float64').round(2)
+    for name in INTEGER_FIELDS:
+        values = frame[name] if name in frame.columns else pd.Series(np.nan, index=frame.index)
+        # int() truncation, as the previous float -> IntegerField save did.
+        frame[name] = np.trunc(pd.to_numeric(values, errors='coerce').astype('float64')).astype('Int64')
+    return frame
+
+
+def normalize_partspec_frame(frame: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Normalise renamed workbook columns; return the frame and the dropped row count.
+
+    Rows without a part number or a parseable start date cannot be keyed and
+    are dropped.  A key repeated across sheets keeps its last occurrence, so
+    the newer sheet wins.
+    """
+
+    frame = frame.rename(columns=lambda c: COL_MAP.get(str(c).strip(), str(c).strip()))
+    frame = frame[[name for name in COL_MAP.values() if name in frame.columns]]
+    for name in KEY_FIELDS:
+        if name not in frame.columns:
+            frame = frame.assign(**{name: pd.Series(pd.NA, index=frame.index, dtype=object)})
+
+    part_no = frame['part_no'].astype('string').str.strip().str.upper()
+    valid_from = pd.to_datetime(frame['valid_from'], errors='coerce')
+    keep = part_no.notna() & part_no.ne('') & valid_from.notna()
+    dropped = int((~keep).sum())
+
+    frame = frame.loc[keep].copy()
+    frame['part_no'] = part_no[keep].str.slice(0, _max_length('part_no')).astype(object)
+    frame['valid_from'] = valid_from[keep].dt.date
+    if 'model_code' in frame.columns:
+        frame['model_code'] = (
+            frame['model_code'].astype('string').str.replace(r'\s+', '', regex=True).str.upper()
+        )
+    frame = _coerce_columns(frame)
+    frame = frame.drop_duplicates(subset=list(KEY_FIELDS), keep='last')
+    return frame[list(KEY_FIELDS + DATA_FIELDS)].reset_index(drop=True), dropped
+
+
+def read_partspec_workbook(path: Path | str, sheets: Iterable[str] = SHEETS) -> tuple[pd.DataFrame, int, list[str]]:
+    """Read and normalise the workbook sheets.
+
+    Returns the normalised frame, the number of dropped rows and the sheets
+    that were not found.
+    """
+
+    frames, missing = [], []
+    for sheet in sheets:
+        try:
+            frames.append(pd.read_excel(path, sheet_name=sheet))
+        except ValueError:
+            missing.append(sheet)
+    if not frames:
+        return pd.DataFrame(columns=list(KEY_FIELDS + DATA_FIELDS)), 0, missing
+    frames = [frame.rename(columns=lambda c: COL_MAP.get(str(c).strip(), str(c).strip())) for frame in frames]
+    frame, dropped = normalize_partspec_frame(pd.concat(frames, ignore_index=True))
+    return frame, dropped, missing
+
+
+def _current_partspec_frame() -> pd.DataFrame:
+    columns = ['id', *KEY_FIELDS, *DATA_FIELDS]
+    rows = PartSpec.objects.values_list(*columns).iterator(chunk_size=IMPORT_BATCH_SIZE)
+    return _coerce_columns(pd.DataFrame.from_records(list(rows), columns=columns))
+
+
+def _same(incoming: pd.Series, current: pd.Series) -> pd.Series:
+    both_missing = incoming.isna() & current.isna()
+    if incoming.dtype == 'float64':
+        # Both sides are already rounded to the column scale.
+        equal = np.isclose(incoming.to_numpy(), current.to_numpy(), rtol=0, atol=1e-9)
+        return pd.Series(equal, index=incoming.index) | both_missing
+    return incoming.eq(current).fillna(False).astype(bool) | both_missing
+
+
+def diff_partspecs(incoming: pd.DataFrame, *, dropped_rows: int = 0) -> PartSpecDiff:
+    """Compare a normalised workbook frame with the PartSpec table."""
+
+    current = _current_partspec_frame()
+    merged = incoming.merge(
+        current, on=list(KEY_FIELDS), how='outer', suffixes=('', '_db'), indicator=True,
+    )
+
+    inserts = merged.loc[merged['_merge'] == 'left_only', list(KEY_FIELDS + DATA_FIELDS)]
+    deletes = merged.loc[merged['_merge'] == 'right_only', ['id', *KEY_FIELDS]]
+
+    matched = merged.loc[merged['_merge'] == 'both']
+    changed = pd.DataFrame(
+        {name: ~_same(matched[name], matched[f'{name}_db']) for name in DATA_FIELDS},
+        index=matched.index,
+    )
+    update_mask = changed.any(axis=1) if len(changed) else pd.Series(False, index=matched.index)
+    updates = matched.loc[update_mask, ['id', *KEY_FIELDS, *DATA_FIELDS]]
+    changed_fields = {name: int(count) for name, count in changed.loc[update_mask].sum().items() if count}
+
+    return PartSpecDiff(
+        inserts=inserts.reset_index(drop=True),
+        updates=updates.reset_index(drop=True),
+        deletes=deletes.astype({'id': 'int64'}).reset_index(drop=True),
+        unchanged=int(len(matched) - update_mask.sum()),
+        changed_fields=changed_fields,
+        dropped_rows=dropped_rows,
+    )
+
+
+def _model_rows(frame: pd.DataFrame) -> list[PartSpec]:
+    frame = frame[list(KEY_FIELDS + DATA_FIELDS)].copy()
+    for name in DECIMAL_FIELDS:
+        formatted = frame[name].map('{:.2f}'.format, na_action='ignore')
+        frame[name] = formatted.map(Decimal, na_action='ignore')
+    frame = frame.astype(object).where(frame.notna(), None)
+    return [PartSpec(**record) for record in frame.to_dict('records')]
+
+
+def _delete_partspecs(ids: list[int]) -> None:
+    """Delete spec versions without post_delete signals.
+
+    ``QuerySet.delete()`` would load every row to send post_delete, and the
+    injection and quality receivers would each refresh the catalog, bump the
+    spec version and mark audit states once per row.  Cascading relations are
+    deleted in bulk first; ``apply_partspec_diff`` refreshes the dependants
+    once for every affected part_no.
+    """
+
+    for relation in PartSpec._meta.related_objects:
+        if relation.on_delete is models.CASCADE:
+            relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': ids}).delete()
+    PartSpec.objects.filter(pk__in=ids)._raw_delete(PartSpec.objects.db)
+
+
+def apply_partspec_diff(diff: PartSpecDiff, *, batch_size: int = IMPORT_BATCH_SIZE) -> dict[str, float]:
+    """Write ``diff`` in one transaction and return per-phase timings in ms."""
+
+    timings: dict[str, float] = {}
+    if not diff.has_changes:
+        return timings
+
+    affected = diff.affected_part_nos()
+    with transaction.atomic():
+        started = time.perf_counter()
+        delete_ids = diff.deletes['id'].tolist()
+        for offset in range(0, len(delete_ids), batch_size):
+            _delete_partspecs(delete_ids[offset:offset + batch_size])
+        timings['delete_ms'] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        rows = _model_rows(pd.concat([diff.inserts, diff.updates], ignore_index=True))
+        PartSpec.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=list(KEY_FIELDS),
+            update_fields=list(DATA_FIELDS),
+        )
+        timings['upsert_ms'] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        # Neither the raw deletes nor bulk_create send the PartSpec signals,
+        # so refresh their dependants here.
+        from quality.classification_audit import mark_quality_report_audit_states_dirty
+
+        mark_quality_report_audit_states_dirty(part_nos=affected)
+        refresh_part_catalog(affected)
+        timings['catalog_ms'] = (time.perf_counter() - started) * 1000
+    bump_part_spec_version()
+    return timings
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 import re
 from django.utils import timezone
@@ -106,7 +107,7 @@ class ProductionPlanProcessor:
 
         records = self._build_records(df, day_columns, day_map)
         plan_long = self._build_plan_long(df, day_columns, day_map)
-        if not plan_long:
+        if plan_long.empty:
             raise ProductionPlanProcessingError(
                 "양수 생산 계획 수량이 있는 유효한 계획 행을 찾을 수 없습니다."
             )
@@ -120,7 +121,7 @@ class ProductionPlanProcessor:
             "sheet_name": sheet_name,
             "available_days": [day_map[col].isoformat() for col in day_columns],
             "records": records,
-            "plan_long": plan_long,
+            "plan_long": self._records(plan_long),
             "machine_summary": machine_summary,
             "model_summary": model_summary,
             "daily_totals": daily_totals,
@@ -194,48 +195,56 @@ class ProductionPlanProcessor:
         day_columns: List[Any],
         day_map: Mapping[Any, date],
     ) -> List[Dict[str, Any]]:
-        records: List[Dict[str, Any]] = []
-        for _, row in df.iterrows():
-            part_spec = self._clean_str(row.get("part_spec") or row.get("spec_detail"))
-            product_context = extract_plan_product_context(part_spec)
-            base = {
-                "machine": self._clean_str(row.get("machine")),
-                "lot_no": self._clean_str(row.get("lot_no")),
-                "model": self._clean_str(row.get("model")),
-                "part_spec": part_spec,
-                **product_context,
-                "fg_part_no": self._clean_str(row.get("fg_part_no")),
-                "sg_part_no": self._clean_str(row.get("sg_part_no")),
-                "material": self._clean_str(row.get("material")),
-                "color": self._clean_str(row.get("color")),
-                "delivery_date": self._clean_date(row.get("delivery_date")),
-                "lot_qty": self._clean_number(row.get("lot_qty")),
-                "produced_qty": self._clean_number(row.get("produced_qty")),
-                "req_qty": self._clean_number(row.get("req_qty")),
+        # ``part_spec or spec_detail``: only a falsy SPEC falls back (NaN is truthy).
+        part_spec = self._column(df, "part_spec")
+        falsy = self._map_distinct(part_spec, lambda value: not value).astype(bool)
+        part_spec = part_spec.astype(object).where(~falsy, self._column(df, "spec_detail"))
+        columns: Dict[str, Any] = {
+            "machine": self._clean_str_column(self._column(df, "machine")),
+            "lot_no": self._clean_str_column(self._column(df, "lot_no")),
+            "model": self._clean_str_column(self._column(df, "model")),
+            "part_spec": self._clean_str_column(part_spec),
+        }
+        columns.update(self._product_context_columns(columns["part_spec"]))
+        for name in ("fg_part_no", "sg_part_no", "material", "color"):
+            columns[name] = self._clean_str_column(self._column(df, name))
+        columns["delivery_date"] = self._map_distinct(self._column(df, "delivery_date"), self._clean_date).tolist()
+        for name in ("lot_qty", "produced_qty", "req_qty"):
+            columns[name] = self._map_distinct(self._column(df, name), self._clean_number).tolist()
+
+        # One rows x days matrix; np.nonzero walks it row by row, day by day.
+        mapped_days = [column for column in day_columns if column in day_map]
+        quantities = np.rint(np.column_stack(
+            [self._plan_qty_values(df[column]) for column in mapped_days]
+            or [np.full(len(df), np.nan)]
+        ))
+        daily_plans: List[List[Dict[str, Any]]] = [[] for _ in range(len(df))]
+        day_labels = [day_map[column].isoformat() for column in mapped_days]
+        row_positions, day_positions = np.nonzero(quantities > 0)
+        for row_position, day_position in zip(row_positions.tolist(), day_positions.tolist()):
+            daily_plans[row_position].append(
+                {
+                    "date": day_labels[day_position],
+                    "plan_qty": int(quantities[row_position, day_position]),
+                }
+            )
+
+        names = list(columns)
+        return [
+            {
+                **dict(zip(names, values)),
                 "plan_type": self.plan_type,
-                "daily_plan": [],
+                "daily_plan": daily_plan,
             }
-            for column in day_columns:
-                qty = self._clean_plan_qty(row.get(column))
-                if not qty or qty <= 0:
-                    continue
-                if column not in day_map:
-                    continue
-                base["daily_plan"].append(
-                    {
-                        "date": day_map[column].isoformat(),
-                        "plan_qty": qty,
-                    }
-                )
-            records.append(base)
-        return records
+            for *values, daily_plan in zip(*(columns[name] for name in names), daily_plans)
+        ]
 
     def _build_plan_long(
         self,
         df: pd.DataFrame,
         day_columns: List[Any],
         day_map: Mapping[Any, date],
-    ) -> List[Dict[str, Any]]:
+    ) -> pd.DataFrame:
         id_vars = [
             col
             for col in [
@@ -276,42 +285,79 @@ class ProductionPlanProcessor:
         if 'original_order' in aggregated.columns:
             aggregated = aggregated.sort_values(by='original_order').reset_index(drop=True)
 
-        payload: List[Dict[str, Any]] = []
-        for _, row in aggregated.iterrows():
-            plan_date = day_map.get(row["day"])
-            if not plan_date:
-                continue
-            part_spec = self._clean_str(row.get("part_spec"))
-            product_context = extract_plan_product_context(part_spec)
-            payload.append(
-                {
-                    "original_order": row.get("original_order"),
-                    "machine": self._clean_str(row.get("machine")),
-                    "lot_no": self._clean_str(row.get("lot_no")),
-                    "model": self._clean_str(row.get("model")),
-                    "part_spec": part_spec,
-                    **product_context,
-                    "fg_part_no": self._clean_str(row.get("fg_part_no")),
-                    "sg_part_no": self._clean_str(row.get("sg_part_no")),
-                    "material": self._clean_str(row.get("material")),
-                    "color": self._clean_str(row.get("color")),
-                    "date": plan_date.isoformat(),
-                    "plan_qty": int(row.get("plan_qty") or 0),
-                    "plan_type": self.plan_type,
-                }
-            )
-        return payload
-
-    def _summarize(self, rows: List[Dict[str, Any]], keys: List[str]) -> List[Dict[str, Any]]:
-        summary: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
-            key_parts = [row.get(key) or "" for key in keys]
-            summary_key = "|".join(key_parts)
-            if summary_key not in summary:
-                summary[summary_key] = {key: row.get(key) for key in keys}
-                summary[summary_key]["plan_qty"] = 0
-            summary[summary_key]["plan_qty"] += row.get("plan_qty") or 0
-        return sorted(summary.values(), key=lambda item: tuple(item.get(key) or "" for key in keys))
+        day_labels = {column: plan_date.isoformat() for column, plan_date in day_map.items()}
+        dates = self._map_distinct(aggregated["day"], day_labels.get)
+        aggregated = aggregated[dates.notna().to_numpy()]
+        dates = dates[dates.notna()]
+
+        part_spec = self._clean_str_column(self._column(aggregated, "part_spec"))
+        columns: Dict[str, Any] = {
+            "original_order": self._column(aggregated, "original_order").tolist(),
+            "machine": self._clean_str_column(self._column(aggregated, "machine")),
+            "lot_no": self._clean_str_column(self._column(aggregated, "lot_no")),
+            "model": self._clean_str_column(self._column(aggregated, "model")),
+            "part_spec": part_spec,
+            **self._product_context_columns(part_spec),
+        }
+        for name in ("fg_part_no", "sg_part_no", "material", "color"):
+            columns[name] = self._clean_str_column(self._column(aggregated, name))
+        columns["date"] = dates.to_numpy()
+        columns["plan_qty"] = aggregated["plan_qty"].fillna(0).astype(int).tolist()
+        columns["plan_type"] = self.plan_type
+        return pd.DataFrame(columns)
+
+    def _summarize(self, plan_long: pd.DataFrame, keys: List[str]) -> List[Dict[str, Any]]:
+        # Cleaned keys are never "", so a blank group key stands for None.
+        summary = (
+            plan_long.assign(**{key: plan_long[key].fillna("") for key in keys})
+            .groupby(keys, sort=True)["plan_qty"]
+            .sum()
+            .reset_index()
+        )
+        for key in keys:
+            summary[key] = summary[key].where(summary[key] != "", None)
+        return self._records(summary[[*keys, "plan_qty"]])
+
+    def _records(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """``to_dict("records")`` with native values, without its per-cell boxing."""
+
+        names = list(frame.columns)
+        return [dict(zip(names, row)) for row in zip(*(frame[name].tolist() for name in names))]
+
+    def _column(self, df: pd.DataFrame, name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name]
+        return pd.Series(None, index=df.index, dtype=object)
+
+    def _map_distinct(self, series: pd.Series, func) -> pd.Series:
+        """Apply a scalar cleaner once per distinct value and broadcast the result."""
+
+        values = series.astype(object).to_numpy()
+        codes, uniques = pd.factorize(values)
+        results = np.empty(len(uniques) + 1, dtype=object)
+        results[:-1] = [func(value) for value in uniques]
+        # factorize folds None, NaN and NaT into code -1, but the cleaners tell
+        # them apart (NaN is truthy, NaT formats as "NaT"), so feed a real one.
+        missing = values[codes == -1]
+        results[-1] = func(missing[0] if len(missing) else None)
+        return pd.Series(results[codes], index=series.index, dtype=object)
+
+    def _clean_str_column(self, series: pd.Series) -> List[Optional[str]]:
+        return self._map_distinct(series, self._clean_str).tolist()
+
+    def _product_context_columns(self, part_specs: List[Optional[str]]) -> Dict[str, List[Any]]:
+        contexts = self._map_distinct(pd.Series(part_specs, dtype=object), extract_plan_product_context)
+        names = list(extract_plan_product_context(None))
+        return {name: [context[name] for context in contexts] for name in names}
+
+    def _plan_qty_values(self, series: pd.Series) -> np.ndarray:
+        """``_clean_number`` of a day column as floats; NaN where it yields None."""
+
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+        else:
+            values = self._map_distinct(series, self._clean_number).to_numpy(dtype="float64", na_value=np.nan)
+        return np.where(np.abs(values) < 1e-6, 0.0, values)
 
     def _clean_str(self, value: Any) -> Optional[str]:
         if value is None or (isinstance(value, float) and pd.isna(value)):
@@ -330,13 +376,6 @@ class ProductionPlanProcessor:
             return 0
         return number
 
-    def _clean_plan_qty(self, value: Any) -> Optional[int]:
-        number = self._clean_number(value)
-        if number is None:
-            return None
-        rounded = int(round(number))
-        return rounded
-
     def _clean_date(self, value: Any) -> Optional[str]:
         if value in (None, "", " "):
             return None
@@ -383,3 +422,9 @@ class ProductionPlanProcessor:
 
         # Fallback for any other plan types
         return df
+
+
+def parse_plan_upload(source, *, plan_type: str, target_date: Optional[str]) -> Dict[str, Any]:
+    """Parse-pool entry point: process one spooled plan workbook."""
+
+    return ProductionPlanProcessor(source, plan_type, target_date).process()
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from assembly.models import AssemblyReport
+
+from .latest_effective import bump_cycle_time_setup_version, bump_part_spec_version
+from .models import CycleTimeSetup, InjectionReport, PartCatalogEntry, PartSpec
+from .part_catalog import refresh_part_catalog
+
+
+@receiver(post_save, sender=PartSpec)
+@receiver(post_delete, sender=PartSpec)
+def refresh_part_spec_catalog(sender, instance, **kwargs):
+    # A renamed PartSpec still owns catalog rows under its previous part_no.
+    previous = PartCatalogEntry.objects.filter(part_spec_id=instance.pk).values_list('part_no', flat=True)
+    refresh_part_catalog([instance.part_no, *previous])
+    bump_part_spec_version()
+
+
+@receiver(post_save, sender=CycleTimeSetup)
+@receiver(post_delete, sender=CycleTimeSetup)
+def bump_cycle_time_setup_lookups(sender, instance, **kwargs):
+    bump_cycle_time_setup_version()
+
+
+# No post_delete receivers for reports: they would turn every queryset delete
+# into a row-by-row delete.  Report delete paths (viewset destroy, admin)
+# refresh the catalog themselves.
+@receiver(post_save, sender=AssemblyReport)
+@receiver(post_save, sender=InjectionReport)
+def refresh_report_catalog(sender, instance, **kwargs):
+    refresh_part_catalog([instance.part_no])
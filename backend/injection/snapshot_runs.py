@@ -0,0 +1,172 @@
+"""Run log and latency report for the MES monitoring snapshot job.
+
+``update_hourly_snapshot_from_mes`` runs every two minutes from Celery beat
+(``expires=115``).  Each execution records a ``MonitoringSnapshotRun`` with
+per-stage wall-clock timings and MES/row counters, so a run that creeps
+towards the beat interval shows up in ``snapshot_run_stats`` before it starts
+leaving gaps in the production matrix.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from django.utils import timezone
+
+from .models import MonitoringSnapshotRun
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INTERVAL_SECONDS = 120
+SNAPSHOT_STAGES = ('token', 'fetch', 'write', 'rollup', 'compaction')
+SNAPSHOT_RUN_RETENTION_DAYS = 14
+DEFAULT_STATS_RUNS = 200
+MAX_STATS_RUNS = 5000
+COUNTER_FIELDS = ('mes_call_count', 'devices_failed', 'records_written', 'rollup_rows', 'compacted_rows')
+
+
+class SnapshotRunRecorder:
+    """Collect timings and counters for one snapshot execution, then persist them."""
+
+    def __init__(self, *, trigger: str = 'beat', target_timestamp: Optional[datetime] = None):
+        self.trigger = trigger
+        self.target_timestamp = target_timestamp
+        self.started_at = timezone.now()
+        self._started = time.perf_counter()
+        self.stage_ms: dict[str, float] = {}
+        self.counters: dict[str, int] = {name: 0 for name in COUNTER_FIELDS}
+        self.coalesced_runs = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_ms[name] = self.stage_ms.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def finish(self, status: str, *, error: str = '') -> Optional[MonitoringSnapshotRun]:
+        """Persist the run; telemetry failures never fail the snapshot itself."""
+
+        try:
+            return MonitoringSnapshotRun.objects.create(
+                started_at=self.started_at,
+                finished_at=timezone.now(),
+                target_timestamp=self.target_timestamp,
+                trigger=self.trigger,
+                status=status,
+                duration_ms=round((time.perf_counter() - self._started) * 1000),
+                stage_ms={name: round(value, 1) for name, value in self.stage_ms.items()},
+                coalesced_runs=self.coalesced_runs,
+                error=str(error)[:500],
+                **{name: self.counters.get(name, 0) for name in COUNTER_FIELDS},
+            )
+        except Exception:
+            logger.warning('Failed to record monitoring snapshot run.', exc_info=True)
+            return None
+
+
+def already_completed(target_timestamp: datetime) -> bool:
+    """True when a completed run already stored this target minute."""
+
+    return MonitoringSnapshotRun.objects.filter(
+        status=MonitoringSnapshotRun.STATUS_COMPLETED,
+        target_timestamp=target_timestamp,
+    ).exists()
+
+
+def skipped_since_last_completion() -> int:
+    """Overlap-skipped runs since the newest completed run.
+
+    The next completed run covers them: its rollup window reaches back an
+    hour, so the skipped minutes are coalesced into it rather than replayed.
+    """
+
+    last_completed = (
+        MonitoringSnapshotRun.objects
+        .filter(status=MonitoringSnapshotRun.STATUS_COMPLETED)
+        .order_by('-started_at')
+        .values_list('started_at', flat=True)
+        .first()
+    )
+    skipped = MonitoringSnapshotRun.objects.filter(status=MonitoringSnapshotRun.STATUS_SKIPPED)
+    if last_completed is not None:
+        skipped = skipped.filter(started_at__gt=last_completed)
+    return skipped.count()
+
+
+def purge_snapshot_runs(retention_days: int = SNAPSHOT_RUN_RETENTION_DAYS) -> int:
+    deleted, _ = MonitoringSnapshotRun.objects.filter(
+        started_at__lt=timezone.now() - timedelta(days=retention_days),
+    ).delete()
+    return deleted
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _distribution(values: Iterable[float]) -> dict[str, Any]:
+    ordered = sorted(values)
+    return {
+        'samples': len(ordered),
+        'p50': _percentile(ordered, 0.50),
+        'p95': _percentile(ordered, 0.95),
+        'max': ordered[-1] if ordered else None,
+    }
+
+
+def snapshot_run_stats(limit: int = DEFAULT_STATS_RUNS) -> dict[str, Any]:
+    """p50/p95 latency per stage and run outcome counts over the last ``limit`` runs."""
+
+    limit = max(1, min(int(limit), MAX_STATS_RUNS))
+    runs = list(
+        MonitoringSnapshotRun.objects
+        .order_by('-started_at', '-id')
+        .values('status', 'duration_ms', 'stage_ms', 'started_at', *COUNTER_FIELDS)[:limit]
+    )
+    status_counts = {status: 0 for status, _label in MonitoringSnapshotRun.STATUS_CHOICES}
+    for run in runs:
+        status_counts[run['status']] = status_counts.get(run['status'], 0) + 1
+
+    # Latency is only meaningful for runs that did the work.
+    worked = [
+        run for run in runs
+        if run['status'] in (MonitoringSnapshotRun.STATUS_COMPLETED, MonitoringSnapshotRun.STATUS_FAILED)
+    ]
+    stage_names = list(SNAPSHOT_STAGES) + sorted(
+        {name for run in worked for name in (run['stage_ms'] or {})} - set(SNAPSHOT_STAGES)
+    )
+    interval_ms = SNAPSHOT_INTERVAL_SECONDS * 1000
+    return {
+        'runs': len(runs),
+        'window_start': runs[-1]['started_at'] if runs else None,
+        'window_end': runs[0]['started_at'] if runs else None,
+        'interval_seconds': SNAPSHOT_INTERVAL_SECONDS,
+        'status_counts': status_counts,
+        'overrun_count': sum(1 for run in worked if run['duration_ms'] > interval_ms),
+        'duration_ms': _distribution(run['duration_ms'] for run in worked),
+        'stage_ms': {
+            name: _distribution(
+                (run['stage_ms'] or {})[name] for run in worked if name in (run['stage_ms'] or {})
+            )
+            for name in stage_names
+        },
+        'counters': {
+            name: {**_distribution(run[name] for run in worked), 'total': sum(run[name] for run in worked)}
+            for name in COUNTER_FIELDS
+        },
+    }
@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .cycle_time_stats import (
+    report_cycle_time_stats,
+    resolve_standard_cycle_time,
+    setup_target_cycle_time_by_prefix,
+)
+from .models import CycleTimeSetup, InjectionReport, PartSpec
+
+
+def create_report(part_no, *, days_ago=1, machine_no=1, actual_qty=100, actual_defect=0, idle_time=0):
+    return InjectionReport.objects.create(
+        date=timezone.now().date() - timedelta(days=days_ago),
+        machine_no=machine_no,
+        tonnage='850T',
+        model='MODEL-A',
+        section='C/A',
+        plan_qty=100,
+        actual_qty=actual_qty,
+        reported_defect=0,
+        actual_defect=actual_defect,
+        total_time=1440,
+        idle_time=idle_time,
+        part_no=part_no,
+    )
+
+
+class ReportCycleTimeStatsTests(TestCase):
+    def setUp(self):
+        # 1440분 / 1200개 -> 72초, 720분 / 600개 -> 72초
+        create_report('ACQ300010AA', actual_qty=1200)
+        create_report('ACQ300010BB', actual_qty=600, idle_time=720, machine_no=2)
+        create_report('ACQ300010AA', actual_qty=100, actual_defect=50)  # 불량률 초과
+        create_report('ACQ300010AA', actual_qty=100, days_ago=40)  # 기간 밖
+        create_report('ACQ300020AA', actual_qty=10)  # 다른 prefix
+
+    def test_prefix_window_and_quality_filters_in_one_query(self):
+        with self.assertNumQueries(1):
+            stats = report_cycle_time_stats('acq300010zz')
+
+        self.assertEqual(stats['sample_count'], 2)
+        self.assertEqual(stats['total_operation_time'], 2160)
+        self.assertEqual(stats['total_production'], 1800)
+        self.assertEqual(stats['avg_cycle_time'], 72.0)
+
+    def test_machine_filter(self):
+        self.assertEqual(report_cycle_time_stats('ACQ300010AA', machine_no=2)['sample_count'], 1)
+
+    def test_endpoint_keeps_response_shape(self):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='ct', password='pw', is_staff=True))
+
+        found = client.get('/api/injection/reports/avg-cycle-time/', {'part_no': 'ACQ300010AA'}).json()
+        missing = client.get('/api/injection/reports/avg-cycle-time/', {'part_no': 'NOPE00000'}).json()
+
+        self.assertEqual(found['avg_cycle_time'], 72.0)
+        self.assertEqual(found['sample_count'], 2)
+        self.assertEqual(found['period_days'], 30)
+        self.assertEqual((missing['avg_cycle_time'], missing['sample_count']), (None, 0))
+        self.assertNotIn('period_days', missing)
+
+
+class StandardAndSetupCycleTimeTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='setup', password='pw')
+
+    def create_setup(self, part_no, target, **kwargs):
+        return CycleTimeSetup.objects.create(
+            machine_no=kwargs.pop('machine_no', 1),
+            part_no=part_no,
+            target_cycle_time=target,
+            setup_by=self.user,
+            **kwargs,
+        )
+
+    def test_latest_part_spec_wins_then_approved_setup(self):
+        self.create_setup('ACQ300010AA', 40, status='APPROVED', mean_cycle_time=41, approved_at=timezone.now())
+        self.assertEqual(resolve_standard_cycle_time('ACQ300010AA'), (41, 'setup'))
+
+        PartSpec.objects.create(part_no='ACQ300010AA', model_code='M', valid_from=date(2026, 1, 1), cycle_time_sec=38)
+        self.assertEqual(resolve_standard_cycle_time('ACQ300010AA'), (38, 'spec'))
+        self.assertEqual(resolve_standard_cycle_time('ACQ399999AA'), (None, None))
+
+    def test_target_average_is_grouped_by_part_prefix(self):
+        self.create_setup('ACQ300010AA', 40)
+        self.create_setup('ACQ300010BB', 45, machine_no=2)
+        self.create_setup('ACQ300020AA', 30, machine_no=3)
+        self.create_setup('SHORT', 99, machine_no=4)
+
+        with self.assertNumQueries(1):
+            averages = setup_target_cycle_time_by_prefix(CycleTimeSetup.objects.all())
+
+        self.assertEqual(averages, {'ACQ300010': 42, 'ACQ300020': 30})
+
+    def test_dashboard_reports_prefix_mean_for_latest_setup_per_machine(self):
+        self.create_setup('ACQ300010AA', 40)
+        latest = self.create_setup('ACQ300010BB', 45)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        body = client.get('/api/injection/setup/dashboard/').json()
+
+        self.assertEqual(body['total_setups_today'], 2)
+        self.assertEqual([row['id'] for row in body['recent_setups']], [latest.id])
+        self.assertEqual(body['recent_setups'][0]['mean_cycle_time'], 42)
@@ -1088,3 +1088,50 @@ class MouldPublicViewTests(TestCase):
         cached_response = client.get("/api/injection/moulds/1736127906878176/")
         self.assertEqual(cached_response.status_code, 200)
         build_detail.assert_called_once_with("1736127906878176")
+
+
+class MouldOperationLogDetailCacheTests(TestCase):
+    def fake_blacklake(self, endpoint, body):
+        if endpoint == mould_service.OPERATION_LOG_LIST_ENDPOINT:
+            return {
+                "code": 200,
+                "data": {
+                    "list": [
+                        {"logId": 1, "operationTime": 1_767_225_600_000},
+                        {"logId": 2, "operationTime": 1_767_225_700_000},
+                        {"logId": 3, "detailFields": [{"fieldName": "当前位置"}]},
+                    ]
+                },
+            }
+        if body["logId"] == 2 and self.fail_log_two:
+            raise mould_service.MouldServiceError("detail unavailable")
+        return {"code": 200, "data": {"detailFields": [{"fieldName": f"log-{body['logId']}"}]}}
+
+    def test_details_are_fetched_once_and_served_from_the_database(self):
+        self.fail_log_two = True
+        with patch("injection.mould_service._post_blacklake", side_effect=self.fake_blacklake) as post:
+            cold_stats = {}
+            cold_logs, cold_warnings = mould_service._fetch_operation_logs("MOLD-1", cold_stats)
+
+            self.fail_log_two = False
+            warm_stats = {}
+            warm_logs, warm_warnings = mould_service._fetch_operation_logs("MOLD-1", warm_stats)
+            post.reset_mock()
+            hot_stats = {}
+            mould_service._fetch_operation_logs("MOLD-1", hot_stats)
+
+        self.assertEqual(cold_warnings, ["operation_log_detail_unavailable:2"])
+        self.assertEqual(cold_logs[0]["detailFields"], [{"fieldName": "log-1"}])
+        self.assertEqual((cold_stats["mes_calls"], cold_stats["detail_fetches"]), (3, 2))
+        self.assertEqual(warm_warnings, [])
+        self.assertEqual(warm_logs[1]["detailFields"], [{"fieldName": "log-2"}])
+        self.assertEqual(
+            (warm_stats["mes_calls"], warm_stats["detail_cache_hits"], warm_stats["detail_fetches"]),
+            (2, 1, 1),
+        )
+        self.assertEqual((hot_stats["mes_calls"], hot_stats["detail_cache_hits"]), (1, 2))
+        post.assert_called_once()
+        self.assertEqual(
+            sorted(mould_service.MouldOperationLogDetail.objects.values_list("log_id", flat=True)),
+            ["1", "2"],
+        )
@@ -0,0 +1,155 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from assembly.models import AssemblyReport
+
+from .models import InjectionReport, PartCatalogEntry, PartSpec
+from .part_catalog import rebuild_part_catalog, refresh_part_catalog, search_part_catalog
+
+
+def create_injection_report(part_no, model):
+    return InjectionReport.objects.create(
+        date=date(2026, 9, 1),
+        tonnage='850T',
+        model=model,
+        section='C/A',
+        plan_qty=100,
+        actual_qty=100,
+        reported_defect=0,
+        actual_defect=0,
+        part_no=part_no,
+    )
+
+
+def create_assembly_report(part_no, model):
+    return AssemblyReport.objects.create(
+        date=date(2026, 9, 1),
+        part_no=part_no,
+        model=model,
+        plan_qty=100,
+        actual_qty=100,
+    )
+
+
+class PartCatalogSyncTests(TestCase):
+    def test_part_spec_shadows_report_rows_for_the_same_part(self):
+        create_injection_report('ACQ30001', 'MODEL-INJ')
+        self.assertEqual(
+            list(PartCatalogEntry.objects.values_list('part_no', 'source')),
+            [('ACQ30001', 'mes_report_injection')],
+        )
+
+        create_assembly_report('ACQ30001', 'MODEL-ASSY')
+        self.assertEqual(
+            list(PartCatalogEntry.objects.values_list('source', 'model_code')),
+            [('mes_report_assembly', 'MODEL-ASSY')],
+        )
+
+        spec = PartSpec.objects.create(part_no='acq30001', model_code='MODEL-A', valid_from=date(2026, 1, 1))
+        self.assertEqual(
+            list(PartCatalogEntry.objects.values_list('source', 'part_spec_id')),
+            [('models', spec.pk)],
+        )
+
+        spec.delete()
+        self.assertEqual(
+            list(PartCatalogEntry.objects.values_list('source', flat=True)),
+            ['mes_report_assembly'],
+        )
+
+    def test_report_deletes_keep_the_fast_path_and_endpoints_refresh_the_catalog(self):
+        create_injection_report('ACQ30001', 'MODEL-INJ')
+        create_injection_report('ACQ30002', 'MODEL-INJ')
+        report = create_assembly_report('ACQ30003', 'MODEL-ASSY')
+
+        # One DELETE, no per-row signals; bulk deleters refresh the catalog once.
+        with self.assertNumQueries(1):
+            InjectionReport.objects.filter(part_no='ACQ30002').delete()
+        refresh_part_catalog(['ACQ30002'])
+
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_superuser(username='admin', password='pw'))
+        injection_report = InjectionReport.objects.get(part_no='ACQ30001')
+        self.assertEqual(client.delete(f'/api/injection/reports/{injection_report.pk}/').status_code, 204)
+        self.assertEqual(client.delete(f'/api/assembly/reports/{report.pk}/').status_code, 204)
+
+        self.assertFalse(PartCatalogEntry.objects.exists())
+
+    def test_renamed_part_spec_leaves_no_row_behind(self):
+        spec = PartSpec.objects.create(part_no='ACQ30001', model_code='MODEL-A', valid_from=date(2026, 1, 1))
+        spec.part_no = 'ACQ30002'
+        spec.save()
+
+        self.assertEqual(list(PartCatalogEntry.objects.values_list('part_no', flat=True)), ['ACQ30002'])
+
+    def test_rebuild_repairs_bulk_writes_and_drops_orphans(self):
+        PartSpec.objects.bulk_create([
+            PartSpec(part_no='ACQ30001', model_code='MODEL-A', valid_from=date(2026, 1, 1)),
+            PartSpec(part_no='ACQ30001', model_code='MODEL-A', valid_from=date(2026, 6, 1)),
+        ])
+        PartCatalogEntry.objects.create(source='mes_report_injection', rank=2, part_no='GONE0001')
+
+        self.assertEqual(rebuild_part_catalog(), 2)
+
+        self.assertEqual(
+            list(PartCatalogEntry.objects.values_list('part_no', 'valid_from')),
+            [('ACQ30001', date(2026, 6, 1)), ('ACQ30001', date(2026, 1, 1))],
+        )
+
+
+class PartCatalogSearchTests(TestCase):
+    def setUp(self):
+        for index in range(3):
+            PartSpec.objects.create(
+                part_no=f'ACQ3000{index}',
+                model_code='MODEL-A',
+                description='Cover assy',
+                valid_from=date(2026, 1, 1),
+            )
+        create_assembly_report('ACQ39999', 'MODEL-B')
+        create_injection_report('ACQ38888', 'MODEL-C')
+        create_injection_report('ACQ30000', 'MODEL-A')
+
+    def test_search_is_case_insensitive_and_ranks_part_specs_first(self):
+        with self.assertNumQueries(2):
+            total, rows = search_part_catalog(search='acq3')
+
+        self.assertEqual(total, 5)
+        self.assertEqual(
+            [(row['part_no'], row['source']) for row in rows],
+            [
+                ('ACQ30000', 'models'),
+                ('ACQ30001', 'models'),
+                ('ACQ30002', 'models'),
+                ('ACQ39999', 'mes_report_assembly'),
+                ('ACQ38888', 'mes_report_injection'),
+            ],
+        )
+        self.assertEqual(rows[3]['id'], 'report_assembly_ACQ39999')
+        self.assertEqual(rows[0]['description'], 'Cover assy')
+
+    def test_search_does_not_match_across_fields(self):
+        self.assertEqual(search_part_catalog(search='0000model')[0], 0)
+
+    def test_without_search_only_part_specs_are_listed(self):
+        total, rows = search_part_catalog()
+
+        self.assertEqual(total, 3)
+        self.assertEqual({row['source'] for row in rows}, {'models'})
+
+    def test_list_endpoint_paginates_in_the_database(self):
+        user = get_user_model().objects.create_user(username='picker', password='pw')
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.get('/api/injection/parts/', {'search': 'ACQ', 'page': 2, 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['count'], 5)
+        self.assertEqual([row['part_no'] for row in body['results']], ['ACQ30002', 'ACQ39999'])
+        self.assertEqual(body['next'], '?page=3&search=ACQ&page_size=2')
+        self.assertEqual(body['previous'], '?page=1&search=ACQ&page_size=2')
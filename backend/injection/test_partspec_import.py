@@ -0,0 +1,105 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from unittest import mock
+
+import pandas as pd
+from django.core.management import call_command
+from django.db.models.signals import post_delete
+from django.test import TestCase
+
+from injection.models import InventorySnapshot, PartCatalogEntry, PartSpec
+from injection.partspec_import import apply_partspec_diff, diff_partspecs, normalize_partspec_frame
+
+
+def workbook_row(part_no, start, **overrides):
+    row = {
+        'Model': 'mnt 27', 'P/N': part_no, 'start date': start, 'Desc': 'COVER',
+        'Mold Type': 'T1', 'Color': 'BLACK', 'Resin(1)': 'ABS', 'Resin(2)': 'R-1',
+        'Net(g)': 12.346, 'S/R(g)': 3.1, 'Ton': 850.0, 'C/T': 42.0, '효율': 95.5,
+        'Cavity': 2.0, 'ResinLoss(%)': 1.2, 'Defect(%)': None,
+    }
+    row.update(overrides)
+    return row
+
+
+class PartSpecImportTests(TestCase):
+    def setUp(self):
+        self.kept = PartSpec.objects.create(
+            part_no='KEEP1', model_code='MNT27', description='COVER', mold_type='T1', color='BLACK',
+            resin_type='ABS', resin_code='R-1', net_weight_g=Decimal('12.35'), sr_weight_g=Decimal('3.10'),
+            tonnage=850, cycle_time_sec=42, efficiency_rate=Decimal('95.50'), cavity=2,
+            resin_loss_pct=Decimal('1.20'), valid_from=date(2025, 1, 1),
+        )
+        self.changed = PartSpec.objects.create(part_no='EDIT1', model_code='MNT27', valid_from=date(2025, 1, 1))
+        self.removed = PartSpec.objects.create(part_no='GONE1', model_code='MNT27', valid_from=date(2025, 1, 1))
+
+    def _frame(self):
+        return normalize_partspec_frame(pd.DataFrame([
+            workbook_row('keep1 ', '2025-01-01'),
+            workbook_row('EDIT1', '2025-01-01', **{'C/T': 40.0}),
+            workbook_row('EDIT1', '2025-01-01', **{'C/T': 38.0}),
+            workbook_row('NEW1', '2025-06-01'),
+            workbook_row(None, '2025-06-01'),
+            workbook_row('BAD1', 'not a date'),
+        ]))
+
+    def test_diff_keys_on_part_no_and_valid_from(self):
+        frame, dropped = self._frame()
+        self.assertEqual(dropped, 2)
+        self.assertEqual(frame.loc[frame['part_no'] == 'EDIT1', 'cycle_time_sec'].item(), 38)
+
+        diff = diff_partspecs(frame, dropped_rows=dropped)
+
+        self.assertEqual(list(diff.inserts['part_no']), ['NEW1'])
+        self.assertEqual(list(diff.updates['part_no']), ['EDIT1'])
+        self.assertEqual(list(diff.deletes['id']), [self.removed.pk])
+        self.assertEqual(diff.unchanged, 1)
+        self.assertEqual(diff.changed_fields['cycle_time_sec'], 1)
+        self.assertEqual(diff.summary()['samples']['inserts'], ['NEW1@2025-06-01'])
+
+    def test_apply_upserts_in_place_and_reimport_is_a_no_op(self):
+        frame, dropped = self._frame()
+        apply_partspec_diff(diff_partspecs(frame, dropped_rows=dropped), batch_size=1)
+
+        self.assertEqual(set(PartSpec.objects.values_list('part_no', flat=True)), {'KEEP1', 'EDIT1', 'NEW1'})
+        edited = PartSpec.objects.get(part_no='EDIT1')
+        self.assertEqual(edited.pk, self.changed.pk)
+        self.assertEqual((edited.cycle_time_sec, edited.net_weight_g), (38, Decimal('12.35')))
+        self.assertTrue(PartCatalogEntry.objects.filter(part_no='NEW1').exists())
+        self.assertFalse(PartCatalogEntry.objects.filter(part_no='GONE1').exists())
+
+        again = diff_partspecs(frame)
+        self.assertFalse(again.has_changes)
+        self.assertEqual(again.unchanged, 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(apply_partspec_diff(again), {})
+
+    def test_deletes_skip_per_row_signals_but_cascade(self):
+        InventorySnapshot.objects.create(part_spec=self.removed, qty=3)
+        receiver = mock.Mock()
+        post_delete.connect(receiver, sender=PartSpec)
+        self.addCleanup(post_delete.disconnect, receiver, sender=PartSpec)
+        frame, dropped = self._frame()
+
+        apply_partspec_diff(diff_partspecs(frame, dropped_rows=dropped))
+
+        receiver.assert_not_called()
+        self.assertFalse(PartSpec.objects.filter(pk=self.removed.pk).exists())
+        self.assertFalse(InventorySnapshot.objects.exists())
+        self.assertFalse(PartCatalogEntry.objects.filter(part_no='GONE1').exists())
+
+    def test_command_dry_run_reports_without_writing(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'c_table.xlsx'
+            pd.DataFrame([workbook_row('NEW2', '2025-06-01')]).to_excel(path, sheet_name='MNT_modi', index=False)
+            out, err = StringIO(), StringIO()
+
+            call_command('import_partspecs', str(path), '--dry-run', stdout=out, stderr=err)
+
+        self.assertIn('inserts=1 updates=0 deletes=3', out.getvalue())
+        self.assertIn('MNT_modi_2207', err.getvalue())
+        self.assertEqual(PartSpec.objects.count(), 3)
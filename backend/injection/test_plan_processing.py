@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from injection.management.commands.benchmark_plan_processing import (
+    HEADERS,
+    build_synthetic_plan_workbook,
+    process_plan_workbook,
+)
+from injection.tests import build_plan_workbook
+
+# Expected processor output, captured from the row-by-row implementation.
+# Regenerate only for an intended output change: UPDATE_PLAN_GOLDEN=1.
+GOLDEN_DIR = Path(__file__).resolve().parent / 'testdata' / 'plan_processing'
+UPDATE_GOLDEN = os.environ.get('UPDATE_PLAN_GOLDEN') == '1'
+
+
+def typed_columns_workbook():
+    """Typed columns the synthetic builder does not produce.
+
+    A MODEL column with blanks is read as float, an IN column with only dates
+    and blanks as datetime64, and duplicated plan keys aggregate.
+    """
+
+    row = ['850T-1', 'L1', 21700, 'B/C 完', None, 'SG-1', 'ABS', 'BLACK', datetime(2026, 8, 1), 1000, 1e-7, 5]
+    return build_plan_workbook(
+        [*HEADERS['injection'], 30, 31, 1, 2],
+        [
+            [*row, 100, 2.5, '试料', 3.5],
+            [*row, 20, None, 0, -5],
+            ['1300T-2 ', None, None, ' ', 'FG-2', None, None, None, None, None, None, None, 7, 7, 7, 7],
+            ['1300T-2', 'L2', 21701, 'c/a', 'FG-3', None, None, None, None, 0, None, None, 1, None, 1, None],
+        ],
+    )
+
+
+SCENARIOS = {
+    'injection_month_rollover': lambda: (
+        build_synthetic_plan_workbook('injection', sheet_date=date(2026, 7, 28), machines=4, days=8, seed=3),
+        'injection',
+        '2026-07-28',
+    ),
+    'machining_year_rollover': lambda: (
+        build_synthetic_plan_workbook('machining', sheet_date=date(2026, 12, 29), machines=3, days=6, seed=5),
+        'machining',
+        '2026-12-29',
+    ),
+    'injection_typed_columns': lambda: (typed_columns_workbook(), 'injection', '2026-07-16'),
+}
+FULL_SIZE = {
+    'injection_17x31': lambda: (build_synthetic_plan_workbook('injection', seed=11), 'injection', '2026-07-16'),
+    'machining_17x31': lambda: (build_synthetic_plan_workbook('machining', seed=12), 'machining', '2026-07-16'),
+}
+
+
+def canonical(result):
+    return json.dumps(result, ensure_ascii=False, indent=1) + '\n'
+
+
+class ProductionPlanGoldenTests(SimpleTestCase):
+    maxDiff = None
+
+    def _check(self, path, actual):
+        if UPDATE_GOLDEN:
+            path.write_text(actual, encoding='utf-8')
+        self.assertEqual(actual, path.read_text(encoding='utf-8'))
+
+    def test_small_plans_match_golden_output(self):
+        for name, scenario in SCENARIOS.items():
+            with self.subTest(name):
+                self._check(GOLDEN_DIR / f'{name}.json', canonical(process_plan_workbook(*scenario())))
+
+    def test_full_month_plans_match_golden_digests(self):
+        digests = {
+            name: hashlib.sha256(canonical(process_plan_workbook(*scenario())).encode('utf-8')).hexdigest()
+            for name, scenario in FULL_SIZE.items()
+        }
+        self._check(GOLDEN_DIR / 'full_month_digests.json', canonical(digests))
+
+    def test_golden_plans_cover_the_edge_cases(self):
+        result = json.loads((GOLDEN_DIR / 'injection_typed_columns.json').read_text(encoding='utf-8'))
+        first = result['records'][0]
+        self.assertEqual((first['model'], first['delivery_date'], first['produced_qty']), ('21700.0', '2026-08-01', 0))
+        self.assertEqual(first['daily_plan'], [{'date': '2026-07-30', 'plan_qty': 100}, {'date': '2026-07-31', 'plan_qty': 2}, {'date': '2026-08-02', 'plan_qty': 4}])
+        self.assertEqual(result['available_days'], ['2026-07-30', '2026-07-31', '2026-08-01', '2026-08-02'])
+        self.assertEqual(result['daily_totals'][0], {'date': '2026-07-30', 'plan_qty': 128})
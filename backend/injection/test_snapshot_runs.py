@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from injection import mes_service as mes_module
+from injection.models import InjectionMonitoringRecord, MonitoringSnapshotRun
+from injection.snapshot_runs import snapshot_run_stats
+
+
+SHANGHAI = ZoneInfo('Asia/Shanghai')
+NOW = datetime(2026, 8, 7, 10, 30, 12, tzinfo=SHANGHAI)
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW.astimezone(tz) if tz else NOW.replace(tzinfo=None)
+
+
+def mes_response():
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        'code': 200,
+        'data': {'list': [{
+            'paramId': mes_module.MES_PARAM_ID_PROD,
+            'recordTime': int(NOW.replace(second=0).timestamp() * 1000),
+            'val': 1200,
+        }]},
+    }
+    return response
+
+
+@patch('injection.mes_service.datetime', FixedDatetime)
+@patch('injection.mes_service.get_access_token', return_value='token')
+@patch('injection.mes_service.requests.post', side_effect=lambda *args, **kwargs: mes_response())
+class SnapshotRunLogTests(TestCase):
+    def setUp(self):
+        self.service = mes_module.MESResourceService()
+
+    def test_completed_run_records_stage_timings_and_counts(self, post, _token):
+        result = self.service.update_hourly_snapshot_from_mes()
+
+        self.assertEqual(result['status'], 'completed')
+        run = MonitoringSnapshotRun.objects.get()
+        self.assertEqual(run.status, MonitoringSnapshotRun.STATUS_COMPLETED)
+        self.assertEqual(run.target_timestamp, NOW.replace(second=0))
+        self.assertEqual(run.mes_call_count, post.call_count)
+        self.assertEqual(run.records_written, 17)
+        self.assertEqual(InjectionMonitoringRecord.objects.count(), 17)
+        self.assertEqual(set(run.stage_ms), {'token', 'fetch', 'write', 'rollup', 'compaction'})
+        self.assertGreaterEqual(run.duration_ms, 0)
+
+    def test_duplicate_delivery_for_a_completed_minute_is_coalesced(self, post, _token):
+        self.service.update_hourly_snapshot_from_mes()
+        calls = post.call_count
+
+        result = self.service.update_hourly_snapshot_from_mes()
+
+        self.assertEqual(result['reason'], 'snapshot_already_completed')
+        self.assertEqual(post.call_count, calls)
+        self.assertEqual(
+            list(MonitoringSnapshotRun.objects.order_by('id').values_list('status', flat=True)),
+            [MonitoringSnapshotRun.STATUS_COMPLETED, MonitoringSnapshotRun.STATUS_COALESCED],
+        )
+
+    def test_overlapping_run_is_logged_as_skipped_and_absorbed_by_the_next(self, post, _token):
+        with patch.object(self.service, '_acquire_snapshot_update_lock', return_value=None):
+            result = self.service.update_hourly_snapshot_from_mes()
+        self.assertEqual(result['status'], 'skipped')
+        post.assert_not_called()
+
+        self.service.update_hourly_snapshot_from_mes()
+
+        skipped, completed = MonitoringSnapshotRun.objects.order_by('id')
+        self.assertEqual(skipped.status, MonitoringSnapshotRun.STATUS_SKIPPED)
+        self.assertEqual(completed.coalesced_runs, 1)
+
+
+class SnapshotRunStatsTests(TestCase):
+    def setUp(self):
+        started = timezone.now()
+        for index in range(20):
+            MonitoringSnapshotRun.objects.create(
+                started_at=started - timedelta(minutes=2 * index),
+                status=MonitoringSnapshotRun.STATUS_COMPLETED,
+                duration_ms=1000 * (index + 1),
+                stage_ms={'fetch': 100.0 * (index + 1), 'rollup': 10.0},
+                mes_call_count=17,
+            )
+        MonitoringSnapshotRun.objects.create(
+            started_at=started - timedelta(minutes=1),
+            status=MonitoringSnapshotRun.STATUS_SKIPPED,
+        )
+
+    def test_stats_report_nearest_rank_percentiles_of_worked_runs(self):
+        stats = snapshot_run_stats(limit=100)
+
+        self.assertEqual(stats['runs'], 21)
+        self.assertEqual(stats['status_counts']['skipped'], 1)
+        self.assertEqual(stats['duration_ms']['p50'], 10_000)
+        self.assertEqual(stats['duration_ms']['p95'], 19_000)
+        self.assertEqual(stats['stage_ms']['fetch']['p95'], 1900.0)
+        self.assertEqual(stats['stage_ms']['token']['samples'], 0)
+        self.assertEqual(stats['counters']['mes_call_count']['total'], 340)
+        self.assertEqual(stats['overrun_count'], 0)
+
+        self.assertEqual(snapshot_run_stats(limit=5)['runs'], 5)
+
+    def test_stats_endpoint_is_admin_only(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user(username='viewer', password='pw'))
+        url = '/api/injection/monitoring/snapshot-runs/stats/'
+        self.assertEqual(client.get(url).status_code, 403)
+
+        client.force_authenticate(User.objects.create_user(username='ops', password='pw', is_staff=True))
+        response = client.get(url, {'runs': 10})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['runs'], 10)
@@ -4,15 +4,17 @@ from io import BytesIO
 import pytz
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
 from openpyxl import Workbook
 from rest_framework.test import APIClient
 
+from config.parse_pool import get_parse_job
+
 from .mes_service import mes_service
 from .models import InjectionMonitoringRecord, InjectionMonitoringRollup
 from .plan_processing import ProductionPlanProcessingError, ProductionPlanProcessor
-from production.models import ProductionPlan
+from production.models import ProductionPlan, ProductionPlanChangeLog
 
 
 def build_plan_workbook(headers, rows):
@@ -287,3 +289,44 @@ class ProductionPlanProcessorMissingOrderTests(TestCase):
         self.assertEqual(model_record['planned_quantity'], 624)
         self.assertIsNone(model_record['lot_no'])
         self.assertEqual(model_record['part_no'], '')
+
+
+@override_settings(PARSE_POOL_ENABLED=True)
+class ProductionPlanAsyncUploadTests(TransactionTestCase):
+    # The plan is saved from a parse pool thread, outside the test's transaction.
+
+    def test_async_upload_is_saved_without_being_polled(self):
+        user = get_user_model().objects.create_user(
+            username='async-plan-uploader',
+            password='test-password',
+            is_staff=True,
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+        upload = SimpleUploadedFile(
+            'injection-plan.xlsx',
+            build_model_only_injection_plan_workbook(),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+
+        response = client.post(
+            reverse('production-plan-upload-root') + '?async=1',
+            {'file': upload, 'plan_type': 'injection', 'date': '2026-07-16'},
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, 202, response.data)
+        # Parallel test workers are daemonic and parse inline, so the job may be done already.
+        self.assertIn(response.data['status'], {'queued', 'running', 'finishing', 'completed'})
+        job = get_parse_job(response.data['id'])
+        self.addCleanup(job.discard)
+        job.wait(timeout=30)
+        self.assertEqual(
+            ProductionPlan.objects.get(plan_date='2026-07-16', model_name='21700').planned_quantity,
+            624,
+        )
+        self.assertTrue(ProductionPlanChangeLog.objects.filter(changed_by=user, action='upload').exists())
+
+        polled = client.get(response.data['poll_url']).data
+        self.assertEqual((polled['status'], polled['http_status']), ('completed', 200), polled)
+        self.assertEqual(polled['result']['plan_type'], 'injection')
@@ -8,7 +8,7 @@ from .views import (
     CycleTimeTestRecordViewSet, InjectionMonitoringRecordListView,
     InjectionMonitoringDatesView, ResourceMonitorPageListView, ProductionMatrixView, MachineListView,
     MesRawDebugView, SingleDeviceMonitorView, UpdateRecentSnapshotsView,
-    UpdateRecentSnapshotsStatusView,
+    UpdateRecentSnapshotsStatusView, MonitoringSnapshotRunStatsView,
     ProductionPlanUploadView
 )
 from .mould_views import (
@@ -44,6 +44,7 @@ urlpatterns = [
     path('monitoring-dates/', InjectionMonitoringDatesView.as_view(), name='injection-monitoring-dates'),
     path('update-recent-snapshots/', UpdateRecentSnapshotsView.as_view(), name='update-recent-snapshots'),
     path('update-recent-snapshots/status/', UpdateRecentSnapshotsStatusView.as_view(), name='update-recent-snapshots-status'),
+    path('monitoring/snapshot-runs/stats/', MonitoringSnapshotRunStatsView.as_view(), name='monitoring-snapshot-run-stats'),
     # BLACKLAKE 스펙을 따르는 새로운 API 엔드포인트
     path('resource/open/v1/resource_monitor/_page_list/', ResourceMonitorPageListView.as_view(), name='resource-monitor-page-list'),
     # 생산 모니터링 매트릭스 API
@@ -8,7 +8,6 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404, render, redirect
 from django.http import HttpResponse
 import csv
-import io
 
 # Import actual models
 from .models import (
@@ -39,11 +38,21 @@ from .permissions import (
     AdminOnlyPermission,
 )
 from config.authentication import ScopedJWTAuthentication
+from config.csv_import import BulkCsvImporter, CsvRowError, iter_csv_rows, query_param_flag
+from config.parse_pool import (
+    DiskUploadMixin,
+    ParseJobError,
+    parse_job_error_response,
+    submit_parse_job,
+)
+from config.http_cache import PUBLIC, cache_policy
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.hashers import make_password
 from django.db import transaction, OperationalError, ProgrammingError
 from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.urls import reverse
 from django.db.models.functions import TruncDate
 from django.core.cache import cache
 import secrets, string
@@ -57,8 +66,21 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 
 from .mes_service import mes_service
+from .cycle_time_stats import (
+    CYCLE_TIME_CALCULATION_METHOD,
+    CYCLE_TIME_WINDOW_DAYS,
+    PART_PREFIX_LENGTH,
+    part_prefix,
+    report_cycle_time_stats,
+    resolve_standard_cycle_time,
+    setup_target_cycle_time_by_prefix,
+)
+from .snapshot_runs import DEFAULT_STATS_RUNS, snapshot_run_stats
+from .part_catalog import PART_CATALOG_MAX_PAGE_SIZE, refresh_part_catalog, search_part_catalog
 from .plan_processing import ProductionPlanProcessor, ProductionPlanProcessingError
 from production.models import ProductionPlan, ProductionPlanChangeLog
+from analytics.partitions import mark_monitoring_dirty, mark_plans_dirty
+from production.ai_context_cache import bump_plan_context_revision
 from production.permissions import user_can_edit_plan
 
 User = get_user_model()
@@ -210,7 +232,69 @@ class UpdateRecentSnapshotsStatusView(generics.GenericAPIView):
         return Response(payload, status=status.HTTP_200_OK)
 
 
-class InjectionReportViewSet(viewsets.ModelViewSet):
+class MonitoringSnapshotRunStatsView(generics.GenericAPIView):
+    """p50/p95 stage latency and outcome counts of recent monitoring snapshot runs."""
+    permission_classes = [AdminOnlyPermission]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = int(request.query_params.get('runs', DEFAULT_STATS_RUNS))
+        except (TypeError, ValueError):
+            limit = DEFAULT_STATS_RUNS
+        return Response(snapshot_run_stats(limit), status=status.HTTP_200_OK)
+
+
+INJECTION_REPORT_IMPORT_KEY = ('date', 'machine_no', 'part_no')
+INJECTION_REPORT_IMPORT_UPDATE_FIELDS = [
+    'tonnage', 'model', 'section', 'plan_qty', 'actual_qty', 'reported_defect',
+    'actual_defect', 'total_time', 'idle_time', 'start_datetime', 'end_datetime', 'note',
+]
+
+
+def _parse_csv_datetime(value):
+    if not value:
+        return None
+    try:
+        return timezone.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def parse_injection_report_csv_row(row, row_num):
+    """사출 보고서 CSV 한 행을 InjectionReport 필드 값으로 변환"""
+    date_str = (row.get('date') or '').lstrip('\ufeff').strip()
+    if not date_str:
+        raise CsvRowError(f"Row {row_num}: Date is required.")
+
+    try:
+        report_date = parse_date(date_str)
+        if report_date is None:
+            raise ValueError(f"Invalid date '{date_str}'")
+        operation_time = int(row.get('operation_time') or 0)
+        total_time = int(row.get('total_time') or 1440)
+        return {
+            'date': report_date,
+            'machine_no': int(row['machine_no']) if row.get('machine_no') else None,
+            # bulk 저장은 save() 를 거치지 않으므로 여기서 대문자로 정규화
+            'part_no': (row.get('part_no') or '').strip().upper(),
+            'tonnage': row.get('tonnage') or '',
+            'model': row.get('model') or '',
+            'section': row.get('section') or '',
+            'plan_qty': int(row.get('plan_qty') or 0),
+            'actual_qty': int(row.get('actual_qty') or 0),
+            'reported_defect': int(row.get('reported_defect') or 0),
+            'actual_defect': int(row.get('actual_defect') or 0),
+            'total_time': total_time,
+            'idle_time': max(0, total_time - operation_time),
+            'start_datetime': _parse_csv_datetime(row.get('start_datetime')),
+            'end_datetime': _parse_csv_datetime(row.get('end_datetime')),
+            'note': row.get('note') or '',
+        }
+    except (ValueError, TypeError, KeyError) as e:
+        raise CsvRowError(f"Row {row_num}: Invalid data format - {e} - {row}") from e
+
+
+class InjectionReportViewSet(DiskUploadMixin, viewsets.ModelViewSet):
     queryset = InjectionReport.objects.all()
     serializer_class = InjectionReportSerializer
 
@@ -227,6 +311,12 @@ class InjectionReportViewSet(viewsets.ModelViewSet):
         
         return queryset.order_by('-date', 'machine_no', 'start_datetime')
 
+    def perform_destroy(self, instance):
+        part_no = instance.part_no
+        instance.delete()
+        # 보고서 삭제는 signal 로 품목 카탈로그를 갱신하지 않으므로 직접 갱신
+        refresh_part_catalog([part_no])
+
     @action(detail=False, methods=['get'])
     def dates(self, request):
         """
@@ -314,6 +404,7 @@ class InjectionReportViewSet(viewsets.ModelViewSet):
         """
         CSV 파일을 이용해 여러 개의 사출 보고서를 한 번에 생성하거나 업데이트합니다.
         'date', 'machine_no', 'part_no'를 기준으로 중복을 확인합니다.
+        ``?dry_run=1`` 이면 검증과 건수 계산만 하고 저장하지 않습니다.
         """
         file = request.FILES.get('file')
         if not file:
@@ -322,94 +413,38 @@ class InjectionReportViewSet(viewsets.ModelViewSet):
         if not file.name.endswith('.csv'):
             return Response({'error': 'File is not a CSV'}, status=status.HTTP_400_BAD_REQUEST)
 
-        created_count = 0
-        updated_count = 0
-        errors = []
-
-        try:
-            decoded_file = file.read().decode('utf-8-sig')
-            io_string = io.StringIO(decoded_file)
-            reader = csv.DictReader(io_string)
-
-            with transaction.atomic():
-                for i, row in enumerate(reader):
-                    try:
-                        # --- 데이터 파싱 및 검증 ---
-                        date_str = row.get('date', '').lstrip('\ufeff').strip()
-                        if not date_str:
-                            errors.append(f"Row {i+1}: Date is required.")
-                            continue
-
-                        machine_no = int(row['machine_no']) if row.get('machine_no') else None
-                        part_no = row.get('part_no', '').strip().upper()
-
-                        plan_qty = int(row.get('plan_qty') or 0)
-                        actual_qty = int(row.get('actual_qty') or 0)
-                        reported_defect = int(row.get('reported_defect') or 0)
-                        actual_defect = int(row.get('actual_defect') or 0)
-                        operation_time = int(row.get('operation_time') or 0)
-                        total_time = int(row.get('total_time') or 1440)
-                        idle_time = max(0, total_time - operation_time)
-
-                        start_datetime = None
-                        start_datetime_str = row.get('start_datetime')
-                        if start_datetime_str:
-                            try:
-                                start_datetime = timezone.datetime.fromisoformat(start_datetime_str)
-                            except ValueError:
-                                start_datetime = None
-
-                        end_datetime = None
-                        end_datetime_str = row.get('end_datetime')
-                        if end_datetime_str:
-                            try:
-                                end_datetime = timezone.datetime.fromisoformat(end_datetime_str)
-                            except ValueError:
-                                end_datetime = None
-
-                        # --- Upsert 로직 ---
-                        lookup_key = {
-                            'date': date_str,
-                            'machine_no': machine_no,
-                            'part_no': part_no,
-                        }
-
-                        report_defaults = {
-                            'tonnage': row.get('tonnage', ''),
-                            'model': row.get('model', ''),
-                            'section': row.get('section', ''),
-                            'plan_qty': plan_qty,
-                            'actual_qty': actual_qty,
-                            'reported_defect': reported_defect,
-                            'actual_defect': actual_defect,
-                            'total_time': total_time,
-                            'idle_time': idle_time,
-                            'start_datetime': start_datetime,
-                            'end_datetime': end_datetime,
-                            'note': row.get('note', '')
-                        }
-
-                        obj, created = InjectionReport.objects.update_or_create(
-                            **lookup_key,
-                            defaults=report_defaults
-                        )
+        dry_run = query_param_flag(request.query_params.get('dry_run'))
+        part_nos = set()
 
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
+        def parse_row(row, row_num):
+            values = parse_injection_report_csv_row(row, row_num)
+            part_nos.add(values['part_no'])
+            return values
 
-                    except (ValueError, TypeError, KeyError) as e:
-                        errors.append(f"Row {i+1}: Invalid data format - {e} - {row}")
+        try:
+            importer = BulkCsvImporter(
+                InjectionReport,
+                key_fields=INJECTION_REPORT_IMPORT_KEY,
+                parse_row=parse_row,
+                update_fields=INJECTION_REPORT_IMPORT_UPDATE_FIELDS,
+            )
+            result = importer.run(iter_csv_rows(file), dry_run=dry_run)
+            if not dry_run:
+                # bulk 저장은 signal 을 보내지 않으므로 품목 카탈로그를 직접 갱신
+                refresh_part_catalog(part_nos)
 
-            if errors:
-                return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+            if result.errors:
+                return Response(
+                    {'errors': result.errors, 'metrics': result.metrics()},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
             return Response({
-                'created': created_count,
-                'skipped': updated_count, # 'skipped'는 프론트엔드 호환성을 위해 유지 (업데이트된 항목 수)
-                'errors': len(errors)
-            }, status=status.HTTP_201_CREATED)
+                'created': result.created,
+                'skipped': result.updated, # 'skipped'는 프론트엔드 호환성을 위해 유지 (업데이트된 항목 수)
+                'errors': 0,
+                'metrics': result.metrics(),
+            }, status=status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED)
 
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -439,54 +474,32 @@ class InjectionReportViewSet(viewsets.ModelViewSet):
         if not part_no:
             return Response({'error': 'part_no is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 기본 필터 조건: Part No.의 앞 9자리로 검색
-        part_prefix = part_no[:9]
-        filter_kwargs = {
-            'part_no__startswith': part_prefix,
-            'actual_qty__gt': 0,  # 실제 생산량이 있는 것만
-            'actual_defect__lte': django_models.F('actual_qty') * 0.1  # 불량률 10% 이하 (양품 기준)
-        }
-
-        # 사출기 번호가 있으면 추가 필터링
+        machine_filter = None
         if machine_no:
             try:
-                filter_kwargs['machine_no'] = int(machine_no)
+                machine_filter = int(machine_no)
             except (ValueError, TypeError):
                 return Response({'error': 'Invalid machine_no'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 최근 30일간의 데이터로 제한
-        recent_date = timezone.now().date() - timedelta(days=30)
-        filter_kwargs['date__gte'] = recent_date
+        # 최근 30일, Part No. 앞 9자리, 불량률 10% 이하 보고서를 한 번의 집계 쿼리로 계산
+        stats = report_cycle_time_stats(part_no, machine_no=machine_filter)
 
-        # 평균 사이클 타임 계산
-        # operation_time(분) / actual_qty = 분당 사이클 타임 -> 초로 변환
-        reports = InjectionReport.objects.filter(**filter_kwargs)
-
-        if not reports.exists():
+        if not stats['sample_count']:
             return Response({
                 'part_no': part_no,
                 'machine_no': machine_no,
                 'avg_cycle_time': None,
                 'sample_count': 0,
-                'calculation_method': 'operation_time / actual_qty'
+                'calculation_method': CYCLE_TIME_CALCULATION_METHOD
             })
 
-        # 평균 계산: (총 가동시간 / 총 생산량) * 60초
-        total_operation_time = sum(r.operation_time for r in reports)  # 분
-        total_production = sum(r.actual_qty for r in reports)
-
-        if total_production == 0:
-            avg_cycle_time = None
-        else:
-            avg_cycle_time = round((total_operation_time / total_production) * 60, 1)  # 초
-
         return Response({
             'part_no': part_no,
             'machine_no': machine_no,
-            'avg_cycle_time': avg_cycle_time,
-            'sample_count': reports.count(),
-            'calculation_method': 'operation_time / actual_qty',
-            'period_days': 30
+            'avg_cycle_time': stats['avg_cycle_time'],
+            'sample_count': stats['sample_count'],
+            'calculation_method': CYCLE_TIME_CALCULATION_METHOD,
+            'period_days': CYCLE_TIME_WINDOW_DAYS
         })
 
 class ProductViewSet(viewsets.ModelViewSet):
@@ -536,180 +549,29 @@ class PartSpecViewSet(viewsets.ModelViewSet):
         """특정 Part No.의 표준 사이클 타임 조회"""
         part_no = part_no.upper() if part_no else ''
 
-        # PartSpec에서 먼저 조회
-        part_spec = PartSpec.objects.filter(part_no=part_no).first()
-        if part_spec and part_spec.cycle_time_sec:
-            return Response({
-                'part_no': part_no,
-                'standard_cycle_time': part_spec.cycle_time_sec,
-                'source': 'spec'
-            })
-
-        # PartSpec에 없으면 최근 승인된 셋업에서 조회
-        recent_setup = CycleTimeSetup.objects.filter(
-            part_no=part_no,
-            status='APPROVED',
-            mean_cycle_time__isnull=False
-        ).order_by('-approved_at').first()
-
-        if recent_setup:
-            return Response({
-                'part_no': part_no,
-                'standard_cycle_time': recent_setup.mean_cycle_time,
-                'source': 'setup'
-            })
-
-        # 둘 다 없으면 null 반환
+        # PartSpec → 최근 승인된 셋업 순으로 조회, 둘 다 없으면 null
+        standard_ct, source = resolve_standard_cycle_time(part_no)
         return Response({
             'part_no': part_no,
-            'standard_cycle_time': None,
-            'source': None
+            'standard_cycle_time': standard_ct,
+            'source': source
         })
-    
+
     def list(self, request, *args, **kwargs):
-        """Models 데이터 + MES 데이터 통합 검색"""
+        """Models 데이터 + MES 데이터 통합 검색 (PartCatalogEntry 기반 DB 페이지네이션)"""
         search = request.query_params.get('search', '').strip()
         model_code = request.query_params.get('model_code', '').strip()
-        page_size = int(request.query_params.get('page_size', 20))
-        page = int(request.query_params.get('page', 1))
-        
-        # 1. Models 데이터 (PartSpec) 검색 - 우선순위 높음
-        models_queryset = self.get_queryset()
-        if search:
-            models_queryset = models_queryset.filter(
-                Q(part_no__icontains=search) |
-                Q(model_code__icontains=search) |
-                Q(description__icontains=search)
-            )
-        if model_code:
-            models_queryset = models_queryset.filter(model_code__icontains=model_code)
-        
-        models_data = []
-        for part in models_queryset:
-            models_data.append({
-                'id': part.id,
-                'part_no': part.part_no,
-                'model_code': part.model_code,
-                'description': part.description or '',
-                'mold_type': part.mold_type or '',
-                'color': part.color or '',
-                'resin_type': part.resin_type or '',
-                'resin_code': part.resin_code or '',
-                'net_weight_g': str(part.net_weight_g) if part.net_weight_g else '',
-                'sr_weight_g': str(part.sr_weight_g) if part.sr_weight_g else '',
-                'tonnage': part.tonnage,
-                'cycle_time_sec': part.cycle_time_sec,
-                'efficiency_rate': str(part.efficiency_rate) if part.efficiency_rate else '',
-                'cavity': part.cavity,
-                'resin_loss_pct': str(part.resin_loss_pct) if part.resin_loss_pct else '',
-                'defect_rate_pct': str(part.defect_rate_pct) if part.defect_rate_pct else '',
-                'valid_from': part.valid_from.strftime('%Y-%m-%d') if part.valid_from else '',
-                'created_at': part.created_at.isoformat() if part.created_at else '',
-                'source': 'models'  # 데이터 출처 표시
-            })
-        
-        # 2. MES 데이터 (AssemblyPartSpec + Production Reports) 검색
-        mes_data = []
-        if search or model_code:
-            try:
-                from assembly.models import AssemblyPartSpec, AssemblyReport
-                
-                # AssemblyPartSpec에서 검색
-                assembly_filter = Q()
-                if search:
-                    assembly_filter |= (
-                        Q(part_no__icontains=search) |
-                        Q(model_code__icontains=search) |
-                        Q(description__icontains=search)
-                    )
-                if model_code:
-                    assembly_filter &= Q(model_code__icontains=model_code)
-                
-                assembly_parts = AssemblyPartSpec.objects.filter(assembly_filter)[:20] if assembly_filter.children else []
-                
-                for part in assembly_parts:
-                    # Models에 이미 없는 것만 추가 (중복 방지)
-                    if not any(m['part_no'] == part.part_no for m in models_data):
-                        mes_data.append({
-                            'id': f"assembly_{part.id}",
-                            'part_no': part.part_no,
-                            'model_code': part.model_code,
-                            'description': part.description or '',
-                            'process_type': part.process_type or '',
-                            'material_type': part.material_type or '',
-                            'standard_cycle_time': part.standard_cycle_time,
-                            'standard_worker_count': part.standard_worker_count,
-                            'valid_from': part.valid_from.strftime('%Y-%m-%d') if part.valid_from else '',
-                            'source': 'mes_assembly'
-                        })
-                
-                # AssemblyReport (생산 기록)에서도 검색
-                report_filter = Q()
-                if search:
-                    report_filter |= (
-                        Q(part_no__icontains=search) |
-                        Q(model__icontains=search)
-                    )
-                if model_code:
-                    report_filter &= Q(model__icontains=model_code)
-                
-                assembly_reports = AssemblyReport.objects.filter(report_filter).values('part_no', 'model').distinct()[:20] if report_filter.children else []
-                
-                for report in assembly_reports:
-                    part_no = report['part_no']
-                    model = report['model']
-                    # 이미 추가되지 않은 것만 추가
-                    if (not any(m['part_no'] == part_no for m in models_data) and
-                        not any(m['part_no'] == part_no for m in mes_data)):
-                        mes_data.append({
-                            'id': f"report_assembly_{part_no}",
-                            'part_no': part_no,
-                            'model_code': model,
-                            'description': '',
-                            'source': 'mes_report_assembly'
-                        })
-                
-                # InjectionReport (사출 생산 기록)에서도 검색
-                injection_filter = Q()
-                if search:
-                    injection_filter |= (
-                        Q(part_no__icontains=search) |
-                        Q(model__icontains=search)
-                    )
-                if model_code:
-                    injection_filter &= Q(model__icontains=model_code)
-                
-                injection_reports = InjectionReport.objects.filter(injection_filter).values('part_no', 'model', 'type').distinct()[:20] if injection_filter.children else []
-                
-                for report in injection_reports:
-                    part_no = report['part_no']
-                    model = report['model']
-                    description = report['type'] or ''
-                    # 이미 추가되지 않은 것만 추가
-                    if (not any(m['part_no'] == part_no for m in models_data) and
-                        not any(m['part_no'] == part_no for m in mes_data)):
-                        mes_data.append({
-                            'id': f"report_injection_{part_no}",
-                            'part_no': part_no,
-                            'model_code': model,
-                            'description': description,
-                            'source': 'mes_report_injection'
-                        })
-                        
-            except Exception as e:
-                # MES 데이터 조회 실패시 Models 데이터만 반환
-                pass
-        
-        # 3. 결과 통합 (Models 우선, MES 보완)
-        all_results = models_data + mes_data
-        
-        # 4. 페이지네이션
-        total_count = len(all_results)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        page_results = all_results[start_idx:end_idx]
-        
-        # 5. 페이지네이션 응답 형식으로 반환
+        page_size = min(max(1, int(request.query_params.get('page_size', 20))), PART_CATALOG_MAX_PAGE_SIZE)
+        page = max(1, int(request.query_params.get('page', 1)))
+
+        total_count, page_results = search_part_catalog(
+            search=search,
+            model_code=model_code,
+            page=page,
+            page_size=page_size,
+        )
+        end_idx = page * page_size
+
         return Response({
             'count': total_count,
             'next': f"?page={page + 1}&search={search}&page_size={page_size}" if end_idx < total_count else None,
@@ -1339,43 +1201,23 @@ class CycleTimeSetupViewSet(viewsets.ModelViewSet):
     def dashboard(self, request):
         """셋업 대시보드 데이터"""
         from django.utils import timezone
-        from django.db.models import Q, Avg
+        from django.db.models import Q
         today = timezone.now().date()
 
         today_setups = CycleTimeSetup.objects.filter(setup_date__date=today)
 
-        # Part no.의 앞 9자리별 평균 target_cycle_time 계산
-        part_prefix_avg_ct = {}  # 앞 9자리 -> 평균 C/T
-        part_to_prefix = {}  # 전체 Part no. -> 앞 9자리 매핑
-
-        for part_no in today_setups.values_list('part_no', flat=True).distinct():
-            if part_no and len(part_no) >= 9:
-                prefix = part_no[:9]
-                part_to_prefix[part_no] = prefix
-
-        # 앞 9자리별로 그룹화하여 평균 계산
-        for prefix in set(part_to_prefix.values()):
-            # 앞 9자리가 동일한 모든 Part no. 찾기
-            matching_parts = [pn for pn, px in part_to_prefix.items() if px == prefix]
-
-            # 해당 Part no.들의 평균 target_cycle_time 계산
-            avg = today_setups.filter(part_no__in=matching_parts).aggregate(
-                avg_ct=Avg('target_cycle_time')
-            )['avg_ct']
-
-            if avg:
-                part_prefix_avg_ct[prefix] = round(avg)
+        # Part no.의 앞 9자리별 평균 target_cycle_time 계산 (단일 집계 쿼리)
+        part_prefix_avg_ct = setup_target_cycle_time_by_prefix(today_setups)
 
         # 머신별 최신 셋업만 추출 (1~17호기)
         machine_latest_setups = {}
-        for machine_no in range(1, 18):  # 1~17호기
-            latest = today_setups.filter(machine_no=machine_no).order_by('-setup_date').first()
-            if latest:
-                # Part no.의 앞 9자리로 평균 C/T 조회
-                if latest.part_no and len(latest.part_no) >= 9:
-                    prefix = latest.part_no[:9]
-                    latest.mean_cycle_time = part_prefix_avg_ct.get(prefix)
-                machine_latest_setups[machine_no] = latest
+        for latest in today_setups.filter(machine_no__range=(1, 17)).order_by('machine_no', '-setup_date'):
+            if latest.machine_no in machine_latest_setups:
+                continue
+            # Part no.의 앞 9자리로 평균 C/T 조회
+            if latest.part_no and len(latest.part_no) >= PART_PREFIX_LENGTH:
+                latest.mean_cycle_time = part_prefix_avg_ct.get(part_prefix(latest.part_no))
+            machine_latest_setups[latest.machine_no] = latest
 
         # 최신순으로 정렬된 리스트로 변환
         recent_setups_list = sorted(
@@ -1719,10 +1561,32 @@ class InjectionMonitoringRecordListView(generics.ListAPIView):
         return queryset.order_by('timestamp', 'device_code')
 
 
+def monitoring_record_version(request, *args, **kwargs):
+    return InjectionMonitoringRecord.objects.aggregate(
+        last_id=django_models.Max('id'),
+        earliest=django_models.Min('timestamp'),
+        latest=django_models.Max('timestamp'),
+    )
+
+
+def machine_list_version(request, *args, **kwargs):
+    # 사출기 목록은 생산 보고서와 셋업 기록에서 파생되므로 두 테이블의 변경만 확인
+    reports = InjectionReport.objects.aggregate(
+        count=django_models.Count('id'),
+        latest=django_models.Max('updated_at'),
+    )
+    setups = CycleTimeSetup.objects.aggregate(
+        count=django_models.Count('id'),
+        latest=django_models.Max('updated_at'),
+    )
+    return {'reports': reports, 'setups': setups}
+
+
 class InjectionMonitoringDatesView(generics.GenericAPIView):
     """저장된 사출 MES 모니터링 데이터의 생산 기준일 목록."""
     permission_classes = [AllowAny]
 
+    @cache_policy(max_age=60, scope=PUBLIC, version=monitoring_record_version)
     def get(self, request, *args, **kwargs):
         try:
             limit = int(request.query_params.get('limit', '120'))
@@ -2120,6 +1984,7 @@ class MachineListView(generics.GenericAPIView):
     """사출기 목록 뷰"""
     permission_classes = [AllowAny]
 
+    @cache_policy(max_age=300, scope=PUBLIC, version=machine_list_version)
     def get(self, request):
         """사출기 목록 반환"""
         # ProductionMatrixView의 실제 사출기 정보 조회 로직 재사용
@@ -2207,6 +2072,7 @@ class SingleDeviceMonitorView(generics.GenericAPIView):
                     'power_kwh': latest_power,
                 }
             )
+            mark_monitoring_dirty([(obj.machine_name, obj.timestamp)], reason='monitoring_api')
             
             serializer = InjectionMonitoringRecordSerializer(obj)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -2215,8 +2081,134 @@ class SingleDeviceMonitorView(generics.GenericAPIView):
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class ProductionPlanUploadView(generics.GenericAPIView):
-    """Upload production-plan workbooks for injection or machining."""
+def finish_production_plan_upload(job, *, file_name, user_id):
+    """Save a parsed plan workbook; the parse pool's ``finish`` step for plan uploads."""
+
+    try:
+        response_data = job.result()
+    except ProductionPlanProcessingError as exc:
+        return status.HTTP_400_BAD_REQUEST, {"error": str(exc)}
+    except ParseJobError as exc:
+        return exc.http_status, {"code": exc.code, "error": exc.message}
+    changed_by = get_user_model().objects.filter(pk=user_id).first() if user_id else None
+
+    # --- Begin: Save processed data to the database ---
+    try:
+        with transaction.atomic():
+            # 1. Get the date range and plan type from the processed data
+            available_days = response_data.get("available_days", [])
+            plan_type = response_data.get("plan_type")
+
+            if available_days and plan_type:
+                # 2. Delete all existing plan entries within this date range for this plan type
+                deleted_count, _ = ProductionPlan.objects.filter(
+                    plan_date__in=available_days,
+                    plan_type=plan_type
+                ).delete()
+            else:
+                deleted_count = 0
+
+            # 3. Create new records from the 'plan_long' data
+            plan_long_data = response_data.get("plan_long", [])
+            plans_to_create = []
+            part_map = {}
+            for i, record in enumerate(plan_long_data):
+                plan_qty = record.get("plan_qty")
+                try:
+                    plan_qty = int(round(float(plan_qty)))
+                except (TypeError, ValueError):
+                    plan_qty = 0
+                if plan_qty <= 0:
+                    continue
+                sequence = record.get("original_order", i)
+                try:
+                    sequence = int(sequence)
+                except (TypeError, ValueError):
+                    sequence = i
+                part_no = (record.get("fg_part_no") or "").strip().upper()
+                model_name = (record.get("model") or "").strip() or None
+                if part_no:
+                    part_map[(record.get("plan_type"), part_no)] = model_name
+                plans_to_create.append(
+                    ProductionPlan(
+                        plan_date=record.get("date"),
+                        plan_type=record.get("plan_type"),
+                        machine_name=record.get("machine"),
+                        lot_no=record.get("lot_no"),
+                        model_name=record.get("model"),
+                        part_spec=record.get("part_spec"),
+                        product_family_code=record.get("product_family_code"),
+                        product_family_name=record.get("product_family_name"),
+                        is_finished_product=bool(record.get("is_finished_product")),
+                        part_no=part_no, # fg_part_no is mapped to part_no
+                        planned_quantity=plan_qty,
+                        sequence=sequence # Cast pandas/numpy values to plain int for DB writes
+                    )
+                )
+
+            ProductionPlan.objects.bulk_create(plans_to_create)
+            mark_plans_dirty(
+                {(plan_date, plan_type) for plan_date in available_days if plan_type}
+                | {(plan.plan_date, plan.plan_type) for plan in plans_to_create},
+                reason='plan_upload',
+            )
+            bump_plan_context_revision()
+            if available_days and plan_type:
+                for plan_date in available_days:
+                    created_count = sum(
+                        1
+                        for plan in plans_to_create
+                        if str(plan.plan_date) == str(plan_date) and plan.plan_type == plan_type
+                    )
+                    ProductionPlanChangeLog.objects.create(
+                        plan_date=plan_date,
+                        plan_type=plan_type,
+                        action='upload',
+                        summary=f"{file_name} 업로드 · {created_count}행 생성 · 기존 {deleted_count}행 교체",
+                        after={
+                            'file_name': file_name,
+                            'created_count': created_count,
+                            'deleted_count': deleted_count,
+                            'available_days': available_days,
+                        },
+                        changed_by=changed_by,
+                    )
+            if part_map:
+                from production.models import ProductionPlanPart
+                try:
+                    for (plan_type_key, part_no_key), model_name in part_map.items():
+                        if plan_type_key not in ['injection', 'machining']:
+                            continue
+                        ProductionPlanPart.objects.update_or_create(
+                            plan_type=plan_type_key,
+                            part_no=part_no_key,
+                            defaults={'model_name': model_name},
+                        )
+                except (OperationalError, ProgrammingError):
+                    # Local DB can be missing the optional mapping table.
+                    # Plan upload should still succeed because the main plan rows are already saved.
+                    pass
+
+    except Exception as e:
+        # If the database operation fails, return an error.
+        # The file processing was successful, but saving failed.
+        return (
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"error": f"데이터베이스 저장 중 오류가 발생했습니다: {str(e)}"},
+        )
+    # --- End: Save logic ---
+
+    # Return the original response data to the frontend
+    return status.HTTP_200_OK, response_data
+
+
+class ProductionPlanUploadView(DiskUploadMixin, generics.GenericAPIView):
+    """Upload production-plan workbooks for injection or machining.
+
+    The parse pool parses the workbook and then saves the plan.  ``?async=1``
+    answers 202 with the job at once; poll ``/api/parse-jobs/<id>/`` for the
+    usual response.
+    """
 
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
@@ -2245,113 +2237,30 @@ class ProductionPlanUploadView(generics.GenericAPIView):
             )
 
         try:
-            processor = ProductionPlanProcessor(uploaded_file, plan_type, target_date)
-            response_data = processor.process()
-        except ProductionPlanProcessingError as exc:
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_400_BAD_REQUEST,
+            job = submit_parse_job(
+                'injection.plan_processing.parse_plan_upload',
+                uploaded_file,
+                owner=request.user,
+                finish='injection.views.finish_production_plan_upload',
+                finish_params={'file_name': uploaded_file.name, 'user_id': request.user.pk},
+                plan_type=plan_type,
+                target_date=target_date,
             )
+        except ParseJobError as exc:
+            return parse_job_error_response(exc)
 
-        # --- Begin: Save processed data to the database ---
-        try:
-            with transaction.atomic():
-                # 1. Get the date range and plan type from the processed data
-                available_days = response_data.get("available_days", [])
-                plan_type = response_data.get("plan_type")
-
-                if available_days and plan_type:
-                    # 2. Delete all existing plan entries within this date range for this plan type
-                    deleted_count, _ = ProductionPlan.objects.filter(
-                        plan_date__in=available_days,
-                        plan_type=plan_type
-                    ).delete()
-                else:
-                    deleted_count = 0
-
-                # 3. Create new records from the 'plan_long' data
-                plan_long_data = response_data.get("plan_long", [])
-                plans_to_create = []
-                part_map = {}
-                for i, record in enumerate(plan_long_data):
-                    plan_qty = record.get("plan_qty")
-                    try:
-                        plan_qty = int(round(float(plan_qty)))
-                    except (TypeError, ValueError):
-                        plan_qty = 0
-                    if plan_qty <= 0:
-                        continue
-                    sequence = record.get("original_order", i)
-                    try:
-                        sequence = int(sequence)
-                    except (TypeError, ValueError):
-                        sequence = i
-                    part_no = (record.get("fg_part_no") or "").strip().upper()
-                    model_name = (record.get("model") or "").strip() or None
-                    if part_no:
-                        part_map[(record.get("plan_type"), part_no)] = model_name
-                    plans_to_create.append(
-                        ProductionPlan(
-                            plan_date=record.get("date"),
-                            plan_type=record.get("plan_type"),
-                            machine_name=record.get("machine"),
-                            lot_no=record.get("lot_no"),
-                            model_name=record.get("model"),
-                            part_spec=record.get("part_spec"),
-                            product_family_code=record.get("product_family_code"),
-                            product_family_name=record.get("product_family_name"),
-                            is_finished_product=bool(record.get("is_finished_product")),
-                            part_no=part_no, # fg_part_no is mapped to part_no
-                            planned_quantity=plan_qty,
-                            sequence=sequence # Cast pandas/numpy values to plain int for DB writes
-                        )
-                    )
-                
-                ProductionPlan.objects.bulk_create(plans_to_create)
-                if available_days and plan_type:
-                    for plan_date in available_days:
-                        created_count = sum(
-                            1
-                            for plan in plans_to_create
-                            if str(plan.plan_date) == str(plan_date) and plan.plan_type == plan_type
-                        )
-                        ProductionPlanChangeLog.objects.create(
-                            plan_date=plan_date,
-                            plan_type=plan_type,
-                            action='upload',
-                            summary=f"{uploaded_file.name} 업로드 · {created_count}행 생성 · 기존 {deleted_count}행 교체",
-                            after={
-                                'file_name': uploaded_file.name,
-                                'created_count': created_count,
-                                'deleted_count': deleted_count,
-                                'available_days': available_days,
-                            },
-                            changed_by=request.user if request.user.is_authenticated else None,
-                        )
-                if part_map:
-                    from production.models import ProductionPlanPart
-                    try:
-                        for (plan_type_key, part_no_key), model_name in part_map.items():
-                            if plan_type_key not in ['injection', 'machining']:
-                                continue
-                            ProductionPlanPart.objects.update_or_create(
-                                plan_type=plan_type_key,
-                                part_no=part_no_key,
-                                defaults={'model_name': model_name},
-                            )
-                    except (OperationalError, ProgrammingError):
-                        # Local DB can be missing the optional mapping table.
-                        # Plan upload should still succeed because the main plan rows are already saved.
-                        pass
+        if query_param_flag(request.query_params.get('async')):
+            payload = job.describe()
+            payload['poll_url'] = reverse('parse-job-detail', kwargs={'job_id': job.id})
+            return Response(payload, status=status.HTTP_202_ACCEPTED)
 
-        except Exception as e:
-            # If the database operation fails, return an error.
-            # The file processing was successful, but saving failed.
-            return Response(
-                {"error": f"데이터베이스 저장 중 오류가 발생했습니다: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        try:
+            completed = job.wait().outcome()
+        finally:
+            job.discard()
+        if completed is None:
+            return parse_job_error_response(
+                ParseJobError('parse_job_pending', 'The upload could not be processed. Retry the upload.')
             )
-        # --- End: Save logic ---
-
-        # Return the original response data to the frontend
-        return Response(response_data)
+        response_status, response_data = completed
+        return Response(response_data, status=response_status)
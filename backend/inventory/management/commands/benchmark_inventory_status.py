@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import datetime
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from inventory.models import StagingInventory
+from inventory.services.staging_inventory import cached_staging_count, keyset_page, search_staging, sort_staging
+
+
+class Command(BaseCommand):
+    help = (
+        "Time page-N of the live inventory status with OFFSET + COUNT(*) against keyset "
+        "paging + cached counts over synthetic staging rows, in a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--page", type=int, default=500, help="Page number to time.")
+        parser.add_argument("--size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--search", default="material 42")
+
+    def _time(self, repeat, func):
+        durations = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - started) * 1000)
+        return statistics.median(durations)
+
+    def handle(self, *args, **options):
+        row_count = max(1, options["rows"])
+        size = max(1, options["size"])
+        page = max(1, min(options["page"], (row_count + size - 1) // size))
+        repeat = max(1, options["repeat"])
+        base_time = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+        with transaction.atomic():
+            StagingInventory.objects.all().delete()
+            batch = []
+            for index in range(row_count):
+                row = StagingInventory(
+                    material_id=index,
+                    material_code=f"RM-{index % 5000:04d}",
+                    qr_code=f"QR-{index:08d}",
+                    label_code=f"TROLLEY-{index:08d}",
+                    material_name=f"Material {index % 5000}",
+                    specification=f"Spec {index % 300}",
+                    warehouse_code=f"W{index % 12}",
+                    warehouse_name=f"Warehouse {index % 12}",
+                    qc_status=str(1 + index % 4),
+                    quantity=Decimal(index % 997),
+                    unit="kg",
+                    updated_at=base_time + datetime.timedelta(seconds=index // 3),
+                )
+                row.refresh_search_text()
+                batch.append(row)
+                if len(batch) == 5000:
+                    StagingInventory.objects.bulk_create(batch)
+                    batch = []
+            StagingInventory.objects.bulk_create(batch)
+
+            for label, search in (("all", ""), ("search", options["search"])):
+                def filtered():
+                    queryset = StagingInventory.objects.all()
+                    return search_staging(queryset, search) if search else queryset
+
+                # Reach the page once by following cursors, then time the seek itself.
+                cursor, reached = "", 1
+                while reached < page:
+                    _, next_cursor = keyset_page(filtered(), "updated_at", "desc", cursor, size)
+                    if next_cursor is None:
+                        break
+                    cursor, reached = next_cursor, reached + 1
+
+                def offset_page():
+                    queryset = sort_staging(filtered(), "updated_at", "desc")
+                    queryset.count()
+                    list(queryset[(reached - 1) * size:reached * size])
+
+                def keyset():
+                    cached_staging_count(filtered())
+                    keyset_page(filtered(), "updated_at", "desc", cursor, size)
+
+                offset_ms = self._time(repeat, offset_page)
+                keyset_ms = self._time(repeat, keyset)
+                self.stdout.write(
+                    f"{label:<6} rows={row_count} page={reached} size={size} "
+                    f"offset+count_ms={offset_ms:.1f} keyset+cached_count_ms={keyset_ms:.1f}"
+                )
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Benchmark finished; staging rows were rolled back."))
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.db import transaction
 from inventory.models import StagingInventory, DailyInventorySnapshot, DailyReportSummary
+from inventory.services.daily_inventory_diff import materialize_previous_day_diff, purge_daily_inventory_diffs
 from collections import defaultdict
 from datetime import timedelta
 import logging
@@ -118,6 +119,8 @@ class Command(BaseCommand):
         # 데이터베이스에 저장
         with transaction.atomic():
             DailyInventorySnapshot.objects.bulk_create(snapshots_to_create, ignore_conflicts=True)
+            # 전일 대비 증감을 한 번만 계산해 둔다 (일일 보고서가 읽음)
+            materialize_previous_day_diff(snapshot_date)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -135,6 +138,7 @@ class Command(BaseCommand):
         deleted_summaries = DailyReportSummary.objects.filter(
             snapshot_date__lt=ten_days_ago
         ).delete()
+        purge_daily_inventory_diffs(ten_days_ago)
         
         if deleted_snapshots[0] > 0 or deleted_summaries[0] > 0:
             self.stdout.write(
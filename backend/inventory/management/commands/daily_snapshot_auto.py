@@ -18,6 +18,7 @@ from collections import defaultdict
 import logging
 
 from inventory.models import RawMaterialSyncState
+from inventory.services.daily_inventory_diff import materialize_previous_day_diff
 from inventory.services.raw_material_sync import run_raw_material_sync
 
 logger = logging.getLogger(__name__)
@@ -117,6 +118,8 @@ class Command(BaseCommand):
         # Save to database
         with transaction.atomic():
             DailyInventorySnapshot.objects.bulk_create(snapshots_to_create, ignore_conflicts=True)
+            # Day-over-day diff read by the daily report endpoints
+            materialize_previous_day_diff(snapshot_date)
 
         return len(snapshots_to_create)
 
@@ -296,6 +296,7 @@ class Command(BaseCommand):
                 unit=unit.get("code", ""),
                 updated_at=updated_at,
             )
+            staging_object.refresh_search_text()
         except (AttributeError, KeyError, OSError, OverflowError, TypeError, ValueError):
             # Do not include the original row or field values in command output.
             raise ValueError(f"Page {page} item {index} is malformed") from None
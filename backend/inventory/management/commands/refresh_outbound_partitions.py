@@ -0,0 +1,35 @@
+"""Refetch stored outbound-order business days on demand."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from inventory.services.outbound_performance import (
+    OutboundPerformanceError,
+    _business_date_of,
+    refresh_outbound_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = "Refetch outbound-order lines for a range of business days into the day partitions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", help="Last business day (YYYY-MM-DD); defaults to the open day.")
+        parser.add_argument("--days", type=int, default=1, help="Number of days ending at --date.")
+
+    def handle(self, *args, **options):
+        last_day = parse_date(options["date"]) if options["date"] else _business_date_of(timezone.now())
+        if last_day is None:
+            raise CommandError("--date must be YYYY-MM-DD.")
+        first_day = last_day - timedelta(days=max(1, options["days"]) - 1)
+        try:
+            audit = refresh_outbound_partitions(first_day, last_day)
+        except OutboundPerformanceError as exc:
+            raise CommandError(str(exc)) from None
+        self.stdout.write(self.style.SUCCESS(
+            f"Refreshed {first_day}..{last_day}: pages={audit['pages_fetched']} "
+            f"lines={audit['raw_item_line_count']}"
+        ))
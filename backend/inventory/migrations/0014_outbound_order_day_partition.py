@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0013_rawmaterialmesdataset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundOrderDayPartition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('business_date', models.DateField(unique=True)),
+                ('lines', models.JSONField(default=list)),
+                ('line_count', models.PositiveIntegerField(default=0)),
+                ('fetch_warnings', models.JSONField(blank=True, default=list)),
+                ('duplicate_count', models.PositiveIntegerField(default=0)),
+                ('complete', models.BooleanField(default=True)),
+                ('fetched_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Outbound-order day partition',
+                'verbose_name_plural': 'Outbound-order day partitions',
+                'ordering': ['business_date'],
+            },
+        ),
+    ]
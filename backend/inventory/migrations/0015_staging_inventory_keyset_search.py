@@ -0,0 +1,88 @@
+# Generated by Django 5.2.3 on 2026-10-19 09:10
+
+from django.db import migrations, models
+
+SEARCH_FIELDS = ("qr_code", "label_code", "material_code", "specification", "material_name")
+BACKFILL_BATCH_SIZE = 2000
+
+
+def staging_search_text(*values):
+    # Frozen copy of inventory.services.staging_inventory.staging_search_text.
+    return "\n".join(str(value or "").strip() for value in values).casefold()
+
+
+def create_trigram_index(apps, schema_editor):
+    # Portable databases scan the single search_text column instead.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS staging_inv_search_trgm ON inventory_staginginventory "
+        "USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS staging_inv_search_trgm")
+
+
+def backfill_search_text(apps, schema_editor):
+    StagingInventory = apps.get_model("inventory", "StagingInventory")
+    last_id = 0
+    while True:
+        batch = list(
+            StagingInventory.objects.filter(id__gt=last_id).order_by("id").only("id", *SEARCH_FIELDS)[:BACKFILL_BATCH_SIZE]
+        )
+        if not batch:
+            break
+        for row in batch:
+            row.search_text = staging_search_text(*(getattr(row, name) for name in SEARCH_FIELDS))
+        StagingInventory.objects.bulk_update(batch, ["search_text"])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0014_outbound_order_day_partition"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="staginginventory",
+            name="search_text",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["updated_at", "id"], name="staging_inv_updated_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["quantity", "id"], name="staging_inv_quantity_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["material_code", "id"], name="staging_inv_material_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["specification", "id"], name="staging_inv_spec_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["warehouse_name", "id"], name="staging_inv_warehouse_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["qc_status", "id"], name="staging_inv_qc_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staginginventory",
+            index=models.Index(fields=["work_order_code", "id"], name="staging_inv_work_order_id_idx"),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0015_staging_inventory_keyset_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyInventoryDiffSet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('snapshot_date', models.DateField()),
+                ('base_date', models.DateField()),
+                ('source_revision', models.CharField(blank=True, max_length=100)),
+                ('row_count', models.IntegerField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('snapshot_date', 'base_date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyInventoryDiff',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('snapshot_date', models.DateField()),
+                ('base_date', models.DateField()),
+                ('presence', models.CharField(choices=[('both', '두 날짜 모두'), ('date1_only', '기준일에만'), ('date2_only', '보고일에만')], max_length=20)),
+                ('material_code', models.CharField(max_length=100)),
+                ('material_name', models.CharField(blank=True, max_length=255)),
+                ('specification', models.CharField(blank=True, max_length=255)),
+                ('warehouse_code', models.CharField(max_length=50)),
+                ('warehouse_name', models.CharField(blank=True, max_length=255)),
+                ('qc_status', models.CharField(blank=True, max_length=50)),
+                ('unit', models.CharField(blank=True, max_length=20)),
+                ('total_quantity', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('base_quantity', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('quantity_change', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('cart_count', models.IntegerField(default=0)),
+                ('base_cart_count', models.IntegerField(default=0)),
+                ('cart_count_change', models.IntegerField(default=0)),
+                ('diff_set', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rows', to='inventory.dailyinventorydiffset')),
+                ('snapshot', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='inventory.dailyinventorysnapshot')),
+            ],
+            options={
+                'ordering': ['warehouse_name', 'material_code', 'warehouse_code', 'qc_status'],
+                'indexes': [models.Index(fields=['snapshot_date', 'warehouse_name', 'material_code'], name='inv_diff_date_wh_material_idx')],
+            },
+        ),
+    ]
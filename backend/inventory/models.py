@@ -87,17 +87,39 @@ class StagingInventory(models.Model):
     unit = models.CharField(max_length=20, blank=True)
     updated_at = models.DateTimeField()
     fetched_at = models.DateTimeField(auto_now_add=True)
+    # qr/label/material code, specification and name, casefolded and newline-joined
+    search_text = models.TextField(blank=True, default="")
+
+    SEARCH_FIELDS = ("qr_code", "label_code", "material_code", "specification", "material_name")
 
     class Meta:
         indexes = [
             models.Index(fields=["fetched_at"]),
             models.Index(fields=["material_code"]),
+            # Keyset paging seeks (sort field, id) for every sortable column.
+            models.Index(fields=["updated_at", "id"], name="staging_inv_updated_id_idx"),
+            models.Index(fields=["quantity", "id"], name="staging_inv_quantity_id_idx"),
+            models.Index(fields=["material_code", "id"], name="staging_inv_material_id_idx"),
+            models.Index(fields=["specification", "id"], name="staging_inv_spec_id_idx"),
+            models.Index(fields=["warehouse_name", "id"], name="staging_inv_warehouse_id_idx"),
+            models.Index(fields=["qc_status", "id"], name="staging_inv_qc_id_idx"),
+            models.Index(fields=["work_order_code", "id"], name="staging_inv_work_order_id_idx"),
         ]
         ordering = ["-fetched_at"]
 
     def __str__(self):
         return f"{self.material_code} {self.quantity}{self.unit} @{self.warehouse_code}"
 
+    def refresh_search_text(self):
+        from inventory.services.staging_inventory import staging_search_text
+
+        self.search_text = staging_search_text(*(getattr(self, name) for name in self.SEARCH_FIELDS))
+
+    def save(self, *args, **kwargs):
+        # bulk_create skips save(); bulk writers call refresh_search_text themselves.
+        self.refresh_search_text()
+        super().save(*args, **kwargs)
+
 
 class RawMaterialMESDataset(models.Model):
     """Last successful MES payload for a deterministic raw-material scope."""
@@ -272,6 +294,65 @@ class DailyInventorySnapshot(models.Model):
         return f"{self.snapshot_date} - {self.material_code} @{self.warehouse_code}"
 
 
+class DailyInventoryDiffSet(models.Model):
+    """``snapshot_date`` 대 ``base_date`` 스냅샷 비교 결과의 헤더 (inventory.services.daily_inventory_diff)"""
+    snapshot_date = models.DateField()
+    base_date = models.DateField()
+    # 두 날짜 스냅샷의 "행 수:최대 id" — 스냅샷이 다시 만들어지면 달라진다
+    source_revision = models.CharField(max_length=100, blank=True)
+    row_count = models.IntegerField(default=0)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["snapshot_date", "base_date"]
+
+    def __str__(self):
+        return f"{self.snapshot_date} vs {self.base_date}"
+
+
+class DailyInventoryDiff(models.Model):
+    """(품목, 창고, QC 상태) 단위 일간 재고 증감"""
+    PRESENCE_BOTH = 'both'
+    PRESENCE_BASE_ONLY = 'date1_only'
+    PRESENCE_SNAPSHOT_ONLY = 'date2_only'
+    PRESENCE_CHOICES = [
+        (PRESENCE_BOTH, '두 날짜 모두'),
+        (PRESENCE_BASE_ONLY, '기준일에만'),
+        (PRESENCE_SNAPSHOT_ONLY, '보고일에만'),
+    ]
+
+    diff_set = models.ForeignKey(DailyInventoryDiffSet, on_delete=models.CASCADE, related_name='rows')
+    snapshot_date = models.DateField()
+    base_date = models.DateField()
+    # 보고일 스냅샷 (대차 상세용) — 기준일에만 있는 품목은 비어 있다
+    snapshot = models.ForeignKey(
+        DailyInventorySnapshot, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    presence = models.CharField(max_length=20, choices=PRESENCE_CHOICES)
+    material_code = models.CharField(max_length=100)
+    material_name = models.CharField(max_length=255, blank=True)
+    specification = models.CharField(max_length=255, blank=True)
+    warehouse_code = models.CharField(max_length=50)
+    warehouse_name = models.CharField(max_length=255, blank=True)
+    qc_status = models.CharField(max_length=50, blank=True)
+    unit = models.CharField(max_length=20, blank=True)
+    total_quantity = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    base_quantity = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    quantity_change = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    cart_count = models.IntegerField(default=0)
+    base_cart_count = models.IntegerField(default=0)
+    cart_count_change = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["snapshot_date", "warehouse_name", "material_code"], name="inv_diff_date_wh_material_idx"),
+        ]
+        ordering = ["warehouse_name", "material_code", "warehouse_code", "qc_status"]
+
+    def __str__(self):
+        return f"{self.snapshot_date} vs {self.base_date} - {self.material_code} @{self.warehouse_code}"
+
+
 class DailyReportSummary(models.Model):
     """일일 보고서 요약 정보"""
     snapshot_date = models.DateField(unique=True, db_index=True)
@@ -373,3 +454,25 @@ class FinishedGoodsTransaction(models.Model):
 
     def __str__(self):
         return f"{self.material_code} ({self.snapshot})"
+
+
+class OutboundOrderDayPartition(models.Model):
+    """Flattened BLACKLAKE outbound-order lines planned for one business day."""
+
+    business_date = models.DateField(unique=True)
+    lines = models.JSONField(default=list)
+    line_count = models.PositiveIntegerField(default=0)
+    # Fetch warnings and removed duplicates belong to the last day of a fetch
+    # so a multi-day fetch reports them once.
+    fetch_warnings = models.JSONField(default=list, blank=True)
+    duplicate_count = models.PositiveIntegerField(default=0)
+    complete = models.BooleanField(default=True)
+    fetched_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name = "Outbound-order day partition"
+        verbose_name_plural = "Outbound-order day partitions"
+        ordering = ["business_date"]
+
+    def __str__(self):
+        return f"outbound:{self.business_date} ({self.line_count})"
@@ -0,0 +1,138 @@
+"""Materialised day-over-day diffs of ``DailyInventorySnapshot``.
+
+The daily report, the two-date comparison and the CSV export all join two
+snapshot dates on ``(material_code, warehouse_code, qc_status)``.  Instead of
+loading both dates into Python on every request, the joined rows are written
+once per ``(snapshot_date, base_date)`` pair into ``DailyInventoryDiff`` and
+the endpoints filter, page and stream that table.
+
+Snapshot commands materialise ``(day, day - 1)`` right after writing a day.
+Any other pair is materialised on first read.  Each ``DailyInventoryDiffSet``
+remembers the row count and newest id of both source dates; when a snapshot
+is recreated (``--force``, the cron job) the next read sees a different
+revision and rebuilds the pair.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Max, Q
+
+from inventory.models import DailyInventoryDiff, DailyInventoryDiffSet, DailyInventorySnapshot
+
+DIFF_BATCH_SIZE = 1000
+SNAPSHOT_FIELDS = (
+    "id",
+    "material_code",
+    "material_name",
+    "specification",
+    "warehouse_code",
+    "warehouse_name",
+    "qc_status",
+    "unit",
+    "total_quantity",
+    "cart_count",
+)
+
+
+def snapshot_pair_revision(snapshot_date: date, base_date: date) -> str:
+    """Row count and newest id of both dates, in one grouped query."""
+
+    revisions = {
+        row["snapshot_date"]: f"{row['rows']}:{row['last_id']}"
+        for row in DailyInventorySnapshot.objects.filter(snapshot_date__in=[snapshot_date, base_date])
+        .order_by()
+        .values("snapshot_date")
+        .annotate(rows=Count("id"), last_id=Max("id"))
+    }
+    return f"{revisions.get(snapshot_date, '0:')}|{revisions.get(base_date, '0:')}"
+
+
+def _snapshot_rows(day: date) -> dict[tuple[str, str, str], dict]:
+    return {
+        (row["material_code"], row["warehouse_code"], row["qc_status"]): row
+        for row in DailyInventorySnapshot.objects.filter(snapshot_date=day).values(*SNAPSHOT_FIELDS)
+    }
+
+
+def _diff_rows(diff_set: DailyInventoryDiffSet) -> list[DailyInventoryDiff]:
+    current = _snapshot_rows(diff_set.snapshot_date)
+    base = _snapshot_rows(diff_set.base_date) if diff_set.base_date != diff_set.snapshot_date else current
+    rows = []
+    for key in current.keys() | base.keys():
+        item, base_item = current.get(key), base.get(key)
+        source = item or base_item
+        quantity = item["total_quantity"] if item else Decimal("0")
+        base_quantity = base_item["total_quantity"] if base_item else Decimal("0")
+        cart_count = item["cart_count"] if item else 0
+        base_cart_count = base_item["cart_count"] if base_item else 0
+        if item and base_item:
+            presence = DailyInventoryDiff.PRESENCE_BOTH
+        elif item:
+            presence = DailyInventoryDiff.PRESENCE_SNAPSHOT_ONLY
+        else:
+            presence = DailyInventoryDiff.PRESENCE_BASE_ONLY
+        rows.append(DailyInventoryDiff(
+            diff_set=diff_set,
+            snapshot_date=diff_set.snapshot_date,
+            base_date=diff_set.base_date,
+            snapshot_id=item["id"] if item else None,
+            presence=presence,
+            material_code=source["material_code"],
+            material_name=source["material_name"],
+            specification=source["specification"],
+            warehouse_code=source["warehouse_code"],
+            warehouse_name=source["warehouse_name"],
+            qc_status=source["qc_status"],
+            unit=source["unit"],
+            total_quantity=quantity,
+            base_quantity=base_quantity,
+            quantity_change=quantity - base_quantity,
+            cart_count=cart_count,
+            base_cart_count=base_cart_count,
+            cart_count_change=cart_count - base_cart_count,
+        ))
+    return rows
+
+
+def materialize_daily_inventory_diff(snapshot_date: date, base_date: date, *, force: bool = False) -> DailyInventoryDiffSet:
+    """Write (or keep) the diff rows of ``snapshot_date`` against ``base_date``."""
+
+    revision = snapshot_pair_revision(snapshot_date, base_date)
+    with transaction.atomic():
+        diff_set, _ = DailyInventoryDiffSet.objects.select_for_update().get_or_create(
+            snapshot_date=snapshot_date,
+            base_date=base_date,
+        )
+        if diff_set.source_revision == revision and not force:
+            return diff_set
+        rows = _diff_rows(diff_set)
+        diff_set.rows.all().delete()
+        DailyInventoryDiff.objects.bulk_create(rows, batch_size=DIFF_BATCH_SIZE)
+        diff_set.source_revision = revision
+        diff_set.row_count = len(rows)
+        diff_set.save(update_fields=["source_revision", "row_count", "computed_at"])
+    return diff_set
+
+
+def daily_inventory_diff(snapshot_date: date, base_date: date):
+    """Diff rows of the pair, rebuilt first when either snapshot date changed."""
+
+    diff_set = DailyInventoryDiffSet.objects.filter(snapshot_date=snapshot_date, base_date=base_date).first()
+    if diff_set is None or diff_set.source_revision != snapshot_pair_revision(snapshot_date, base_date):
+        diff_set = materialize_daily_inventory_diff(snapshot_date, base_date)
+    return DailyInventoryDiff.objects.filter(diff_set=diff_set)
+
+
+def materialize_previous_day_diff(snapshot_date: date) -> DailyInventoryDiffSet:
+    return materialize_daily_inventory_diff(snapshot_date, snapshot_date - timedelta(days=1))
+
+
+def purge_daily_inventory_diffs(before: date) -> int:
+    """Drop diff sets touching snapshot dates older than ``before``."""
+
+    deleted, _ = DailyInventoryDiffSet.objects.filter(Q(snapshot_date__lt=before) | Q(base_date__lt=before)).delete()
+    return deleted
@@ -9,8 +9,12 @@ inventory movements.
 from __future__ import annotations
 
 import copy
+import logging
 import re
+import time as time_module
+import uuid
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal, InvalidOperation
 from typing import Any, Mapping
@@ -19,8 +23,10 @@ from zoneinfo import ZoneInfo
 
 import requests
 from django.core.cache import cache
+from django.db import close_old_connections, transaction
 from django.utils import timezone
 
+from inventory.models import OutboundOrderDayPartition
 from inventory.mes import (
     MES_BASE_URL,
     MES_ROUTE_BASE,
@@ -29,6 +35,8 @@ from inventory.mes import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 SHANGHAI_TZ = ZoneInfo("Asia/Shanghai")
 OUTBOUND_ORDER_LIST_ENDPOINT = (
     f"{MES_ROUTE_BASE}/inventory/open/v1/outbound_order/_list"
@@ -36,7 +44,34 @@ OUTBOUND_ORDER_LIST_ENDPOINT = (
 PAGE_SIZE = 200
 MAX_PAGES = 20
 CACHE_SECONDS = 5 * 60
-CACHE_KEY_PREFIX = "overview-board:outbound-performance:v4"
+# A payload past its fresh window is still served while one worker refreshes it.
+STALE_SECONDS = 10 * 60
+REFRESH_AHEAD_SECONDS = 30
+REFRESH_LOCK_SECONDS = 2 * 60
+REFRESH_LOCK_WAIT_SECONDS = 20
+REFRESH_LOCK_POLL_SECONDS = 0.25
+# Stored business days: the open day is refetched on every refresh, a closed
+# day once after it settles and then every few hours.
+CLOSED_DAY_SETTLE_SECONDS = 60 * 60
+CLOSED_DAY_REFRESH_SECONDS = 6 * 60 * 60
+PARTITION_RUN_MAX_GAP_DAYS = 7
+CACHE_KEY_PREFIX = "overview-board:outbound-performance:v5"
+STATS_CACHE_PREFIX = f"{CACHE_KEY_PREFIX}:stats"
+# Plain cache hits are not counted so the hot path stays write-free.
+STAT_NAMES = (
+    "stale_hits",
+    "misses",
+    "lock_waits",
+    "background_refreshes",
+    "upstream_fetches",
+    "duplicate_fetches",
+)
+
+_REFRESH_POOL = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="outbound-performance-refresh",
+)
+
 MAX_PRIORITY_ITEMS = 10
 FETCH_AUDIT_KEYS = (
     "upstream_order_total",
@@ -739,6 +774,210 @@ def _fetch_all_lines(
     return rows, warnings, duplicate_count, audit
 
 
+def _business_date_of(moment: datetime) -> date:
+    return (moment.astimezone(SHANGHAI_TZ) - timedelta(hours=8)).date()
+
+
+def _window_days(start: datetime, end: datetime) -> list[date]:
+    first = _business_date_of(start)
+    last = _business_date_of(end - timedelta(microseconds=1))
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def _line_business_date(row: Mapping[str, Any]) -> date | None:
+    _present, plan_time_value = _first_value(
+        row,
+        "planTime",
+        "planAt",
+        "plannedAt",
+        "plannedOutboundTime",
+    )
+    plan_time = _parse_datetime(plan_time_value)
+    return _business_date_of(plan_time) if plan_time is not None else None
+
+
+def _merge_fetch_audit(
+    total: Mapping[str, Any], part: Mapping[str, Any]
+) -> dict[str, int | None]:
+    merged = _fetch_audit_payload(total)
+    for key, value in _fetch_audit_payload(part).items():
+        if value is None:
+            continue
+        merged[key] = int(merged[key] or 0) + int(value)
+    return merged
+
+
+def _partition_is_current(partition: OutboundOrderDayPartition, now: datetime) -> bool:
+    """Whether a stored day can be reused without asking BLACKLAKE again.
+
+    The open business day is always refetched.  A closed day is fetched once
+    more after it settles and then only every ``CLOSED_DAY_REFRESH_SECONDS``.
+    """
+
+    day_close = _business_datetime(partition.business_date + timedelta(days=1))
+    if now < day_close or not partition.complete:
+        return False
+    if partition.fetched_at < day_close + timedelta(seconds=CLOSED_DAY_SETTLE_SECONDS):
+        return False
+    return (now - partition.fetched_at).total_seconds() < CLOSED_DAY_REFRESH_SECONDS
+
+
+def _contiguous_runs(days: list[date]) -> list[tuple[date, date]]:
+    """Group days into fetch runs; short gaps are fetched rather than split."""
+
+    runs: list[tuple[date, date]] = []
+    for day in sorted(days):
+        if runs and (day - runs[-1][1]).days <= PARTITION_RUN_MAX_GAP_DAYS + 1:
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def outbound_partition_retention_start(today: date) -> date:
+    """First business day any comparison window of ``today`` still reads."""
+
+    return min(_window_days(start, end)[0] for start, end in _period_windows(today).values())
+
+
+def purge_outbound_partitions(before: date) -> int:
+    """Drop stored business days older than ``before``."""
+
+    deleted, _ = OutboundOrderDayPartition.objects.filter(business_date__lt=before).delete()
+    return deleted
+
+
+def refresh_outbound_partitions(
+    first_day: date, last_day: date
+) -> dict[str, int | None]:
+    """Fetch ``first_day``..``last_day`` in one bounded query and store each day.
+
+    Lines are stored under the business day of their plan time; lines without
+    a usable plan time, or outside the requested days, stay with the last day
+    so the aggregate still reports them.  A multi-day run that hits the page
+    limit is refetched day by day, which removes the ceiling for a month of
+    history.  Returns the fetch audit.
+    """
+
+    rows, warnings, duplicate_count, audit = _fetch_all_lines(
+        start=_business_datetime(first_day),
+        end=_business_datetime(last_day + timedelta(days=1)),
+    )
+    limit_reached = "outbound_pagination_limit_reached" in warnings
+    if limit_reached and first_day < last_day:
+        total_audit = _fetch_audit_payload(audit)
+        day = first_day
+        while day <= last_day:
+            total_audit = _merge_fetch_audit(total_audit, refresh_outbound_partitions(day, day))
+            day += timedelta(days=1)
+        return total_audit
+
+    days = [first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1)]
+    lines_by_day: dict[date, list[dict[str, Any]]] = {day: [] for day in days}
+    for row in rows:
+        line_day = _line_business_date(row)
+        lines_by_day[line_day if line_day in lines_by_day else last_day].append(row)
+    now = timezone.now()
+    # An upsert rather than delete + insert: a forced refresh does not take the
+    # refresh lock, so two refreshes of the same day may overlap.
+    with transaction.atomic():
+        OutboundOrderDayPartition.objects.bulk_create(
+            [
+                OutboundOrderDayPartition(
+                    business_date=day,
+                    lines=lines,
+                    line_count=len(lines),
+                    fetch_warnings=sorted(set(warnings)) if day == last_day else [],
+                    duplicate_count=duplicate_count if day == last_day else 0,
+                    complete=not limit_reached,
+                    fetched_at=now,
+                )
+                for day, lines in lines_by_day.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["business_date"],
+            update_fields=["lines", "line_count", "fetch_warnings", "duplicate_count", "complete", "fetched_at"],
+        )
+    return audit
+
+
+def _partitioned_lines(
+    target_date: date,
+    windows: Mapping[str, tuple[datetime, datetime]],
+    *,
+    force_refresh: bool = False,
+) -> tuple[list[dict[str, Any]], list[str], int, dict[str, int | None], dict[str, int]]:
+    """Lines for every stored day from the earliest window to ``target_date``.
+
+    Only days needed by ``windows`` that are missing or no longer current are
+    fetched.  Days in the gaps between the windows are aggregated when they
+    are stored (their lines count as outside the periods).  After a fetch,
+    stored days older than both these windows and the open day's windows are
+    purged, so the table holds about two months of lines.
+    """
+
+    needed = sorted({day for start, end in windows.values() for day in _window_days(start, end)})
+    first_day = needed[0]
+    now = timezone.now()
+    stored = {
+        partition.business_date: partition
+        for partition in OutboundOrderDayPartition.objects.filter(
+            business_date__range=(first_day, target_date)
+        ).only("business_date", "complete", "fetched_at")
+    }
+    stale = [
+        day for day in needed
+        if force_refresh or day not in stored or not _partition_is_current(stored[day], now)
+    ]
+    audit = _fetch_audit_payload()
+    runs = _contiguous_runs(stale)
+    for run_first, run_last in runs:
+        audit = _merge_fetch_audit(audit, refresh_outbound_partitions(run_first, run_last))
+    if runs:
+        purge_outbound_partitions(min(first_day, outbound_partition_retention_start(_business_date_of(now))))
+    else:
+        audit["upstream_order_total"] = None
+
+    partitions = list(
+        OutboundOrderDayPartition.objects.filter(
+            business_date__range=(first_day, target_date)
+        ).order_by("business_date")
+    )
+    # A line whose plan day moved lives in two partitions until the older one
+    # is refetched; the newest fetch owns it.
+    owners: dict[tuple[str, ...], tuple[datetime, date]] = {}
+    for partition in partitions:
+        for row in partition.lines:
+            identity = _row_identity(row)
+            if identity is None or row.get("__identity_missing__"):
+                continue
+            candidate = (partition.fetched_at, partition.business_date)
+            if identity not in owners or candidate > owners[identity]:
+                owners[identity] = candidate
+
+    rows: list[dict[str, Any]] = []
+    seen: set[tuple[str, ...]] = set()
+    warnings: set[str] = set()
+    duplicate_count = 0
+    for partition in partitions:
+        warnings.update(partition.fetch_warnings or [])
+        duplicate_count += partition.duplicate_count
+        if not partition.complete:
+            warnings.add("outbound_pagination_limit_reached")
+        for row in partition.lines:
+            identity = _row_identity(row)
+            if identity is not None and not row.get("__identity_missing__"):
+                if owners[identity][1] != partition.business_date or identity in seen:
+                    continue
+                seen.add(identity)
+            rows.append(row)
+    partition_audit = {
+        "stored_day_count": len(partitions),
+        "refreshed_day_count": sum((last - first).days + 1 for first, last in runs),
+    }
+    return rows, sorted(warnings), duplicate_count, audit, partition_audit
+
+
 def _nested_order(row: Mapping[str, Any]) -> Mapping[str, Any]:
     order = row.get("outboundOrder") or row.get("order")
     return order if isinstance(order, Mapping) else {}
@@ -1389,61 +1628,58 @@ def _aggregate(
     return payload, warnings
 
 
-def get_outbound_performance(
+def _cached_result(
+    payload: dict[str, Any], *, cache_status: str
+) -> tuple[dict[str, Any], list[str], dict[str, Any], dict[str, Any]]:
+    payload = copy.deepcopy(payload)
+    payload["cache_status"] = cache_status
+    stale = cache_status == "stale"
+    warnings = list(payload.get("warnings") or [])
+    cached_status = str(payload.get("status") or "unavailable")
+    source_status = "error" if cached_status == "unavailable" else cached_status
+    source = {
+        "status": source_status,
+        "source_latest_at": payload.get("fetched_at"),
+        "row_count": int(payload.get("accepted_line_count") or 0),
+        "stale": stale,
+    }
+    if cached_status == "unavailable":
+        source["detail"] = "cached_upstream_unavailable"
+    trace = {
+        "source": "BLACKLAKE inventory outbound_order._list items[]",
+        "status": source_status,
+        "rows_returned": int(payload.get("accepted_line_count") or 0),
+        "rows_unclassified": int(
+            (payload.get("unclassified") or {}).get("line_count") or 0
+        ),
+        "cache_status": cache_status,
+        "calculation": "planTime cohort; sum planAmount and current doneAmount",
+        **{
+            key: payload.get(key)
+            for key in FETCH_AUDIT_KEYS
+        },
+    }
+    if cached_status == "unavailable":
+        trace["detail"] = "cached_upstream_unavailable"
+    return payload, warnings, source, trace
+
+
+def _fetch_outbound_performance(
     target_date: date,
     *,
     force_refresh: bool = False,
 ) -> tuple[dict[str, Any], list[str], dict[str, Any], dict[str, Any]]:
-    """Return dashboard payload, warnings, freshness state, and trace.
-
-    Successful and partial responses are cached for five minutes.  Upstream
-    errors return explicit unavailable/null metrics and are never represented
-    as a valid zero-activity period.
-    """
-
-    cache_key = f"{CACHE_KEY_PREFIX}:{target_date.isoformat()}"
-    if not force_refresh:
-        cached = cache.get(cache_key)
-        if isinstance(cached, Mapping):
-            payload = copy.deepcopy(dict(cached))
-            payload["cache_status"] = "hit"
-            warnings = list(payload.get("warnings") or [])
-            cached_status = str(payload.get("status") or "unavailable")
-            source_status = "error" if cached_status == "unavailable" else cached_status
-            source = {
-                "status": source_status,
-                "source_latest_at": payload.get("fetched_at"),
-                "row_count": int(payload.get("accepted_line_count") or 0),
-                "stale": False,
-            }
-            if cached_status == "unavailable":
-                source["detail"] = "cached_upstream_unavailable"
-            trace = {
-                "source": "BLACKLAKE inventory outbound_order._list items[]",
-                "status": source_status,
-                "rows_returned": int(payload.get("accepted_line_count") or 0),
-                "rows_unclassified": int(
-                    (payload.get("unclassified") or {}).get("line_count") or 0
-                ),
-                "cache_status": "hit",
-                "calculation": "planTime cohort; sum planAmount and current doneAmount",
-                **{
-                    key: payload.get(key)
-                    for key in FETCH_AUDIT_KEYS
-                },
-            }
-            if cached_status == "unavailable":
-                trace["detail"] = "cached_upstream_unavailable"
-            return payload, warnings, source, trace
-
     windows = _period_windows(target_date)
     query_start = min(start for start, _end in windows.values())
     query_end = max(end for _start, end in windows.values())
     try:
-        rows, fetch_warnings, duplicate_count, fetch_audit = _fetch_all_lines(
-            start=query_start,
-            end=query_end,
-        )
+        (
+            rows,
+            fetch_warnings,
+            duplicate_count,
+            fetch_audit,
+            partition_audit,
+        ) = _partitioned_lines(target_date, windows, force_refresh=force_refresh)
         payload, warnings = _aggregate(
             rows,
             windows=windows,
@@ -1451,7 +1687,7 @@ def get_outbound_performance(
             duplicate_count=duplicate_count,
             fetch_audit=fetch_audit,
         )
-        cache.set(cache_key, copy.deepcopy(payload), timeout=CACHE_SECONDS)
+        payload.update(partition_audit)
         source = {
             "status": payload["status"],
             "source_latest_at": payload["fetched_at"],
@@ -1491,11 +1727,6 @@ def get_outbound_performance(
             audit=error_audit,
             extra_warnings=error_warnings,
         )
-        # A wall display refreshes frequently. Cache the explicit unavailable
-        # result so a credential or MES outage cannot trigger a blocking token
-        # and API request on every refresh. Null metrics preserve fail-closed
-        # semantics; the cache-hit path above still reports source status error.
-        cache.set(cache_key, copy.deepcopy(payload), timeout=CACHE_SECONDS)
         source = {
             "status": "error",
             "source_latest_at": None,
@@ -1517,3 +1748,166 @@ def get_outbound_performance(
             },
         }
         return payload, list(payload["warnings"]), source, trace
+
+
+def _record_stat(name: str, amount: int = 1) -> None:
+    key = f"{STATS_CACHE_PREFIX}:{name}"
+    try:
+        if not cache.add(key, amount, None):
+            cache.incr(key, amount)
+    except ValueError:
+        # The counter expired or was evicted between ``add`` and ``incr``.
+        cache.add(key, amount, None)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+
+
+def outbound_performance_cache_stats() -> dict[str, int]:
+    """Cache counters since the last reset.
+
+    ``duplicate_fetches`` counts upstream fetches whose result landed after
+    another fetch for the same business date had already stored a newer
+    entry, i.e. herd work that single-flight is meant to remove.
+    """
+
+    try:
+        values = cache.get_many([f"{STATS_CACHE_PREFIX}:{name}" for name in STAT_NAMES])
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        values = {}
+    return {name: int(values.get(f"{STATS_CACHE_PREFIX}:{name}") or 0) for name in STAT_NAMES}
+
+
+def reset_outbound_performance_cache_stats() -> None:
+    cache.delete_many([f"{STATS_CACHE_PREFIX}:{name}" for name in STAT_NAMES])
+
+
+def _read_entry(cache_key: str) -> dict[str, Any] | None:
+    try:
+        entry = cache.get(cache_key)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        return None
+    if isinstance(entry, Mapping) and isinstance(entry.get("payload"), Mapping):
+        return dict(entry)
+    return None
+
+
+def _fetch_and_store(
+    target_date: date,
+    *,
+    force_refresh: bool = False,
+) -> tuple[dict[str, Any], list[str], dict[str, Any], dict[str, Any]]:
+    cache_key = f"{CACHE_KEY_PREFIX}:{target_date.isoformat()}"
+    started = time_module.time()
+    _record_stat("upstream_fetches")
+    result = _fetch_outbound_performance(target_date, force_refresh=force_refresh)
+    previous = _read_entry(cache_key)
+    if previous and float(previous.get("stored_at") or 0) >= started:
+        _record_stat("duplicate_fetches")
+    now = time_module.time()
+    entry = {
+        "payload": copy.deepcopy(result[0]),
+        "stored_at": now,
+        "fresh_until": now + CACHE_SECONDS,
+    }
+    # Unavailable results are cached too: a wall display refreshes often, so
+    # a credential or MES outage must not trigger a blocking token and API
+    # request on every refresh.  Null metrics keep fail-closed semantics and
+    # the cached path still reports source status error.
+    try:
+        cache.set(cache_key, entry, timeout=CACHE_SECONDS + STALE_SECONDS)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+    return result
+
+
+def _acquire_refresh_lock(lock_key: str) -> str | None:
+    token = uuid.uuid4().hex
+    try:
+        return token if cache.add(lock_key, token, REFRESH_LOCK_SECONDS) else None
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        # Without a working lock every caller refreshes, as before.
+        return token
+
+
+def _release_refresh_lock(lock_key: str, token: str) -> None:
+    try:
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+
+
+def _run_background_refresh(target_date: date, lock_key: str, token: str) -> None:
+    close_old_connections()
+    try:
+        _record_stat("background_refreshes")
+        _fetch_and_store(target_date)
+    except Exception:  # Keep serving the previous payload until the next attempt.
+        logger.exception("Outbound performance background refresh failed for %s", target_date)
+    finally:
+        _release_refresh_lock(lock_key, token)
+        close_old_connections()
+
+
+def _schedule_background_refresh(target_date: date, lock_key: str) -> None:
+    token = _acquire_refresh_lock(lock_key)
+    if token is None:
+        return
+    try:
+        _REFRESH_POOL.submit(_run_background_refresh, target_date, lock_key, token)
+    except RuntimeError:  # pragma: no cover - interpreter shutdown
+        _release_refresh_lock(lock_key, token)
+
+
+def get_outbound_performance(
+    target_date: date,
+    *,
+    force_refresh: bool = False,
+) -> tuple[dict[str, Any], list[str], dict[str, Any], dict[str, Any]]:
+    """Return dashboard payload, warnings, freshness state, and trace.
+
+    Successful and partial responses are fresh for five minutes.  Upstream
+    errors return explicit unavailable/null metrics and are never represented
+    as a valid zero-activity period.
+
+    Only one worker fetches a business date at a time (a cache ``add`` lock).
+    Shortly before expiry the holder refreshes in the background while the
+    current payload is still served; after expiry the previous payload is
+    served as ``stale`` for up to ``STALE_SECONDS`` while the refresh runs.
+    A caller with nothing to serve waits for the lock holder's result.
+    """
+
+    cache_key = f"{CACHE_KEY_PREFIX}:{target_date.isoformat()}"
+    lock_key = f"{cache_key}:refresh-lock"
+    if force_refresh:
+        return _fetch_and_store(target_date, force_refresh=True)
+
+    entry = _read_entry(cache_key)
+    if entry is not None:
+        remaining = float(entry.get("fresh_until") or 0) - time_module.time()
+        if remaining > 0:
+            if remaining <= REFRESH_AHEAD_SECONDS:
+                _schedule_background_refresh(target_date, lock_key)
+            return _cached_result(entry["payload"], cache_status="hit")
+        _schedule_background_refresh(target_date, lock_key)
+        _record_stat("stale_hits")
+        return _cached_result(entry["payload"], cache_status="stale")
+
+    token = _acquire_refresh_lock(lock_key)
+    if token is None:
+        _record_stat("lock_waits")
+        deadline = time_module.monotonic() + REFRESH_LOCK_WAIT_SECONDS
+        while time_module.monotonic() < deadline:
+            time_module.sleep(REFRESH_LOCK_POLL_SECONDS)
+            entry = _read_entry(cache_key)
+            if entry is not None:
+                return _cached_result(entry["payload"], cache_status="hit")
+        # The holder is stuck or died; fetch rather than fail the request.
+        _record_stat("misses")
+        return _fetch_and_store(target_date)
+
+    try:
+        _record_stat("misses")
+        return _fetch_and_store(target_date)
+    finally:
+        _release_refresh_lock(lock_key, token)
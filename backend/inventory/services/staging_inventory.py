@@ -0,0 +1,180 @@
+"""Search, ordering, keyset paging and counts over the live MES inventory.
+
+``StagingInventory`` holds the full MES inventory (tens of thousands of rows)
+and is replaced wholesale by ``fetch_inventory``.  The status screens used to
+page it with OFFSET/LIMIT, run an exact ``COUNT(*)`` per request and search
+with one ``icontains`` per column.  Instead:
+
+* search matches ``search_text`` (the searchable columns, casefolded and
+  newline-joined).  On PostgreSQL it carries a pg_trgm GIN index so
+  ``LIKE '%term%'`` stays indexed; other databases scan that single column.
+* a ``cursor`` walks the allowed sort fields with a ``(value, id)`` seek that
+  is backed by a composite index, so page N costs the same as page 1.
+* counts are cached per staging generation (the newest id of the current
+  snapshot, read from the primary key index) and per filter, so a new MES
+  snapshot invalidates them without any writer bumping a revision.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Case, CharField, F, Max, Q, When
+from django.db.models.functions import Cast
+from django.utils.dateparse import parse_datetime
+
+from inventory.models import StagingInventory
+
+# Request sort field -> model field or annotation used for ordering/seeking.
+SORT_FIELDS = {
+    "qr_code": "sort_key",
+    "quantity": "quantity",
+    "updated_at": "updated_at",
+    "material_code": "material_code",
+    "specification": "specification",
+    "warehouse_name": "warehouse_name",
+    "qc_status": "qc_status",
+    "work_order_code": "work_order_code",
+}
+DEFAULT_SORT_FIELD = "updated_at"
+STAGING_COUNT_CACHE_PREFIX = "inventory:staging-count"
+# Generation keys already change with every snapshot; the timeout only bounds
+# how long counts of an abandoned generation linger in the cache.
+STAGING_COUNT_CACHE_SECONDS = 6 * 60 * 60
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def staging_search_text(*values: Any) -> str:
+    # Newline-separated so a term never matches across two fields.
+    return "\n".join(str(value or "").strip() for value in values).casefold()
+
+
+def search_staging(queryset, terms):
+    """Keep rows whose searchable columns contain every term."""
+
+    if isinstance(terms, str):
+        terms = [terms]
+    for term in terms:
+        term = str(term or "").strip().casefold()
+        if term:
+            queryset = queryset.filter(search_text__contains=term)
+    return queryset
+
+
+def resolve_sort(sort_field: str | None, sort_order: str | None) -> tuple[str, bool]:
+    """``(request sort field, descending)``; unknown fields use the default order."""
+
+    if sort_field not in SORT_FIELDS:
+        return DEFAULT_SORT_FIELD, True
+    return sort_field, sort_order == "desc"
+
+
+def sort_staging(queryset, sort_field: str | None, sort_order: str | None):
+    """Order by the requested field with ``id`` as tie-breaker."""
+
+    sort_field, descending = resolve_sort(sort_field, sort_order)
+    column = SORT_FIELDS[sort_field]
+    if column == "sort_key":
+        # Identification code shown in the list: QR, then trolley label, then material id.
+        queryset = queryset.annotate(
+            sort_key=Case(
+                When(qr_code__isnull=False, then=F("qr_code")),
+                When(label_code__isnull=False, then=F("label_code")),
+                default=Cast("material_id", CharField()),
+                output_field=CharField(),
+            )
+        )
+    prefix = "-" if descending else ""
+    return queryset.order_by(f"{prefix}{column}", f"{prefix}id")
+
+
+def staging_generation() -> str:
+    """Identify the current snapshot by its newest id (one primary key probe).
+
+    Snapshots are only ever replaced wholesale and ids never go backwards, so
+    every replacement yields a new generation.
+    """
+
+    last_id = StagingInventory.objects.order_by().aggregate(last=Max("id"))["last"]
+    return "empty" if last_id is None else str(last_id)
+
+
+def cached_staging_count(queryset) -> int:
+    """``queryset.count()`` memoised per staging generation and filter set."""
+
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    signature = hashlib.sha1(f"{sql}|{params!r}".encode("utf-8")).hexdigest()
+    cache_key = f"{STAGING_COUNT_CACHE_PREFIX}:{staging_generation()}:{signature}"
+    try:
+        cached = cache.get(cache_key)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        cached = None
+    if isinstance(cached, int):
+        return cached
+    total = queryset.order_by().count()
+    try:
+        cache.set(cache_key, total, timeout=STAGING_COUNT_CACHE_SECONDS)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+    return total
+
+
+def _encode_cursor(sort_field: str, descending: bool, value: Any, row_id: int) -> str:
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    elif value is not None:
+        value = str(value)
+    payload = json.dumps([sort_field, int(descending), value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_field: str, descending: bool) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_field, cursor_desc, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        row_id = int(row_id)
+    except (TypeError, ValueError):
+        raise InvalidCursor("Invalid cursor") from None
+    if cursor_field != sort_field or bool(cursor_desc) != descending or not isinstance(value, str):
+        raise InvalidCursor("Cursor does not match the requested ordering")
+    if sort_field == "updated_at":
+        value = parse_datetime(value)
+        if value is None:
+            raise InvalidCursor("Invalid cursor")
+    elif sort_field == "quantity":
+        try:
+            value = Decimal(value)
+        except InvalidOperation:
+            raise InvalidCursor("Invalid cursor") from None
+    return value, row_id
+
+
+def keyset_page(queryset, sort_field: str | None, sort_order: str | None, cursor: str | None, size: int):
+    """Return ``(rows, next_cursor)`` for the page after ``cursor`` (first page when empty)."""
+
+    sort_field, descending = resolve_sort(sort_field, sort_order)
+    column = SORT_FIELDS[sort_field]
+    queryset = sort_staging(queryset, sort_field, "desc" if descending else "asc")
+    if cursor:
+        value, row_id = _decode_cursor(cursor, sort_field, descending)
+        lookup = "lt" if descending else "gt"
+        # The redundant inclusive bound gives the planner an index range on
+        # (column, id) instead of an OR it can only evaluate row by row.
+        queryset = queryset.filter(**{f"{column}__{lookup}e": value}).filter(
+            Q(**{f"{column}__{lookup}": value}) | Q(**{f"id__{lookup}": row_id})
+        )
+    rows = list(queryset[:size + 1])
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        next_cursor = _encode_cursor(sort_field, descending, getattr(last, column), last.pk)
+    return rows, next_cursor
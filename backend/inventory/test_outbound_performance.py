@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from datetime import date, datetime
 from unittest.mock import MagicMock, call, patch
 
@@ -15,7 +17,11 @@ from inventory.services.outbound_performance import (
     _quantity_unit,
     _status_label,
     get_outbound_performance,
+    outbound_performance_cache_stats,
+    refresh_outbound_partitions,
 )
+from inventory.models import OutboundOrderDayPartition
+from inventory.services import outbound_performance
 from inventory.mes import MES_BASE_URL
 
 
@@ -972,6 +978,207 @@ class OutboundPerformanceServiceTests(TestCase):
         self.assertEqual(second["today_priority_items"], [])
 
 
+class OutboundOrderDayPartitionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def page(self, *rows):
+        return {"code": 200, "data": {"total": len(rows), "list": list(rows)}}
+
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_closed_days_are_served_from_stored_partitions(self, post):
+        post.return_value = self.page(
+            _row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12), plan=240, done=200),
+            _row(2, "20260805LGENT-JIT", _at(2026, 8, 5, 12), plan=100, done=80),
+            _row(3, "20260715LGENT-CSD", _at(2026, 7, 15, 9), plan=50, done=40),
+        )
+
+        first, *_rest = get_outbound_performance(TARGET_DATE)
+        cache.clear()
+        second, *_rest = get_outbound_performance(TARGET_DATE)
+
+        self.assertEqual(post.call_count, 1)
+        self.assertEqual(first["refreshed_day_count"], 41)
+        self.assertEqual(second["refreshed_day_count"], 0)
+        self.assertEqual(second["pages_fetched"], 0)
+        self.assertEqual(second["periods"], first["periods"])
+        self.assertEqual(
+            OutboundOrderDayPartition.objects.get(business_date=date(2026, 8, 5)).line_count,
+            1,
+        )
+
+    @patch("inventory.services.outbound_performance.timezone.now")
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_only_the_open_day_is_refetched(self, post, now):
+        now.return_value = datetime(2026, 8, 10, 15, tzinfo=SHANGHAI_TZ)
+        post.return_value = self.page(
+            _row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12), plan=240, done=200),
+            _row(2, "20260805LGENT-JIT", _at(2026, 8, 5, 12), plan=100, done=80),
+        )
+        get_outbound_performance(TARGET_DATE)
+
+        post.reset_mock()
+        post.return_value = self.page(
+            _row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12), plan=240, done=240),
+        )
+        cache.clear()
+        payload, *_rest = get_outbound_performance(TARGET_DATE)
+
+        post.assert_called_once()
+        self.assertEqual(post.call_args.args[0]["planAtFrom"], _at(2026, 8, 10, 8))
+        self.assertEqual(payload["periods"]["today"]["JIT"]["fulfilled_qty"], 240)
+        self.assertEqual(payload["periods"]["previous_week"]["JIT"]["target_qty"], 100)
+
+    @patch("inventory.services.outbound_performance.MAX_PAGES", 1)
+    @patch("inventory.services.outbound_performance.PAGE_SIZE", 1)
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_multi_day_run_over_the_page_limit_is_refetched_per_day(self, post):
+        post.return_value = {
+            "code": 200,
+            "data": {"total": 5, "list": [_row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12))]},
+        }
+
+        audit = refresh_outbound_partitions(date(2026, 8, 9), date(2026, 8, 10))
+
+        self.assertEqual(
+            [call.args[0]["planAtFrom"] for call in post.call_args_list],
+            [_at(2026, 8, 9, 8), _at(2026, 8, 9, 8), _at(2026, 8, 10, 8)],
+        )
+        self.assertEqual(audit["pages_fetched"], 3)
+        self.assertFalse(OutboundOrderDayPartition.objects.get(business_date=date(2026, 8, 10)).complete)
+
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_refresh_updates_stored_days_in_place(self, post):
+        post.return_value = self.page(_row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12)))
+        refresh_outbound_partitions(date(2026, 8, 10), date(2026, 8, 10))
+        stored = OutboundOrderDayPartition.objects.get(business_date=date(2026, 8, 10))
+
+        post.return_value = self.page(
+            _row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12)),
+            _row(2, "20260810LGENT-CSD", _at(2026, 8, 10, 13)),
+        )
+        refresh_outbound_partitions(date(2026, 8, 10), date(2026, 8, 10))
+
+        refreshed = OutboundOrderDayPartition.objects.get(business_date=date(2026, 8, 10))
+        self.assertEqual((refreshed.pk, refreshed.line_count), (stored.pk, 2))
+        self.assertGreaterEqual(refreshed.fetched_at, stored.fetched_at)
+
+
+    @patch("inventory.services.outbound_performance.timezone.now")
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_fetch_purges_days_before_the_comparison_windows(self, post, now):
+        now.return_value = datetime(2026, 8, 10, 15, tzinfo=SHANGHAI_TZ)
+        fetched_at = datetime(2026, 8, 1, 15, tzinfo=SHANGHAI_TZ)
+        for day in (date(2026, 6, 30), date(2026, 7, 1)):
+            OutboundOrderDayPartition.objects.create(business_date=day, fetched_at=fetched_at)
+        post.return_value = self.page(_row(1, "20260810LGENT-JIT", _at(2026, 8, 10, 12)))
+
+        get_outbound_performance(TARGET_DATE)
+
+        self.assertFalse(OutboundOrderDayPartition.objects.filter(business_date__lt=date(2026, 7, 1)).exists())
+        self.assertTrue(OutboundOrderDayPartition.objects.filter(business_date=date(2026, 7, 1)).exists())
+
+        # An older target date keeps every day its own windows read.
+        cache.clear()
+        get_outbound_performance(date(2026, 5, 28))
+
+        self.assertEqual(
+            OutboundOrderDayPartition.objects.order_by("business_date").first().business_date,
+            date(2026, 4, 1),
+        )
+        self.assertTrue(OutboundOrderDayPartition.objects.filter(business_date=date(2026, 5, 18)).exists())
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+@patch("inventory.services.outbound_performance._REFRESH_POOL", _InlineExecutor())
+class OutboundPerformanceSingleFlightCacheTests(TestCase):
+    cache_key = f"{outbound_performance.CACHE_KEY_PREFIX}:{TARGET_DATE.isoformat()}"
+
+    def setUp(self):
+        cache.clear()
+
+    def store_entry(self, *, fresh_for, target_qty_marker="cached"):
+        now = time.time()
+        cache.set(
+            self.cache_key,
+            {
+                "payload": {"status": "ok", "warnings": [], "fetched_at": target_qty_marker},
+                "stored_at": now - 60,
+                "fresh_until": now + fresh_for,
+            },
+            timeout=None,
+        )
+
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_expired_payload_is_served_stale_while_one_refresh_runs(self, post):
+        post.return_value = {"data": {"list": [], "total": 0}}
+        self.store_entry(fresh_for=-5)
+
+        payload, _warnings, source, trace = get_outbound_performance(TARGET_DATE)
+
+        self.assertEqual(payload["fetched_at"], "cached")
+        self.assertEqual((payload["cache_status"], trace["cache_status"]), ("stale", "stale"))
+        self.assertTrue(source["stale"])
+        self.assertEqual(post.call_count, 1)
+        refreshed, _warnings, source, _trace = get_outbound_performance(TARGET_DATE)
+        self.assertEqual(refreshed["cache_status"], "hit")
+        self.assertNotEqual(refreshed["fetched_at"], "cached")
+        self.assertFalse(source["stale"])
+        stats = outbound_performance_cache_stats()
+        self.assertEqual(
+            (stats["stale_hits"], stats["background_refreshes"], stats["duplicate_fetches"]),
+            (1, 1, 0),
+        )
+
+    @patch("inventory.services.outbound_performance._post_mes")
+    def test_refreshes_ahead_of_expiry_and_skips_while_locked(self, post):
+        post.return_value = {"data": {"list": [], "total": 0}}
+        self.store_entry(fresh_for=outbound_performance.REFRESH_AHEAD_SECONDS - 5)
+        cache.add(f"{self.cache_key}:refresh-lock", "other-worker", 60)
+
+        payload, *_rest = get_outbound_performance(TARGET_DATE)
+        self.assertEqual(payload["cache_status"], "hit")
+        post.assert_not_called()
+
+        cache.delete(f"{self.cache_key}:refresh-lock")
+        get_outbound_performance(TARGET_DATE)
+        self.assertEqual(post.call_count, 1)
+        self.assertIsNone(cache.get(f"{self.cache_key}:refresh-lock"))
+
+    @patch("inventory.services.outbound_performance.REFRESH_LOCK_POLL_SECONDS", 0.01)
+    @patch("inventory.services.outbound_performance._fetch_outbound_performance")
+    def test_concurrent_misses_share_one_upstream_fetch(self, fetch):
+        # Worker threads use their own DB connections, so the upstream build is
+        # replaced to keep this test from writing outside the test transaction.
+        def slow_fetch(_target_date, **_kwargs):
+            time.sleep(0.2)
+            return {"status": "ok", "warnings": []}, [], {}, {}
+
+        fetch.side_effect = slow_fetch
+        barrier = threading.Barrier(8)
+        results = []
+
+        def request():
+            barrier.wait()
+            results.append(get_outbound_performance(TARGET_DATE)[0]["status"])
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["ok"] * 8)
+        self.assertEqual(fetch.call_count, 1)
+        stats = outbound_performance_cache_stats()
+        self.assertEqual((stats["upstream_fetches"], stats["duplicate_fetches"]), (1, 0))
+        self.assertEqual(stats["lock_waits"], 7)
+
+
 class OverviewInventoryOutboundIntegrationTests(TestCase):
     @patch("production.overview_board.get_outbound_performance")
     def test_inventory_contract_keeps_legacy_stock_and_adds_outbound_metrics(self, outbound):
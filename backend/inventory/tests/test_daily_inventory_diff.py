@@ -0,0 +1,130 @@
+import csv
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from inventory.models import DailyInventoryDiff, DailyInventoryDiffSet, DailyInventorySnapshot, StagingInventory
+
+
+REPORT_DATE = datetime.date(2026, 7, 14)
+PREV_DATE = REPORT_DATE - datetime.timedelta(days=1)
+
+
+def snapshot(day, material_code, quantity, carts=1, warehouse_name="成品仓库", qc_status="1"):
+    return DailyInventorySnapshot.objects.create(
+        snapshot_date=day,
+        material_code=material_code,
+        material_name=f"Part {material_code}",
+        warehouse_code="FG",
+        warehouse_name=warehouse_name,
+        qc_status=qc_status,
+        total_quantity=Decimal(quantity),
+        unit="EA",
+        cart_count=carts,
+        cart_details=[{"qr_code": f"QR-{material_code}"}],
+    )
+
+
+class DailyInventoryDiffTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(username="report", password="pw"))
+        snapshot(PREV_DATE, "A", 10, carts=2)
+        snapshot(PREV_DATE, "GONE", 5)
+        snapshot(REPORT_DATE, "A", 15, carts=3)
+        snapshot(REPORT_DATE, "NEW", 4)
+        snapshot(REPORT_DATE, "RAW", 9, warehouse_name="原材料仓库")
+
+    def test_daily_report_reads_the_materialised_pair_once(self):
+        body = self.client.get("/api/inventory/daily-report/", {"date": REPORT_DATE.isoformat()}).json()
+        rows = {row["material_code"]: row for row in body["results"]}
+        self.assertEqual(set(rows), {"A", "NEW"})
+        self.assertEqual(body["total"], 2)
+        self.assertEqual(Decimal(rows["A"]["quantity_change"]), Decimal(5))
+        self.assertEqual(rows["A"]["quantity_change_percent"], 50.0)
+        self.assertEqual(rows["A"]["cart_count_change"], 1)
+        self.assertEqual(rows["A"]["cart_details"], [{"qr_code": "QR-A"}])
+        self.assertEqual(rows["NEW"]["quantity_change_percent"], 100.0)
+        self.assertEqual(DailyInventoryDiffSet.objects.get().row_count, 4)
+
+        # Revision probe, diff set, aggregate, page.
+        with self.assertNumQueries(4):
+            body = self.client.get(
+                "/api/inventory/daily-report/", {"date": REPORT_DATE.isoformat(), "page": 2, "size": 1}
+            ).json()
+        self.assertEqual([row["material_code"] for row in body["results"]], ["NEW"])
+        self.assertEqual((body["total"], body["pages"]), (2, 2))
+
+    def test_recreated_snapshot_rebuilds_the_diff(self):
+        self.client.get("/api/inventory/daily-report/", {"date": REPORT_DATE.isoformat()})
+        DailyInventorySnapshot.objects.filter(snapshot_date=REPORT_DATE, material_code="A").delete()
+        snapshot(REPORT_DATE, "A", 7)
+
+        body = self.client.get("/api/inventory/daily-report/", {"date": REPORT_DATE.isoformat()}).json()
+        row = next(row for row in body["results"] if row["material_code"] == "A")
+        self.assertEqual(Decimal(row["quantity_change"]), Decimal(-3))
+
+    def test_compare_summarises_both_sides_and_pages(self):
+        body = self.client.get(
+            "/api/inventory/daily-report/compare/",
+            {"date1": PREV_DATE.isoformat(), "date2": REPORT_DATE.isoformat()},
+        ).json()
+        rows = {row["material_code"]: row for row in body["comparison_results"]}
+        self.assertEqual(rows["GONE"]["status"], "date1_only")
+        self.assertEqual(rows["GONE"]["quantity_change_percent"], -100)
+        self.assertEqual(rows["NEW"]["status"], "date2_only")
+        self.assertIsNone(rows["NEW"]["quantity_change_percent"])
+        self.assertEqual(body["summary"]["date1"], {"total_items": 2, "total_quantity": 15.0, "total_carts": 3})
+        self.assertEqual(body["summary"]["date2"], {"total_items": 3, "total_quantity": 28.0, "total_carts": 5})
+
+        body = self.client.get(
+            "/api/inventory/daily-report/compare/",
+            {"date1": PREV_DATE.isoformat(), "date2": REPORT_DATE.isoformat(), "material_code": "gon", "size": 10},
+        ).json()
+        self.assertEqual([row["material_code"] for row in body["comparison_results"]], ["GONE"])
+        self.assertEqual(body["page"], 1)
+
+    def test_csv_export_streams_rows_with_comparison_columns(self):
+        response = self.client.get(
+            "/api/inventory/daily-report/export-csv/",
+            {"date": REPORT_DATE.isoformat(), "compare_date": PREV_DATE.isoformat()},
+        )
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode("utf-8").lstrip("\ufeff")
+        rows = {row[1]: row for row in list(csv.reader(StringIO(content)))[1:]}
+        self.assertEqual(set(rows), {"A", "NEW", "RAW"})
+        self.assertEqual(rows["A"][10:], ["10.0", "2", "5.0", "50.0", "1"])
+        self.assertEqual(rows["NEW"][10:], ["0", "0", "4.0", "100", "1"])
+
+        plain = self.client.get("/api/inventory/daily-report/export-csv/", {"date": REPORT_DATE.isoformat()})
+        header, *rows = csv.reader(StringIO(b"".join(plain.streaming_content).decode("utf-8").lstrip("\ufeff")))
+        self.assertEqual(len(header), 10)
+        self.assertEqual({len(row) for row in rows}, {10})
+
+    def test_snapshot_command_materialises_the_previous_day_diff(self):
+        # The command purges snapshots and diffs older than ten days, so use today.
+        self.client.get("/api/inventory/daily-report/", {"date": REPORT_DATE.isoformat()})
+        today = timezone.now().date()
+        snapshot(today - datetime.timedelta(days=1), "A", 10)
+        StagingInventory.objects.create(
+            material_id=1,
+            material_code="A",
+            warehouse_code="FG",
+            warehouse_name="成品仓库",
+            qc_status="1",
+            quantity=Decimal("12"),
+            unit="EA",
+            updated_at=timezone.now(),
+        )
+
+        call_command("create_daily_snapshot", date=today.isoformat(), stdout=StringIO())
+
+        diff = DailyInventoryDiff.objects.get(snapshot_date=today, material_code="A")
+        self.assertEqual(diff.quantity_change, Decimal("2.0000"))
+        self.assertFalse(DailyInventoryDiffSet.objects.filter(snapshot_date=REPORT_DATE).exists())
@@ -0,0 +1,95 @@
+import datetime
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from inventory.models import StagingInventory
+
+
+SOURCE_TIME = datetime.datetime(2026, 7, 14, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def staging_row(index, **overrides):
+    values = {
+        "material_id": 1000 + index,
+        "material_code": f"RM-{index % 7:03d}",
+        "qr_code": f"QR-{index:04d}",
+        "label_code": f"LABEL-{index:04d}",
+        "material_name": f"Resin {index}",
+        "specification": "25kg bag" if index % 2 else "Bulk Tank",
+        "warehouse_code": "RAW",
+        "warehouse_name": "原材料仓库",
+        "qc_status": str(1 + index % 3),
+        "quantity": Decimal(index % 5),
+        "unit": "kg",
+        # Several rows share each timestamp so the id tie-breaker matters.
+        "updated_at": SOURCE_TIME + datetime.timedelta(minutes=index // 4),
+    }
+    values.update(overrides)
+    return StagingInventory(**values)
+
+
+class StagingInventoryStatusTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(username="stock", password="pw"))
+        rows = [staging_row(index) for index in range(23)]
+        for row in rows:
+            row.refresh_search_text()
+        StagingInventory.objects.bulk_create(rows)
+
+    def walk(self, url, params):
+        seen, cursor, pages = [], "", 0
+        while cursor is not None:
+            body = self.client.get(url, {**params, "cursor": cursor}).json()
+            seen.extend(row["qr_code"] for row in body["results"])
+            cursor = body["next_cursor"]
+            pages += 1
+        return seen, pages
+
+    def test_cursor_walk_matches_offset_order_for_every_sort_field(self):
+        for sort_field in ("qr_code", "quantity", "updated_at", "material_code", "qc_status", "specification"):
+            for sort_order in ("asc", "desc"):
+                params = {"size": 5, "sort_field": sort_field, "sort_order": sort_order}
+                with self.subTest(sort_field=sort_field, sort_order=sort_order):
+                    offset_order = []
+                    for page in range(1, 6):
+                        body = self.client.get("/api/inventory/status/", {**params, "page": page}).json()
+                        offset_order.extend(row["qr_code"] for row in body["results"])
+                    keyset_order, pages = self.walk("/api/inventory/status/", params)
+                    self.assertEqual(keyset_order, offset_order)
+                    self.assertEqual(len(set(keyset_order)), 23)
+                    self.assertEqual(pages, 5)
+
+    def test_list_view_cursor_and_search_use_search_text(self):
+        keyset_order, _ = self.walk("/api/inventory/", {"size": 4, "search": "bulk tank"})
+        self.assertEqual(len(keyset_order), 12)
+
+        body = self.client.get("/api/inventory/", {"search": "qr-001", "size": 50}).json()
+        self.assertEqual(body["count"], 10)
+        body = self.client.get("/api/inventory/status/", {"search": "Resin 1", "size": 50}).json()
+        self.assertEqual(body["total"], 11)  # Resin 1 and Resin 10-19
+        self.assertEqual(
+            self.client.get("/api/inventory/", {"cursor": "not-a-cursor"}).status_code,
+            404,
+        )
+
+    def test_count_is_cached_per_staging_generation(self):
+        params = {"size": 5, "qc_status": "1"}
+        self.assertEqual(self.client.get("/api/inventory/status/", params).json()["total"], 8)
+
+        with self.assertNumQueries(2):  # generation probe + page
+            self.assertEqual(self.client.get("/api/inventory/status/", params).json()["total"], 8)
+
+        # A new MES snapshot replaces every row and therefore the generation.
+        StagingInventory.objects.all().delete()
+        StagingInventory.objects.create(**{
+            field.name: getattr(staging_row(1, qc_status="1"), field.name)
+            for field in StagingInventory._meta.concrete_fields
+            if field.name not in {"id", "fetched_at"}
+        })
+        self.assertEqual(self.client.get("/api/inventory/status/", params).json()["total"], 1)
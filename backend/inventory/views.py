@@ -9,8 +9,11 @@ from .serializers import FactInventorySerializer, UnifiedPartSpecSerializer
 from .models import FactInventory, StagingInventory, UnifiedPartSpec
 from django.core.management import call_command
 from rest_framework.pagination import PageNumberPagination
-from django.http import HttpResponse
-from django.db.models import Case, When, F, CharField, Max
+from rest_framework.exceptions import NotFound
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.http import HttpResponse, StreamingHttpResponse
+from django.db.models import Max
 import csv
 from io import StringIO
 
@@ -25,7 +28,15 @@ from django.db.models import Q, Sum, Count
 from django.utils import timezone
 from datetime import datetime, timedelta
 from decimal import Decimal
-from .models import StagingInventory, FactInventory, DailyInventorySnapshot, DailyReportSummary
+from .models import StagingInventory, FactInventory, DailyInventoryDiff, DailyInventorySnapshot, DailyReportSummary
+from .services.daily_inventory_diff import daily_inventory_diff
+from .services.staging_inventory import (
+    InvalidCursor,
+    cached_staging_count,
+    keyset_page,
+    search_staging,
+    sort_staging,
+)
 from .serializers import (
     StagingInventorySerializer, 
     FactInventorySerializer, 
@@ -189,9 +200,48 @@ class LastUpdateView(APIView):
         })
 
 
+class StagingCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        return cached_staging_count(self.object_list)
+
+
 class InventoryPagination(PageNumberPagination):
+    """Page numbers by default; ``?cursor=`` switches to keyset paging."""
+
     page_size_query_param = 'size'
     page_query_param = 'page'
+    cursor_query_param = 'cursor'
+    django_paginator_class = StagingCountPaginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+        self.total = cached_staging_count(queryset)
+        try:
+            rows, self.next_cursor = keyset_page(
+                queryset,
+                request.query_params.get('sort_field'),
+                request.query_params.get('sort_order'),
+                request.query_params.get(self.cursor_query_param),
+                self.get_page_size(request),
+            )
+        except InvalidCursor as exc:
+            raise NotFound(str(exc))
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({'count': self.total, 'next_cursor': self.next_cursor, 'results': data})
+
+
+class StagingSearchFilter(filters.SearchFilter):
+    """``?search=`` against the indexed ``StagingInventory.search_text``."""
+
+    def filter_queryset(self, request, queryset, view):
+        return search_staging(queryset, self.get_search_terms(request))
 
 
 # --- filters ---
@@ -214,41 +264,17 @@ class InventoryListView(ListAPIView):
     pagination_class = InventoryPagination
     queryset = StagingInventory.objects.all()
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, StagingSearchFilter]
     filterset_class = InventoryFilter
-    search_fields = ['qr_code', 'label_code', 'material_code', 'specification', 'material_name']
+    search_fields = StagingInventory.SEARCH_FIELDS
 
     def get_queryset(self):
-        queryset = StagingInventory.objects.all()
-        
-        # 정렬 파라미터 처리
-        sort_field = self.request.query_params.get('sort_field', '')
-        sort_order = self.request.query_params.get('sort_order', 'asc')
-        
-        if sort_field:
-            # 필드별 정렬 처리
-            if sort_field == 'qr_code':
-                # qr_code, label_code, material_id 순서로 정렬
-                from django.db.models import F, Value
-                queryset = queryset.annotate(
-                    sort_key=Case(
-                        When(qr_code__isnull=False, then=F('qr_code')),
-                        When(label_code__isnull=False, then=F('label_code')),
-                        default=F('material_id'),
-                        output_field=CharField(),
-                    )
-                ).order_by(f'{"-" if sort_order == "desc" else ""}sort_key')
-            elif sort_field == 'quantity':
-                queryset = queryset.order_by(f'{"-" if sort_order == "desc" else ""}quantity')
-            elif sort_field == 'updated_at':
-                queryset = queryset.order_by(f'{"-" if sort_order == "desc" else ""}updated_at')
-            elif sort_field in ['material_code', 'specification', 'warehouse_name', 'qc_status', 'work_order_code']:
-                queryset = queryset.order_by(f'{"-" if sort_order == "desc" else ""}{sort_field}')
-        else:
-            # 기본 정렬: 최신 업데이트 순
-            queryset = queryset.order_by('-updated_at')
-        
-        return queryset
+        # 정렬: 허용된 필드 + id 보조 정렬 (기본: 최신 업데이트 순)
+        return sort_staging(
+            StagingInventory.objects.all(),
+            self.request.query_params.get('sort_field', ''),
+            self.request.query_params.get('sort_order', 'asc'),
+        )
 
 
 class WarehouseListView(APIView):
@@ -281,37 +307,10 @@ class InventoryExportView(APIView):
         # Apply search
         search = request.GET.get('search')
         if search:
-            from django.db.models import Q
-            queryset = queryset.filter(
-                Q(qr_code__icontains=search) |
-                Q(label_code__icontains=search) |
-                Q(material_code__icontains=search) |
-                Q(specification__icontains=search) |
-                Q(material_name__icontains=search)
-            )
+            queryset = search_staging(queryset, search)
         
         # Apply sorting (same logic as InventoryListView)
-        sort_field = request.GET.get('sort_field', '')
-        sort_order = request.GET.get('sort_order', 'asc')
-        
-        if sort_field:
-            if sort_field == 'qr_code':
-                queryset = queryset.annotate(
-                    sort_key=Case(
-                        When(qr_code__isnull=False, then=F('qr_code')),
-                        When(label_code__isnull=False, then=F('label_code')),
-                        default=F('material_id'),
-                        output_field=CharField(),
-                    )
-                ).order_by(f'{"-" if sort_order == "desc" else ""}sort_key')
-            elif sort_field == 'quantity':
-                queryset = queryset.order_by(f'{"-" if sort_order == "desc" else ""}quantity')
-            elif sort_field == 'updated_at':
-                queryset = queryset.order_by(f'{"-" if sort_order == "desc" else ""}updated_at')
-            elif sort_field in ['material_code', 'specification', 'warehouse_name', 'qc_status', 'work_order_code']:
-                queryset = queryset.order_by(f'{"-" if sort_order == "desc" else ""}{sort_field}')
-        else:
-            queryset = queryset.order_by('-updated_at')
+        queryset = sort_staging(queryset, request.GET.get('sort_field', ''), request.GET.get('sort_order', 'asc'))
         
         # Limit to 10000 records for CSV export
         queryset = queryset[:10000]
@@ -358,10 +357,14 @@ class InventoryExportView(APIView):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def inventory_status(request):
-    """재고 상세 현황 API"""
+    """재고 상세 현황 API
+
+    ``cursor`` 파라미터가 있으면 (빈 값 = 첫 페이지) OFFSET 대신 keyset 으로
+    페이지를 넘기고 응답의 ``next_cursor`` 로 다음 페이지를 요청한다.
+    """
     # 파라미터 처리
-    page = int(request.GET.get('page', 1))
-    size = int(request.GET.get('size', 100))
+    page = max(1, int(request.GET.get('page', 1)))
+    size = max(1, int(request.GET.get('size', 100)))
     search = request.GET.get('search', '')
     warehouse_code_in = request.GET.get('warehouse_code__in', '')
     qc_status = request.GET.get('qc_status', '')
@@ -373,14 +376,9 @@ def inventory_status(request):
     # 쿼리셋 생성 - StagingInventory 사용
     queryset = StagingInventory.objects.all()
 
-    # 검색 필터
+    # 검색 필터 (search_text 인덱스)
     if search:
-        queryset = queryset.filter(
-            Q(qr_code__icontains=search) |
-            Q(label_code__icontains=search) |
-            Q(material_code__icontains=search) |
-            Q(specification__icontains=search)
-        )
+        queryset = search_staging(queryset, search)
 
     # 창고 필터
     if warehouse_code_in:
@@ -397,16 +395,25 @@ def inventory_status(request):
     if updated_at_lte:
         queryset = queryset.filter(updated_at__lte=updated_at_lte)
 
+    # 전체 건수는 스냅샷 세대별로 캐시
+    total = cached_staging_count(queryset)
+
+    if 'cursor' in request.GET:
+        try:
+            results, next_cursor = keyset_page(queryset, sort_field, sort_order, request.GET.get('cursor'), size)
+        except InvalidCursor as exc:
+            raise NotFound(str(exc))
+        return Response({
+            'results': StagingInventorySerializer(results, many=True).data,
+            'total': total,
+            'size': size,
+            'next_cursor': next_cursor,
+        })
+
     # 정렬
-    if sort_field:
-        if sort_order == 'desc':
-            sort_field = f'-{sort_field}'
-        queryset = queryset.order_by(sort_field)
-    else:
-        queryset = queryset.order_by('-updated_at')
+    queryset = sort_staging(queryset, sort_field, sort_order)
 
     # 페이지네이션
-    total = queryset.count()
     start = (page - 1) * size
     end = start + size
     results = queryset[start:end]
@@ -423,10 +430,41 @@ def inventory_status(request):
     })
 
 
+DAILY_REPORT_MAX_PAGE_SIZE = 1000
+
+
+def _daily_report_page(request, queryset):
+    """``page``/``size`` 가 있으면 해당 페이지만, 없으면 전체를 돌려준다."""
+    if 'page' not in request.GET and 'size' not in request.GET:
+        return queryset, {}
+    try:
+        page = max(1, int(request.GET.get('page', 1)))
+        size = min(DAILY_REPORT_MAX_PAGE_SIZE, max(1, int(request.GET.get('size', 100))))
+    except ValueError:
+        page, size = 1, 100
+    start = (page - 1) * size
+    return queryset[start:start + size], {'page': page, 'size': size}
+
+
+def _daily_change_percent(prev_quantity, quantity):
+    if prev_quantity > 0:
+        return float((quantity - prev_quantity) / prev_quantity * 100)
+    if prev_quantity == 0 and quantity > 0:
+        # 전날 0에서 오늘 양수면 100% 증가로 표시
+        return 100.0
+    if prev_quantity == 0 and quantity == 0:
+        return 0.0
+    return None
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def daily_report(request):
-    """일일 보고서 API"""
+    """일일 보고서 API
+
+    전일 대비 증감은 ``DailyInventoryDiff`` 에 미리 계산된 값을 읽는다.
+    ``page``/``size`` 를 주면 페이지 단위로 응답한다.
+    """
     # 파라미터 처리
     date_str = request.GET.get('date', '')
     warehouse_code = request.GET.get('warehouse_code', '')
@@ -447,8 +485,10 @@ def daily_report(request):
     # 전일 날짜 계산
     prev_date = report_date - timedelta(days=1)
 
-    # 쿼리셋 생성
-    queryset = DailyInventorySnapshot.objects.filter(snapshot_date=report_date)
+    # 보고일에 존재하는 품목만 (전일에만 있던 품목 제외)
+    queryset = daily_inventory_diff(report_date, prev_date).exclude(
+        presence=DailyInventoryDiff.PRESENCE_BASE_ONLY
+    )
 
     # 필터 적용
     if warehouse_code:
@@ -458,122 +498,55 @@ def daily_report(request):
     
     # 창고 타입 필터링 (warehouse_name 기반)
     warehouse_type = request.GET.get('warehouse_type', '')
-    # print(f"Requested warehouse_type: {warehouse_type}")
-    
     if warehouse_type == 'finished':
-        # 成品仓库만 포함
         queryset = queryset.filter(warehouse_name='成品仓库')
-        # print(f"Filtering: finished warehouse, count: {queryset.count()}")
-        # 필터링된 창고 이름들 출력
-        warehouse_names = queryset.values_list('warehouse_name', flat=True).distinct()
-        # print(f"Filtered warehouses: {list(warehouse_names)}")
     elif warehouse_type == 'semi':
-        # 半成品仓库만 포함 (다른 창고들은 제외)
         queryset = queryset.filter(warehouse_name='半成品仓库')
-        # print(f"Filtering: semi-finished warehouse, count: {queryset.count()}")
-        # 필터링된 창고 이름들 출력
-        warehouse_names = queryset.values_list('warehouse_name', flat=True).distinct()
-        # print(f"Filtered warehouses: {list(warehouse_names)}")
     else:
         # 기본값: 제품창고와 반제품창고만 포함
         queryset = queryset.filter(
             warehouse_name__in=['成品仓库', '半成品仓库', '注塑车间仓库', '加工车间仓库']
         )
-        # print(f"Default filtering: finished+semi warehouses, count: {queryset.count()}")
-        warehouse_names = queryset.values_list('warehouse_name', flat=True).distinct()
-        # print(f"Filtered warehouses: {list(warehouse_names)}")
-    
-    # 검색 디버깅
-    if material_code:
-        # print(f"Search term: {material_code}, filtered count: {queryset.count()}")
-        if queryset.count() == 0:
-            # 전체 데이터에서 해당 제품 검색
-            all_items = DailyInventorySnapshot.objects.filter(snapshot_date=report_date)
-            matching_items = all_items.filter(material_code__icontains=material_code)
-            # print(f"Search results for '{material_code}': {matching_items.count()} items")
-            for item in matching_items[:5]:  # 처음 5개만 출력
-                print(f"  - {item.material_code} @ {item.warehouse_name}")
-
-    # 전일 데이터 조회
-    prev_queryset = DailyInventorySnapshot.objects.filter(snapshot_date=prev_date)
-    if warehouse_code:
-        prev_queryset = prev_queryset.filter(warehouse_code=warehouse_code)
-    if material_code:
-        prev_queryset = prev_queryset.filter(material_code__icontains=material_code)
-    
-    # 창고 타입 필터링 (전일 데이터에도 적용)
-    if warehouse_type == 'finished':
-        prev_queryset = prev_queryset.filter(warehouse_name='成品仓库')
-    elif warehouse_type == 'semi':
-        prev_queryset = prev_queryset.filter(warehouse_name='半成品仓库')
-
-    # 전일 데이터를 딕셔너리로 변환 (빠른 조회용)
-    prev_data = {}
-    for item in prev_queryset:
-        key = (item.material_code, item.warehouse_code, item.qc_status)
-        prev_data[key] = item
 
-    # 결과 데이터 생성
-    results = []
-    for item in queryset:
-        key = (item.material_code, item.warehouse_code, item.qc_status)
-        prev_item = prev_data.get(key)
-        
-        # 증감 계산 (전날 데이터와 비교)
-        prev_quantity = prev_item.total_quantity if prev_item else 0
-        quantity_change = item.total_quantity - prev_quantity
-        quantity_change_percent = None
-        
-        # 전날 수량이 0이 아닌 경우에만 변화율 계산
-        if prev_quantity > 0:
-            quantity_change_percent = (quantity_change / prev_quantity) * 100
-        elif prev_quantity == 0 and item.total_quantity > 0:
-            # 전날 0에서 오늘 양수면 100% 증가로 표시
-            quantity_change_percent = 100.0
-        elif prev_quantity == 0 and item.total_quantity == 0:
-            # 둘 다 0이면 변화 없음
-            quantity_change_percent = 0.0
-            
-        prev_cart_count = prev_item.cart_count if prev_item else 0
-        cart_count_change = item.cart_count - prev_cart_count
-
-        # 결과 데이터 구성
-        result_data = {
-            'snapshot_date': item.snapshot_date,
-            'material_code': item.material_code,
-            'material_name': item.material_name,
-            'specification': item.specification,
-            'warehouse_code': item.warehouse_code,
-            'warehouse_name': item.warehouse_name,
-            'qc_status': item.qc_status,
-            'total_quantity': item.total_quantity,
-            'unit': item.unit,
-            'cart_count': item.cart_count,
-            'cart_details': item.cart_details,
-            'prev_quantity': prev_quantity,
-            'quantity_change': quantity_change,
-            'quantity_change_percent': quantity_change_percent,
-            'prev_cart_count': prev_cart_count,
-            'cart_count_change': cart_count_change,
+    # 건수와 스냅샷 생성 시간 (해당 날짜의 가장 최근 스냅샷)을 한 번에 조회
+    totals = queryset.aggregate(total=Count('id'), snapshot_created_at=Max('snapshot__created_at'))
+    rows, page_info = _daily_report_page(request, queryset.select_related('snapshot'))
+
+    results = [
+        {
+            'snapshot_date': row.snapshot_date,
+            'material_code': row.material_code,
+            'material_name': row.material_name,
+            'specification': row.specification,
+            'warehouse_code': row.warehouse_code,
+            'warehouse_name': row.warehouse_name,
+            'qc_status': row.qc_status,
+            'total_quantity': row.total_quantity,
+            'unit': row.unit,
+            'cart_count': row.cart_count,
+            'cart_details': row.snapshot.cart_details if row.snapshot else [],
+            'prev_quantity': row.base_quantity,
+            'quantity_change': row.quantity_change,
+            'quantity_change_percent': _daily_change_percent(row.base_quantity, row.total_quantity),
+            'prev_cart_count': row.base_cart_count,
+            'cart_count_change': row.cart_count_change,
         }
-        results.append(result_data)
+        for row in rows
+    ]
 
     # 시리얼라이징
     serializer = DailyReportSerializer(results, many=True)
 
-    # 스냅샷 생성 시간 조회 (해당 날짜의 가장 최근 스냅샷)
-    snapshot_created_at = None
-    if queryset.exists():
-        latest_snapshot = queryset.order_by('-created_at').first()
-        snapshot_created_at = latest_snapshot.created_at
-
-    return Response({
+    payload = {
         'results': serializer.data,
         'report_date': report_date,
         'prev_date': prev_date,
-        'total': len(results),
-        'snapshot_created_at': snapshot_created_at
-    })
+        'total': totals['total'],
+        'snapshot_created_at': totals['snapshot_created_at'],
+    }
+    if page_info:
+        payload.update(page_info, pages=(totals['total'] + page_info['size'] - 1) // page_info['size'])
+    return Response(payload)
 
 
 @api_view(['GET'])
@@ -895,10 +868,12 @@ def email_status(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def daily_report_compare(request):
-    """두 날짜의 일일 보고서 비교 API"""
+    """두 날짜의 일일 보고서 비교 API (materialised ``DailyInventoryDiff``)"""
     date1_str = request.GET.get('date1', '')
     date2_str = request.GET.get('date2', '')
     warehouse_code = request.GET.get('warehouse_code', '')
+    warehouse_name = request.GET.get('warehouse_name', '')
+    material_code = request.GET.get('material_code', '')
     
     if not date1_str or not date2_str:
         return Response(
@@ -915,98 +890,65 @@ def daily_report_compare(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # 두 날짜의 데이터 조회
-    queryset1 = DailyInventorySnapshot.objects.filter(snapshot_date=date1)
-    queryset2 = DailyInventorySnapshot.objects.filter(snapshot_date=date2)
-    
+    # date1 을 기준일로 한 date2 의 증감
+    queryset = daily_inventory_diff(date2, date1)
     if warehouse_code:
-        queryset1 = queryset1.filter(warehouse_code=warehouse_code)
-        queryset2 = queryset2.filter(warehouse_code=warehouse_code)
-    
-    # 데이터를 딕셔너리로 변환
-    data1 = {}
-    data2 = {}
-    
-    for item in queryset1:
-        key = (item.material_code, item.warehouse_code, item.qc_status)
-        data1[key] = item
-    
-    for item in queryset2:
-        key = (item.material_code, item.warehouse_code, item.qc_status)
-        data2[key] = item
-    
-    # 비교 결과 생성
-    all_keys = set(data1.keys()) | set(data2.keys())
+        queryset = queryset.filter(warehouse_code=warehouse_code)
+    if warehouse_name:
+        queryset = queryset.filter(warehouse_name=warehouse_name)
+    if material_code:
+        queryset = queryset.filter(material_code__icontains=material_code)
+
+    # 요약 통계
+    totals = queryset.aggregate(
+        total=Count('id'),
+        total_items_date1=Count('id', filter=~Q(presence=DailyInventoryDiff.PRESENCE_SNAPSHOT_ONLY)),
+        total_items_date2=Count('id', filter=~Q(presence=DailyInventoryDiff.PRESENCE_BASE_ONLY)),
+        total_quantity_date1=Sum('base_quantity'),
+        total_quantity_date2=Sum('total_quantity'),
+        total_carts_date1=Sum('base_cart_count'),
+        total_carts_date2=Sum('cart_count'),
+    )
+    total_items_date1 = totals['total_items_date1']
+    total_items_date2 = totals['total_items_date2']
+    total_quantity_date1 = float(totals['total_quantity_date1'] or 0)
+    total_quantity_date2 = float(totals['total_quantity_date2'] or 0)
+    total_carts_date1 = totals['total_carts_date1'] or 0
+    total_carts_date2 = totals['total_carts_date2'] or 0
+
+    rows, page_info = _daily_report_page(request, queryset.values(
+        'material_code', 'material_name', 'warehouse_code', 'warehouse_name', 'qc_status', 'presence',
+        'base_quantity', 'total_quantity', 'quantity_change', 'base_cart_count', 'cart_count', 'cart_count_change',
+    ))
     comparison_results = []
-    
-    for key in all_keys:
-        item1 = data1.get(key)
-        item2 = data2.get(key)
-        
-        if item1 and item2:
-            # 두 날짜 모두 데이터가 있는 경우
-            quantity_diff = float(item2.total_quantity) - float(item1.total_quantity)
-            cart_diff = item2.cart_count - item1.cart_count
-            
-            comparison_results.append({
-                'material_code': item1.material_code,
-                'material_name': item1.material_name,
-                'warehouse_code': item1.warehouse_code,
-                'warehouse_name': item1.warehouse_name,
-                'qc_status': item1.qc_status,
-                'date1_quantity': float(item1.total_quantity),
-                'date2_quantity': float(item2.total_quantity),
-                'quantity_diff': quantity_diff,
-                'quantity_change_percent': (quantity_diff / float(item1.total_quantity) * 100) if float(item1.total_quantity) > 0 else 0,
-                'date1_carts': item1.cart_count,
-                'date2_carts': item2.cart_count,
-                'cart_diff': cart_diff,
-                'status': 'both'  # 두 날짜 모두 데이터 있음
-            })
-        elif item1:
-            # date1에만 데이터가 있는 경우
-            comparison_results.append({
-                'material_code': item1.material_code,
-                'material_name': item1.material_name,
-                'warehouse_code': item1.warehouse_code,
-                'warehouse_name': item1.warehouse_name,
-                'qc_status': item1.qc_status,
-                'date1_quantity': float(item1.total_quantity),
-                'date2_quantity': 0,
-                'quantity_diff': -float(item1.total_quantity),
-                'quantity_change_percent': -100,
-                'date1_carts': item1.cart_count,
-                'date2_carts': 0,
-                'cart_diff': -item1.cart_count,
-                'status': 'date1_only'  # date1에만 데이터 있음
-            })
+    for row in rows:
+        date1_quantity = float(row['base_quantity'])
+        date2_quantity = float(row['total_quantity'])
+        quantity_diff = float(row['quantity_change'])
+        if row['presence'] == DailyInventoryDiff.PRESENCE_BOTH:
+            quantity_change_percent = quantity_diff / date1_quantity * 100 if date1_quantity > 0 else 0
+        elif row['presence'] == DailyInventoryDiff.PRESENCE_BASE_ONLY:
+            quantity_change_percent = -100
         else:
-            # date2에만 데이터가 있는 경우
-            comparison_results.append({
-                'material_code': item2.material_code,
-                'material_name': item2.material_name,
-                'warehouse_code': item2.warehouse_code,
-                'warehouse_name': item2.warehouse_name,
-                'qc_status': item2.qc_status,
-                'date1_quantity': 0,
-                'date2_quantity': float(item2.total_quantity),
-                'quantity_diff': float(item2.total_quantity),
-                'quantity_change_percent': float('inf') if float(item2.total_quantity) > 0 else 0,
-                'date1_carts': 0,
-                'date2_carts': item2.cart_count,
-                'cart_diff': item2.cart_count,
-                'status': 'date2_only'  # date2에만 데이터 있음
-            })
-    
-    # 요약 통계
-    total_items_date1 = len(data1)
-    total_items_date2 = len(data2)
-    total_quantity_date1 = sum(float(item.total_quantity) for item in data1.values())
-    total_quantity_date2 = sum(float(item.total_quantity) for item in data2.values())
-    total_carts_date1 = sum(item.cart_count for item in data1.values())
-    total_carts_date2 = sum(item.cart_count for item in data2.values())
+            # date2 에만 있는 품목: 증가율 무한대는 JSON 으로 표현할 수 없어 null
+            quantity_change_percent = None if date2_quantity > 0 else 0
+        comparison_results.append({
+            'material_code': row['material_code'],
+            'material_name': row['material_name'],
+            'warehouse_code': row['warehouse_code'],
+            'warehouse_name': row['warehouse_name'],
+            'qc_status': row['qc_status'],
+            'date1_quantity': date1_quantity,
+            'date2_quantity': date2_quantity,
+            'quantity_diff': quantity_diff,
+            'quantity_change_percent': quantity_change_percent,
+            'date1_carts': row['base_cart_count'],
+            'date2_carts': row['cart_count'],
+            'cart_diff': row['cart_count_change'],
+            'status': row['presence'],
+        })
     
-    return Response({
+    payload = {
         'date1': date1_str,
         'date2': date2_str,
         'comparison_results': comparison_results,
@@ -1028,13 +970,27 @@ def daily_report_compare(request):
                 'quantity_change_percent': (total_quantity_date2 - total_quantity_date1) / total_quantity_date1 * 100 if total_quantity_date1 > 0 else 0
             }
         },
-        'total': len(comparison_results)
-    }) 
+        'total': totals['total']
+    }
+    if page_info:
+        payload.update(page_info, pages=(totals['total'] + page_info['size'] - 1) // page_info['size'])
+    return Response(payload)
+
+
+class _Echo:
+    """csv.writer 가 만든 한 줄을 그대로 돌려주는 버퍼 (StreamingHttpResponse 용)"""
+
+    def write(self, value):
+        return value
+
+
+DAILY_REPORT_CSV_CHUNK_SIZE = 2000
+
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def daily_report_export_csv(request):
-    """일일 보고서 CSV 다운로드 API"""
+    """일일 보고서 CSV 다운로드 API (행 단위 스트리밍)"""
     date_str = request.GET.get('date', '')
     warehouse_code = request.GET.get('warehouse_code', '')
     material_code = request.GET.get('material_code', '')
@@ -1053,100 +1009,74 @@ def daily_report_export_csv(request):
         report_date = timezone.now().date()
     
     # 비교 날짜 처리
-    compare_data = None
+    compare_date_obj = None
     if compare_date:
         try:
             compare_date_obj = datetime.strptime(compare_date, '%Y-%m-%d').date()
-            compare_queryset = DailyInventorySnapshot.objects.filter(snapshot_date=compare_date_obj)
-            if warehouse_code:
-                compare_queryset = compare_queryset.filter(warehouse_code=warehouse_code)
-            if material_code:
-                compare_queryset = compare_queryset.filter(material_code__icontains=material_code)
-            
-            # 비교 데이터를 딕셔너리로 변환
-            compare_data = {}
-            for item in compare_queryset:
-                key = (item.material_code, item.warehouse_code, item.qc_status)
-                compare_data[key] = item
         except ValueError:
             return Response(
                 {'error': '잘못된 비교 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-    
-    # 메인 데이터 조회
-    queryset = DailyInventorySnapshot.objects.filter(snapshot_date=report_date)
-    if warehouse_code:
-        queryset = queryset.filter(warehouse_code=warehouse_code)
-    if material_code:
-        queryset = queryset.filter(material_code__icontains=material_code)
-    
-    # CSV 생성
-    response = HttpResponse(content_type='text/csv; charset=utf-8')
-    filename = f'daily_report_{report_date}'
-    if compare_date:
-        filename += f'_vs_{compare_date}'
-    filename += '.csv'
-    
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    # BOM 추가 (한글 깨짐 방지)
-    response.write('\ufeff')
-    
-    writer = csv.writer(response)
-    
+
     # 헤더 작성
     headers = [
         '날짜', '품목코드', '품목명', '규격', '창고코드', '창고명', 
         'QC상태', '총수량', '단위', '带车数'
     ]
-    
-    if compare_date:
+    base_fields = (
+        'material_code', 'material_name', 'specification', 'warehouse_code', 'warehouse_name',
+        'qc_status', 'total_quantity', 'unit', 'cart_count',
+    )
+
+    # 메인 데이터 조회 (비교 날짜가 있으면 미리 계산된 증감 사용)
+    if compare_date_obj:
         headers.extend([
             f'{compare_date}_수량', f'{compare_date}_带车数', 
             '수량변화', '수량변화율(%)', '带车数变化'
         ])
-    
-    writer.writerow(headers)
-    
-    # 데이터 작성
-    for item in queryset:
-        row = [
-            report_date,
-            item.material_code,
-            item.material_name,
-            item.specification,
-            item.warehouse_code,
-            item.warehouse_name,
-            item.qc_status,
-            float(item.total_quantity),
-            item.unit,
-            item.cart_count
-        ]
-        
-        if compare_date and compare_data:
-            key = (item.material_code, item.warehouse_code, item.qc_status)
-            compare_item = compare_data.get(key)
-            
-            if compare_item:
-                quantity_diff = float(item.total_quantity) - float(compare_item.total_quantity)
-                quantity_change_percent = (quantity_diff / float(compare_item.total_quantity) * 100) if float(compare_item.total_quantity) > 0 else 0
-                cart_diff = item.cart_count - compare_item.cart_count
-                
-                row.extend([
-                    float(compare_item.total_quantity),
-                    compare_item.cart_count,
-                    quantity_diff,
-                    round(quantity_change_percent, 2),
-                    cart_diff
-                ])
-            else:
-                row.extend([0, 0, float(item.total_quantity), 100, item.cart_count])
-        else:
-            row.extend([0, 0, 0, 0, 0])
-        
-        writer.writerow(row)
-    
+        queryset = daily_inventory_diff(report_date, compare_date_obj).exclude(
+            presence=DailyInventoryDiff.PRESENCE_BASE_ONLY
+        ).values(*base_fields, 'presence', 'base_quantity', 'base_cart_count', 'quantity_change', 'cart_count_change')
+    else:
+        queryset = DailyInventorySnapshot.objects.filter(snapshot_date=report_date).order_by(
+            'material_code', 'warehouse_code', 'qc_status'
+        ).values(*base_fields)
+    if warehouse_code:
+        queryset = queryset.filter(warehouse_code=warehouse_code)
+    if material_code:
+        queryset = queryset.filter(material_code__icontains=material_code)
+
+    def csv_rows():
+        writer = csv.writer(_Echo())
+        # BOM 추가 (한글 깨짐 방지)
+        yield '\ufeff'
+        yield writer.writerow(headers)
+        for item in queryset.iterator(chunk_size=DAILY_REPORT_CSV_CHUNK_SIZE):
+            row = [report_date, *(item[field] for field in base_fields)]
+            row[7] = float(item['total_quantity'])
+            if compare_date_obj:
+                if item['presence'] == DailyInventoryDiff.PRESENCE_BOTH:
+                    base_quantity = float(item['base_quantity'])
+                    quantity_diff = float(item['quantity_change'])
+                    quantity_change_percent = (quantity_diff / base_quantity * 100) if base_quantity > 0 else 0
+                    row.extend([
+                        base_quantity,
+                        item['base_cart_count'],
+                        quantity_diff,
+                        round(quantity_change_percent, 2),
+                        item['cart_count_change'],
+                    ])
+                else:
+                    row.extend([0, 0, float(item['total_quantity']), 100, item['cart_count']])
+            yield writer.writerow(row)
+
+    filename = f'daily_report_{report_date}'
+    if compare_date:
+        filename += f'_vs_{compare_date}'
+    filename += '.csv'
+    response = StreamingHttpResponse(csv_rows(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
     return response
 
 
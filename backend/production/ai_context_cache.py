@@ -0,0 +1,145 @@
+"""Versioned cache of the injection context pack used by production AI answers.
+
+``build_injection_plan_context`` only changes when a new monitoring snapshot
+lands or a plan/cavity write happens, so the pack is cached under
+``(business_date, latest snapshot timestamp, plan revision)``.  A new snapshot
+changes the key by itself; plan and cavity writers call
+``bump_plan_context_revision`` so every web worker sharing the Django cache
+stops reading the old pack.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .ai_gateway import build_injection_plan_context, get_business_range, latest_snapshot_time
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_CACHE_PREFIX = 'production-ai:injection-context'
+PLAN_REVISION_CACHE_KEY = f'{CONTEXT_CACHE_PREFIX}:plan-revision'
+STATS_CACHE_PREFIX = f'{CONTEXT_CACHE_PREFIX}:stats'
+STAT_NAMES = ('hits', 'misses', 'uncached', 'build_ms_total')
+
+
+def injection_context_cache_seconds() -> int:
+    return max(0, int(getattr(settings, 'PRODUCTION_AI_CONTEXT_CACHE_SECONDS', 600) or 0))
+
+
+def _new_revision() -> str:
+    return uuid.uuid4().hex
+
+
+def current_plan_context_revision() -> str:
+    try:
+        revision = cache.get(PLAN_REVISION_CACHE_KEY)
+        if revision is None:
+            cache.add(PLAN_REVISION_CACHE_KEY, _new_revision(), None)
+            revision = cache.get(PLAN_REVISION_CACHE_KEY)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        revision = None
+    return str(revision or '')
+
+
+def _set_new_revision() -> None:
+    try:
+        cache.set(PLAN_REVISION_CACHE_KEY, _new_revision(), None)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        logger.warning('Failed to bump the production AI plan context revision', exc_info=True)
+
+
+def bump_plan_context_revision() -> None:
+    """Invalidate every cached context pack after a plan or cavity write.
+
+    The bump waits for the surrounding transaction to commit; otherwise a
+    concurrent question could cache the old plan under the new revision.
+    """
+
+    transaction.on_commit(_set_new_revision)
+
+
+def _record_stat(name: str, amount: int = 1) -> None:
+    key = f'{STATS_CACHE_PREFIX}:{name}'
+    try:
+        if not cache.add(key, amount, None):
+            cache.incr(key, amount)
+    except ValueError:
+        # The counter expired or was evicted between ``add`` and ``incr``.
+        cache.add(key, amount, None)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+
+
+def injection_context_cache_stats() -> dict[str, Any]:
+    """Hit rate and average build latency since the counters were last reset."""
+
+    try:
+        values = cache.get_many([f'{STATS_CACHE_PREFIX}:{name}' for name in STAT_NAMES])
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        values = {}
+    stats = {name: int(values.get(f'{STATS_CACHE_PREFIX}:{name}') or 0) for name in STAT_NAMES}
+    lookups = stats['hits'] + stats['misses']
+    builds = stats['misses'] + stats['uncached']
+    return {
+        'hits': stats['hits'],
+        'misses': stats['misses'],
+        'uncached': stats['uncached'],
+        'hit_rate': round(stats['hits'] / lookups, 4) if lookups else None,
+        'avg_build_ms': round(stats['build_ms_total'] / builds, 1) if builds else None,
+    }
+
+
+def reset_injection_context_cache_stats() -> None:
+    cache.delete_many([f'{STATS_CACHE_PREFIX}:{name}' for name in STAT_NAMES])
+
+
+def _build_timed(business_date: str, latest_time) -> tuple[dict[str, Any], float]:
+    started = time.perf_counter()
+    context = build_injection_plan_context(business_date, latest_time=latest_time)
+    build_ms = (time.perf_counter() - started) * 1000
+    _record_stat('build_ms_total', int(round(build_ms)))
+    return context, build_ms
+
+
+def get_injection_plan_context(business_date: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(context, cache_info)`` for ``business_date``.
+
+    ``cache_info`` reports whether the pack came from the cache and, for a
+    rebuild, how long it took.  Days without any monitoring snapshot are not
+    cached because their range end follows the wall clock.
+    """
+
+    start, end = get_business_range(business_date)
+    snapshot_time = latest_snapshot_time(start, end)
+    timeout = injection_context_cache_seconds()
+    if snapshot_time is None or not timeout:
+        context, build_ms = _build_timed(business_date, None)
+        _record_stat('uncached')
+        return context, {'status': 'bypass', 'build_ms': round(build_ms, 1)}
+
+    cache_key = (
+        f'{CONTEXT_CACHE_PREFIX}:{business_date}:'
+        f'{snapshot_time.isoformat()}:{current_plan_context_revision()}'
+    )
+    try:
+        cached = cache.get(cache_key)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        cached = None
+    if isinstance(cached, dict):
+        _record_stat('hits')
+        return cached, {'status': 'hit', 'build_ms': None}
+
+    context, build_ms = _build_timed(business_date, snapshot_time)
+    _record_stat('misses')
+    try:
+        cache.set(cache_key, context, timeout=timeout)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+    return context, {'status': 'miss', 'build_ms': round(build_ms, 1)}
@@ -72,7 +72,7 @@ def get_business_range(business_date: Any) -> tuple[datetime, datetime]:
     return start, start + timedelta(days=1)
 
 
-def latest_record_time(start: datetime, end: datetime) -> datetime:
+def latest_snapshot_time(start: datetime, end: datetime) -> datetime | None:
     latest = (
         InjectionMonitoringRecord.objects
         .filter(timestamp__gte=start, timestamp__lt=end)
@@ -80,8 +80,13 @@ def latest_record_time(start: datetime, end: datetime) -> datetime:
         .values_list("timestamp", flat=True)
         .first()
     )
+    return latest.astimezone(pytz.timezone("Asia/Shanghai")) if latest else None
+
+
+def latest_record_time(start: datetime, end: datetime) -> datetime:
+    latest = latest_snapshot_time(start, end)
     if latest:
-        return latest.astimezone(pytz.timezone("Asia/Shanghai"))
+        return latest
     now = timezone.now().astimezone(pytz.timezone("Asia/Shanghai"))
     return min(max(now, start), end)
 
@@ -107,9 +112,10 @@ def capacity_delta(machine_name: str, start: datetime, end: datetime) -> int:
     return int(round(delta)) if delta > 0 else 0
 
 
-def build_injection_plan_context(business_date: str) -> dict[str, Any]:
+def build_injection_plan_context(business_date: str, latest_time: datetime | None = None) -> dict[str, Any]:
     start, end = get_business_range(business_date)
-    latest_time = latest_record_time(start, end)
+    if latest_time is None:
+        latest_time = latest_record_time(start, end)
     recent_start = max(start, latest_time - timedelta(minutes=60))
 
     plans = list(
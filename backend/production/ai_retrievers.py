@@ -298,7 +298,13 @@ def cavity_map_for_plans(plans: list[ProductionPlan]) -> dict[str, dict[str, Any
     return get_cavity_meta_map(ProductionPartCavity, part_nos)
 
 
-def get_injection_summary(target_date: Any) -> dict[str, Any]:
+def get_injection_summary(target_date: Any, machine_numbers: set[int] | None = None) -> dict[str, Any]:
+    """Summarize injection progress for a business day.
+
+    ``machine_numbers`` limits the per-machine rows (and their totals) to a
+    subset; day-level fields such as the reference time and row counts always
+    describe the whole business day.
+    """
     range_start, range_end = business_range(target_date)
     plan_queryset = (
         ProductionPlan.objects
@@ -323,6 +329,11 @@ def get_injection_summary(target_date: Any) -> dict[str, Any]:
         return (machine_number or 999, int(plan.sequence or 0), int(plan.id or 0))
 
     sorted_plans = sorted(plans, key=sort_key)
+    if machine_numbers is not None:
+        sorted_plans = [
+            plan for plan in sorted_plans
+            if parse_machine_number(plan.machine_name) in machine_numbers
+        ]
     machine_rows = []
     part_rows = []
 
@@ -455,9 +466,14 @@ def get_injection_summary(target_date: Any) -> dict[str, Any]:
     }
 
 
-def get_machining_summary(target_date: Any) -> dict[str, Any]:
+def get_machining_summary(target_date: Any, include_rows: bool = True) -> dict[str, Any]:
+    """Summarize machining progress for a business day.
+
+    With ``include_rows=False`` the reconciliation payload is skipped and only
+    the day-level counts and timestamps are filled in.
+    """
     range_start, range_end = business_range(target_date)
-    provision = build_machining_provision_payload(target_date, days=1)
+    provision = build_machining_provision_payload(target_date, days=1) if include_rows else {}
     plan_queryset = ProductionPlan.objects.filter(plan_date=target_date, plan_type="machining", planned_quantity__gt=0)
     mes_queryset = ProductionMesReportRecord.objects.filter(
         business_date=target_date,
@@ -511,16 +527,20 @@ def get_machining_summary(target_date: Any) -> dict[str, Any]:
     }
 
 
-def get_daily_production_context(target_date: Any) -> dict[str, Any]:
-    injection = get_injection_summary(target_date)
-    machining = get_machining_summary(target_date)
-    time_progress_rate = float(injection.get("time_progress_rate") or 0)
+def apply_machining_time_progress(machining: dict[str, Any], time_progress_rate: float) -> dict[str, Any]:
     machining["time_progress_rate"] = time_progress_rate
     for row in machining.get("rows", []):
         expected_qty_by_time = safe_int(row.get("planned_qty", 0) * time_progress_rate / 100)
         row["expected_qty_by_time"] = expected_qty_by_time
         row["gap_to_time_qty"] = safe_int(row.get("actual_qty")) - expected_qty_by_time
         row["gap_to_time_rate_pp"] = round(float(row.get("progress_rate") or 0) - time_progress_rate, 1)
+    return machining
+
+
+def get_daily_production_context(target_date: Any) -> dict[str, Any]:
+    injection = get_injection_summary(target_date)
+    machining = get_machining_summary(target_date)
+    apply_machining_time_progress(machining, float(injection.get("time_progress_rate") or 0))
     return {
         "business_date": target_date,
         "range_start": injection["range_start"],
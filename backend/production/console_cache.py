@@ -0,0 +1,94 @@
+"""Memoised production console payloads.
+
+The console polls ``/api/production/console/`` for a ``(date, plan_type)``
+and the answer only changes when a plan, execution, cavity, part spec or
+cycle-time setup changes.  The payload is cached under
+
+    (date, plan_type, plan/execution revision, plan context revision,
+     PartSpec version, CycleTimeSetup version)
+
+The plan/execution revision is a single indexed aggregate per table (row count
+and latest ``updated_at``) so console edits invalidate the entry without any
+writer having to remember a bump.  The remaining revisions are read from the
+Django cache in one ``get_many``: cavity and plan upload writers already call
+``bump_plan_context_revision`` and the PartSpec/CycleTimeSetup versions come
+from ``injection.latest_effective``.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from injection.latest_effective import CYCLE_TIME_SETUP_VERSION_KEY, PART_SPEC_VERSION_KEY, table_versions
+
+from .ai_context_cache import PLAN_REVISION_CACHE_KEY
+from .models import ProductionExecution, ProductionPlan
+
+CONSOLE_CACHE_PREFIX = 'production:console'
+
+
+def console_cache_seconds() -> int:
+    return max(0, int(getattr(settings, 'PRODUCTION_CONSOLE_CACHE_SECONDS', 300) or 0))
+
+
+def _table_revision(queryset) -> str:
+    totals = queryset.order_by().aggregate(rows=Count('id'), updated=Max('updated_at'))
+    updated = totals['updated'].isoformat() if totals['updated'] else ''
+    return f"{totals['rows']}@{updated}"
+
+
+def console_data_revision(target_date: date, plan_type: str) -> str:
+    return '|'.join((
+        _table_revision(ProductionPlan.objects.filter(plan_date=target_date, plan_type=plan_type)),
+        _table_revision(ProductionExecution.objects.filter(plan_date=target_date, plan_type=plan_type)),
+    ))
+
+
+def get_console_payload(
+    target_date: date,
+    plan_type: str,
+    build: Callable[[dict[str, str]], dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(payload, cache_info)``; ``build(versions)`` runs on a miss.
+
+    ``versions`` is handed to the builder so its latest-effective lookups do
+    not read the table versions a second time.
+    """
+
+    versions = table_versions(extra_keys=(PLAN_REVISION_CACHE_KEY,))
+    timeout = console_cache_seconds()
+    if not timeout:
+        started = time.perf_counter()
+        payload = build(versions)
+        return payload, {'status': 'bypass', 'build_ms': round((time.perf_counter() - started) * 1000, 1)}
+
+    cache_key = ':'.join((
+        CONSOLE_CACHE_PREFIX,
+        target_date.isoformat(),
+        plan_type,
+        console_data_revision(target_date, plan_type),
+        versions[PLAN_REVISION_CACHE_KEY],
+        versions[PART_SPEC_VERSION_KEY],
+        versions[CYCLE_TIME_SETUP_VERSION_KEY],
+    ))
+    try:
+        cached = cache.get(cache_key)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        cached = None
+    if isinstance(cached, dict):
+        return cached, {'status': 'hit', 'build_ms': None}
+
+    started = time.perf_counter()
+    payload = build(versions)
+    build_ms = round((time.perf_counter() - started) * 1000, 1)
+    try:
+        cache.set(cache_key, payload, timeout=timeout)
+    except Exception:  # pragma: no cover - cache backend failure is deployment-specific
+        pass
+    return payload, {'status': 'miss', 'build_ms': build_ms}
@@ -5,10 +5,13 @@ from datetime import date, timedelta
 from typing import Any
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import Case, F, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.dateparse import parse_date
 
+from analytics.partitions import mark_machining_dirty
+
 from .ai_metrics import business_range, safe_int, safe_rate
 from .mes_progress import equipment_sort_order, format_equipment_label, normalize_equipment_key, normalize_part_no
 from .models import (
@@ -52,41 +55,101 @@ def plan_identity_for_plan(plan: ProductionPlan) -> str:
     )
 
 
-def get_match_totals() -> tuple[dict[int, int], dict[int, int]]:
-    matched_by_manual: dict[int, int] = defaultdict(int)
-    matched_by_mes: dict[int, int] = defaultdict(int)
-    for row in MachiningManualReportMatch.objects.values("manual_report_id", "mes_report_record_id").annotate(total=Sum("matched_qty")):
-        qty = safe_int(row.get("total"))
-        matched_by_manual[safe_int(row.get("manual_report_id"))] += qty
-        matched_by_mes[safe_int(row.get("mes_report_record_id"))] += qty
-    return matched_by_manual, matched_by_mes
+LEDGER_MODELS = (
+    (MachiningManualReport, "manual_report"),
+    (ProductionMesReportRecord, "mes_report_record"),
+)
+
+
+def apply_match_ledger_deltas(report_deltas: dict[int, int], record_deltas: dict[int, int]) -> None:
+    """Add matched-qty deltas to the ``matched_qty`` ledger columns.
+
+    Call inside the transaction that wrote the matches.  ``F()`` increments
+    lock each row and build on its latest committed value, so concurrent
+    writers never overwrite each other's totals.
+    """
+
+    for (model, _), deltas in zip(LEDGER_MODELS, (report_deltas, record_deltas)):
+        items = [(pk, delta) for pk, delta in deltas.items() if delta]
+        for offset in range(0, len(items), 500):
+            chunk = items[offset:offset + 500]
+            model.objects.filter(pk__in=[pk for pk, _ in chunk]).update(
+                matched_qty=F("matched_qty") + Case(
+                    *[When(pk=pk, then=Value(delta)) for pk, delta in chunk],
+                    default=Value(0),
+                    output_field=IntegerField(),
+                ),
+            )
+
+
+def _actual_matched_qty(match_field: str) -> Coalesce:
+    totals = (
+        MachiningManualReportMatch.objects
+        .filter(**{match_field: OuterRef("pk")})
+        .values(match_field)
+        .annotate(total=Sum("matched_qty"))
+        .values("total")
+    )
+    return Coalesce(Subquery(totals), Value(0))
+
+
+def find_match_ledger_drift() -> dict[str, list[tuple[int, int, int]]]:
+    """Return ``(id, ledger_qty, actual_qty)`` rows whose ledger disagrees with the matches."""
+
+    drift = {}
+    for (model, match_field), key in zip(LEDGER_MODELS, ("manual_reports", "mes_records")):
+        drift[key] = list(
+            model.objects
+            .annotate(actual_matched_qty=_actual_matched_qty(match_field))
+            .exclude(matched_qty=F("actual_matched_qty"))
+            .order_by("pk")
+            .values_list("pk", "matched_qty", "actual_matched_qty")
+        )
+    return drift
+
+
+def repair_match_ledger() -> dict[str, int]:
+    """Reset drifted ledger rows to the aggregate of their matches."""
+
+    repaired = {}
+    with transaction.atomic():
+        drift = find_match_ledger_drift()
+        for (model, match_field), key in zip(LEDGER_MODELS, ("manual_reports", "mes_records")):
+            ids = [pk for pk, _, _ in drift[key]]
+            for offset in range(0, len(ids), 500):
+                model.objects.filter(pk__in=ids[offset:offset + 500]).update(
+                    matched_qty=_actual_matched_qty(match_field),
+                )
+            repaired[key] = len(ids)
+    return repaired
+
+
+def manual_report_status_for(total_reported_qty: int, matched_qty: int) -> str:
+    matched_qty = safe_int(matched_qty)
+    total_qty = safe_int(total_reported_qty)
+    if matched_qty <= 0:
+        return "open"
+    if matched_qty < total_qty:
+        return "partial"
+    if matched_qty == total_qty:
+        return "matched"
+    return "mismatch"
 
 
 def refresh_manual_report_status(report: MachiningManualReport) -> MachiningManualReport:
     if report.status == "cancelled":
         return report
 
-    matched_qty = safe_int(report.matches.aggregate(total=Sum("matched_qty")).get("total"))
-    total_qty = safe_int(report.total_reported_qty)
-    if matched_qty <= 0:
-        next_status = "open"
-    elif matched_qty < total_qty:
-        next_status = "partial"
-    elif matched_qty == total_qty:
-        next_status = "matched"
-    else:
-        next_status = "mismatch"
-
+    report.refresh_from_db(fields=["matched_qty"])
+    next_status = manual_report_status_for(report.total_reported_qty, report.matched_qty)
     if report.status != next_status:
         report.status = next_status
         report.save(update_fields=["status", "updated_at"])
     return report
 
 
-def build_manual_report_payload(report: MachiningManualReport, matched_by_manual: dict[int, int] | None = None) -> dict[str, Any]:
-    matched_qty = safe_int((matched_by_manual or {}).get(report.id))
-    if matched_by_manual is None:
-        matched_qty = safe_int(report.matches.aggregate(total=Sum("matched_qty")).get("total"))
+def build_manual_report_payload(report: MachiningManualReport) -> dict[str, Any]:
+    matched_qty = safe_int(report.matched_qty)
     total_qty = safe_int(report.total_reported_qty)
     return {
         "id": report.id,
@@ -185,30 +248,51 @@ def create_manual_report(*, user, payload: dict[str, Any]) -> MachiningManualRep
                 quantity=quantity,
                 note=(item.get("note") or "").strip(),
             )
+        mark_machining_dirty(
+            {(report.business_date, equipment_key), (report.credit_business_date, equipment_key)},
+            reason="manual_report",
+        )
     return report
 
 
-def confirm_manual_report_match(*, manual_report_id: int, mes_report_record_ids: list[int], matched_qty: int, user, note: str = "") -> MachiningManualReport:
-    report = MachiningManualReport.objects.get(id=manual_report_id, plan_type="machining")
-    if report.status == "cancelled":
-        raise ValueError("Cancelled manual report cannot be matched.")
+def _mark_match_partitions_dirty(report: MachiningManualReport, records: list[ProductionMesReportRecord]) -> None:
+    partitions = {
+        (report.business_date, report.equipment_key),
+        (report.credit_business_date, report.equipment_key),
+    }
+    partitions.update((record.business_date, record.equipment_key) for record in records)
+    mark_machining_dirty(partitions, reason="manual_report_match")
 
-    remaining_qty = max(0, safe_int(matched_qty))
-    records = list(
-        ProductionMesReportRecord.objects
-        .filter(id__in=mes_report_record_ids, plan_type="machining")
-        .order_by("business_date", "report_time", "id")
-    )
-    if not records:
-        raise ValueError("Matching MES report record not found.")
 
+def confirm_manual_report_match(*, manual_report_id: int, mes_report_record_ids: list[int], matched_qty: int, user, note: str = "") -> MachiningManualReport:
+    remaining_qty = max(0, safe_int(matched_qty))
     with transaction.atomic():
+        # Same lock order as reconcile_manual_reports: manual report, then MES records.
+        report = MachiningManualReport.objects.select_for_update().get(id=manual_report_id, plan_type="machining")
+        if report.status == "cancelled":
+            raise ValueError("Cancelled manual report cannot be matched.")
+        records = list(
+            ProductionMesReportRecord.objects
+            .select_for_update()
+            .filter(id__in=mes_report_record_ids, plan_type="machining")
+            .order_by("business_date", "report_time", "id")
+        )
+        if not records:
+            raise ValueError("Matching MES report record not found.")
+
+        previous_qty = dict(
+            report.matches
+            .filter(mes_report_record__in=records)
+            .values_list("mes_report_record_id", "matched_qty")
+        )
+        record_deltas: dict[int, int] = {}
         for record in records:
             if remaining_qty <= 0:
                 break
             qty = remaining_qty if len(records) == 1 else min(remaining_qty, max(0, safe_int(record.report_qty)))
             if qty <= 0:
                 continue
+            record_deltas[record.id] = qty - safe_int(previous_qty.get(record.id))
             MachiningManualReportMatch.objects.update_or_create(
                 manual_report=report,
                 mes_report_record=record,
@@ -220,64 +304,138 @@ def confirm_manual_report_match(*, manual_report_id: int, mes_report_record_ids:
                 },
             )
             remaining_qty -= qty
+        apply_match_ledger_deltas({report.id: sum(record_deltas.values())}, record_deltas)
         refresh_manual_report_status(report)
+        _mark_match_partitions_dirty(report, records)
     report.refresh_from_db()
     return report
 
 
 def reconcile_manual_reports(from_date: date, to_date: date) -> dict[str, int]:
-    reports = (
-        MachiningManualReport.objects
-        .filter(credit_business_date__gte=from_date, credit_business_date__lte=to_date)
-        .exclude(status__in=["matched", "cancelled"])
-        .order_by("credit_business_date", "id")
-    )
-    matched_count = 0
-    partial_count = 0
-    for report in reports:
-        matched_total = safe_int(report.matches.aggregate(total=Sum("matched_qty")).get("total"))
-        if matched_total >= safe_int(report.total_reported_qty):
-            refresh_manual_report_status(report)
-            continue
+    """Greedily match open manual reports to later MES records of the same part.
+
+    Reports are served in (credit_business_date, id) order and consume MES
+    records in (business_date, report_time, id) order, exactly as the former
+    per-report loop did.  The window is loaded with a fixed number of queries,
+    the allocation runs in memory, and matches and status changes are written
+    in bulk.
+
+    The pass runs in one transaction.  The window's open manual reports and
+    candidate MES records are locked before their ledgers and existing pair
+    quantities are read, so an overlapping run or a manual confirmation waits
+    instead of allocating the same MES quantity twice.
+    """
+    with transaction.atomic():
+        report_queryset = (
+            MachiningManualReport.objects
+            .filter(credit_business_date__gte=from_date, credit_business_date__lte=to_date)
+            .exclude(status__in=["matched", "cancelled"])
+        )
+        reports = list(
+            report_queryset
+            .select_for_update()
+            .order_by("credit_business_date", "id")
+            .only(
+                "id", "business_date", "credit_business_date", "equipment_key", "part_no",
+                "total_reported_qty", "matched_qty", "status",
+            )
+        )
+        if not reports:
+            return {"matched": 0, "partial": 0}
+
+        matched_by_manual = {report.id: safe_int(report.matched_qty) for report in reports}
+        pair_qty: dict[tuple[int, int], int] = {
+            (manual_report_id, mes_report_record_id): safe_int(qty)
+            for manual_report_id, mes_report_record_id, qty in (
+                MachiningManualReportMatch.objects
+                .filter(manual_report__in=report_queryset.values("id"))
+                .values_list("manual_report_id", "mes_report_record_id", "matched_qty")
+            )
+        }
 
-        candidates = (
+        candidates_by_part: dict[str, list[ProductionMesReportRecord]] = defaultdict(list)
+        matched_by_mes: dict[int, int] = {}
+        for record in (
             ProductionMesReportRecord.objects
+            .select_for_update()
             .filter(
                 plan_type="machining",
-                part_no=report.part_no,
-                business_date__gte=report.business_date,
+                part_no__in={report.part_no for report in reports},
+                business_date__gte=min(report.business_date for report in reports),
                 business_date__lte=to_date,
             )
             .order_by("business_date", "report_time", "id")
-        )
-        _, matched_by_mes = get_match_totals()
-        for record in candidates:
-            available_qty = max(0, safe_int(record.report_qty) - safe_int(matched_by_mes.get(record.id)))
-            if available_qty <= 0:
+            .only("id", "business_date", "equipment_key", "part_no", "report_qty", "matched_qty")
+        ):
+            candidates_by_part[record.part_no].append(record)
+            matched_by_mes[record.id] = safe_int(record.matched_qty)
+
+        match_rows: dict[tuple[int, int], MachiningManualReportMatch] = {}
+        report_deltas: dict[int, int] = defaultdict(int)
+        record_deltas: dict[int, int] = defaultdict(int)
+        attempted_ids: set[int] = set()
+        dirty_partitions: set[tuple[date, str]] = set()
+        for report in reports:
+            total_qty = safe_int(report.total_reported_qty)
+            matched_total = matched_by_manual[report.id]
+            if matched_total >= total_qty:
                 continue
-            remaining_qty = max(0, safe_int(report.total_reported_qty) - matched_total)
-            if remaining_qty <= 0:
-                break
-            qty = min(available_qty, remaining_qty)
-            MachiningManualReportMatch.objects.update_or_create(
-                manual_report=report,
-                mes_report_record=record,
-                defaults={
-                    "matched_qty": qty,
-                    "match_confidence": "probable" if qty < safe_int(report.total_reported_qty) else "exact",
-                    "match_reason": "Auto matched by part number and business date window",
-                    "matched_by": None,
-                },
+            attempted_ids.add(report.id)
+            for record in candidates_by_part.get(report.part_no, []):
+                if record.business_date < report.business_date:
+                    continue
+                available_qty = max(0, safe_int(record.report_qty) - matched_by_mes[record.id])
+                if available_qty <= 0:
+                    continue
+                remaining_qty = max(0, total_qty - matched_total)
+                if remaining_qty <= 0:
+                    break
+                qty = min(available_qty, remaining_qty)
+                key = (report.id, record.id)
+                pair_qty[key] = pair_qty.get(key, 0) + qty
+                match_rows[key] = MachiningManualReportMatch(
+                    manual_report_id=report.id,
+                    mes_report_record_id=record.id,
+                    matched_qty=pair_qty[key],
+                    match_confidence="probable" if qty < total_qty else "exact",
+                    match_reason="Auto matched by part number and business date window",
+                    matched_by=None,
+                )
+                matched_total += qty
+                matched_by_mes[record.id] += qty
+                report_deltas[report.id] += qty
+                record_deltas[record.id] += qty
+                dirty_partitions.update({
+                    (report.business_date, report.equipment_key),
+                    (report.credit_business_date, report.equipment_key),
+                    (record.business_date, record.equipment_key),
+                })
+            matched_by_manual[report.id] = matched_total
+
+        ids_by_status: dict[str, list[int]] = defaultdict(list)
+        counts = {"matched": 0, "partial": 0}
+        for report in reports:
+            next_status = manual_report_status_for(report.total_reported_qty, matched_by_manual[report.id])
+            if next_status != report.status:
+                ids_by_status[next_status].append(report.id)
+            if report.id in attempted_ids and next_status in counts:
+                counts[next_status] += 1
+
+        if match_rows:
+            MachiningManualReportMatch.objects.bulk_create(
+                list(match_rows.values()),
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["manual_report", "mes_report_record"],
+                update_fields=["matched_qty", "match_confidence", "match_reason", "matched_by"],
             )
-            matched_total += qty
-            matched_by_mes[record.id] += qty
-        refresh_manual_report_status(report)
-        report.refresh_from_db()
-        if report.status == "matched":
-            matched_count += 1
-        elif report.status == "partial":
-            partial_count += 1
-    return {"matched": matched_count, "partial": partial_count}
+            apply_match_ledger_deltas(report_deltas, record_deltas)
+        now = timezone.now()
+        for next_status, ids in ids_by_status.items():
+            MachiningManualReport.objects.filter(id__in=ids).update(status=next_status, updated_at=now)
+        if dirty_partitions:
+            mark_machining_dirty(dirty_partitions, reason="manual_report_match")
+        return counts
 
 
 def build_machining_provision_payload(business_date: Any, days: int = 3) -> dict[str, Any]:
@@ -302,7 +460,6 @@ def build_machining_provision_payload(business_date: Any, days: int = 3) -> dict
         if plan.part_no:
             last_plan_hash_by_part[normalize_part_no(plan.part_no)] = plan_identity_for_plan(plan)
 
-    matched_by_manual, matched_by_mes = get_match_totals()
     manual_reports = list(
         MachiningManualReport.objects
         .select_related("plan", "reported_by")
@@ -328,7 +485,7 @@ def build_machining_provision_payload(business_date: Any, days: int = 3) -> dict
     mes_qty_by_part: dict[str, int] = defaultdict(int)
     mes_meta_by_part: dict[str, dict[str, Any]] = {}
     for record in mes_records:
-        unmatched_qty = max(0, safe_int(record.report_qty) - safe_int(matched_by_mes.get(record.id)))
+        unmatched_qty = max(0, safe_int(record.report_qty) - safe_int(record.matched_qty))
         if unmatched_qty <= 0:
             continue
         part_no = normalize_part_no(record.part_no)
@@ -349,9 +506,9 @@ def build_machining_provision_payload(business_date: Any, days: int = 3) -> dict
         equipment_key = normalize_equipment_key("machining", plan.machine_name)
         plan_hash = plan_identity_for_plan(plan)
         plan_manual_reports = manual_by_hash.get(plan_hash, [])
-        matched_manual_qty = sum(safe_int(matched_by_manual.get(report.id)) for report in plan_manual_reports)
+        matched_manual_qty = sum(safe_int(report.matched_qty) for report in plan_manual_reports)
         manual_total_qty = sum(safe_int(report.total_reported_qty) for report in plan_manual_reports)
-        manual_open_qty = sum(max(0, safe_int(report.total_reported_qty) - safe_int(matched_by_manual.get(report.id))) for report in plan_manual_reports)
+        manual_open_qty = sum(max(0, safe_int(report.total_reported_qty) - safe_int(report.matched_qty)) for report in plan_manual_reports)
         manual_defect_qty = sum(safe_int(report.defect_qty) for report in plan_manual_reports)
 
         planned_qty = safe_int(plan.planned_quantity)
@@ -401,7 +558,7 @@ def build_machining_provision_payload(business_date: Any, days: int = 3) -> dict
             "status": row_status,
             "defect_qty": manual_defect_qty,
             "manual_reports": [
-                build_manual_report_payload(report, matched_by_manual)
+                build_manual_report_payload(report)
                 for report in plan_manual_reports
             ],
         })
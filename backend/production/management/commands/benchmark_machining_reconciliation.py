@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import time
+from datetime import date, datetime, timedelta
+
+import pytz
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.dateparse import parse_date
+
+from production.machining_reconciliation import reconcile_manual_reports
+from production.models import MachiningManualReport, ProductionMesReportRecord
+
+SHANGHAI_TZ = pytz.timezone("Asia/Shanghai")
+
+
+def seed_reconciliation_month(
+    start_date: date,
+    *,
+    days: int = 30,
+    parts: int = 40,
+    reports_per_day: int = 2,
+    records_per_day: int = 3,
+) -> tuple[int, int]:
+    """Create a month of open manual reports and later MES records.
+
+    Every part gets ``reports_per_day`` manual reports per day and
+    ``records_per_day`` MES records from the next day on, with quantities
+    chosen so reports end up matched, partial, or spread across records.
+    """
+
+    reports = []
+    records = []
+    detail_id = 9_000_000
+    for day_offset in range(days):
+        business_date = start_date + timedelta(days=day_offset)
+        for part_index in range(parts):
+            part_no = f"BENCH-PART-{part_index:03d}"
+            equipment_key = chr(ord("A") + part_index % 8)
+            for report_index in range(reports_per_day):
+                total_qty = 40 + 10 * ((part_index + report_index + day_offset) % 5)
+                reports.append(MachiningManualReport(
+                    business_date=business_date,
+                    plan_date=business_date,
+                    plan_identity_hash="",
+                    machine_name=f"{equipment_key} LINE",
+                    equipment_key=equipment_key,
+                    part_no=part_no,
+                    sequence=report_index + 1,
+                    good_qty=total_qty,
+                    total_reported_qty=total_qty,
+                    reason_code="mes_work_order_missing",
+                    credit_business_date=business_date,
+                ))
+            mes_date = business_date + timedelta(days=1)
+            for record_index in range(records_per_day):
+                detail_id += 1
+                records.append(ProductionMesReportRecord(
+                    report_record_detail_id=detail_id,
+                    report_record_id=detail_id,
+                    report_record_code=f"BENCH-{detail_id}",
+                    business_date=mes_date,
+                    plan_type="machining",
+                    process_code="JG",
+                    report_time=SHANGHAI_TZ.localize(datetime.combine(mes_date, datetime.min.time()) + timedelta(hours=9 + record_index)),
+                    equipment_name=f"{equipment_key} LINE",
+                    equipment_key=equipment_key,
+                    part_no=part_no,
+                    report_qty=25 + 5 * ((part_index + record_index) % 4),
+                    raw_payload={},
+                ))
+    MachiningManualReport.objects.bulk_create(reports, batch_size=500)
+    ProductionMesReportRecord.objects.bulk_create(records, batch_size=500)
+    return len(reports), len(records)
+
+
+class Command(BaseCommand):
+    help = "Seed a month of machining data in a rolled-back transaction and time reconcile_manual_reports."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start-date", dest="start_date", default="2026-05-01", help="First seeded business date, YYYY-MM-DD.")
+        parser.add_argument("--days", type=int, default=30)
+        parser.add_argument("--parts", type=int, default=40)
+        parser.add_argument("--reports-per-day", type=int, default=2)
+        parser.add_argument("--records-per-day", type=int, default=3)
+
+    def handle(self, *args, **options):
+        start_date = parse_date(options["start_date"] or "")
+        if not start_date:
+            raise CommandError("--start-date must be YYYY-MM-DD.")
+        days = max(1, options["days"])
+        to_date = start_date + timedelta(days=days)
+
+        with transaction.atomic():
+            report_count, record_count = seed_reconciliation_month(
+                start_date,
+                days=days,
+                parts=max(1, options["parts"]),
+                reports_per_day=max(1, options["reports_per_day"]),
+                records_per_day=max(1, options["records_per_day"]),
+            )
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                result = reconcile_manual_reports(start_date, to_date)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            # Nothing seeded here may outlive the benchmark.
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"reports={report_count} mes_records={record_count} "
+            f"matched={result['matched']} partial={result['partial']} "
+            f"queries={len(queries.captured_queries)} elapsed_ms={elapsed_ms:.1f}"
+        ))
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+from rest_framework.test import APIClient
+
+from injection.models import CycleTimeSetup, PartSpec
+from production.models import ProductionPlan
+
+CONSOLE_URL = "/api/production/console/"
+# A warm request normally takes a few ms; this leaves room for a loaded host.
+WARM_P95_BUDGET_MS = 250
+
+
+def seed_console_day(target_date: date, user, *, machines: int = 40) -> int:
+    """One injection plan per machine, each with two PartSpecs and two setups."""
+
+    plans, specs, setups = [], [], []
+    for machine in range(1, machines + 1):
+        part_no = f"BENCH-CONSOLE-{machine:03d}"
+        plans.append(ProductionPlan(
+            plan_date=target_date, plan_type="injection", machine_name=f"850T-{machine}",
+            part_no=part_no, lot_no="", model_name="Bench", planned_quantity=100, sequence=1,
+        ))
+        for valid_from, cycle_time in ((target_date - timedelta(days=120), 40), (target_date - timedelta(days=30), 36)):
+            specs.append(PartSpec(part_no=part_no, model_code="BENCH", valid_from=valid_from, cycle_time_sec=cycle_time))
+        for target in (50, 45):
+            setups.append(CycleTimeSetup(machine_no=machine, part_no=part_no, target_cycle_time=target, setup_by=user))
+    ProductionPlan.objects.bulk_create(plans)
+    PartSpec.objects.bulk_create(specs)
+    CycleTimeSetup.objects.bulk_create(setups)
+    return len(plans)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed one console day in a rolled-back transaction and time cold and warm "
+        "/api/production/console/ requests against a warm-p95 budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", default="2026-05-18", help="Seeded plan date, YYYY-MM-DD.")
+        parser.add_argument("--machines", type=int, default=40)
+        parser.add_argument("--requests", type=int, default=40, help="Warm requests to time.")
+        parser.add_argument("--budget-ms", type=float, default=WARM_P95_BUDGET_MS, help="Warm p95 budget.")
+
+    def handle(self, *args, **options):
+        target_date = parse_date(options["date"] or "")
+        if not target_date:
+            raise CommandError("--date must be YYYY-MM-DD.")
+        if options["machines"] < 1 or options["requests"] < 2:
+            raise CommandError("--machines must be positive and --requests at least 2.")
+
+        with transaction.atomic():
+            user = get_user_model().objects.create_user(username="bench-console", password=None, is_staff=True)
+            plan_count = seed_console_day(target_date, user, machines=options["machines"])
+            client = APIClient(HTTP_HOST="localhost")
+            client.force_authenticate(user)
+            params = {"date": target_date.isoformat(), "plan_type": "injection"}
+
+            started = time.perf_counter()
+            response = client.get(CONSOLE_URL, params)
+            cold_ms = (time.perf_counter() - started) * 1000
+            if response.status_code != 200:
+                raise CommandError(f"console answered {response.status_code}; is the database migrated?")
+            warm = []
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                client.get(CONSOLE_URL, params)
+                warm.append((time.perf_counter() - started) * 1000)
+            # Nothing seeded here may outlive the benchmark.
+            transaction.set_rollback(True)
+
+        p95 = statistics.quantiles(warm, n=20)[-1]
+        line = (
+            f"plans={plan_count} cold_ms={cold_ms:.1f} warm_p50_ms={statistics.median(warm):.1f} "
+            f"warm_p95_ms={p95:.1f} budget_ms={options['budget_ms']:.0f}"
+        )
+        if p95 > options["budget_ms"]:
+            raise CommandError(f"warm p95 over budget: {line}")
+        self.stdout.write(self.style.SUCCESS(line))
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from production.ai_context_cache import injection_context_cache_stats, reset_injection_context_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show the production AI context-pack cache hit rate and build latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Clear the counters after printing them.")
+
+    def handle(self, *args, **options):
+        stats = injection_context_cache_stats()
+        hit_rate = "-" if stats["hit_rate"] is None else f"{stats['hit_rate'] * 100:.1f}%"
+        avg_build_ms = "-" if stats["avg_build_ms"] is None else f"{stats['avg_build_ms']}ms"
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} uncached={stats['uncached']} "
+            f"hit_rate={hit_rate} avg_build={avg_build_ms}"
+        )
+        if options["reset"]:
+            reset_injection_context_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
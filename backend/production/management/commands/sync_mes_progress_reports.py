@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import time
 from datetime import timedelta
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from analytics.partitions import mark_machining_dirty
 from production.mes_progress import (
     extract_equipment_name,
     extract_mes_material_name,
@@ -17,31 +19,158 @@ from production.mes_progress import (
     normalize_mes_part_no,
     normalize_plan_type,
     parse_report_time,
+    progress_report_content_hash,
 )
-from production.models import ProductionMesReportRecord
+from production.models import ProductionMesReportRecord, ProductionMesSyncWatermark
+
+
+WRITE_BATCH_SIZE = 500
+HASH_LOOKUP_CHUNK = 900
+UPSERT_FIELDS = [
+    'report_record_id',
+    'report_record_code',
+    'business_date',
+    'plan_type',
+    'process_code',
+    'report_time',
+    'equipment_name',
+    'equipment_key',
+    'part_no',
+    'material_name',
+    'report_qty',
+    'raw_payload',
+    'content_hash',
+    'updated_at',
+]
+
+
+def _prepare_rows(rows):
+    prepared: dict[int, dict] = {}
+    skipped = 0
+    for row in rows:
+        report_time = parse_report_time(row.get('reportTime'))
+        plan_type = normalize_plan_type(row.get('processCode'))
+        equipment_name = extract_equipment_name(row)
+        equipment_key = normalize_equipment_key(plan_type or '', equipment_name) if plan_type else ''
+        part_no = normalize_mes_part_no(row)
+        report_qty = extract_qty(row)
+        detail_id = row.get('reportRecordDetailId') or row.get('id')
+
+        if not detail_id or not report_time or not plan_type or not equipment_key or not part_no:
+            skipped += 1
+            continue
+        if plan_type == 'machining' and not is_machining_progress_report(row):
+            skipped += 1
+            continue
+
+        # Overlapping pages can repeat a detail row; the last copy wins.
+        prepared[int(detail_id)] = {
+            'report_record_detail_id': int(detail_id),
+            'report_record_id': row.get('reportRecordId'),
+            'report_record_code': row.get('reportRecordCode') or '',
+            'business_date': get_business_date(report_time),
+            'plan_type': plan_type,
+            'process_code': (row.get('processCode') or '').strip().upper(),
+            'report_time': report_time,
+            'equipment_name': equipment_name,
+            'equipment_key': equipment_key,
+            'part_no': part_no,
+            'material_name': extract_mes_material_name(row),
+            'report_qty': report_qty,
+            'raw_payload': row,
+            'content_hash': progress_report_content_hash(row),
+        }
+    return list(prepared.values()), skipped
+
+
+def _existing_hashes(detail_ids):
+    hashes = {}
+    for start in range(0, len(detail_ids), HASH_LOOKUP_CHUNK):
+        chunk = detail_ids[start:start + HASH_LOOKUP_CHUNK]
+        hashes.update(
+            ProductionMesReportRecord.objects.filter(report_record_detail_id__in=chunk)
+            .values_list('report_record_detail_id', 'content_hash')
+        )
+    return hashes
+
+
+def _write_changed(changed):
+    """Upsert changed rows in short batched transactions (idempotent on retry)."""
+
+    written = 0
+    for start in range(0, len(changed), WRITE_BATCH_SIZE):
+        batch = [
+            ProductionMesReportRecord(**payload)
+            for payload in changed[start:start + WRITE_BATCH_SIZE]
+        ]
+        with transaction.atomic():
+            # Both the previous and the new partition of a moved record change.
+            touched = set(
+                ProductionMesReportRecord.objects
+                .filter(
+                    report_record_detail_id__in=[row.report_record_detail_id for row in batch],
+                    plan_type='machining',
+                )
+                .values_list('business_date', 'equipment_key')
+            )
+            touched.update(
+                (row.business_date, row.equipment_key)
+                for row in batch
+                if row.plan_type == 'machining'
+            )
+            ProductionMesReportRecord.objects.bulk_create(
+                batch,
+                update_conflicts=True,
+                unique_fields=['report_record_detail_id'],
+                update_fields=UPSERT_FIELDS,
+            )
+            mark_machining_dirty(touched, reason='mes_progress_sync')
+        written += len(batch)
+    return written
 
 
 class Command(BaseCommand):
     help = 'Sync MES progress reports into ProductionMesReportRecord.'
 
     def add_arguments(self, parser):
-        parser.add_argument('--mode', choices=['auto', 'initial', 'incremental'], default='auto')
+        parser.add_argument('--mode', choices=['auto', 'initial', 'incremental', 'watermark'], default='auto')
         parser.add_argument('--initial-hours', type=int, default=24)
         parser.add_argument('--incremental-minutes', type=int, default=5)
+        parser.add_argument(
+            '--overlap-minutes',
+            type=int,
+            default=10,
+            help='Safety overlap re-read before the stored watermark in watermark mode.',
+        )
         parser.add_argument('--dry-run', action='store_true')
 
     def handle(self, *args, **options):
+        started = time.monotonic()
         mode = options['mode']
         initial_hours = max(1, int(options['initial_hours']))
         incremental_minutes = max(1, int(options['incremental_minutes']))
+        overlap_minutes = max(0, int(options['overlap_minutes']))
         dry_run = bool(options['dry_run'])
 
         now = timezone.now().astimezone(timezone.get_default_timezone())
-        has_existing = ProductionMesReportRecord.objects.exists()
+        state = ProductionMesSyncWatermark.objects.filter(
+            source=ProductionMesSyncWatermark.SOURCE_PROGRESS_REPORTS,
+        ).first()
         if mode == 'auto':
-            mode = 'incremental' if has_existing else 'initial'
-
-        if mode == 'initial':
+            if state and state.watermark:
+                mode = 'watermark'
+            else:
+                has_existing = ProductionMesReportRecord.objects.exists()
+                mode = 'incremental' if has_existing else 'initial'
+
+        if mode == 'watermark' and state and state.watermark:
+            # MES filters by report time only, so the overlap catches rows that
+            # were reported late or edited shortly after the previous run.
+            start_dt = min(
+                state.watermark - timedelta(minutes=overlap_minutes),
+                now - timedelta(minutes=incremental_minutes),
+            )
+        elif mode in {'initial', 'watermark'}:
             start_dt = now - timedelta(hours=initial_hours)
         else:
             start_dt = now - timedelta(minutes=incremental_minutes)
@@ -54,58 +183,42 @@ class Command(BaseCommand):
             report_time_to=report_time_to,
         )
 
-        prepared = []
-        skipped = 0
-        for row in rows:
-            report_time = parse_report_time(row.get('reportTime'))
-            plan_type = normalize_plan_type(row.get('processCode'))
-            equipment_name = extract_equipment_name(row)
-            equipment_key = normalize_equipment_key(plan_type or '', equipment_name) if plan_type else ''
-            part_no = normalize_mes_part_no(row)
-            report_qty = extract_qty(row)
-            detail_id = row.get('reportRecordDetailId') or row.get('id')
-
-            if not detail_id or not report_time or not plan_type or not equipment_key or not part_no:
-                skipped += 1
-                continue
-            if plan_type == 'machining' and not is_machining_progress_report(row):
-                skipped += 1
-                continue
-
-            prepared.append({
-                'report_record_detail_id': int(detail_id),
-                'report_record_id': row.get('reportRecordId'),
-                'report_record_code': row.get('reportRecordCode') or '',
-                'business_date': get_business_date(report_time),
-                'plan_type': plan_type,
-                'process_code': (row.get('processCode') or '').strip().upper(),
-                'report_time': report_time,
-                'equipment_name': equipment_name,
-                'equipment_key': equipment_key,
-                'part_no': part_no,
-                'material_name': extract_mes_material_name(row),
-                'report_qty': report_qty,
-                'raw_payload': row,
-            })
-
-        created = 0
-        updated = 0
+        prepared, skipped = _prepare_rows(rows)
+        existing = _existing_hashes([payload['report_record_detail_id'] for payload in prepared])
+        changed = [
+            payload
+            for payload in prepared
+            if existing.get(payload['report_record_detail_id']) != payload['content_hash']
+        ]
+        created = sum(1 for payload in changed if payload['report_record_detail_id'] not in existing)
+        updated = len(changed) - created
+        unchanged = len(prepared) - len(changed)
+
+        written = 0
         if not dry_run:
-            with transaction.atomic():
-                for payload in prepared:
-                    _, was_created = ProductionMesReportRecord.objects.update_or_create(
-                        report_record_detail_id=payload['report_record_detail_id'],
-                        defaults=payload,
-                    )
-                    if was_created:
-                        created += 1
-                    else:
-                        updated += 1
+            written = _write_changed(changed)
+        duration_ms = int((time.monotonic() - started) * 1000)
+
+        if not dry_run:
+            state, _ = ProductionMesSyncWatermark.objects.get_or_create(
+                source=ProductionMesSyncWatermark.SOURCE_PROGRESS_REPORTS,
+            )
+            if state.watermark is None or now > state.watermark:
+                state.watermark = now
+            state.last_started_at = now
+            state.last_finished_at = timezone.now()
+            state.last_fetched = len(rows)
+            state.last_changed = len(changed)
+            state.last_written = written
+            state.last_duration_ms = duration_ms
+            state.save()
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"[MES Progress Sync] mode={mode} range=({start_dt.isoformat()} -> {now.isoformat()}) "
-                f"raw={len(rows)} prepared={len(prepared)} skipped={skipped} "
-                f"created={created} updated={updated} dry_run={dry_run}"
+                f"fetched={len(rows)} prepared={len(prepared)} skipped={skipped} "
+                f"changed={len(changed)} unchanged={unchanged} written={written} "
+                f"created={created if not dry_run else 0} updated={updated if not dry_run else 0} "
+                f"duration_ms={duration_ms} dry_run={dry_run}"
             )
         )
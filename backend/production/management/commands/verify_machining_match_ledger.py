@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from production.machining_reconciliation import find_match_ledger_drift, repair_match_ledger
+
+
+class Command(BaseCommand):
+    help = "Compare the machining matched-qty ledger with the match rows, optionally repairing drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repair", action="store_true", help="Reset drifted ledger rows to the match aggregate.")
+
+    def handle(self, *args, **options):
+        drift = find_match_ledger_drift()
+        for key, rows in drift.items():
+            for pk, ledger_qty, actual_qty in rows[:20]:
+                self.stdout.write(f"{key} id={pk} ledger={ledger_qty} actual={actual_qty}")
+        summary = " ".join(f"{key}={len(rows)}" for key, rows in drift.items())
+        if not any(drift.values()):
+            self.stdout.write(self.style.SUCCESS(f"Ledger consistent: {summary}"))
+            return
+        if not options["repair"]:
+            raise CommandError(f"Ledger drift found: {summary}")
+        repaired = repair_match_ledger()
+        self.stdout.write(self.style.SUCCESS(
+            "Ledger repaired: " + " ".join(f"{key}={count}" for key, count in repaired.items())
+        ))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 import re
 from datetime import datetime, timedelta
@@ -84,6 +86,13 @@ def fetch_all_progress_reports(report_time_from: int, report_time_to: int, size:
     return rows
 
 
+def progress_report_content_hash(row: dict[str, Any]) -> str:
+    """Stable digest of one raw MES row, used to skip unchanged re-fetches."""
+
+    canonical = json.dumps(row, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
 def get_business_date(dt: datetime):
     localized = dt.astimezone(SHANGHAI_TZ)
     if localized.hour < 8:
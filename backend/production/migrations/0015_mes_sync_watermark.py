@@ -0,0 +1,36 @@
+# Generated by Django 5.2.3 on 2026-10-19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('production', '0014_injectionactivityconfirmation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productionmesreportrecord',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.CreateModel(
+            name='ProductionMesSyncWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, unique=True)),
+                ('watermark', models.DateTimeField(blank=True, null=True)),
+                ('last_started_at', models.DateTimeField(blank=True, null=True)),
+                ('last_finished_at', models.DateTimeField(blank=True, null=True)),
+                ('last_fetched', models.PositiveIntegerField(default=0)),
+                ('last_changed', models.PositiveIntegerField(default=0)),
+                ('last_written', models.PositiveIntegerField(default=0)),
+                ('last_duration_ms', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['source'],
+            },
+        ),
+    ]
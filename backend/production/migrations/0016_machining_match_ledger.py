@@ -0,0 +1,44 @@
+# Generated by Django 5.2.3 on 2026-10-19
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_match_ledger(apps, schema_editor):
+    Match = apps.get_model('production', 'MachiningManualReportMatch')
+    for model_name, match_field in (
+        ('MachiningManualReport', 'manual_report'),
+        ('ProductionMesReportRecord', 'mes_report_record'),
+    ):
+        totals = (
+            Match.objects
+            .filter(**{match_field: OuterRef('pk')})
+            .values(match_field)
+            .annotate(total=Sum('matched_qty'))
+            .values('total')
+        )
+        apps.get_model('production', model_name).objects.filter(
+            pk__in=Match.objects.values(match_field),
+        ).update(matched_qty=Coalesce(Subquery(totals), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('production', '0015_mes_sync_watermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='machiningmanualreport',
+            name='matched_qty',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='productionmesreportrecord',
+            name='matched_qty',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_match_ledger, migrations.RunPython.noop),
+    ]
@@ -295,7 +295,10 @@ class ProductionMesReportRecord(models.Model):
     part_no = models.CharField(max_length=100, db_index=True)
     material_name = models.CharField(max_length=200, blank=True, default='')
     report_qty = models.IntegerField(default=0)
+    # Sum of manual_matches.matched_qty, maintained by machining_reconciliation.
+    matched_qty = models.IntegerField(default=0)
     raw_payload = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -311,6 +314,28 @@ class ProductionMesReportRecord(models.Model):
         return f"{self.business_date} {self.plan_type} {self.equipment_key} {self.part_no} {self.report_qty}"
 
 
+class ProductionMesSyncWatermark(models.Model):
+    """Per-source high-water mark for incremental MES syncs."""
+
+    SOURCE_PROGRESS_REPORTS = 'mes_progress_reports'
+
+    source = models.CharField(max_length=50, unique=True)
+    watermark = models.DateTimeField(null=True, blank=True)
+    last_started_at = models.DateTimeField(null=True, blank=True)
+    last_finished_at = models.DateTimeField(null=True, blank=True)
+    last_fetched = models.PositiveIntegerField(default=0)
+    last_changed = models.PositiveIntegerField(default=0)
+    last_written = models.PositiveIntegerField(default=0)
+    last_duration_ms = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['source']
+
+    def __str__(self):
+        return f"{self.source} @ {self.watermark}"
+
+
 def build_plan_identity_hash(plan_date, plan_type, machine_name, part_no, lot_no, sequence) -> str:
     payload = "|".join([
         str(plan_date or ""),
@@ -355,6 +380,8 @@ class MachiningManualReport(models.Model):
     good_qty = models.IntegerField(default=0)
     defect_qty = models.IntegerField(default=0)
     total_reported_qty = models.IntegerField(default=0)
+    # Sum of matches.matched_qty, maintained by machining_reconciliation.
+    matched_qty = models.IntegerField(default=0)
     reason_code = models.CharField(max_length=80, blank=True, default="")
     note = models.TextField(blank=True, default="")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="open", db_index=True)
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+import pytz
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from injection.models import InjectionMonitoringRecord
+
+from .ai_context_cache import (
+    bump_plan_context_revision,
+    get_injection_plan_context,
+    injection_context_cache_stats,
+)
+from .models import ProductionPlan
+
+SHANGHAI_TZ = pytz.timezone('Asia/Shanghai')
+
+
+@override_settings(PRODUCTION_AI_CONTEXT_CACHE_SECONDS=600)
+class InjectionContextCacheTests(TestCase):
+    business_date = '2026-09-01'
+
+    def setUp(self):
+        cache.clear()
+        self.start = SHANGHAI_TZ.localize(datetime(2026, 9, 1, 8, 0))
+        ProductionPlan.objects.create(
+            plan_date=self.business_date,
+            plan_type='injection',
+            machine_name='1호기',
+            part_no='ACQ30001',
+            model_name='MODEL-A',
+            planned_quantity=100,
+            sequence=1,
+        )
+        self.add_snapshot(-1, 1000)
+        self.add_snapshot(10, 1020)
+
+    def add_snapshot(self, minutes, capacity):
+        InjectionMonitoringRecord.objects.create(
+            machine_name='1호기',
+            device_code='machine-1',
+            timestamp=self.start + timedelta(minutes=minutes),
+            capacity=capacity,
+        )
+
+    def test_hit_reuses_pack_without_rebuilding(self):
+        context, info = get_injection_plan_context(self.business_date)
+        self.assertEqual(info['status'], 'miss')
+        self.assertIsNotNone(info['build_ms'])
+
+        with CaptureQueriesContext(connection) as queries:
+            cached, info = get_injection_plan_context(self.business_date)
+
+        self.assertEqual(info['status'], 'hit')
+        self.assertEqual(cached, context)
+        # Only the latest-snapshot lookup reads monitoring or plan rows.
+        table_reads = [
+            query['sql'] for query in queries.captured_queries
+            if InjectionMonitoringRecord._meta.db_table in query['sql']
+            or ProductionPlan._meta.db_table in query['sql']
+        ]
+        self.assertEqual(len(table_reads), 1)
+        stats = injection_context_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertIsNotNone(stats['avg_build_ms'])
+
+    def test_new_snapshot_changes_key(self):
+        first, _ = get_injection_plan_context(self.business_date)
+        self.add_snapshot(20, 1050)
+
+        second, info = get_injection_plan_context(self.business_date)
+
+        self.assertEqual(info['status'], 'miss')
+        self.assertEqual(first['machines'][0]['day_shots'], 20)
+        self.assertEqual(second['machines'][0]['day_shots'], 50)
+
+    def test_plan_revision_bump_invalidates_pack(self):
+        get_injection_plan_context(self.business_date)
+        ProductionPlan.objects.filter(plan_date=self.business_date).update(planned_quantity=300)
+
+        _, info = get_injection_plan_context(self.business_date)
+        self.assertEqual(info['status'], 'hit')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_plan_context_revision()
+        context, info = get_injection_plan_context(self.business_date)
+
+        self.assertEqual(info['status'], 'miss')
+        self.assertEqual(context['machines'][0]['parts'][0]['planned_qty'], 300)
+
+    def test_day_without_snapshot_is_not_cached(self):
+        _, info = get_injection_plan_context('2026-09-05')
+        _, again = get_injection_plan_context('2026-09-05')
+
+        self.assertEqual((info['status'], again['status']), ('bypass', 'bypass'))
+        self.assertEqual(injection_context_cache_stats()['uncached'], 2)
@@ -0,0 +1,115 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from injection.latest_effective import clear_latest_effective_cache, latest_cycle_time_setups, latest_part_specs
+from injection.models import CycleTimeSetup, PartSpec
+
+from .models import ProductionPlan
+
+CONSOLE_URL = '/api/production/console/'
+
+
+class LatestEffectiveLookupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_latest_effective_cache()
+        self.user = get_user_model().objects.create_user(username='setup-writer', password='pw')
+
+    def create_setup(self, machine_no, part_no, target, status='SETUP'):
+        return CycleTimeSetup.objects.create(
+            machine_no=machine_no, part_no=part_no, target_cycle_time=target, status=status, setup_by=self.user,
+        )
+
+    def test_latest_spec_per_part_is_picked_by_the_database_and_memoised(self):
+        PartSpec.objects.create(part_no='PART-A', model_code='M', valid_from=date(2026, 1, 1), cycle_time_sec=40)
+        PartSpec.objects.create(part_no='PART-A', model_code='M', valid_from=date(2026, 3, 1), cycle_time_sec=35)
+        PartSpec.objects.create(part_no='PART-B', model_code='M', valid_from=date(2026, 2, 1), cycle_time_sec=50)
+
+        with self.assertNumQueries(1):
+            specs = latest_part_specs(['part-a', 'PART-B', 'PART-C'])
+        self.assertEqual({part_no: row['cycle_time_sec'] for part_no, row in specs.items()}, {'PART-A': 35, 'PART-B': 50})
+
+        with self.assertNumQueries(0):
+            latest_part_specs(['PART-B', 'PART-A', 'PART-C'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PartSpec.objects.create(part_no='PART-A', model_code='M', valid_from=date(2026, 4, 1), cycle_time_sec=30)
+        self.assertEqual(latest_part_specs(['PART-A'])['PART-A']['cycle_time_sec'], 30)
+
+    def test_latest_setup_per_machine_and_part_skips_rejected(self):
+        self.create_setup(1, 'PART-A', 40)
+        self.create_setup(1, 'PART-A', 38)
+        self.create_setup(1, 'PART-A', 10, status='REJECTED')
+        self.create_setup(2, 'PART-A', 45)
+
+        setups = latest_cycle_time_setups([1, 2, 3], ['PART-A'])
+
+        self.assertEqual(
+            {key: row['target_cycle_time'] for key, row in setups.items()},
+            {(1, 'PART-A'): 38, (2, 'PART-A'): 45},
+        )
+
+
+class ProductionConsoleCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_latest_effective_cache()
+        self.target_date = date(2026, 5, 18)
+        self.user = get_user_model().objects.create_user(username='console', password='pw', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for machine in range(1, 21):
+            part_no = f'PART-{machine:02d}'
+            ProductionPlan.objects.create(
+                plan_date=self.target_date, plan_type='injection', machine_name=f'850T-{machine}',
+                part_no=part_no, lot_no='', model_name='Model', planned_quantity=100, sequence=1,
+            )
+            PartSpec.objects.create(part_no=part_no, model_code='M', valid_from=date(2026, 1, 1), cycle_time_sec=40)
+            PartSpec.objects.create(part_no=part_no, model_code='M', valid_from=date(2026, 4, 1), cycle_time_sec=36)
+            for target in (50, 45):
+                CycleTimeSetup.objects.create(
+                    machine_no=machine, part_no=part_no, target_cycle_time=target, setup_by=self.user,
+                )
+
+    def get_console(self):
+        return self.client.get(CONSOLE_URL, {'date': self.target_date.isoformat(), 'plan_type': 'injection'})
+
+    def upsert_execution(self, actual_qty):
+        return self.client.post('/api/production/executions/upsert/', {
+            'plan_date': self.target_date.isoformat(), 'plan_type': 'injection', 'machine_name': '850T-1',
+            'part_no': 'PART-01', 'lot_no': '', 'sequence': 1, 'planned_quantity': 100, 'actual_qty': actual_qty,
+        }, format='json')
+
+    def test_query_count_is_constant_and_warm_requests_only_probe_revisions(self):
+        with CaptureQueriesContext(connection) as cold:
+            body = self.get_console().json()
+        self.assertEqual(len(body['rows']), 20)
+        self.assertEqual(body['rows'][0]['baseline_ct'], 36)
+        self.assertEqual(body['rows'][0]['target_cycle_time'], 45)
+        # revisions (2), plans, executions, cavity, part specs, setups
+        self.assertLessEqual(len(cold.captured_queries), 7)
+
+        # Warm latency is tracked by ``manage.py benchmark_production_console``.
+        for _ in range(3):
+            with CaptureQueriesContext(connection) as warm:
+                self.assertEqual(self.get_console().json(), body)
+            # Only the plan and execution revision aggregates; no payload queries.
+            self.assertEqual(len(warm.captured_queries), 2)
+            self.assertTrue(all('COUNT(' in query['sql'] for query in warm.captured_queries), warm.captured_queries)
+
+    def test_execution_and_metadata_writes_invalidate_the_payload(self):
+        self.assertEqual(self.get_console().json()['rows'][0]['actual_qty'], 0)
+
+        self.upsert_execution(40)
+        row = self.get_console().json()['rows'][0]
+        self.assertEqual((row['actual_qty'], row['status']), (40, 'running'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CycleTimeSetup.objects.create(machine_no=1, part_no='PART-01', target_cycle_time=30, setup_by=self.user)
+        self.assertEqual(self.get_console().json()['rows'][0]['target_cycle_time'], 30)
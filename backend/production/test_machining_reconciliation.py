@@ -0,0 +1,259 @@
+from collections import defaultdict
+from datetime import date, datetime
+from io import StringIO
+
+import pytz
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from analytics.models import MartDirtyPartition
+
+from .ai_metrics import safe_int
+from .machining_reconciliation import (
+    build_machining_provision_payload,
+    confirm_manual_report_match,
+    find_match_ledger_drift,
+    manual_report_status_for,
+    reconcile_manual_reports,
+)
+from .management.commands.benchmark_machining_reconciliation import seed_reconciliation_month
+from .models import MachiningManualReport, MachiningManualReportMatch, ProductionMesReportRecord
+
+
+def aggregate_status(report):
+    matched_qty = safe_int(report.matches.aggregate(total=Sum("matched_qty")).get("total"))
+    next_status = manual_report_status_for(report.total_reported_qty, matched_qty)
+    MachiningManualReport.objects.filter(pk=report.pk).update(status=next_status)
+    report.status = next_status
+
+
+def per_report_reconcile(from_date, to_date):
+    """The former one-report-at-a-time loop, kept as the reference result."""
+
+    reports = (
+        MachiningManualReport.objects
+        .filter(credit_business_date__gte=from_date, credit_business_date__lte=to_date)
+        .exclude(status__in=["matched", "cancelled"])
+        .order_by("credit_business_date", "id")
+    )
+    matched_count = 0
+    partial_count = 0
+    for report in reports:
+        matched_total = safe_int(report.matches.aggregate(total=Sum("matched_qty")).get("total"))
+        if matched_total >= safe_int(report.total_reported_qty):
+            aggregate_status(report)
+            continue
+        candidates = (
+            ProductionMesReportRecord.objects
+            .filter(
+                plan_type="machining",
+                part_no=report.part_no,
+                business_date__gte=report.business_date,
+                business_date__lte=to_date,
+            )
+            .order_by("business_date", "report_time", "id")
+        )
+        matched_by_mes = defaultdict(int, {
+            row["mes_report_record_id"]: safe_int(row["total"])
+            for row in MachiningManualReportMatch.objects.values("mes_report_record_id").annotate(total=Sum("matched_qty"))
+        })
+        for record in candidates:
+            available_qty = max(0, safe_int(record.report_qty) - safe_int(matched_by_mes.get(record.id)))
+            if available_qty <= 0:
+                continue
+            remaining_qty = max(0, safe_int(report.total_reported_qty) - matched_total)
+            if remaining_qty <= 0:
+                break
+            qty = min(available_qty, remaining_qty)
+            MachiningManualReportMatch.objects.update_or_create(
+                manual_report=report,
+                mes_report_record=record,
+                defaults={
+                    "matched_qty": qty,
+                    "match_confidence": "probable" if qty < safe_int(report.total_reported_qty) else "exact",
+                },
+            )
+            matched_total += qty
+            matched_by_mes[record.id] += qty
+        aggregate_status(report)
+        if report.status == "matched":
+            matched_count += 1
+        elif report.status == "partial":
+            partial_count += 1
+    return {"matched": matched_count, "partial": partial_count}
+
+
+def reconciliation_snapshot():
+    return (
+        sorted(MachiningManualReportMatch.objects.values_list(
+            "manual_report_id", "mes_report_record_id", "matched_qty", "match_confidence",
+        )),
+        sorted(MachiningManualReport.objects.values_list("id", "status")),
+    )
+
+
+class MachiningReconciliationEngineTests(TestCase):
+    start_date = date(2026, 5, 1)
+    to_date = date(2026, 5, 8)
+
+    def test_matches_the_per_report_loop_on_a_seeded_window(self):
+        seed_reconciliation_month(self.start_date, days=7, parts=4, reports_per_day=2, records_per_day=3)
+        # A report that is already over-matched is refreshed but not counted.
+        over_matched = MachiningManualReport.objects.order_by("id").first()
+        first_record = ProductionMesReportRecord.objects.filter(part_no=over_matched.part_no).order_by("id").first()
+        MachiningManualReportMatch.objects.create(
+            manual_report=over_matched,
+            mes_report_record=first_record,
+            matched_qty=over_matched.total_reported_qty + 5,
+        )
+        call_command("verify_machining_match_ledger", repair=True, stdout=StringIO())
+
+        with transaction.atomic():
+            expected_result = per_report_reconcile(self.start_date, self.to_date)
+            expected_rows = reconciliation_snapshot()
+            transaction.set_rollback(True)
+
+        result = reconcile_manual_reports(self.start_date, self.to_date)
+
+        self.assertEqual(result, expected_result)
+        self.assertEqual(reconciliation_snapshot(), expected_rows)
+        self.assertGreater(result["matched"], 0)
+        self.assertGreater(result["partial"], 0)
+        self.assertTrue(MartDirtyPartition.objects.filter(process="machining").exists())
+        self.assertEqual(find_match_ledger_drift(), {"manual_reports": [], "mes_records": []})
+
+    def test_query_count_does_not_grow_with_the_window(self):
+        def reconcile_query_count(days, parts):
+            with transaction.atomic():
+                seed_reconciliation_month(self.start_date, days=days, parts=parts)
+                with CaptureQueriesContext(connection) as queries:
+                    reconcile_manual_reports(self.start_date, self.to_date)
+                transaction.set_rollback(True)
+            return len(queries.captured_queries)
+
+        small = reconcile_query_count(2, 2)
+        large = reconcile_query_count(7, 12)
+        # 168 reports instead of 8: only write batching may add queries,
+        # where the per-report loop issued several queries per report.
+        self.assertLessEqual(large, small + 4)
+
+    def test_existing_pair_quantity_is_added_to(self):
+        report = MachiningManualReport.objects.create(
+            business_date=self.start_date,
+            plan_date=self.start_date,
+            plan_identity_hash="",
+            machine_name="A LINE",
+            equipment_key="A",
+            part_no="PART-ADD",
+            total_reported_qty=50,
+            credit_business_date=self.start_date,
+            status="partial",
+            matched_qty=20,
+        )
+        record = ProductionMesReportRecord.objects.create(
+            report_record_detail_id=4001,
+            business_date=self.start_date,
+            plan_type="machining",
+            process_code="JG",
+            report_time=pytz.timezone("Asia/Shanghai").localize(datetime(2026, 5, 1, 10, 0)),
+            equipment_key="A",
+            part_no="PART-ADD",
+            # MES revised the record upward after the first match.
+            report_qty=40,
+            matched_qty=20,
+            raw_payload={},
+        )
+        MachiningManualReportMatch.objects.create(manual_report=report, mes_report_record=record, matched_qty=20)
+
+        result = reconcile_manual_reports(self.start_date, self.to_date)
+
+        match = MachiningManualReportMatch.objects.get(manual_report=report, mes_report_record=record)
+        self.assertEqual(match.matched_qty, 40)
+        report.refresh_from_db()
+        self.assertEqual(report.status, "partial")
+        self.assertEqual(result, {"matched": 0, "partial": 1})
+        self.assertEqual((report.matched_qty, MachiningManualReport.objects.get(pk=report.pk).matched_qty), (40, 40))
+        record.refresh_from_db()
+        self.assertEqual(record.matched_qty, 40)
+
+    def test_benchmark_command_rolls_back_seeded_data(self):
+        output = StringIO()
+
+        call_command("benchmark_machining_reconciliation", days=3, parts=3, stdout=output)
+
+        self.assertIn("reports=18 mes_records=27", output.getvalue())
+        self.assertIn("queries=", output.getvalue())
+        self.assertFalse(MachiningManualReport.objects.exists())
+        self.assertFalse(ProductionMesReportRecord.objects.exists())
+
+
+class MachiningMatchLedgerTests(TestCase):
+    start_date = date(2026, 5, 1)
+
+    def setUp(self):
+        seed_reconciliation_month(self.start_date, days=3, parts=2, reports_per_day=2, records_per_day=2)
+
+    def assertLedgerConsistent(self):
+        self.assertEqual(find_match_ledger_drift(), {"manual_reports": [], "mes_records": []})
+
+    def test_ledger_tracks_confirm_reconcile_and_rematch(self):
+        report = MachiningManualReport.objects.order_by("id").first()
+        records = list(ProductionMesReportRecord.objects.filter(part_no=report.part_no).order_by("id")[:2])
+
+        confirm_manual_report_match(
+            manual_report_id=report.id,
+            mes_report_record_ids=[records[0].id],
+            matched_qty=15,
+            user=None,
+        )
+        self.assertLedgerConsistent()
+        # Re-confirming the same pair replaces its quantity.
+        confirm_manual_report_match(
+            manual_report_id=report.id,
+            mes_report_record_ids=[records[0].id],
+            matched_qty=10,
+            user=None,
+        )
+        report.refresh_from_db()
+        self.assertEqual((report.matched_qty, report.status), (10, "partial"))
+        self.assertLedgerConsistent()
+
+        for _ in range(2):
+            reconcile_manual_reports(self.start_date, date(2026, 5, 5))
+            self.assertLedgerConsistent()
+        confirm_manual_report_match(
+            manual_report_id=report.id,
+            mes_report_record_ids=[record.id for record in records],
+            matched_qty=report.total_reported_qty,
+            user=None,
+        )
+        self.assertLedgerConsistent()
+
+    def test_provision_reads_ledger_for_its_window_only(self):
+        reconcile_manual_reports(self.start_date, date(2026, 5, 5))
+        reference = build_machining_provision_payload(date(2026, 5, 2), days=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            payload = build_machining_provision_payload(date(2026, 5, 2), days=2)
+
+        self.assertEqual(payload, reference)
+        self.assertFalse(any(
+            "production_machiningmanualreportmatch" in query["sql"].lower()
+            for query in queries.captured_queries
+        ))
+
+    def test_verify_command_reports_and_repairs_drift(self):
+        reconcile_manual_reports(self.start_date, date(2026, 5, 5))
+        report = MachiningManualReport.objects.filter(matched_qty__gt=0).first()
+        MachiningManualReport.objects.filter(pk=report.pk).update(matched_qty=report.matched_qty + 7)
+
+        with self.assertRaisesMessage(CommandError, "manual_reports=1 mes_records=0"):
+            call_command("verify_machining_match_ledger", stdout=StringIO())
+        output = StringIO()
+        call_command("verify_machining_match_ledger", repair=True, stdout=output)
+
+        self.assertIn("Ledger repaired: manual_reports=1 mes_records=0", output.getvalue())
+        self.assertLedgerConsistent()
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from io import StringIO
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -30,6 +31,7 @@ from .models import (
     MachiningManualReport,
     ProductionExecution,
     ProductionMesReportRecord,
+    ProductionMesSyncWatermark,
     ProductionPartCavity,
     ProductionPlan,
 )
@@ -430,6 +432,71 @@ class MesProgressSyncCommandTests(DjangoTestCase):
         self.assertEqual(record.report_qty, 18)
         self.assertEqual(ProductionMesReportRecord.objects.count(), 1)
 
+    def _progress_row(self, detail_id, amount, report_time_ms):
+        return {
+            'reportRecordDetailId': detail_id,
+            'reportRecordId': detail_id // 10,
+            'reportRecordCode': f'R-{detail_id}',
+            'processCode': 'ZS',
+            'processName': '注塑',
+            'reportTime': report_time_ms,
+            'equipments': [{'name': '850T-3'}],
+            'materialInfo': {'baseInfo': {'code': 'PART-Z', 'name': 'Part Z'}},
+            'reportBaseAmount': {'amount': amount},
+        }
+
+    def test_watermark_mode_fetches_from_watermark_and_skips_unchanged_rows(self):
+        tz = pytz.timezone('Asia/Shanghai')
+        report_time_ms = int(tz.localize(datetime(2026, 5, 18, 9, 0)).timestamp() * 1000)
+        rows = [self._progress_row(2001, 10, report_time_ms), self._progress_row(2002, 20, report_time_ms)]
+        command = 'production.management.commands.sync_mes_progress_reports.fetch_all_progress_reports'
+
+        with patch(command, return_value=rows):
+            call_command('sync_mes_progress_reports', mode='initial', stdout=StringIO())
+
+        state = ProductionMesSyncWatermark.objects.get(
+            source=ProductionMesSyncWatermark.SOURCE_PROGRESS_REPORTS,
+        )
+        self.assertIsNotNone(state.watermark)
+        self.assertEqual(state.last_written, 2)
+        first_watermark = state.watermark
+        untouched_updated_at = ProductionMesReportRecord.objects.get(report_record_detail_id=2001).updated_at
+
+        changed_rows = [rows[0], self._progress_row(2002, 25, report_time_ms), self._progress_row(2003, 5, report_time_ms)]
+        output = StringIO()
+        with patch(command, return_value=changed_rows) as fetch:
+            call_command('sync_mes_progress_reports', overlap_minutes=10, stdout=output)
+
+        window_start = fetch.call_args.kwargs['report_time_from']
+        self.assertLessEqual(window_start, int((first_watermark - timedelta(minutes=10)).timestamp() * 1000))
+        self.assertGreater(window_start, int((first_watermark - timedelta(minutes=11)).timestamp() * 1000))
+        self.assertIn('mode=watermark', output.getvalue())
+        self.assertIn('fetched=3', output.getvalue())
+        self.assertIn('changed=2', output.getvalue())
+        self.assertIn('written=2', output.getvalue())
+        self.assertIn('duration_ms=', output.getvalue())
+        self.assertEqual(
+            ProductionMesReportRecord.objects.get(report_record_detail_id=2001).updated_at,
+            untouched_updated_at,
+        )
+        self.assertEqual(ProductionMesReportRecord.objects.get(report_record_detail_id=2002).report_qty, 25)
+        self.assertEqual(ProductionMesReportRecord.objects.count(), 3)
+        state.refresh_from_db()
+        self.assertGreaterEqual(state.watermark, first_watermark)
+        self.assertEqual(state.last_changed, 2)
+
+    def test_dry_run_does_not_write_or_advance_watermark(self):
+        tz = pytz.timezone('Asia/Shanghai')
+        report_time_ms = int(tz.localize(datetime(2026, 5, 18, 9, 0)).timestamp() * 1000)
+        with patch(
+            'production.management.commands.sync_mes_progress_reports.fetch_all_progress_reports',
+            return_value=[self._progress_row(3001, 1, report_time_ms)],
+        ):
+            call_command('sync_mes_progress_reports', mode='watermark', dry_run=True, stdout=StringIO())
+
+        self.assertFalse(ProductionMesReportRecord.objects.exists())
+        self.assertFalse(ProductionMesSyncWatermark.objects.exists())
+
 
 class ProductionMesReportStatsApiTests(DjangoTestCase):
     def test_ai_briefing_api_requires_authentication(self):
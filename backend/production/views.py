@@ -22,11 +22,14 @@ from .models import (
     ProductionPlanChangeLog,
     ProductionPartCavity,
 )
-from injection.models import CycleTimeSetup, InjectionMonitoringRecord, PartSpec
+from injection.latest_effective import latest_cycle_time_setups, latest_part_specs
+from injection.models import InjectionMonitoringRecord
 from assembly.models import AssemblyReport
 from ai_core.models import AiJob
+from analytics.partitions import mark_plans_dirty
+from config.http_cache import PRIVATE, PUBLIC, cache_policy
 
-from django.db.models import Sum, Q, Max
+from django.db.models import Count, Sum, Q, Max
 from django.db.utils import DatabaseError, OperationalError, ProgrammingError, IntegrityError
 from .serializers import (
     InjectionActivityConfirmationSerializer,
@@ -44,7 +47,9 @@ from .ai_answer import (
     build_injection_shot_projection,
 )
 from .ai_context import build_context_pack, build_used_data
-from .ai_gateway import answer_from_intent, build_injection_plan_context, heuristic_intent_from_question
+from .ai_context_cache import bump_plan_context_revision, get_injection_plan_context
+from .console_cache import get_console_payload
+from .ai_gateway import answer_from_intent, heuristic_intent_from_question
 from .ai_retrievers import get_daily_production_context
 from .ai_types import DEFAULT_PRODUCTION_AI_MODEL_ID, PRODUCTION_AI_MODELS
 from .counter_utils import calculate_cumulative_counter_delta
@@ -300,6 +305,8 @@ class ProductionPlanListView(generics.ListCreateAPIView):
             sequence = (last_seq or 0) + 1
         try:
             obj = serializer.save(plan_date=target_date, plan_type=plan_type, sequence=sequence)
+            mark_plans_dirty([(obj.plan_date, obj.plan_type)], reason='plan_create')
+            bump_plan_context_revision()
             ProductionPlanChangeLog.objects.create(
                 plan_date=obj.plan_date,
                 plan_type=obj.plan_type,
@@ -739,7 +746,7 @@ class ProductionAiAskView(APIView):
                 'job_status': job.status if job else None,
             })
 
-        context = build_injection_plan_context(target_date.isoformat())
+        context, context_cache = get_injection_plan_context(target_date.isoformat())
         calculated_answer = answer_from_intent(intent, context, language)
         if calculated_answer:
             deterministic = self.build_legacy_deterministic_payload(
@@ -774,6 +781,7 @@ class ProductionAiAskView(APIView):
                     'range_end': context['range_end'],
                     'recent_range_start': context['recent_range_start'],
                     'recent_range_end': context['recent_range_end'],
+                    'cache': context_cache,
                 },
                 'job_id': job.id if job else None,
                 'job_status': job.status if job else None,
@@ -831,8 +839,12 @@ class ProductionPlanDetailView(generics.RetrieveUpdateDestroyAPIView):
         return obj
 
     def perform_update(self, serializer):
-        before = serialize_plan_for_log(self.get_object())
+        previous = self.get_object()
+        before = serialize_plan_for_log(previous)
+        previous_key = (previous.plan_date, previous.plan_type)
         obj = serializer.save()
+        mark_plans_dirty([previous_key, (obj.plan_date, obj.plan_type)], reason='plan_update')
+        bump_plan_context_revision()
         after = serialize_plan_for_log(obj)
         action = 'reorder' if set(key for key in after if before.get(key) != after.get(key)) == {'sequence'} else 'update'
         ProductionPlanChangeLog.objects.create(
@@ -861,6 +873,23 @@ class ProductionPlanDetailView(generics.RetrieveUpdateDestroyAPIView):
                 # Mapping table not ready; ignore to avoid 500 on plan update.
                 pass
 
+    def perform_destroy(self, instance):
+        mark_plans_dirty([(instance.plan_date, instance.plan_type)], reason='plan_delete')
+        bump_plan_context_revision()
+        super().perform_destroy(instance)
+
+
+def production_plan_table_version(request, *args, **kwargs):
+    # Deletes lower the count; creates and edits move the latest timestamp.
+    return ProductionPlan.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+
+
+def production_plan_part_table_version(request, *args, **kwargs):
+    try:
+        return ProductionPlanPart.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    except (OperationalError, ProgrammingError):
+        return None
+
 
 class ProductionPlanDatesView(APIView):
     """
@@ -868,6 +897,7 @@ class ProductionPlanDatesView(APIView):
     """
     permission_classes = []
 
+    @cache_policy(max_age=60, scope=PUBLIC, version=production_plan_table_version)
     def get(self, request, *args, **kwargs):
         injection_dates = list(
             ProductionPlan.objects.filter(plan_type='injection')
@@ -895,6 +925,7 @@ class ProductionPlanDatesView(APIView):
 class ProductionPlanPartSearchView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @cache_policy(max_age=300, scope=PRIVATE, version=production_plan_part_table_version)
     def get(self, request, *args, **kwargs):
         search = (request.query_params.get('search') or '').strip()
         plan_type = request.query_params.get('plan_type')
@@ -1358,6 +1389,7 @@ class ProductionPartCavityView(APIView):
                 },
             )
             objects.append({"part_no": obj.part_no, **serialize_cavity_meta(obj, obj.part_no)})
+        bump_plan_context_revision()
 
         first = objects[0]
         return Response({
@@ -1383,6 +1415,14 @@ class ProductionConsoleView(APIView):
         if plan_type not in ['injection', 'machining']:
             return Response({"error": "Invalid plan_type."}, status=status.HTTP_400_BAD_REQUEST)
 
+        payload, _cache_info = get_console_payload(
+            target_date,
+            plan_type,
+            lambda versions: self._build_payload(target_date, plan_type, versions),
+        )
+        return Response(payload)
+
+    def _build_payload(self, target_date, plan_type, versions):
         plans = list(
             ProductionPlan.objects.filter(
                 plan_date=target_date,
@@ -1411,25 +1451,15 @@ class ProductionConsoleView(APIView):
 
         part_nos = sorted({(row.get('part_no') or '').strip().upper() for row in plans if row.get('part_no')})
         cavity_map = get_cavity_meta_map(ProductionPartCavity, part_nos)
-
-        latest_partspec_map = {}
-        if part_nos:
-            for spec in PartSpec.objects.filter(part_no__in=part_nos).order_by('part_no', '-valid_from'):
-                latest_partspec_map.setdefault(spec.part_no, spec)
+        latest_partspec_map = latest_part_specs(part_nos, versions=versions)
 
         latest_setup_map = {}
         if plan_type == 'injection':
-            machine_numbers = sorted({
+            machine_numbers = {
                 number for number in (self._extract_machine_number(row.get('machine_name')) for row in plans)
                 if isinstance(number, int)
-            })
-            if machine_numbers and part_nos:
-                setups = CycleTimeSetup.objects.filter(
-                    machine_no__in=machine_numbers,
-                    part_no__in=part_nos,
-                ).exclude(status='REJECTED').order_by('machine_no', 'part_no', '-setup_date')
-                for setup in setups:
-                    latest_setup_map.setdefault((setup.machine_no, setup.part_no), setup)
+            }
+            latest_setup_map = latest_cycle_time_setups(machine_numbers, part_nos, versions=versions)
 
         rows = []
         total_planned = 0
@@ -1451,14 +1481,14 @@ class ProductionConsoleView(APIView):
             actual_qty = int(execution.actual_qty if execution else 0)
             defect_qty = int(execution.defect_qty if execution else 0)
             idle_time = int(execution.idle_time if execution else 0)
-            personnel_count = float(execution.personnel_count if execution else (setup.personnel_count if setup else 0))
+            personnel_count = float(execution.personnel_count if execution else (setup['personnel_count'] if setup else 0))
             operating_ct = (
                 float(execution.operating_ct)
                 if execution and execution.operating_ct is not None
-                else float(setup.target_cycle_time)
-                if setup and setup.target_cycle_time is not None
-                else float(spec.cycle_time_sec)
-                if spec and spec.cycle_time_sec is not None
+                else float(setup['target_cycle_time'])
+                if setup and setup['target_cycle_time'] is not None
+                else float(spec['cycle_time_sec'])
+                if spec and spec['cycle_time_sec'] is not None
                 else None
             )
             status_value = self._derive_status(
@@ -1492,10 +1522,10 @@ class ProductionConsoleView(APIView):
                 'note': execution.note if execution else '',
                 'status': status_value,
                 'progress': round((actual_qty / planned_quantity) * 100, 1) if planned_quantity > 0 else 0,
-                'baseline_ct': int(spec.cycle_time_sec) if spec and spec.cycle_time_sec is not None else None,
-                'target_cycle_time': int(setup.target_cycle_time) if setup else None,
-                'standard_cycle_time': int(setup.standard_cycle_time) if setup and setup.standard_cycle_time is not None else None,
-                'mean_cycle_time': int(setup.mean_cycle_time) if setup and setup.mean_cycle_time is not None else None,
+                'baseline_ct': int(spec['cycle_time_sec']) if spec and spec['cycle_time_sec'] is not None else None,
+                'target_cycle_time': int(setup['target_cycle_time']) if setup else None,
+                'standard_cycle_time': int(setup['standard_cycle_time']) if setup and setup['standard_cycle_time'] is not None else None,
+                'mean_cycle_time': int(setup['mean_cycle_time']) if setup and setup['mean_cycle_time'] is not None else None,
             }
             attach_cavity_meta(row_payload, cavity_map)
             rows.append(row_payload)
@@ -1504,7 +1534,7 @@ class ProductionConsoleView(APIView):
             total_actual += actual_qty
             total_defect += defect_qty
 
-        return Response({
+        return {
             'date': target_date.isoformat(),
             'plan_type': plan_type,
             'summary': {
@@ -1524,7 +1554,7 @@ class ProductionConsoleView(APIView):
                 ) if any(row['operating_ct'] is not None for row in rows) else 0,
             },
             'rows': rows,
-        })
+        }
 
     @staticmethod
     def _extract_machine_number(name):
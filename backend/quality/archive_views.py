@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import base64
+import json
 import logging
-from urllib.parse import urlsplit, urlunsplit
+from urllib.parse import urlencode, urlsplit, urlunsplit
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.db import transaction
+from django.db.models import Max, Q
+from django.db.models.functions import Coalesce, Greatest
 from django.http import FileResponse, Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers, status
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.pagination import PageNumberPagination
@@ -43,7 +48,7 @@ def _content_archive_path(sha256: str) -> str:
 
 
 def _validate_archive_query(request, *, asset_list: bool = False) -> None:
-    allowed = {'page', 'page_size'} | ({'mirror_state'} if asset_list else set())
+    allowed = {'page', 'page_size', 'updated_since', 'cursor'} | ({'mirror_state'} if asset_list else set())
     if set(request.query_params) - allowed:
         raise ValidationError({'query': 'Unexpected archive query parameter.'})
     if request.query_params.get('page_size') != '200':
@@ -53,6 +58,70 @@ def _validate_archive_query(request, *, asset_list: bool = False) -> None:
         raise ValidationError({'page': 'The archive page must be a positive integer.'})
     if asset_list and request.query_params.get('mirror_state') != 'pending':
         raise ValidationError({'mirror_state': 'The archive only reads pending assets.'})
+    if 'updated_since' in request.query_params:
+        if raw_page is not None:
+            raise ValidationError({'page': 'The changed-since feed pages with a cursor.'})
+    elif 'cursor' in request.query_params:
+        raise ValidationError({'cursor': 'A cursor requires updated_since.'})
+
+
+def _parse_updated_since(raw_value: str):
+    value = parse_datetime(raw_value or '')
+    if value is None or timezone.is_naive(value):
+        raise ValidationError({'updated_since': 'updated_since must be an ISO-8601 datetime with a timezone.'})
+    return value
+
+
+def _encode_feed_cursor(updated_at, row_id: int) -> str:
+    payload = json.dumps([updated_at.isoformat(), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_feed_cursor(cursor: str):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw_updated_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        updated_at = parse_datetime(raw_updated_at)
+        row_id = int(row_id)
+    except (TypeError, ValueError):
+        updated_at = None
+    if updated_at is None or timezone.is_naive(updated_at):
+        raise ValidationError({'cursor': 'Invalid archive cursor.'})
+    return updated_at, row_id
+
+
+def _changed_since_response(request, queryset, *, column: str, serializer_class):
+    """Keyset page of rows changed at or after ``updated_since``, oldest first.
+
+    The feed walks ``(column, id)`` so rows touched while the archive pages
+    move behind the cursor and are picked up by the next run instead of
+    shifting offsets.  The response carries no count; ``next`` is null on the
+    last page.
+    """
+
+    updated_since = _parse_updated_since(request.query_params.get('updated_since'))
+    queryset = queryset.filter(**{f'{column}__gte': updated_since}).order_by(column, 'id')
+    raw_cursor = request.query_params.get('cursor')
+    if raw_cursor is not None:
+        updated_at, row_id = _decode_feed_cursor(raw_cursor)
+        queryset = queryset.filter(**{f'{column}__gte': updated_at}).filter(
+            Q(**{f'{column}__gt': updated_at}) | Q(id__gt=row_id)
+        )
+    page_size = ArchivePagination.page_size
+    rows = list(queryset[:page_size + 1])
+    next_link = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        query = {
+            key: request.query_params[key]
+            for key in ('mirror_state', 'page_size', 'updated_since')
+            if key in request.query_params
+        }
+        query['cursor'] = _encode_feed_cursor(getattr(last, column), last.pk)
+        next_link = f'{request.path}?{urlencode(query)}'
+    serializer = serializer_class(rows, many=True, context={'request': request})
+    return Response({'next': next_link, 'results': serializer.data})
 
 
 class ArchiveServicePermission(BasePermission):
@@ -99,6 +168,13 @@ class ArchiveQualityAssetSerializer(serializers.ModelSerializer):
         return reverse('quality-archive-asset-content', kwargs={'pk': obj.pk})
 
 
+class ArchiveChangedAssetSerializer(ArchiveQualityAssetSerializer):
+    updated_at = serializers.DateTimeField(source='feed_updated_at', read_only=True)
+
+    class Meta(ArchiveQualityAssetSerializer.Meta):
+        fields = ArchiveQualityAssetSerializer.Meta.fields + ['updated_at']
+
+
 class ArchiveReportListView(APIView):
     permission_classes = [IsAuthenticated, ArchiveServicePermission]
 
@@ -107,6 +183,13 @@ class ArchiveReportListView(APIView):
         queryset = QualityReport.objects.only(
             'id', 'updated_at', 'image1', 'image2', 'image3', 'image4', 'image5',
         ).order_by('id')
+        if 'updated_since' in request.query_params:
+            return _changed_since_response(
+                request,
+                queryset,
+                column='updated_at',
+                serializer_class=ArchiveQualityReportSerializer,
+            )
         paginator = ArchivePagination()
         page = paginator.paginate_queryset(queryset, request, view=self)
         serializer = ArchiveQualityReportSerializer(page, many=True)
@@ -122,11 +205,38 @@ def _archive_asset_queryset():
     ).distinct().order_by('id')
 
 
+def _archive_changed_asset_queryset():
+    """Pending archive assets with the time they last (re)entered the feed.
+
+    Assets carry no modification time of their own; they become visible when
+    an attached batch turns ready, so the newest ready batch's ``updated_at``
+    stands in for it.
+    """
+
+    ready = [QualityImportBatch.Status.READY, QualityImportBatch.Status.READY_WITH_WARNINGS]
+    return QualityImportAsset.objects.filter(
+        attachments__batch__status__in=ready,
+        mirror_state=QualityImportAsset.MirrorState.PENDING,
+    ).annotate(
+        feed_updated_at=Greatest(
+            'created_at',
+            Coalesce(Max('attachments__batch__updated_at'), 'created_at'),
+        ),
+    )
+
+
 class ArchiveAssetListView(APIView):
     permission_classes = [IsAuthenticated, ArchiveServicePermission]
 
     def get(self, request):
         _validate_archive_query(request, asset_list=True)
+        if 'updated_since' in request.query_params:
+            return _changed_since_response(
+                request,
+                _archive_changed_asset_queryset(),
+                column='feed_updated_at',
+                serializer_class=ArchiveChangedAssetSerializer,
+            )
         queryset = _archive_asset_queryset().filter(
             mirror_state=QualityImportAsset.MirrorState.PENDING,
         )
@@ -13,16 +13,19 @@ from copy import deepcopy
 from datetime import date, timedelta
 import hashlib
 import json
+import logging
 import re
+import time
 from typing import Any, Iterable
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 from django.db import transaction
-from django.db.models import F, Value
+from django.db.models import Count, F, Q, Value
 from django.db.models.functions import Replace, Upper
 from django.utils import timezone
 
+from ai_core.job_queue import notify_ai_jobs_available
 from ai_core.models import AiJob
 from ai_core.quality_report_audit import (
     QUALITY_BODY_COLOR_KEYS,
@@ -42,14 +45,22 @@ from .injection_terminology import (
     INJECTION_DEFECT_TERMS,
     INJECTION_TERMINOLOGY_VERSION,
 )
-from .models import QualityReport
+from .models import QualityReport, QualityReportAuditState
 
 
+logger = logging.getLogger(__name__)
+
 SHANGHAI_TZ = ZoneInfo("Asia/Shanghai")
 QUALITY_REPORT_AUDIT_SCAN_LIMIT = 5
-QUALITY_REPORT_AUDIT_SCAN_WINDOW = 100
+# Dirty audit states refreshed per scheduler call.
+QUALITY_REPORT_AUDIT_DRAIN_BATCH_SIZE = 100
+QUALITY_REPORT_AUDIT_RETRY_AFTER = timedelta(minutes=5)
 QUALITY_REPORT_AUDIT_MAX_MANUAL_BATCH = 200
 QUALITY_REPORT_AUDIT_MAX_PAGE_SIZE = 50
+# Bump when the persisted queue state (e.g. search text) changes shape.
+QUALITY_REPORT_AUDIT_STATE_SCHEMA = 1
+QUALITY_REPORT_AUDIT_STATE_BATCH_SIZE = 500
+QUALITY_REPORT_AUDIT_STATE_SYNC_LIMIT = 1000
 QUALITY_REPORT_AUDIT_REVIEW_ACTIONS = frozenset({
     "accepted",
     "overridden",
@@ -355,7 +366,7 @@ def enqueue_quality_report_audit(
         )
         retryable = bool(
             retryable
-            and existing.updated_at <= timezone.now() - timedelta(minutes=5)
+            and existing.updated_at <= timezone.now() - QUALITY_REPORT_AUDIT_RETRY_AFTER
         )
         if not retryable:
             return existing, False
@@ -369,111 +380,124 @@ def enqueue_quality_report_audit(
     return job, True
 
 
+def _audit_enqueue_candidates(now):
+    """Fresh states whose current revision has no usable audit job.
+
+    Rows still waiting in the dirty queue are skipped: their stored status may
+    predate a job created since, and enqueueing from them would duplicate it.
+    """
+
+    return QualityReportAuditState.objects.filter(
+        needs_refresh=False,
+        contract_version=quality_report_audit_contract_version(),
+    ).filter(
+        Q(latest_job__isnull=True)
+        | Q(
+            queue_status="failed",
+            latest_job__updated_at__lte=now - QUALITY_REPORT_AUDIT_RETRY_AFTER,
+        )
+    )
+
+
+def quality_report_audit_backlog(report_ids: Iterable[int] | None = None) -> int:
+    """Dirty-queue depth: reports whose persisted state must be recomputed."""
+
+    missing = QualityReport.objects.filter(audit_state__isnull=True)
+    outdated = QualityReportAuditState.objects.filter(
+        Q(needs_refresh=True) | ~Q(contract_version=quality_report_audit_contract_version())
+    )
+    if report_ids is not None:
+        missing = missing.filter(pk__in=report_ids)
+        outdated = outdated.filter(report_id__in=report_ids)
+    return missing.count() + outdated.count()
+
+
 def enqueue_stale_quality_report_audits(
     *,
     limit: int = QUALITY_REPORT_AUDIT_SCAN_LIMIT,
     report_ids: Iterable[int] | None = None,
     created_by: Any = None,
-    bounded_scan: bool = False,
+    drain_batch_size: int = QUALITY_REPORT_AUDIT_DRAIN_BATCH_SIZE,
 ) -> dict[str, Any]:
+    """Drain the audit dirty queue, then enqueue reports lacking a current audit.
+
+    Report edits, imports, PartSpec changes, audit-job writes and contract
+    bumps all land in the dirty queue (see ``sync_quality_report_audit_states``).
+    A scheduler call refreshes at most ``drain_batch_size`` of those states, so
+    its cost no longer grows with the report table; an explicit ``report_ids``
+    request refreshes exactly those reports.
+    """
+
+    started = time.perf_counter()
     limit = max(1, min(int(limit or 1), QUALITY_REPORT_AUDIT_MAX_MANUAL_BATCH))
-    queryset = QualityReport.objects.order_by("-report_dt", "-id")
     if report_ids is not None:
-        ids = [value for value in report_ids if type(value) is int and value > 0]
-        queryset = queryset.filter(pk__in=ids)
-    total_report_count = queryset.count() if bounded_scan and report_ids is None else None
-    if bounded_scan and report_ids is None and total_report_count:
-        page_count = max(
-            1,
-            (total_report_count + QUALITY_REPORT_AUDIT_SCAN_WINDOW - 1)
-            // QUALITY_REPORT_AUDIT_SCAN_WINDOW,
+        report_ids = [value for value in report_ids if type(value) is int and value > 0]
+    queue_depth = quality_report_audit_backlog(report_ids)
+    refreshed_count = 0
+    if queue_depth:
+        refreshed_count = sync_quality_report_audit_states(
+            limit=None if report_ids is not None else max(1, int(drain_batch_size or 1)),
+            report_ids=report_ids,
         )
-        page_index = int(timezone.now().timestamp() // 60) % page_count
-        start = page_index * QUALITY_REPORT_AUDIT_SCAN_WINDOW
-        reports = list(queryset[start:start + QUALITY_REPORT_AUDIT_SCAN_WINDOW])
-    else:
-        reports = list(queryset)
-    if total_report_count is None:
-        total_report_count = len(reports)
+    now = timezone.now()
+    candidates = _audit_enqueue_candidates(now)
+    if report_ids is not None:
+        candidates = candidates.filter(report_id__in=report_ids)
+    eligible_count = candidates.count()
+    selected_ids = list(
+        candidates.order_by("-report_dt", "-report_id").values_list("report_id", flat=True)[:limit]
+    )
+    reports_by_id = QualityReport.objects.in_bulk(selected_ids)
+    reports = [reports_by_id[pk] for pk in selected_ids if pk in reports_by_id]
     specs_by_part = _part_spec_lookup(reports)
-    snapshots = {
-        report.pk: build_quality_report_audit_input(
+    jobs: list[AiJob] = []
+    for report in reports:
+        input_payload, source_revision = build_quality_report_audit_input(
             report,
             specs_by_part=specs_by_part,
         )
-        for report in reports
-    }
-    jobs_by_report: dict[int, list[AiJob]] = defaultdict(list)
-    if reports:
-        jobs = AiJob.objects.filter(
-            job_type=AiJob.JOB_TYPE_QUALITY_IMAGE,
-            scope__mode=QUALITY_REPORT_AUDIT_MODE,
-            scope__trigger=QUALITY_REPORT_AUDIT_TRIGGER,
-            scope__report_id__in=[report.pk for report in reports],
-            scope__source_revision__in=[
-                snapshot[1] for snapshot in snapshots.values()
-            ],
-        ).order_by("-id")
-        for job in jobs:
-            scope = job.scope if isinstance(job.scope, dict) else {}
-            report_id = scope.get("report_id")
-            if type(report_id) is int:
-                jobs_by_report[report_id].append(job)
-    created_jobs: list[AiJob] = []
-    examined = 0
-    eligible_count = 0
-    for report in reports:
-        examined += 1
-        input_payload, source_revision = snapshots[report.pk]
-        existing = next((
-            job
-            for job in jobs_by_report.get(report.pk, [])
-            if isinstance(job.scope, dict)
-            and job.scope.get("source_revision") == source_revision
-        ), None)
-        if existing is not None:
-            result = (
-                existing.result_payload
-                if isinstance(existing.result_payload, dict)
-                else {}
-            )
-            retryable = (
-                existing.status == AiJob.STATUS_FAILED
-                or (
-                    existing.status == AiJob.STATUS_COMPLETED
-                    and result.get("available") is not True
-                )
-            ) and existing.updated_at <= timezone.now() - timedelta(minutes=5)
-            if not retryable:
-                continue
-        eligible_count += 1
-        if len(created_jobs) >= limit:
-            continue
-        scope = {
-            "mode": QUALITY_REPORT_AUDIT_MODE,
-            "trigger": QUALITY_REPORT_AUDIT_TRIGGER,
-            "report_id": report.pk,
-            "source_revision": source_revision,
-            "report_source_revision": input_payload["report_source_revision"],
-            "taxonomy_version": INJECTION_TERMINOLOGY_VERSION,
-            "model_id": "qwen38",
-        }
-        job = AiJob.objects.create(
+        jobs.append(AiJob(
             job_type=AiJob.JOB_TYPE_QUALITY_IMAGE,
             status=AiJob.STATUS_PENDING,
-            scope=scope,
+            scope={
+                "mode": QUALITY_REPORT_AUDIT_MODE,
+                "trigger": QUALITY_REPORT_AUDIT_TRIGGER,
+                "report_id": report.pk,
+                "source_revision": source_revision,
+                "report_source_revision": input_payload["report_source_revision"],
+                "taxonomy_version": INJECTION_TERMINOLOGY_VERSION,
+                "model_id": "qwen38",
+            },
             input_payload=input_payload,
             created_by=created_by,
-        )
-        created_jobs.append(job)
-    return {
-        "created_count": len(created_jobs),
-        "created_job_ids": [job.pk for job in created_jobs],
-        "examined_count": examined,
-        "total_report_count": total_report_count,
+        ))
+    if jobs:
+        with transaction.atomic():
+            AiJob.objects.bulk_create(jobs)
+            # bulk_create sends no post_save, so do what the signals would.
+            mark_quality_report_audit_states_dirty(report_ids=[report.pk for report in reports])
+            notify_ai_jobs_available()
+    duration_ms = (time.perf_counter() - started) * 1000
+    drained_count = refreshed_count + len(jobs)
+    result = {
+        "created_count": len(jobs),
+        "created_job_ids": [job.pk for job in jobs],
         "eligible_count": eligible_count,
-        "remaining_count": max(0, eligible_count - len(created_jobs)),
+        "remaining_count": max(0, eligible_count - len(jobs)),
+        "queue_depth": queue_depth,
+        "refreshed_count": refreshed_count,
+        "remaining_queue_depth": max(0, queue_depth - refreshed_count),
+        "duration_ms": round(duration_ms, 1),
+        "drain_rate_per_second": (
+            round(drained_count / (duration_ms / 1000), 1) if duration_ms > 0 else None
+        ),
     }
+    if queue_depth or jobs:
+        logger.info(
+            "Quality audit dirty queue: depth=%s refreshed=%s created=%s in %.1fms",
+            queue_depth, refreshed_count, len(jobs), duration_ms,
+        )
+    return result
 
 
 def _latest_jobs_by_current_revision(
@@ -672,6 +696,243 @@ def approved_quality_report_classifications(
     return overrides, revision_rows
 
 
+def quality_report_audit_contract_version() -> str:
+    """Hash of everything outside a report that shapes its persisted state."""
+
+    material = {
+        "state_schema": QUALITY_REPORT_AUDIT_STATE_SCHEMA,
+        "source": QUALITY_REPORT_AUDIT_SOURCE,
+        "taxonomy_version": INJECTION_TERMINOLOGY_VERSION,
+        "prompt_version": QUALITY_REPORT_AUDIT_PROMPT_VERSION,
+        "worker_schema_version": QUALITY_REPORT_AUDIT_WORKER_SCHEMA_VERSION,
+        "result_schema_version": QUALITY_REPORT_AUDIT_RESULT_SCHEMA_VERSION,
+    }
+    return hashlib.sha256(
+        json.dumps(material, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def _queue_search_text(row: dict[str, Any]) -> str:
+    report = row["report"]
+    values: list[Any] = [
+        report.get("part_no"), report.get("model"), report.get("section"),
+        report.get("phenomenon"), report.get("disposition"),
+        report.get("action_result"), row.get("queue_status"),
+        (row.get("part_spec") or {}).get("color_raw"),
+    ]
+    for term in row.get("deterministic_classification") or []:
+        if not isinstance(term, dict):
+            continue
+        label = term.get("label") if isinstance(term.get("label"), dict) else {}
+        values.extend([term.get("key"), *label.values()])
+        for observed in term.get("observed_terms") or []:
+            if isinstance(observed, dict):
+                observed_label = (
+                    observed.get("label")
+                    if isinstance(observed.get("label"), dict)
+                    else {}
+                )
+                values.extend([
+                    observed.get("key"),
+                    *observed_label.values(),
+                ])
+    result = row.get("result") if isinstance(row.get("result"), dict) else {}
+    qwen = (
+        result.get("qwen_classification")
+        if isinstance(result.get("qwen_classification"), dict)
+        else {}
+    )
+    for selected in qwen.get("candidate_selections") or []:
+        if isinstance(selected, dict):
+            selected_label = (
+                selected.get("label")
+                if isinstance(selected.get("label"), dict)
+                else {}
+            )
+            values.extend([
+                selected.get("key"),
+                *selected_label.values(),
+            ])
+    suggestion = (
+        result.get("product_color_suggestion")
+        if isinstance(result.get("product_color_suggestion"), dict)
+        else {}
+    )
+    suggestion_label = (
+        suggestion.get("suggested_color_label")
+        if isinstance(suggestion.get("suggested_color_label"), dict)
+        else {}
+    )
+    values.extend([
+        suggestion.get("suggested_color_key"),
+        *suggestion_label.values(),
+        *(result.get("review_reason_codes") or []),
+    ])
+    review = result.get("review") if isinstance(result.get("review"), dict) else {}
+    for category_key in review.get("category_keys") or []:
+        candidate = next((
+            candidate_row
+            for candidate_row in row.get("taxonomy_candidates") or []
+            if isinstance(candidate_row, dict)
+            and candidate_row.get("key") == category_key
+        ), None)
+        candidate_label = (
+            candidate.get("label")
+            if isinstance(candidate, dict)
+            and isinstance(candidate.get("label"), dict)
+            else {}
+        )
+        values.extend([category_key, *candidate_label.values()])
+    reviewed_color = str(review.get("product_color_key") or "")
+    reviewed_color_label = QUALITY_BODY_COLOR_LABELS.get(reviewed_color, {})
+    values.extend([reviewed_color, *reviewed_color_label.values()])
+    return " ".join(str(value or "") for value in values).casefold()
+
+
+def _queue_row(
+    input_payload: dict[str, Any],
+    source_revision: str,
+    job: AiJob | None,
+) -> dict[str, Any]:
+    result = (
+        deepcopy(job.result_payload)
+        if job is not None and isinstance(job.result_payload, dict)
+        else None
+    )
+    return {
+        "report": input_payload["report"],
+        "source_revision": source_revision,
+        "deterministic_classification": input_payload["deterministic_classification"],
+        "taxonomy_candidates": [
+            {
+                "key": candidate.get("key"),
+                "parent_key": candidate.get("parent_key"),
+                "label": deepcopy(candidate.get("label") or {}),
+            }
+            for candidate in input_payload["taxonomy_candidates"]
+            if isinstance(candidate, dict)
+        ],
+        "part_spec": input_payload["part_spec"],
+        "queue_status": _job_queue_status(job),
+        "job": ({
+            "id": job.pk,
+            "status": job.status,
+            "model_name": job.model_name,
+            "prompt_version": job.prompt_version,
+            "created_at": job.created_at.isoformat(),
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "error_message": job.error_message,
+        } if job is not None else None),
+        "result": result,
+    }
+
+
+def mark_quality_report_audit_states_dirty(
+    *,
+    report_ids: Iterable[int] = (),
+    part_nos: Iterable[str] = (),
+) -> int:
+    """Flag persisted states for recomputation on the next sync.
+
+    Reports without a state row need no mark; the sync treats them as missing.
+    """
+
+    report_ids = sorted({value for value in report_ids if type(value) is int})
+    part_nos = sorted({normalize_part_no(value) for value in part_nos} - {""})
+    now = timezone.now()
+    marked = 0
+    chunk_size = QUALITY_REPORT_AUDIT_STATE_BATCH_SIZE
+    for field, values in (("report_id__in", report_ids), ("part_no__in", part_nos)):
+        for offset in range(0, len(values), chunk_size):
+            marked += QualityReportAuditState.objects.filter(
+                **{field: values[offset:offset + chunk_size]}
+            ).update(needs_refresh=True, marked_at=now)
+    return marked
+
+
+def refresh_quality_report_audit_states(report_ids: Iterable[int]) -> int:
+    """Recompute and upsert the persisted state of the given reports."""
+
+    report_ids = sorted({value for value in report_ids if type(value) is int})
+    if not report_ids:
+        return 0
+    contract_version = quality_report_audit_contract_version()
+    refreshed = 0
+    for offset in range(0, len(report_ids), QUALITY_REPORT_AUDIT_STATE_BATCH_SIZE):
+        chunk = report_ids[offset:offset + QUALITY_REPORT_AUDIT_STATE_BATCH_SIZE]
+        started_at = timezone.now()
+        reports = list(QualityReport.objects.filter(pk__in=chunk))
+        if not reports:
+            continue
+        snapshots, current_jobs = _latest_jobs_by_current_revision(
+            reports,
+            _part_spec_lookup(reports),
+        )
+        states = []
+        for report in reports:
+            input_payload, source_revision = snapshots[report.pk]
+            job = current_jobs.get(report.pk)
+            row = _queue_row(input_payload, source_revision, job)
+            states.append(QualityReportAuditState(
+                report_id=report.pk,
+                report_dt=report.report_dt,
+                part_no=input_payload["report"]["part_no"],
+                source_revision=source_revision,
+                report_source_revision=input_payload["report_source_revision"],
+                contract_version=contract_version,
+                latest_job_id=job.pk if job is not None else None,
+                queue_status=row["queue_status"],
+                has_images=bool(input_payload["report"]["image_refs"]),
+                search_text=_queue_search_text(row),
+                needs_refresh=False,
+                refreshed_at=started_at,
+            ))
+        QualityReportAuditState.objects.bulk_create(
+            states,
+            update_conflicts=True,
+            unique_fields=["report"],
+            update_fields=[
+                "report_dt", "part_no", "source_revision", "report_source_revision",
+                "contract_version", "latest_job", "queue_status", "has_images",
+                "search_text", "needs_refresh", "refreshed_at",
+            ],
+        )
+        # A write that landed while this chunk was being read keeps its mark.
+        QualityReportAuditState.objects.filter(
+            report_id__in=[state.report_id for state in states],
+            marked_at__gte=started_at,
+        ).update(needs_refresh=True)
+        refreshed += len(states)
+    return refreshed
+
+
+def sync_quality_report_audit_states(
+    *,
+    limit: int | None = QUALITY_REPORT_AUDIT_STATE_SYNC_LIMIT,
+    report_ids: Iterable[int] | None = None,
+) -> int:
+    """Refresh missing, marked and outdated-contract states, newest first."""
+
+    contract_version = quality_report_audit_contract_version()
+    missing = QualityReport.objects.filter(audit_state__isnull=True)
+    outdated = QualityReportAuditState.objects.filter(
+        Q(needs_refresh=True) | ~Q(contract_version=contract_version)
+    )
+    if report_ids is not None:
+        report_ids = [value for value in report_ids if type(value) is int]
+        missing = missing.filter(pk__in=report_ids)
+        outdated = outdated.filter(report_id__in=report_ids)
+    missing_ids = missing.order_by("-report_dt", "-id").values_list("pk", flat=True)
+    outdated_ids = outdated.order_by("-report_dt", "-report_id").values_list("report_id", flat=True)
+    if limit is not None:
+        missing_ids = missing_ids[:limit]
+        outdated_ids = outdated_ids[:limit]
+    stale_ids = list(dict.fromkeys([*missing_ids, *outdated_ids]))
+    if limit is not None:
+        stale_ids = stale_ids[:limit]
+    return refresh_quality_report_audit_states(stale_ids)
+
+
 def quality_report_audit_queue(
     *,
     page: int = 1,
@@ -682,154 +943,75 @@ def quality_report_audit_queue(
 ) -> dict[str, Any]:
     page = max(1, int(page or 1))
     page_size = max(1, min(int(page_size or 20), QUALITY_REPORT_AUDIT_MAX_PAGE_SIZE))
-    queryset = QualityReport.objects.order_by("-report_dt", "-id")
+    states = QualityReportAuditState.objects.all()
     if report_id is not None:
-        queryset = queryset.filter(pk=report_id)
-    reports = list(queryset)
-    specs_by_part = _part_spec_lookup(reports)
-    snapshots, current_jobs = _latest_jobs_by_current_revision(reports, specs_by_part)
-    consensus = _exact_part_consensus(current_jobs)
+        # A single-report lookup may refresh that one row; the backlog is
+        # drained by the sync_quality_report_audit_states cron, never here.
+        sync_quality_report_audit_states(report_ids=[report_id])
+        states = states.filter(report_id=report_id)
+
+    stats: dict[str, int] = {}
+    for row in states.order_by().values("queue_status").annotate(count=Count("pk")):
+        stats[row["queue_status"]] = row["count"]
+    if stats:
+        stats["total"] = sum(stats.values())
+        with_images = states.filter(has_images=True).count()
+        if with_images:
+            stats["with_images"] = with_images
+
+    filtered = states
+    if status_filter == "attention":
+        filtered = filtered.exclude(queue_status__in=["matched", "reviewed"])
+    elif status_filter not in {"", "all"}:
+        filtered = filtered.filter(queue_status=status_filter)
     search_value = str(search or "").strip().casefold()
+    if search_value:
+        filtered = filtered.filter(search_text__contains=search_value)
+    total_filtered = filtered.count()
+    start = (page - 1) * page_size
+    end = start + page_size
+    page_ids = list(
+        filtered.order_by("-report_dt", "-report_id").values_list("report_id", flat=True)[start:end]
+    )
 
-    def matches_search(row: dict[str, Any]) -> bool:
-        if not search_value:
-            return True
-        report = row["report"]
-        values: list[Any] = [
-            report.get("part_no"), report.get("model"), report.get("section"),
-            report.get("phenomenon"), report.get("disposition"),
-            report.get("action_result"), row.get("queue_status"),
-            (row.get("part_spec") or {}).get("color_raw"),
-        ]
-        for term in row.get("deterministic_classification") or []:
-            if not isinstance(term, dict):
-                continue
-            label = term.get("label") if isinstance(term.get("label"), dict) else {}
-            values.extend([term.get("key"), *label.values()])
-            for observed in term.get("observed_terms") or []:
-                if isinstance(observed, dict):
-                    observed_label = (
-                        observed.get("label")
-                        if isinstance(observed.get("label"), dict)
-                        else {}
-                    )
-                    values.extend([
-                        observed.get("key"),
-                        *observed_label.values(),
-                    ])
-        result = row.get("result") if isinstance(row.get("result"), dict) else {}
-        qwen = (
-            result.get("qwen_classification")
-            if isinstance(result.get("qwen_classification"), dict)
-            else {}
-        )
-        for selected in qwen.get("candidate_selections") or []:
-            if isinstance(selected, dict):
-                selected_label = (
-                    selected.get("label")
-                    if isinstance(selected.get("label"), dict)
-                    else {}
-                )
-                values.extend([
-                    selected.get("key"),
-                    *selected_label.values(),
-                ])
-        suggestion = (
-            result.get("product_color_suggestion")
-            if isinstance(result.get("product_color_suggestion"), dict)
-            else {}
-        )
-        suggestion_label = (
-            suggestion.get("suggested_color_label")
-            if isinstance(suggestion.get("suggested_color_label"), dict)
-            else {}
-        )
-        values.extend([
-            suggestion.get("suggested_color_key"),
-            *suggestion_label.values(),
-            *(result.get("review_reason_codes") or []),
-        ])
-        review = result.get("review") if isinstance(result.get("review"), dict) else {}
-        for category_key in review.get("category_keys") or []:
-            candidate = next((
-                candidate_row
-                for candidate_row in row.get("taxonomy_candidates") or []
-                if isinstance(candidate_row, dict)
-                and candidate_row.get("key") == category_key
-            ), None)
-            candidate_label = (
-                candidate.get("label")
-                if isinstance(candidate, dict)
-                and isinstance(candidate.get("label"), dict)
-                else {}
-            )
-            values.extend([category_key, *candidate_label.values()])
-        reviewed_color = str(review.get("product_color_key") or "")
-        reviewed_color_label = QUALITY_BODY_COLOR_LABELS.get(reviewed_color, {})
-        values.extend([reviewed_color, *reviewed_color_label.values()])
-        return search_value in " ".join(str(value or "") for value in values).casefold()
+    reports_by_id = QualityReport.objects.in_bulk(page_ids)
+    reports = [reports_by_id[pk] for pk in page_ids if pk in reports_by_id]
+    snapshots, current_jobs = _latest_jobs_by_current_revision(
+        reports,
+        _part_spec_lookup(reports),
+    )
+    page_part_nos = {
+        snapshots[report.pk][0]["report"]["part_no"] for report in reports
+    } - {""}
+    consensus_job_ids = dict(
+        QualityReportAuditState.objects.filter(
+            part_no__in=page_part_nos,
+            latest_job__isnull=False,
+        ).values_list("report_id", "latest_job_id")
+    )
+    consensus_jobs = AiJob.objects.in_bulk(set(consensus_job_ids.values()))
+    consensus = _exact_part_consensus({
+        state_report_id: consensus_jobs[job_id]
+        for state_report_id, job_id in consensus_job_ids.items()
+        if job_id in consensus_jobs
+    })
 
-    stats = Counter()
     rows: list[dict[str, Any]] = []
     for report in reports:
         input_payload, source_revision = snapshots[report.pk]
-        job = current_jobs.get(report.pk)
-        queue_status = _job_queue_status(job)
-        stats[queue_status] += 1
-        stats["total"] += 1
-        if input_payload["report"]["image_refs"]:
-            stats["with_images"] += 1
-        if status_filter == "attention" and queue_status in {"matched", "reviewed"}:
-            continue
-        if status_filter not in {"", "all", "attention"} and queue_status != status_filter:
-            continue
-        result = (
-            deepcopy(job.result_payload)
-            if job is not None and isinstance(job.result_payload, dict)
-            else None
+        row = _queue_row(input_payload, source_revision, current_jobs.get(report.pk))
+        row["exact_part_consensus"] = consensus.get(
+            normalize_part_no(input_payload["report"]["part_no"])
         )
-        row = {
-            "report": input_payload["report"],
-            "source_revision": source_revision,
-            "deterministic_classification": input_payload["deterministic_classification"],
-            "taxonomy_candidates": [
-                {
-                    "key": candidate.get("key"),
-                    "parent_key": candidate.get("parent_key"),
-                    "label": deepcopy(candidate.get("label") or {}),
-                }
-                for candidate in input_payload["taxonomy_candidates"]
-                if isinstance(candidate, dict)
-            ],
-            "part_spec": input_payload["part_spec"],
-            "queue_status": queue_status,
-            "job": ({
-                "id": job.pk,
-                "status": job.status,
-                "model_name": job.model_name,
-                "prompt_version": job.prompt_version,
-                "created_at": job.created_at.isoformat(),
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "error_message": job.error_message,
-            } if job is not None else None),
-            "result": result,
-            "exact_part_consensus": consensus.get(
-                normalize_part_no(input_payload["report"]["part_no"])
-            ),
-        }
-        if matches_search(row):
-            rows.append(row)
-    total_filtered = len(rows)
-    start = (page - 1) * page_size
-    end = start + page_size
+        rows.append(row)
     return {
         "count": total_filtered,
         "page": page,
         "page_size": page_size,
         "next_page": page + 1 if end < total_filtered else None,
         "previous_page": page - 1 if page > 1 else None,
-        "stats": dict(stats),
-        "results": rows[start:end],
+        "stats": stats,
+        "results": rows,
         "taxonomy_version": INJECTION_TERMINOLOGY_VERSION,
         "color_match_policy": "normalized_full_part_no_only",
     }
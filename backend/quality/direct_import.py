@@ -23,7 +23,7 @@ from .excel_import import (
     MAX_UPLOAD_BYTES,
     ParsedWorkbook,
     WorkbookValidationError,
-    parse_quality_workbook,
+    parse_quality_workbook_in_pool,
     validate_upload_metadata,
 )
 from .duplicate_detection import normalize_identifier, normalize_text
@@ -512,8 +512,7 @@ def _parse_upload(upload, *, filename: str) -> tuple[ParsedWorkbook, str, int]:
                 source.write(block)
             validate_upload_metadata(filename, content_type, size)
             source_sha256 = digest.hexdigest()
-            source.seek(0)
-            parsed = parse_quality_workbook(
+            parsed = parse_quality_workbook_in_pool(
                 source,
                 workbook_sha256=source_sha256,
                 uploaded_on=datetime.now(REPORT_TIMEZONE).date(),
@@ -19,6 +19,7 @@ import threading
 import time as monotonic_time
 import uuid
 import warnings as python_warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -35,6 +36,15 @@ from django.utils import timezone
 from openpyxl import load_workbook
 from PIL import Image as PillowImage, ImageOps
 
+from config.parse_pool import ParseJobError, run_parse_job
+
+from .import_spool import (
+    SpoolError,
+    cleanup_orphaned_spool_files,
+    read_spooled_bytes,
+    spooled_file_exists,
+    write_spooled_bytes,
+)
 from .models import (
     QualityImportAsset,
     QualityImportBatch,
@@ -81,6 +91,10 @@ class WorkbookValidationError(ValueError):
         self.code = code
         self.message = message
 
+    def __reduce__(self):
+        # Parse-pool children send these back to the web process pickled.
+        return type(self), (self.code, self.message)
+
 
 @dataclass
 class ParsedWorkbook:
@@ -1360,15 +1374,24 @@ def _asset_item(asset: QualityImportAsset) -> dict[str, Any]:
 #
 # Only normalized image bytes enter durable staging; XLSX bytes exist solely in
 # an anonymous temporary file owned by the request and are closed before 202.
+# Staged bytes live in the content-addressed local spool; asset rows keep only
+# the SHA-256 and the spool path.
 # ---------------------------------------------------------------------------
 
 ASSET_LEASE_SECONDS = 5 * 60
 REMOTE_VERIFICATION_TTL = timedelta(days=30)
 PUMP_IDLE_GRACE_SECONDS = 0.25
+DEFAULT_UPLOAD_CONCURRENCY = 4
+MAX_UPLOAD_CONCURRENCY = 16
+UPLOAD_RETRY_ATTEMPTS = 3
+UPLOAD_RETRY_BACKOFF_SECONDS = 0.5
+RETRYABLE_UPLOAD_CODES = {'stored_asset_unavailable'}
+SPOOL_CLEANUP_INTERVAL_SECONDS = 60 * 60
 _PUMP_GUARD = threading.Lock()
 _PUMP_WAKE = threading.Event()
 _PUMP_THREAD: threading.Thread | None = None
 _STAGING_ADVISORY_LOCK = 0x57514C49  # "WQLI"
+_LAST_SPOOL_CLEANUP_AT = 0.0
 
 
 def _metadata_matches(asset: QualityImportAsset, item: dict[str, Any]) -> bool:
@@ -1389,15 +1412,88 @@ def _lock_staging_capacity() -> None:
             cursor.execute('SELECT pg_advisory_xact_lock(%s)', [_STAGING_ADVISORY_LOCK])
 
 
+def _staged_content_filter(prefix: str = '') -> models.Q:
+    return (
+        models.Q(**{f'{prefix}staged_bytes__isnull': False})
+        | ~models.Q(**{f'{prefix}spool_path': ''})
+    )
+
+
 def _pending_staged_bytes() -> int:
     return int(
-        QualityImportAsset.objects.filter(staged_bytes__isnull=False).aggregate(
+        QualityImportAsset.objects.filter(_staged_content_filter()).aggregate(
             total=models.Sum('byte_size')
         )['total']
         or 0
     )
 
 
+def _has_staged_content(asset: QualityImportAsset) -> bool:
+    return asset.staged_bytes is not None or bool(asset.spool_path)
+
+
+def _stage_asset_content(asset: QualityImportAsset, item: dict[str, Any]) -> None:
+    """Spool normalized bytes and point the (unsaved) asset row at them."""
+
+    try:
+        asset.spool_path = write_spooled_bytes(item['sha256'], item['content'])
+    except OSError as exc:
+        raise WorkbookValidationError(
+            'staging_spool_unavailable',
+            'Normalized images could not be written to the local staging spool.',
+        ) from exc
+    asset.staged_bytes = None
+
+
+def _read_staged_content(asset: QualityImportAsset) -> bytes:
+    if asset.spool_path:
+        if not spooled_file_exists(asset.spool_path):
+            raise WorkbookValidationError(
+                'normalized_checkpoint_incomplete',
+                'A pending image is missing from the local staging spool.',
+            )
+        try:
+            return read_spooled_bytes(
+                asset.spool_path,
+                sha256=asset.sha256,
+                byte_size=asset.byte_size,
+            )
+        except SpoolError as exc:
+            raise WorkbookValidationError(
+                'staged_asset_mismatch',
+                'Normalized staging bytes failed their content-address checksum.',
+            ) from exc
+    if asset.staged_bytes is not None:
+        # Rows staged before the spool existed drain from the legacy column.
+        return bytes(asset.staged_bytes)
+    raise WorkbookValidationError(
+        'normalized_checkpoint_incomplete',
+        'A pending image has no normalized staging bytes.',
+    )
+
+
+def cleanup_quality_import_spool(*, min_age_seconds: float | None = None) -> dict[str, int]:
+    """Remove spool files that no asset references, e.g. after READY or rollback."""
+
+    referenced = set(
+        QualityImportAsset.objects.exclude(spool_path='').values_list('spool_path', flat=True)
+    )
+    if min_age_seconds is None:
+        return cleanup_orphaned_spool_files(referenced)
+    return cleanup_orphaned_spool_files(referenced, min_age_seconds=min_age_seconds)
+
+
+def _upload_concurrency() -> int:
+    configured = getattr(settings, 'QUALITY_IMPORT_UPLOAD_CONCURRENCY', None)
+    if configured is None:
+        configured = os.getenv('QUALITY_IMPORT_UPLOAD_CONCURRENCY', '')
+    try:
+        value = int(configured)
+    except (TypeError, ValueError):
+        value = DEFAULT_UPLOAD_CONCURRENCY
+    return min(MAX_UPLOAD_CONCURRENCY, max(1, value))
+
+
 def _latest_baseline_rows(
     *,
     dataset_key: str,
@@ -1585,12 +1681,12 @@ def _persist_parsed_workbook(
                             and asset.remote_verified_at >= verification_cutoff
                         )
                         if not reusable_unchanged_asset and not active_upload:
-                            if asset.staged_bytes is None:
+                            if not _has_staged_content(asset):
                                 staged_bytes_added += item['byte_size']
                                 if staged_bytes_before + staged_bytes_added > MAX_STAGED_MEDIA_BYTES:
                                     raise WorkbookValidationError(
                                         'staging_capacity_exceeded',
-                                        'Pending normalized images exceed the temporary database staging limit.',
+                                        'Pending normalized images exceed the temporary staging limit.',
                                     )
                             # ADDED/CHANGED evidence and any stale or incomplete
                             # unchanged checkpoint must be verified by the pump.
@@ -1603,7 +1699,7 @@ def _persist_parsed_workbook(
                             asset.height = item['height']
                             asset.extension = item['extension']
                             asset.storage_key = item['storage_key']
-                            asset.staged_bytes = content
+                            _stage_asset_content(asset, item)
                             asset.upload_state = QualityImportAsset.UploadState.STAGED
                             asset.processing_owner = ''
                             asset.lease_expires_at = None
@@ -1612,7 +1708,7 @@ def _persist_parsed_workbook(
                             asset.save(update_fields=[
                                 'normalizer_version', 'byte_size', 'content_type',
                                 'width', 'height', 'extension', 'storage_key',
-                                'staged_bytes', 'upload_state', 'processing_owner',
+                                'staged_bytes', 'spool_path', 'upload_state', 'processing_owner',
                                 'lease_expires_at', 'next_attempt_at', 'last_error',
                             ])
                     else:
@@ -1620,9 +1716,9 @@ def _persist_parsed_workbook(
                         if staged_bytes_before + staged_bytes_added > MAX_STAGED_MEDIA_BYTES:
                             raise WorkbookValidationError(
                                 'staging_capacity_exceeded',
-                                'Pending normalized images exceed the temporary database staging limit.',
+                                'Pending normalized images exceed the temporary staging limit.',
                             )
-                        asset = QualityImportAsset.objects.create(
+                        asset = QualityImportAsset(
                             sha256=item['sha256'],
                             normalizer_version=NORMALIZER_VERSION,
                             byte_size=item['byte_size'],
@@ -1632,10 +1728,11 @@ def _persist_parsed_workbook(
                             extension=item['extension'],
                             storage_key=item['storage_key'],
                             file='',
-                            staged_bytes=content,
                             upload_state=QualityImportAsset.UploadState.STAGED,
                             created_by_batch=batch,
                         )
+                        _stage_asset_content(asset, item)
+                        asset.save()
                         new_asset_shas.add(item['sha256'])
                     staged_asset_cache[item['sha256']] = asset
                 if item['sha256'] not in new_asset_shas:
@@ -1716,6 +1813,19 @@ def _persist_parsed_workbook(
         return batch, False
 
 
+def parse_quality_workbook_in_pool(source: BinaryIO, *, owner=None, **kwargs) -> ParsedWorkbook:
+    """``parse_quality_workbook`` in the upload parse pool (``config.parse_pool``).
+
+    openpyxl and Pillow hold the GIL for the whole parse; the pool keeps that
+    off the request worker.  Pool failures surface as validation errors.
+    """
+
+    try:
+        return run_parse_job('quality.excel_import.parse_quality_workbook', source, owner=owner, **kwargs)
+    except ParseJobError as exc:
+        raise WorkbookValidationError(exc.code, exc.message) from exc
+
+
 def ingest_quality_workbook(
     upload,
     *,
@@ -1759,9 +1869,9 @@ def ingest_quality_workbook(
             if existing:
                 return existing, True
             source.flush()
-            source.seek(0)
-            parsed = parse_quality_workbook(
+            parsed = parse_quality_workbook_in_pool(
                 source,
+                owner=uploaded_by,
                 workbook_sha256=source_sha256,
                 uploaded_on=timezone.localdate(),
                 import_scope=import_scope,
@@ -1888,12 +1998,14 @@ def _renew_upload_lease(batch_id: int, owner: str, *, done: int, total: int) ->
         raise WorkbookValidationError('processing_lease_lost', 'The media upload lease was lost.')
 
 
-def _upload_staged_asset(asset_id: int, *, owner: str) -> QualityImportAsset:
+def _lease_staged_asset(asset_id: int, *, owner: str) -> QualityImportAsset:
+    """Mark one pending asset UPLOADING for ``owner``; READY assets pass through."""
+
     with transaction.atomic():
         asset = QualityImportAsset.objects.select_for_update().get(pk=asset_id)
         if asset.upload_state == QualityImportAsset.UploadState.READY:
             return asset
-        if asset.staged_bytes is None:
+        if not _has_staged_content(asset):
             raise WorkbookValidationError(
                 'normalized_checkpoint_incomplete',
                 'A pending image has no normalized staging bytes.',
@@ -1913,41 +2025,76 @@ def _upload_staged_asset(asset_id: int, *, owner: str) -> QualityImportAsset:
         asset.attempt_count += 1
         asset.next_attempt_at = None
         asset.last_error = ''
-        content = bytes(asset.staged_bytes)
-        item = _asset_item(asset)
-        requested_name = asset.storage_key
         asset.save(update_fields=[
             'upload_state', 'processing_owner', 'lease_expires_at',
             'attempt_count', 'next_attempt_at', 'last_error',
         ])
+    return asset
 
+
+def _store_staged_asset(asset: QualityImportAsset) -> str:
+    """Upload one leased asset and return its verified storage name.
+
+    This runs on uploader threads and must not touch the database.  The
+    content-addressed storage key makes it idempotent: an object that already
+    verifies remotely is reused instead of uploaded again.
+    """
+
+    content = _read_staged_content(asset)
     if sha256_bytes(content) != asset.sha256 or len(content) != asset.byte_size:
         raise WorkbookValidationError(
             'staged_asset_mismatch',
             'Normalized staging bytes failed their content-address checksum.',
         )
+    item = _asset_item(asset)
+    requested_name = asset.storage_key
     storage = QualityImportAsset._meta.get_field('file').storage
     existing_name = asset.file.name if asset.file and asset.file.name else ''
     if _verify_stored_asset(storage, existing_name, item):
-        saved_name = existing_name
-    elif requested_name != existing_name and _verify_stored_asset(storage, requested_name, item):
-        saved_name = requested_name
-    else:
-        saved_name = storage.save(requested_name, ContentFile(content))
-        if not _verify_stored_asset(storage, saved_name, item):
-            raise WorkbookValidationError(
-                'stored_asset_unavailable',
-                'A normalized image could not be verified in durable storage.',
-            )
+        return existing_name
+    if requested_name != existing_name and _verify_stored_asset(storage, requested_name, item):
+        return requested_name
+    saved_name = storage.save(requested_name, ContentFile(content))
+    if not _verify_stored_asset(storage, saved_name, item):
+        raise WorkbookValidationError(
+            'stored_asset_unavailable',
+            'A normalized image could not be verified in durable storage.',
+        )
+    return saved_name
+
+
+def _store_staged_asset_with_retry(asset: QualityImportAsset) -> str:
+    for attempt in range(1, UPLOAD_RETRY_ATTEMPTS + 1):
+        try:
+            return _store_staged_asset(asset)
+        except WorkbookValidationError as exc:
+            if exc.code not in RETRYABLE_UPLOAD_CODES or attempt >= UPLOAD_RETRY_ATTEMPTS:
+                raise
+        except Exception:
+            if attempt >= UPLOAD_RETRY_ATTEMPTS:
+                raise
+        LOGGER.warning(
+            'Quality import asset %s upload attempt %s failed; retrying',
+            asset.pk,
+            attempt,
+        )
+        monotonic_time.sleep(UPLOAD_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+    raise AssertionError('unreachable')
 
+
+def _checkpoint_uploaded_asset(asset_id: int, *, owner: str, saved_name: str) -> QualityImportAsset:
     with transaction.atomic():
         asset = QualityImportAsset.objects.select_for_update().get(pk=asset_id)
         if asset.upload_state == QualityImportAsset.UploadState.READY:
             return asset
         if asset.processing_owner != owner:
             raise WorkbookValidationError('asset_lease_lost', 'The image upload lease was lost.')
+        # The spool file itself is left for cleanup_quality_import_spool(): a
+        # concurrent intake may re-stage this SHA before the file could be
+        # unlinked safely.
         asset.file = saved_name
         asset.staged_bytes = None
+        asset.spool_path = ''
         asset.upload_state = QualityImportAsset.UploadState.READY
         asset.processing_owner = ''
         asset.lease_expires_at = None
@@ -1955,12 +2102,90 @@ def _upload_staged_asset(asset_id: int, *, owner: str) -> QualityImportAsset:
         asset.last_error = ''
         asset.remote_verified_at = timezone.now()
         asset.save(update_fields=[
-            'file', 'staged_bytes', 'upload_state', 'processing_owner',
+            'file', 'staged_bytes', 'spool_path', 'upload_state', 'processing_owner',
             'lease_expires_at', 'next_attempt_at', 'last_error', 'remote_verified_at',
         ])
     return asset
 
 
+def _upload_staged_asset(asset_id: int, *, owner: str) -> QualityImportAsset:
+    asset = _lease_staged_asset(asset_id, owner=owner)
+    if asset.upload_state == QualityImportAsset.UploadState.READY:
+        return asset
+    saved_name = _store_staged_asset_with_retry(asset)
+    return _checkpoint_uploaded_asset(asset_id, owner=owner, saved_name=saved_name)
+
+
+def _upload_batch_assets(
+    batch_id: int,
+    owner: str,
+    asset_ids: list[int],
+    *,
+    ready_before: int,
+    total: int,
+    should_stop=None,
+) -> dict[str, float]:
+    """Upload assets with bounded concurrency; DB work stays on this thread.
+
+    Leases and checkpoints are short transactions issued here, so commit
+    throughput no longer follows per-image upload latency.  After a failure
+    the in-flight uploads are drained and checkpointed before re-raising, so a
+    retry only repeats the images that did not reach storage.
+    """
+
+    concurrency = _upload_concurrency()
+    done = ready_before
+    pending = iter(asset_ids)
+    in_flight = {}
+    failure: BaseException | None = None
+    checkpoint_seconds = 0.0
+    max_checkpoint_seconds = 0.0
+    started_at = monotonic_time.monotonic()
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix='quality-import-upload',
+    ) as executor:
+        while True:
+            while failure is None and len(in_flight) < concurrency:
+                if should_stop and should_stop():
+                    failure = QualityImportStop('Processing stop requested.')
+                    break
+                asset_id = next(pending, None)
+                if asset_id is None:
+                    break
+                asset = _lease_staged_asset(asset_id, owner=owner)
+                if asset.upload_state == QualityImportAsset.UploadState.READY:
+                    done += 1
+                    _renew_upload_lease(batch_id, owner, done=done, total=total)
+                    continue
+                in_flight[executor.submit(_store_staged_asset_with_retry, asset)] = asset_id
+            if not in_flight:
+                break
+            completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in completed:
+                asset_id = in_flight.pop(future)
+                try:
+                    saved_name = future.result()
+                except Exception as exc:
+                    failure = failure or exc
+                    continue
+                checkpoint_started_at = monotonic_time.monotonic()
+                _checkpoint_uploaded_asset(asset_id, owner=owner, saved_name=saved_name)
+                elapsed = monotonic_time.monotonic() - checkpoint_started_at
+                checkpoint_seconds += elapsed
+                max_checkpoint_seconds = max(max_checkpoint_seconds, elapsed)
+                done += 1
+                _renew_upload_lease(batch_id, owner, done=done, total=total)
+    if failure is not None:
+        raise failure
+    return {
+        'concurrency': concurrency,
+        'upload_seconds': monotonic_time.monotonic() - started_at,
+        'checkpoint_seconds': checkpoint_seconds,
+        'max_checkpoint_seconds': max_checkpoint_seconds,
+    }
+
+
 def _finish_batch(batch_id: int, owner: str) -> QualityImportBatch:
     with transaction.atomic():
         batch = QualityImportBatch.objects.select_for_update().get(pk=batch_id)
@@ -2074,11 +2299,14 @@ def process_quality_import_batch(batch_id: int | None = None, *, should_stop=Non
         total = batch.media.filter(asset__isnull=False).values('asset_id').distinct().count()
         ready_before = max(0, total - len(asset_ids))
         _renew_upload_lease(batch.id, owner, done=ready_before, total=total)
-        for offset, asset_id in enumerate(asset_ids, start=1):
-            if should_stop and should_stop():
-                raise QualityImportStop('Processing stop requested.')
-            _upload_staged_asset(asset_id, owner=owner)
-            _renew_upload_lease(batch.id, owner, done=ready_before + offset, total=total)
+        upload_stats = _upload_batch_assets(
+            batch.id,
+            owner,
+            asset_ids,
+            ready_before=ready_before,
+            total=total,
+            should_stop=should_stop,
+        )
         # Incremental direct-import jobs reuse this durable asset queue, then
         # create reports only after every image reached remote storage. Import
         # lazily to keep the workbook parser dependency one-directional.
@@ -2086,12 +2314,18 @@ def process_quality_import_batch(batch_id: int | None = None, *, should_stop=Non
             finalize_quality_import_job(batch.id, owner)
         result = _finish_batch(batch.id, owner)
         LOGGER.info(
-            'Quality import batch %s completed status=%s rows=%s media=%s elapsed_seconds=%.3f max_rss=%s',
+            'Quality import batch %s completed status=%s rows=%s media=%s elapsed_seconds=%.3f '
+            'upload_concurrency=%s upload_seconds=%.3f checkpoint_seconds=%.3f '
+            'max_checkpoint_seconds=%.3f max_rss=%s',
             result.pk,
             result.status,
             result.total_rows,
             result.total_media,
             monotonic_time.monotonic() - started_at,
+            upload_stats['concurrency'],
+            upload_stats['upload_seconds'],
+            upload_stats['checkpoint_seconds'],
+            upload_stats['max_checkpoint_seconds'],
             resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
         )
         return result
@@ -2116,9 +2350,9 @@ def retry_quality_import_batch(batch: QualityImportBatch) -> QualityImportBatch:
         if batch.status != QualityImportBatch.Status.FAILED:
             return batch
         QualityImportAsset.objects.filter(
+            _staged_content_filter(),
             attachments__batch=batch,
             upload_state=QualityImportAsset.UploadState.FAILED,
-            staged_bytes__isnull=False,
         ).update(
             upload_state=QualityImportAsset.UploadState.STAGED,
             processing_owner='',
@@ -2129,6 +2363,7 @@ def retry_quality_import_batch(batch: QualityImportBatch) -> QualityImportBatch:
         if batch.media.filter(
             asset__upload_state=QualityImportAsset.UploadState.FAILED,
             asset__staged_bytes__isnull=True,
+            asset__spool_path='',
         ).exists():
             raise WorkbookValidationError(
                 'source_reupload_required',
@@ -2158,6 +2393,20 @@ def _seconds_until_next_queued_batch() -> float | None:
     return max(0.0, (next_attempt - timezone.now()).total_seconds())
 
 
+def _maybe_cleanup_spool() -> None:
+    global _LAST_SPOOL_CLEANUP_AT
+    now = monotonic_time.monotonic()
+    if _LAST_SPOOL_CLEANUP_AT and now - _LAST_SPOOL_CLEANUP_AT < SPOOL_CLEANUP_INTERVAL_SECONDS:
+        return
+    _LAST_SPOOL_CLEANUP_AT = now
+    try:
+        cleanup_quality_import_spool()
+    except Exception:
+        LOGGER.exception('Quality import spool cleanup failed')
+    finally:
+        close_old_connections()
+
+
 def _pump_main() -> None:
     global _PUMP_THREAD
     close_old_connections()
@@ -2180,6 +2429,7 @@ def _pump_main() -> None:
                 continue
             if _PUMP_WAKE.wait(PUMP_IDLE_GRACE_SECONDS):
                 continue
+            _maybe_cleanup_spool()
             with _PUMP_GUARD:
                 if _PUMP_WAKE.is_set():
                     continue
@@ -0,0 +1,162 @@
+"""Content-addressed local spool for normalized quality-import images.
+
+Staged image bytes used to live in ``QualityImportAsset.staged_bytes``, which
+put every pending picture into PostgreSQL WAL and backups.  The spool keeps
+those bytes on local disk under ``<root>/<sha[:2]>/<sha[2:4]>/<sha>`` and the
+asset row stores only the SHA-256 and the relative spool path.
+
+Deployments must point ``QUALITY_IMPORT_SPOOL_ROOT`` at a disk that survives
+restarts (render.yaml mounts one); outside ``DEBUG`` staging refuses to run
+without it rather than fall back to the temporary directory, where a deploy
+between staging and upload would lose the bytes.  A missing spool file is treated exactly like missing staged bytes:
+the pump fails closed and the workbook has to be uploaded again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+import uuid
+from pathlib import Path, PurePath
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+SPOOL_DIRECTORY_NAME = 'wj-quality-import-spool'
+ORPHAN_MIN_AGE_SECONDS = 6 * 60 * 60
+_SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class SpoolError(OSError):
+    """Raised when spooled bytes are missing or fail their content address."""
+
+
+def spool_root() -> Path:
+    configured = getattr(settings, 'QUALITY_IMPORT_SPOOL_ROOT', None)
+    if configured:
+        return Path(configured)
+    if settings.DEBUG:
+        return Path(tempfile.gettempdir()) / SPOOL_DIRECTORY_NAME
+    raise ImproperlyConfigured(
+        'QUALITY_IMPORT_SPOOL_ROOT must point at a persistent disk; staged quality-import '
+        'images would otherwise be lost on the next deploy or restart.'
+    )
+
+
+def spool_relative_path(sha256: str) -> str:
+    if not _SHA256_PATTERN.match(sha256 or ''):
+        raise SpoolError(f'Invalid spool content address: {sha256!r}')
+    return f'{sha256[:2]}/{sha256[2:4]}/{sha256}'
+
+
+def _absolute_path(relative_path: str) -> Path:
+    sha256 = PurePath(relative_path).name
+    if spool_relative_path(sha256) != relative_path:
+        raise SpoolError(f'Spool path is not content-addressed: {relative_path!r}')
+    return spool_root() / relative_path
+
+
+def write_spooled_bytes(sha256: str, content: bytes) -> str:
+    """Store ``content`` once under its SHA-256 and return the relative path.
+
+    Writing is idempotent: an existing file with the same address is kept when
+    it still verifies, otherwise it is replaced atomically.
+    """
+
+    content = bytes(content)
+    if hashlib.sha256(content).hexdigest() != sha256:
+        raise SpoolError('Spooled bytes do not match their content address.')
+    relative_path = spool_relative_path(sha256)
+    target = spool_root() / relative_path
+    if target.exists():
+        try:
+            read_spooled_bytes(relative_path, sha256=sha256, byte_size=len(content))
+            # Refresh the mtime so orphan cleanup treats a re-staged file as new.
+            os.utime(target)
+            return relative_path
+        except SpoolError:
+            pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(f'.{target.name}.{uuid.uuid4().hex}.partial')
+    try:
+        with open(partial, 'wb') as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(partial, target)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    return relative_path
+
+
+def read_spooled_bytes(relative_path: str, *, sha256: str, byte_size: int | None = None) -> bytes:
+    try:
+        content = _absolute_path(relative_path).read_bytes()
+    except FileNotFoundError as exc:
+        raise SpoolError(f'Spooled image is missing: {relative_path}') from exc
+    if byte_size is not None and len(content) != byte_size:
+        raise SpoolError(f'Spooled image has an unexpected byte length: {relative_path}')
+    if hashlib.sha256(content).hexdigest() != sha256:
+        raise SpoolError(f'Spooled image failed its content-address checksum: {relative_path}')
+    return content
+
+
+def spooled_file_exists(relative_path: str) -> bool:
+    if not relative_path:
+        return False
+    try:
+        return _absolute_path(relative_path).is_file()
+    except SpoolError:
+        return False
+
+
+def discard_spooled_bytes(relative_path: str) -> bool:
+    if not relative_path:
+        return False
+    try:
+        _absolute_path(relative_path).unlink()
+    except (FileNotFoundError, SpoolError):
+        return False
+    return True
+
+
+def cleanup_orphaned_spool_files(
+    referenced_paths: set[str],
+    *,
+    min_age_seconds: float = ORPHAN_MIN_AGE_SECONDS,
+) -> dict[str, int]:
+    """Delete spool files that no asset row references any more.
+
+    Young files are kept because a staging transaction may have written them
+    and not committed its asset row yet.
+    """
+
+    root = spool_root()
+    cutoff = time.time() - max(0.0, float(min_age_seconds))
+    removed = 0
+    removed_bytes = 0
+    kept = 0
+    if not root.is_dir():
+        return {'removed': 0, 'removed_bytes': 0, 'kept': 0}
+    for path in root.glob('*/*/*'):
+        if not path.is_file():
+            continue
+        relative_path = path.relative_to(root).as_posix()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if relative_path in referenced_paths or stat.st_mtime > cutoff:
+            kept += 1
+            continue
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+        removed_bytes += stat.st_size
+    return {'removed': removed, 'removed_bytes': removed_bytes, 'kept': kept}
@@ -21,6 +21,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from config.parse_pool import BUSY_RETRY_AFTER_SECONDS
+
 from .direct_import import import_quality_workbook_direct, safe_workbook_filename
 from .browser_direct_import import (
     DIRECT_DELIVERY_MODE,
@@ -221,9 +223,10 @@ class QualityImportTemporaryUploadHandler(TemporaryFileUploadHandler):
 
 
 def _error(exc: WorkbookValidationError) -> Response:
-    if exc.code == 'file_too_large':
+    if exc.code in {'file_too_large', 'parse_time_limit', 'parse_memory_limit'}:
         response_status = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
     elif exc.code in {
+        'parse_pool_busy',
         'production_storage_required',
         'staging_capacity_exceeded',
         'cloudinary_verification_unavailable',
@@ -235,7 +238,10 @@ def _error(exc: WorkbookValidationError) -> Response:
         response_status = status.HTTP_409_CONFLICT
     else:
         response_status = status.HTTP_400_BAD_REQUEST
-    return Response({'code': exc.code, 'error': exc.message}, status=response_status)
+    response = Response({'code': exc.code, 'error': exc.message}, status=response_status)
+    if exc.code == 'parse_pool_busy':
+        response['Retry-After'] = str(BUSY_RETRY_AFTER_SECONDS)
+    return response
 
 
 class QualityImportBatchViewSet(
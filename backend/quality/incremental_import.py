@@ -57,9 +57,11 @@ from .excel_import import (
     _image_dimensions,
     _image_format,
     _normalize_image_content,
+    _has_staged_content,
     _lock_staging_capacity,
     _metadata_matches,
     _pending_staged_bytes,
+    _stage_asset_content,
     _parse_issue_sheet,
     _parse_oqc_sheet,
     kick_quality_import_pump,
@@ -1117,9 +1119,9 @@ def _stage_incremental_asset(
         if pending_bytes[0] > MAX_STAGED_MEDIA_BYTES:
             raise _manifest_error(
                 'staging_capacity_exceeded',
-                'Pending normalized images exceed the temporary database staging limit.',
+                'Pending normalized images exceed the temporary staging limit.',
             )
-        return QualityImportAsset.objects.create(
+        asset = QualityImportAsset(
             sha256=item['sha256'],
             normalizer_version=NORMALIZER_VERSION,
             byte_size=item['byte_size'],
@@ -1129,23 +1131,25 @@ def _stage_incremental_asset(
             extension=item['extension'],
             storage_key=item['storage_key'],
             file='',
-            staged_bytes=item['content'],
             upload_state=QualityImportAsset.UploadState.STAGED,
             created_by_batch=batch,
-        ), True
+        )
+        _stage_asset_content(asset, item)
+        asset.save()
+        return asset, True
     if not _metadata_matches(asset, item):
         raise _manifest_error(
             'asset_metadata_mismatch',
             'An existing content-addressed image has conflicting metadata.',
         )
-    if asset.staged_bytes is None and asset.upload_state != QualityImportAsset.UploadState.UPLOADING:
+    if not _has_staged_content(asset) and asset.upload_state != QualityImportAsset.UploadState.UPLOADING:
         pending_bytes[0] += item['byte_size']
         if pending_bytes[0] > MAX_STAGED_MEDIA_BYTES:
             raise _manifest_error(
                 'staging_capacity_exceeded',
-                'Pending normalized images exceed the temporary database staging limit.',
+                'Pending normalized images exceed the temporary staging limit.',
             )
-        asset.staged_bytes = item['content']
+        _stage_asset_content(asset, item)
     if asset.upload_state != QualityImportAsset.UploadState.UPLOADING:
         # READY in the database is not proof that the remote object still
         # exists. The worker verifies/recreates it from these staged bytes.
@@ -1155,7 +1159,7 @@ def _stage_incremental_asset(
         asset.next_attempt_at = None
         asset.last_error = ''
         asset.save(update_fields=[
-            'staged_bytes', 'upload_state', 'processing_owner',
+            'staged_bytes', 'spool_path', 'upload_state', 'processing_owner',
             'lease_expires_at', 'next_attempt_at', 'last_error',
         ])
     return asset, False
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from quality.classification_audit import quality_report_audit_queue, sync_quality_report_audit_states
+from quality.models import QualityReport
+
+PHENOMENA = ("表面色差需要调整", "흑점 발생", "气印 확인", "发白·白印", "스크래치", "缩水")
+
+
+def seed_quality_reports(count: int, *, parts: int = 500) -> int:
+    """Create ``count`` synthetic reports spread over the last year."""
+
+    now = timezone.now()
+    reports = [
+        QualityReport(
+            report_dt=now - timedelta(minutes=10 * index),
+            section="LQC_INJ",
+            model=f"BENCH{index % 50:02d}",
+            part_no=f"BENCH{index % parts:06d}",
+            phenomenon=PHENOMENA[index % len(PHENOMENA)],
+            disposition="선별",
+            image1=(
+                f"https://res.cloudinary.com/bench/image/upload/v1/quality/{index}.jpg"
+                if index % 3 == 0 else None
+            ),
+        )
+        for index in range(count)
+    ]
+    QualityReport.objects.bulk_create(reports, batch_size=1000)
+    return len(reports)
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic quality reports in a rolled-back transaction and time the audit queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reports", type=int, default=50_000)
+        parser.add_argument("--parts", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=5, help="Queue requests per scenario.")
+
+    def _time_queue(self, repeat: int, **kwargs) -> tuple[float, int, int]:
+        timings = []
+        for _ in range(max(1, repeat)):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                result = quality_report_audit_queue(**kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+        return sorted(timings)[len(timings) // 2], len(queries.captured_queries), result["count"]
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            report_count = seed_quality_reports(max(1, options["reports"]), parts=max(1, options["parts"]))
+
+            started = time.perf_counter()
+            synced = sync_quality_report_audit_states(limit=None)
+            backfill_ms = (time.perf_counter() - started) * 1000
+            self.stdout.write(
+                f"reports={report_count} backfilled_states={synced} backfill_ms={backfill_ms:.1f} "
+                "(one-off; the previous queue repeated this work on every request)"
+            )
+
+            scenarios = {
+                "attention page 1": {"status_filter": "attention"},
+                "all page 50": {"status_filter": "all", "page": 50},
+                "search 흑점": {"status_filter": "all", "search": "흑점"},
+                "single report": {"status_filter": "all", "report_id": QualityReport.objects.values_list("pk", flat=True).first()},
+            }
+            for label, kwargs in scenarios.items():
+                median_ms, query_count, matched = self._time_queue(options["repeat"], **kwargs)
+                self.stdout.write(f"{label:<18} median_ms={median_ms:.1f} queries={query_count} count={matched}")
+            # Nothing seeded here may outlive the benchmark.
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Benchmark finished; seeded reports were rolled back."))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from quality.import_spool import discard_spooled_bytes, write_spooled_bytes
+from quality.models import QualityImportAsset
+
+STORAGE_KEY_PREFIX = "bench-staging"
+
+
+def asset_table_bytes() -> int | None:
+    """On-disk size of the asset table including TOAST, when the backend can tell."""
+
+    table = QualityImportAsset._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT pg_total_relation_size(%s)", [table])
+            return int(cursor.fetchone()[0])
+        if connection.vendor == "sqlite":
+            try:
+                cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s", [table])
+            except Exception:  # SQLite built without the dbstat virtual table
+                return None
+            return int(cursor.fetchone()[0] or 0)
+    return None
+
+
+def _format_bytes(value: int | None) -> str:
+    return "n/a" if value is None else f"{value / (1024 * 1024):.1f}MiB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Stage synthetic import images as legacy staged_bytes rows and as spool rows, "
+        "committing one row per transaction, and report commit latency and asset table growth."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--images", type=int, default=200)
+        parser.add_argument("--image-kb", type=int, default=256, help="Size of each normalized image.")
+
+    def _stage(self, mode: str, images: list[tuple[str, bytes]]) -> tuple[list[float], int | None]:
+        before = asset_table_bytes()
+        commit_ms = []
+        spool_paths = []
+        try:
+            for sha256, content in images:
+                asset = QualityImportAsset(
+                    sha256=sha256,
+                    byte_size=len(content),
+                    content_type="image/jpeg",
+                    extension="jpg",
+                    storage_key=f"{STORAGE_KEY_PREFIX}/{mode}/{sha256}",
+                )
+                started = time.perf_counter()
+                with transaction.atomic():
+                    if mode == "spool":
+                        asset.spool_path = write_spooled_bytes(sha256, content)
+                        spool_paths.append(asset.spool_path)
+                    else:
+                        asset.staged_bytes = content
+                    asset.save()
+                commit_ms.append((time.perf_counter() - started) * 1000)
+            after = asset_table_bytes()
+        finally:
+            QualityImportAsset.objects.filter(storage_key__startswith=f"{STORAGE_KEY_PREFIX}/").delete()
+            for relative_path in spool_paths:
+                discard_spooled_bytes(relative_path)
+        growth = None if before is None or after is None else after - before
+        return commit_ms, growth
+
+    def handle(self, *args, **options):
+        if options["images"] < 2 or options["image_kb"] < 1:
+            raise CommandError("--images must be at least 2 and --image-kb positive.")
+        if QualityImportAsset.objects.filter(storage_key__startswith=f"{STORAGE_KEY_PREFIX}/").exists():
+            raise CommandError("Benchmark rows from an earlier run are still present.")
+        images = []
+        for _ in range(options["images"]):
+            content = os.urandom(options["image_kb"] * 1024)
+            images.append((hashlib.sha256(content).hexdigest(), content))
+
+        self.stdout.write(
+            f"vendor={connection.vendor} images={len(images)} image_kb={options['image_kb']} "
+            f"table_before={_format_bytes(asset_table_bytes())}"
+        )
+        # Spool first: PostgreSQL keeps the legacy run's dead TOAST pages until vacuum.
+        for mode in ("spool", "staged_bytes"):
+            commit_ms, growth = self._stage(mode, images)
+            self.stdout.write(
+                f"{mode:<12} commit_p50_ms={statistics.median(commit_ms):.2f} "
+                f"commit_p95_ms={statistics.quantiles(commit_ms, n=20)[-1]:.2f} "
+                f"table_growth={_format_bytes(growth)}"
+            )
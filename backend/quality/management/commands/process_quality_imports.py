@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import close_old_connections
 
 from quality.excel_import import (
+    cleanup_quality_import_spool,
     process_quality_import_batch,
     recover_stale_quality_imports,
 )
@@ -23,8 +24,21 @@ class Command(BaseCommand):
         parser.add_argument('--poll-seconds', type=float, default=5.0)
         parser.add_argument('--limit', type=int, default=1)
         parser.add_argument('--batch-id', type=int)
+        parser.add_argument(
+            '--cleanup-spool',
+            action='store_true',
+            help='Delete local staging spool files no asset references, then exit.',
+        )
 
     def handle(self, *args, **options):
+        if options.get('cleanup_spool'):
+            stats = cleanup_quality_import_spool()
+            self.stdout.write(self.style.SUCCESS(
+                f"Spool cleanup: removed={stats['removed']}, "
+                f"removed_bytes={stats['removed_bytes']}, kept={stats['kept']}"
+            ))
+            return
+
         stop = threading.Event()
         previous_handlers = {}
 
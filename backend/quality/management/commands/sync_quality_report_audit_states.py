@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from quality.classification_audit import sync_quality_report_audit_states
+
+
+class Command(BaseCommand):
+    help = "Backfill or refresh the persisted quality report audit queue state."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None, help="Refresh at most this many reports.")
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        refreshed = sync_quality_report_audit_states(limit=max(1, limit) if limit else None)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {refreshed} audit states."))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-19 01:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quality', '0009_qualityreport_direct_excel_import'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qualityimportasset',
+            name='spool_path',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='qualityimportasset',
+            name='upload_state',
+            field=models.CharField(choices=[('staged', 'Staged locally'), ('uploading', 'Uploading'), ('ready', 'Ready'), ('failed', 'Failed')], db_index=True, default='staged', max_length=16),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_core', '0001_initial'),
+        ('quality', '0010_qualityimportasset_spool_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QualityReportAuditState',
+            fields=[
+                ('report', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='audit_state', serialize=False, to='quality.qualityreport')),
+                ('report_dt', models.DateTimeField()),
+                ('part_no', models.CharField(blank=True, db_index=True, default='', max_length=64)),
+                ('source_revision', models.CharField(max_length=64)),
+                ('report_source_revision', models.CharField(max_length=64)),
+                ('contract_version', models.CharField(max_length=64)),
+                ('queue_status', models.CharField(max_length=20)),
+                ('has_images', models.BooleanField(default=False)),
+                ('search_text', models.TextField(blank=True, default='')),
+                ('needs_refresh', models.BooleanField(db_index=True, default=False)),
+                ('marked_at', models.DateTimeField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField()),
+                ('latest_job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='ai_core.aijob')),
+            ],
+            options={
+                'ordering': ['-report_dt', '-report_id'],
+                'indexes': [models.Index(fields=['-report_dt', '-report'], name='quality_audit_state_recent'), models.Index(fields=['queue_status', '-report_dt', '-report'], name='quality_audit_state_status')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quality', '0011_quality_report_audit_state'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='qualityreport',
+            index=models.Index(fields=['updated_at', 'id'], name='quality_report_updated_idx'),
+        ),
+    ]
@@ -53,6 +53,10 @@ class QualityReport(models.Model):
 
     class Meta:
         ordering = ['-report_dt', '-id']
+        indexes = [
+            # Archive changed-since feed: keyset on (updated_at, id).
+            models.Index(fields=['updated_at', 'id'], name='quality_report_updated_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.report_dt} {self.section} {self.model} {self.part_no}"
@@ -370,7 +374,7 @@ class QualityImportAsset(models.Model):
     """Content-addressed image stored once and shared by anchor attachments."""
 
     class UploadState(models.TextChoices):
-        STAGED = 'staged', 'Staged in database'
+        STAGED = 'staged', 'Staged locally'
         UPLOADING = 'uploading', 'Uploading'
         READY = 'ready', 'Ready'
         FAILED = 'failed', 'Failed'
@@ -395,7 +399,9 @@ class QualityImportAsset(models.Model):
         blank=True,
         default='',
     )
+    # Legacy in-database staging; new staging writes ``spool_path`` instead.
     staged_bytes = models.BinaryField(null=True, blank=True)
+    spool_path = models.CharField(max_length=255, blank=True, default='')
     upload_state = models.CharField(
         max_length=16,
         choices=UploadState.choices,
@@ -427,3 +433,52 @@ class QualityImportAsset(models.Model):
 
     def __str__(self) -> str:
         return self.sha256
+
+
+class QualityReportAuditState(models.Model):
+    """Queue-facing audit state of one report, kept in step with its jobs.
+
+    ``quality.classification_audit`` recomputes a row whenever it is missing,
+    marked ``needs_refresh`` by a report, PartSpec or audit-job write, or built
+    under an older audit contract.  The review queue filters and pages this
+    table instead of rebuilding every report's audit input.
+    """
+
+    report = models.OneToOneField(
+        QualityReport,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='audit_state',
+    )
+    report_dt = models.DateTimeField()
+    part_no = models.CharField(max_length=64, blank=True, default='', db_index=True)
+    source_revision = models.CharField(max_length=64)
+    report_source_revision = models.CharField(max_length=64)
+    contract_version = models.CharField(max_length=64)
+    latest_job = models.ForeignKey(
+        'ai_core.AiJob',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    queue_status = models.CharField(max_length=20)
+    has_images = models.BooleanField(default=False)
+    # Casefolded text the queue search matches with a substring test.
+    search_text = models.TextField(blank=True, default='')
+    needs_refresh = models.BooleanField(default=False, db_index=True)
+    marked_at = models.DateTimeField(null=True, blank=True)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-report_dt', '-report_id']
+        indexes = [
+            models.Index(fields=['-report_dt', '-report'], name='quality_audit_state_recent'),
+            models.Index(
+                fields=['queue_status', '-report_dt', '-report'],
+                name='quality_audit_state_status',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.report_id} {self.queue_status}'
@@ -1,7 +1,12 @@
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import QualityImportAsset
+from ai_core.models import AiJob
+from ai_core.quality_report_audit import QUALITY_REPORT_AUDIT_MODE
+from injection.models import PartSpec
+
+from .classification_audit import mark_quality_report_audit_states_dirty
+from .models import QualityImportAsset, QualityReport
 
 
 def _delete_file(field_file) -> None:
@@ -20,3 +25,27 @@ def delete_import_asset_file(sender, instance, **kwargs):
     """Only the content-addressed asset owns the stored image."""
 
     _delete_file(instance.file)
+
+
+@receiver(post_save, sender=QualityReport)
+def mark_report_audit_state_dirty(sender, instance, created, **kwargs):
+    if not created:
+        mark_quality_report_audit_states_dirty(report_ids=[instance.pk])
+
+
+@receiver(post_save, sender=AiJob)
+def mark_audit_job_report_dirty(sender, instance, **kwargs):
+    scope = instance.scope if isinstance(instance.scope, dict) else {}
+    if (
+        instance.job_type == AiJob.JOB_TYPE_QUALITY_IMAGE
+        and scope.get('mode') == QUALITY_REPORT_AUDIT_MODE
+    ):
+        mark_quality_report_audit_states_dirty(report_ids=[scope.get('report_id')])
+
+
+@receiver(post_save, sender=PartSpec)
+@receiver(post_delete, sender=PartSpec)
+def mark_part_spec_audit_states_dirty(sender, instance, **kwargs):
+    """The selected PartSpec is part of every report's audit revision."""
+
+    mark_quality_report_audit_states_dirty(part_nos=[instance.part_no])
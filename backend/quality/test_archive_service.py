@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 from unittest import mock
 from urllib.parse import parse_qs, urlsplit
 
@@ -190,6 +190,62 @@ class QualityArchiveServiceTests(APITestCase):
         self.assertEqual(previous_link.path, reverse('quality-archive-report-list'))
         self.assertEqual(parse_qs(previous_link.query), {'page_size': ['200']})
 
+    def test_changed_since_feed_walks_updated_at_keyset_cursors(self):
+        since = timezone.now() - timedelta(hours=1)
+        QualityReport.objects.filter(pk=self.report.pk).update(updated_at=since - timedelta(days=1))
+        changed = QualityReport.objects.bulk_create([
+            QualityReport(
+                report_dt=timezone.now(),
+                section='LQC_INJ',
+                model=f'archive-changed-{index}',
+                part_no=f'CHANGED{index:05d}',
+                judgement='NG',
+            )
+            for index in range(201)
+        ])
+        QualityReport.objects.filter(pk__in=[report.pk for report in changed]).update(updated_at=since)
+
+        url = reverse('quality-archive-report-list')
+        first = self.service_client.get(url, {'page_size': 200, 'updated_since': since.isoformat()})
+        self.assertEqual(first.status_code, 200, first.data)
+        self.assertNotIn('count', first.data)
+        self.assertEqual(len(first.data['results']), 200)
+        next_link = urlsplit(first.data['next'])
+        self.assertEqual(next_link.netloc, '')
+        self.assertEqual(set(parse_qs(next_link.query)), {'page_size', 'updated_since', 'cursor'})
+
+        second = self.service_client.get(first.data['next'])
+        self.assertEqual(second.status_code, 200, second.data)
+        self.assertIsNone(second.data['next'])
+        seen = [row['id'] for row in first.data['results'] + second.data['results']]
+        self.assertEqual(seen, sorted(report.pk for report in changed))
+
+        assets = self.service_client.get(
+            reverse('quality-archive-asset-list'),
+            {'page_size': 200, 'mirror_state': 'pending', 'updated_since': since.isoformat()},
+        )
+        self.assertEqual(assets.status_code, 200, assets.data)
+        self.assertEqual([row['id'] for row in assets.data['results']], [self.asset.pk])
+        self.assertIn('updated_at', assets.data['results'][0])
+
+        QualityImportBatch.objects.filter(pk=self.batch.pk).update(updated_at=since - timedelta(days=1))
+        QualityImportAsset.objects.filter(pk=self.asset.pk).update(created_at=since - timedelta(days=1))
+        assets = self.service_client.get(
+            reverse('quality-archive-asset-list'),
+            {'page_size': 200, 'mirror_state': 'pending', 'updated_since': since.isoformat()},
+        )
+        self.assertEqual(assets.data['results'], [])
+
+        for query in (
+            {'page_size': 200, 'updated_since': 'yesterday'},
+            {'page_size': 200, 'updated_since': since.replace(tzinfo=None).isoformat()},
+            {'page_size': 200, 'updated_since': since.isoformat(), 'page': 2},
+            {'page_size': 200, 'updated_since': since.isoformat(), 'cursor': 'not-a-cursor'},
+            {'page_size': 200, 'cursor': first.data['results'][0]['id']},
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(self.service_client.get(url, query).status_code, 400)
+
     def test_archive_token_is_rejected_by_every_representative_general_route(self):
         blocked = [
             ('get', reverse('quality-report-list'), None),
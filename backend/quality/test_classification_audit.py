@@ -19,10 +19,13 @@ from .classification_audit import (
     _exact_part_consensus,
     build_quality_report_audit_input,
     enqueue_stale_quality_report_audits,
+    quality_report_audit_contract_version,
+    quality_report_audit_queue,
+    sync_quality_report_audit_states,
     taxonomy_candidates,
 )
 from .daily_attention import build_daily_quality_attention
-from .models import QualityReport
+from .models import QualityReport, QualityReportAuditState
 
 
 @override_settings(AI_WORKER_TOKEN="test-worker-token")
@@ -169,6 +172,7 @@ class QualityClassificationAuditApiTests(APITestCase):
 
     def test_queue_search_finds_dictionary_and_photo_colour_terms(self):
         self._enqueue_and_complete()
+        sync_quality_report_audit_states()
 
         by_defect = self.client.get(
             reverse("quality-classification-audit"),
@@ -224,6 +228,7 @@ class QualityClassificationAuditApiTests(APITestCase):
         )
         self.assertEqual(review.status_code, 200, review.data)
 
+        sync_quality_report_audit_states()
         by_human_category = self.client.get(
             reverse("quality-classification-audit"),
             {"status": "all", "search": "흑점"},
@@ -446,11 +451,14 @@ class QualityClassificationAuditApiTests(APITestCase):
                 phenomenon="色差",
             )
         enqueue_stale_quality_report_audits(limit=50)
+        # The created jobs sit in the dirty queue until the next drain.
+        enqueue_stale_quality_report_audits(limit=50)
 
-        with self.assertNumQueries(3):
+        with self.assertNumQueries(4):
             result = enqueue_stale_quality_report_audits(limit=5)
 
         self.assertEqual(result["created_count"], 0)
+        self.assertEqual(result["queue_depth"], 0)
 
     def test_viewer_can_read_queue_but_cannot_enqueue_or_write_master_colour(self):
         viewer = get_user_model().objects.create_user(username="audit-viewer")
@@ -569,3 +577,168 @@ class QualityClassificationAuditApiTests(APITestCase):
             ["black_dot"],
         )
         self.assertNotEqual(before_hash, after["source_evidence_hash"])
+
+
+class QualityReportAuditStateTests(APITestCase):
+    def setUp(self):
+        self.reports = [
+            QualityReport.objects.create(
+                report_dt=timezone.now() - timedelta(minutes=index),
+                section="LQC_INJ",
+                model="24G411",
+                part_no=f"ACQ3077{index:04d}",
+                phenomenon="흑점" if index % 2 else "色差",
+            )
+            for index in range(25)
+        ]
+
+    def test_queue_pages_persisted_state_in_report_order(self):
+        sync_quality_report_audit_states()
+        first = quality_report_audit_queue(status_filter="all", page=1, page_size=10)
+        third = quality_report_audit_queue(status_filter="all", page=3, page_size=10)
+
+        self.assertEqual(QualityReportAuditState.objects.count(), 25)
+        self.assertEqual(first["count"], 25)
+        self.assertEqual(first["stats"], {"unprocessed": 25, "total": 25})
+        self.assertEqual(
+            [row["report"]["id"] for row in first["results"]],
+            [report.pk for report in self.reports[:10]],
+        )
+        self.assertEqual(
+            [row["report"]["id"] for row in third["results"]],
+            [report.pk for report in self.reports[20:]],
+        )
+        self.assertIsNone(third["next_page"])
+
+    def test_steady_state_queue_does_not_rebuild_states(self):
+        sync_quality_report_audit_states()
+        refreshed_at = QualityReportAuditState.objects.order_by("-refreshed_at").first().refreshed_at
+
+        with self.assertNumQueries(8):
+            result = quality_report_audit_queue(status_filter="all", search="흑점")
+
+        self.assertEqual(result["count"], 12)
+        self.assertEqual(
+            QualityReportAuditState.objects.order_by("-refreshed_at").first().refreshed_at,
+            refreshed_at,
+        )
+
+    def test_report_edit_and_job_completion_refresh_state(self):
+        report = self.reports[0]
+        sync_quality_report_audit_states()
+        report.phenomenon = "스크래치 발생"
+        report.save()
+        self.assertTrue(QualityReportAuditState.objects.get(pk=report.pk).needs_refresh)
+
+        sync_quality_report_audit_states()
+        searched = quality_report_audit_queue(status_filter="all", search="스크래치")
+        self.assertEqual([row["report"]["id"] for row in searched["results"]], [report.pk])
+
+        result = enqueue_stale_quality_report_audits(report_ids=[report.pk], limit=1)
+        job = AiJob.objects.get(pk=result["created_job_ids"][0])
+        sync_quality_report_audit_states()
+        self.assertEqual(
+            quality_report_audit_queue(status_filter="pending")["count"],
+            1,
+        )
+        job.status = AiJob.STATUS_COMPLETED
+        job.result_payload = {"available": True, "review_required": False}
+        job.save(update_fields=["status", "result_payload", "updated_at"])
+
+        state = QualityReportAuditState.objects.get(pk=report.pk)
+        self.assertTrue(state.needs_refresh)
+        sync_quality_report_audit_states()
+        matched = quality_report_audit_queue(status_filter="matched")
+        self.assertEqual([row["report"]["id"] for row in matched["results"]], [report.pk])
+        self.assertEqual(
+            quality_report_audit_queue(status_filter="attention")["count"],
+            24,
+        )
+
+    def test_queue_read_leaves_the_backlog_to_the_sync(self):
+        result = quality_report_audit_queue(status_filter="all")
+
+        self.assertEqual(result["count"], 0)
+        self.assertFalse(QualityReportAuditState.objects.exists())
+
+        report = self.reports[4]
+        single = quality_report_audit_queue(status_filter="all", report_id=report.pk)
+
+        self.assertEqual([row["report"]["id"] for row in single["results"]], [report.pk])
+        self.assertEqual(
+            list(QualityReportAuditState.objects.values_list("pk", flat=True)),
+            [report.pk],
+        )
+
+    def test_part_spec_write_marks_matching_states(self):
+        sync_quality_report_audit_states()
+        PartSpec.objects.create(
+            part_no="ACQ30770003",
+            model_code="24G411",
+            color="BLACK",
+            valid_from=timezone.localdate() - timedelta(days=1),
+        )
+
+        dirty = set(
+            QualityReportAuditState.objects.filter(needs_refresh=True).values_list("pk", flat=True)
+        )
+
+        self.assertEqual(dirty, {self.reports[3].pk})
+
+    def test_contract_change_refreshes_every_state(self):
+        sync_quality_report_audit_states()
+        QualityReportAuditState.objects.update(contract_version="old")
+
+        self.assertEqual(sync_quality_report_audit_states(limit=None), 25)
+        self.assertFalse(
+            QualityReportAuditState.objects.exclude(
+                contract_version=quality_report_audit_contract_version()
+            ).exists()
+        )
+
+    def test_scheduler_drains_dirty_queue_in_bounded_batches(self):
+        first = enqueue_stale_quality_report_audits(limit=3, drain_batch_size=10)
+
+        self.assertEqual(first["queue_depth"], 25)
+        self.assertEqual(first["refreshed_count"], 10)
+        self.assertEqual(first["remaining_queue_depth"], 15)
+        self.assertEqual(first["created_count"], 3)
+        # Only the ten refreshed states are trusted enough to enqueue from.
+        self.assertEqual(first["eligible_count"], 10)
+        self.assertIsNotNone(first["drain_rate_per_second"])
+
+        created_report_ids = set(
+            AiJob.objects.filter(pk__in=first["created_job_ids"])
+            .values_list("scope__report_id", flat=True)
+        )
+        self.assertEqual(created_report_ids, {report.pk for report in self.reports[:3]})
+        self.assertEqual(
+            set(QualityReportAuditState.objects.filter(needs_refresh=True).values_list("pk", flat=True)),
+            created_report_ids,
+        )
+
+        second = enqueue_stale_quality_report_audits(limit=3, drain_batch_size=30)
+
+        self.assertEqual(second["queue_depth"], 18)
+        self.assertEqual(second["created_count"], 3)
+        self.assertEqual(
+            QualityReportAuditState.objects.get(pk=self.reports[0].pk).queue_status,
+            "pending",
+        )
+
+    def test_report_edit_requeues_only_that_report(self):
+        for _ in range(3):
+            enqueue_stale_quality_report_audits(limit=50, drain_batch_size=50)
+        self.assertEqual(
+            enqueue_stale_quality_report_audits(limit=50)["eligible_count"],
+            0,
+        )
+        edited = self.reports[7]
+        edited.phenomenon = "스크래치 발생"
+        edited.save()
+
+        result = enqueue_stale_quality_report_audits(limit=50)
+
+        self.assertEqual((result["queue_depth"], result["created_count"]), (1, 1))
+        job = AiJob.objects.get(pk=result["created_job_ids"][0])
+        self.assertEqual(job.scope["report_id"], edited.pk)
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .excel_import import cleanup_quality_import_spool, process_quality_import_batch
+from .import_spool import (
+    SPOOL_DIRECTORY_NAME,
+    SpoolError,
+    cleanup_orphaned_spool_files,
+    read_spooled_bytes,
+    spool_relative_path,
+    spool_root,
+    write_spooled_bytes,
+)
+from .models import QualityImportAsset, QualityImportBatch
+from .tests import build_quality_workbook
+
+
+class FakeUploadEndpointStorage(FileSystemStorage):
+    """Local stand-in for the remote image endpoint with latency and flakes."""
+
+    def __init__(self, *args, latency=0.05, transient_failures=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latency = latency
+        self.transient_failures = transient_failures
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.save_attempts = 0
+
+    def _save(self, name, content):
+        with self.lock:
+            self.save_attempts += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            fail = self.transient_failures > 0
+            if fail:
+                self.transient_failures -= 1
+        try:
+            time.sleep(self.latency)
+            if fail:
+                raise OSError('simulated upload endpoint timeout')
+            return super()._save(name, content)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class QualityImportSpoolTests(SimpleTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.spool_settings = override_settings(QUALITY_IMPORT_SPOOL_ROOT=self.temp_dir.name)
+        self.spool_settings.enable()
+
+    def tearDown(self):
+        self.spool_settings.disable()
+        self.temp_dir.cleanup()
+
+    def test_spool_is_content_addressed_and_idempotent(self):
+        content = b'normalized-image'
+        sha256 = hashlib.sha256(content).hexdigest()
+
+        first = write_spooled_bytes(sha256, content)
+        second = write_spooled_bytes(sha256, content)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, spool_relative_path(sha256))
+        self.assertEqual(read_spooled_bytes(first, sha256=sha256, byte_size=len(content)), content)
+        self.assertEqual(len(list(Path(self.temp_dir.name).glob('*/*/*'))), 1)
+
+    def test_spool_rejects_wrong_address_and_tampered_bytes(self):
+        content = b'normalized-image'
+        sha256 = hashlib.sha256(content).hexdigest()
+        with self.assertRaises(SpoolError):
+            write_spooled_bytes('0' * 64, content)
+        relative_path = write_spooled_bytes(sha256, content)
+        (Path(self.temp_dir.name) / relative_path).write_bytes(b'tampered-bytes!!')
+        with self.assertRaises(SpoolError):
+            read_spooled_bytes(relative_path, sha256=sha256)
+        with self.assertRaises(SpoolError):
+            read_spooled_bytes('../outside', sha256=sha256)
+
+    def test_cleanup_removes_only_old_unreferenced_files(self):
+        paths = []
+        for content in (b'referenced', b'orphaned', b'young-orphan'):
+            paths.append(write_spooled_bytes(hashlib.sha256(content).hexdigest(), content))
+        old = time.time() - 3600
+        for relative_path in paths[:2]:
+            os.utime(Path(self.temp_dir.name) / relative_path, (old, old))
+
+        stats = cleanup_orphaned_spool_files({paths[0]}, min_age_seconds=60)
+
+        self.assertEqual(stats['removed'], 1)
+        self.assertEqual(stats['kept'], 2)
+        self.assertTrue((Path(self.temp_dir.name) / paths[0]).exists())
+        self.assertFalse((Path(self.temp_dir.name) / paths[1]).exists())
+        self.assertTrue((Path(self.temp_dir.name) / paths[2]).exists())
+
+    def test_unconfigured_spool_only_falls_back_to_the_temp_dir_in_debug(self):
+        with override_settings(QUALITY_IMPORT_SPOOL_ROOT='', DEBUG=True):
+            self.assertEqual(spool_root(), Path(tempfile.gettempdir()) / SPOOL_DIRECTORY_NAME)
+        with override_settings(QUALITY_IMPORT_SPOOL_ROOT='', DEBUG=False):
+            with self.assertRaises(ImproperlyConfigured):
+                write_spooled_bytes(hashlib.sha256(b'image').hexdigest(), b'image')
+
+
+@override_settings(
+    QUALITY_IMPORT_ALLOW_LOCAL_PROXY=True,
+    QUALITY_IMPORT_DISABLE_BACKGROUND_PUMP=True,
+    QUALITY_IMPORT_UPLOAD_CONCURRENCY=4,
+)
+class QualityImportSpoolPumpTests(APITestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.spool_root = Path(self.temp_dir.name) / 'spool'
+        self.spool_settings = override_settings(QUALITY_IMPORT_SPOOL_ROOT=str(self.spool_root))
+        self.spool_settings.enable()
+        self.media_field = QualityImportAsset._meta.get_field('file')
+        self.original_storage = self.media_field.storage
+        self.storage = FakeUploadEndpointStorage(
+            location=os.path.join(self.temp_dir.name, 'remote'),
+            base_url='/test-media/',
+        )
+        self.media_field.storage = self.storage
+        user = get_user_model().objects.create_user(
+            username='quality-spool-editor',
+            password='test-password',
+        )
+        user.profile.can_view_quality = True
+        user.profile.can_edit_quality = True
+        user.profile.save(update_fields=['can_view_quality', 'can_edit_quality'])
+        self.client.force_authenticate(user)
+
+    def tearDown(self):
+        self.media_field.storage = self.original_storage
+        self.spool_settings.disable()
+        self.temp_dir.cleanup()
+
+    def upload(self, image_count=6):
+        workbook = build_quality_workbook(
+            workbook_title=f'quality-spool-{image_count}',
+            image_rows=(3,) * image_count,
+            unique_images=True,
+        )
+        response = self.client.post(
+            reverse('quality-import-batch-list'),
+            {
+                'file': SimpleUploadedFile(
+                    '品质 Issue List - 8月.xlsx',
+                    workbook,
+                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                ),
+                'import_mode': 'full',
+            },
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 202, response.data)
+        return QualityImportBatch.objects.get(pk=response.data['id'])
+
+    def test_staging_keeps_only_hash_and_path_in_database(self):
+        self.upload()
+
+        assets = list(QualityImportAsset.objects.all())
+        self.assertEqual(len(assets), 6)
+        self.assertFalse(QualityImportAsset.objects.filter(staged_bytes__isnull=False).exists())
+        for asset in assets:
+            self.assertEqual(asset.spool_path, spool_relative_path(asset.sha256))
+            spooled = read_spooled_bytes(asset.spool_path, sha256=asset.sha256, byte_size=asset.byte_size)
+            self.assertEqual(len(spooled), asset.byte_size)
+
+    def test_pump_uploads_concurrently_and_retries_transient_failures(self):
+        batch = self.upload()
+        self.storage.transient_failures = 1
+
+        result = process_quality_import_batch(batch.pk)
+
+        self.assertIn(result.status, {
+            QualityImportBatch.Status.READY,
+            QualityImportBatch.Status.READY_WITH_WARNINGS,
+        })
+        self.assertGreater(self.storage.peak, 1)
+        self.assertLessEqual(self.storage.peak, 4)
+        self.assertEqual(self.storage.save_attempts, 7)
+        for asset in QualityImportAsset.objects.all():
+            self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.READY)
+            self.assertEqual(asset.spool_path, '')
+            with asset.file.open('rb') as stored:
+                self.assertEqual(hashlib.sha256(stored.read()).hexdigest(), asset.sha256)
+
+    @override_settings(QUALITY_IMPORT_UPLOAD_CONCURRENCY=1)
+    def test_remote_objects_are_reused_by_content_hash(self):
+        batch = self.upload(image_count=2)
+        for asset in QualityImportAsset.objects.all():
+            self.storage.save(
+                asset.storage_key,
+                SimpleUploadedFile('x', read_spooled_bytes(asset.spool_path, sha256=asset.sha256)),
+            )
+        attempts_before = self.storage.save_attempts
+
+        process_quality_import_batch(batch.pk)
+
+        self.assertEqual(self.storage.save_attempts, attempts_before)
+        self.assertFalse(
+            QualityImportAsset.objects.exclude(
+                upload_state=QualityImportAsset.UploadState.READY,
+            ).exists()
+        )
+
+    def test_legacy_database_staged_bytes_still_drain(self):
+        batch = self.upload(image_count=1)
+        asset = QualityImportAsset.objects.get()
+        content = read_spooled_bytes(asset.spool_path, sha256=asset.sha256)
+        asset.staged_bytes = content
+        asset.spool_path = ''
+        asset.save(update_fields=['staged_bytes', 'spool_path'])
+        for path in self.spool_root.glob('*/*/*'):
+            path.unlink()
+
+        process_quality_import_batch(batch.pk)
+
+        asset.refresh_from_db()
+        self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.READY)
+        self.assertIsNone(asset.staged_bytes)
+
+    def test_missing_spool_file_fails_closed(self):
+        batch = self.upload(image_count=1)
+        for path in self.spool_root.glob('*/*/*'):
+            path.unlink()
+
+        with mock.patch('quality.excel_import.LOGGER.exception'), self.assertRaises(Exception):
+            process_quality_import_batch(batch.pk)
+
+        batch.refresh_from_db()
+        self.assertEqual(batch.status, QualityImportBatch.Status.QUEUED)
+        self.assertTrue(any('normalized_checkpoint_incomplete' in warning for warning in batch.warnings))
+
+    def test_cleanup_removes_spool_files_after_upload(self):
+        batch = self.upload(image_count=2)
+        self.assertEqual(len(list(self.spool_root.glob('*/*/*'))), 2)
+        process_quality_import_batch(batch.pk)
+
+        stats = cleanup_quality_import_spool(min_age_seconds=0)
+
+        self.assertEqual(stats['removed'], 2)
+        self.assertEqual(list(self.spool_root.glob('*/*/*')), [])
+
+    def test_management_command_cleans_orphaned_spool(self):
+        content = b'orphan'
+        write_spooled_bytes(hashlib.sha256(content).hexdigest(), content)
+        output = StringIO()
+
+        call_command('process_quality_imports', cleanup_spool=True, stdout=output)
+
+        # The fresh orphan is younger than the safety age and is kept.
+        self.assertIn('removed=0', output.getvalue())
+        self.assertIn('kept=1', output.getvalue())
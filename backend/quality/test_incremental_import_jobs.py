@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import tempfile
 from io import BytesIO
 from unittest import mock
@@ -17,6 +18,7 @@ from rest_framework.test import APITestCase
 
 from . import incremental_import
 from .excel_import import WorkbookValidationError, process_quality_import_batch
+from .import_spool import read_spooled_bytes
 from .models import (
     QualityImportAsset,
     QualityImportBatch,
@@ -121,6 +123,10 @@ class QualityExcelIncrementalJobTests(APITestCase):
         self.media_field = QualityImportAsset._meta.get_field('file')
         self.original_storage = self.media_field.storage
         self.media_field.storage = self.storage
+        self.spool_settings = override_settings(
+            QUALITY_IMPORT_SPOOL_ROOT=os.path.join(self.temp_dir.name, 'spool'),
+        )
+        self.spool_settings.enable()
 
         self.editor = self._user('incremental-job-editor', view=True, edit=True)
         self.viewer = self._user('incremental-job-viewer', view=True, edit=False)
@@ -131,6 +137,7 @@ class QualityExcelIncrementalJobTests(APITestCase):
         self.jobs_url = reverse('quality-excel-import-jobs')
 
     def tearDown(self):
+        self.spool_settings.disable()
         self.media_field.storage = self.original_storage
         self.temp_dir.cleanup()
 
@@ -197,8 +204,9 @@ class QualityExcelIncrementalJobTests(APITestCase):
 
         asset = QualityImportAsset.objects.get()
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(bytes(asset.staged_bytes))
-        self.assertEqual(hashlib.sha256(bytes(asset.staged_bytes)).hexdigest(), asset.sha256)
+        self.assertIsNone(asset.staged_bytes)
+        spooled = read_spooled_bytes(asset.spool_path, sha256=asset.sha256)
+        self.assertEqual(hashlib.sha256(spooled).hexdigest(), asset.sha256)
         self.assertFalse(asset.file)
         self.assertEqual(QualityReport.objects.count(), 0)
 
@@ -230,7 +238,7 @@ class QualityExcelIncrementalJobTests(APITestCase):
         self.assertEqual(batch.new_media_count, 1)
         asset = QualityImportAsset.objects.get(created_by_batch=batch)
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
         self.assertFalse(asset.file)
 
         draft = QualityImportRow.objects.get(batch=batch)
@@ -286,7 +294,7 @@ class QualityExcelIncrementalJobTests(APITestCase):
         self.assertEqual(batch.phase, 'retry_wait')
         self.assertTrue(any('production_storage_required' in warning for warning in batch.warnings))
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
         self.assertEqual(QualityReport.objects.count(), 0)
 
     def test_same_workbook_chunk_replay_returns_same_job(self):
@@ -332,7 +340,7 @@ class QualityExcelIncrementalJobTests(APITestCase):
         self.assertEqual(response.status_code, 202, response.data)
         self.assertEqual(attempts, 2)
         self.assertEqual(QualityImportBatch.objects.count(), 1)
-        self.assertTrue(QualityImportAsset.objects.get().staged_bytes)
+        self.assertTrue(QualityImportAsset.objects.get().spool_path)
 
     def test_missing_ready_asset_is_restaged_and_recreated_by_worker(self):
         image = _png_bytes((20, 120, 220))
@@ -365,7 +373,7 @@ class QualityExcelIncrementalJobTests(APITestCase):
         intake_open.assert_not_called()
         asset.refresh_from_db()
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
 
         process_quality_import_batch(second.data['id'])
 
@@ -418,7 +426,7 @@ class QualityExcelIncrementalJobTests(APITestCase):
             [bool(report.image1), bool(report.image2), bool(report.image3), bool(report.image4), bool(report.image5)],
             [True, True, True, True, True],
         )
-        self.assertEqual(QualityImportAsset.objects.filter(staged_bytes__isnull=True).count(), 5)
+        self.assertEqual(QualityImportAsset.objects.filter(staged_bytes__isnull=True, spool_path='').count(), 5)
         self.assertEqual(process_quality_import_batch(batch.pk), None)
         self.assertEqual(QualityReport.objects.count(), 1)
 
@@ -29,6 +29,7 @@ from .excel_import import (
     process_quality_import_batch,
     recover_stale_quality_imports,
 )
+from .import_spool import read_spooled_bytes
 from .models import (
     QualityImportAsset,
     QualityImportBatch,
@@ -363,6 +364,10 @@ class QualityWorkbookImportAPITests(APITestCase):
         self.original_storage = self.media_field.storage
         self.storage = FileSystemStorage(location=self.temp_dir.name, base_url='/test-media/')
         self.media_field.storage = self.storage
+        self.spool_settings = override_settings(
+            QUALITY_IMPORT_SPOOL_ROOT=os.path.join(self.temp_dir.name, 'spool'),
+        )
+        self.spool_settings.enable()
         self.user = get_user_model().objects.create_user(
             username='quality-editor',
             password='test-password',
@@ -375,6 +380,7 @@ class QualityWorkbookImportAPITests(APITestCase):
         self.workbook = build_quality_workbook()
 
     def tearDown(self):
+        self.spool_settings.disable()
         self.media_field.storage = self.original_storage
         self.temp_dir.cleanup()
 
@@ -424,7 +430,7 @@ class QualityWorkbookImportAPITests(APITestCase):
         self.assertEqual(QualityReport.objects.count(), 0)
         asset = QualityImportAsset.objects.get()
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
         self.assertFalse(asset.file)
         rows = self.client.get(reverse('quality-import-batch-rows', kwargs={'pk': batch.pk}))
         self.assertEqual(rows.status_code, 409, rows.data)
@@ -678,7 +684,10 @@ class QualityWorkbookImportAPITests(APITestCase):
     def test_crash_after_remote_upload_before_checkpoint_is_idempotent(self):
         queued = self.upload()
         asset = QualityImportAsset.objects.get()
-        self.storage.save(asset.storage_key, ContentFile(bytes(asset.staged_bytes)))
+        self.storage.save(
+            asset.storage_key,
+            ContentFile(read_spooled_bytes(asset.spool_path, sha256=asset.sha256)),
+        )
 
         process_quality_import_batch(queued.data['id'])
 
@@ -702,7 +711,7 @@ class QualityWorkbookImportAPITests(APITestCase):
         ))
         asset.refresh_from_db()
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
 
         process_quality_import_batch(revised.data['id'])
 
@@ -729,7 +738,7 @@ class QualityWorkbookImportAPITests(APITestCase):
         self.assertEqual(batch.status, QualityImportBatch.Status.QUEUED)
         self.assertEqual(batch.new_media_count, 0)
         self.assertEqual(batch.reused_media_count, 1)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
         exists.assert_not_called()
         save.assert_not_called()
@@ -799,7 +808,7 @@ class QualityWorkbookImportAPITests(APITestCase):
         self.assertEqual(batch.changed_count, 1)
         self.assertEqual(batch.unchanged_count, 2)
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
 
         with mock.patch.object(self.storage, 'exists', wraps=self.storage.exists) as pump_exists, mock.patch.object(
             self.storage,
@@ -825,9 +834,10 @@ class QualityWorkbookImportAPITests(APITestCase):
         self.storage.delete(asset.file.name)
         asset.file = ''
         asset.staged_bytes = None
+        asset.spool_path = ''
         asset.upload_state = QualityImportAsset.UploadState.FAILED
         asset.last_error = 'simulated prior failure'
-        asset.save(update_fields=['file', 'staged_bytes', 'upload_state', 'last_error'])
+        asset.save(update_fields=['file', 'staged_bytes', 'spool_path', 'upload_state', 'last_error'])
 
         revised = self.upload(content=build_quality_workbook(
             workbook_title='failed-asset-repair',
@@ -836,7 +846,7 @@ class QualityWorkbookImportAPITests(APITestCase):
 
         asset.refresh_from_db()
         self.assertEqual(asset.upload_state, QualityImportAsset.UploadState.STAGED)
-        self.assertTrue(asset.staged_bytes)
+        self.assertTrue(asset.spool_path)
         self.assertEqual(asset.last_error, '')
         process_quality_import_batch(revised.data['id'])
         asset.refresh_from_db()
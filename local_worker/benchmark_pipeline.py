@@ -0,0 +1,238 @@
+"""Measure Worker throughput against a fake OpenAI-compatible model server.
+
+The fake model server answers one chat completion at a time, like the local
+MLX server, and the fake Render backend adds a fixed latency to every API
+call.  Each mode drains the same job list and reports jobs per minute:
+
+    python benchmark_pipeline.py --jobs 20 --generate-latency 0.5 --network-latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+try:
+    from .llm_client import LocalLlmClient
+    from .response_cache import LlmResponseCache
+    from .worker import PipelinedWorker, RunOnceReport, run_once
+except ImportError:
+    from llm_client import LocalLlmClient
+    from response_cache import LlmResponseCache
+    from worker import PipelinedWorker, RunOnceReport, run_once
+
+
+FAKE_MODEL = "fake-local-model"
+FAKE_ANSWER = {
+    "title": "생산 현황 요약",
+    "summary": (
+        "결론: 계획 대비 진행 상황을 확인했습니다.\n"
+        "판단 근거: 공정별 실적 자료를 검토했습니다.\n"
+        "확인할 항목: 설비 상태를 확인합니다."
+    ),
+}
+
+
+class FakeModelServer:
+    """Single-slot OpenAI-compatible server with a fixed generation latency."""
+
+    def __init__(self, generate_latency: float):
+        self.generate_latency = generate_latency
+        self.completions = 0
+        self._generate_lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_args):
+                pass
+
+            def _send_json(self, payload: dict[str, Any]) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._send_json({"data": [{"id": FAKE_MODEL}]})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with server._generate_lock:
+                    time.sleep(server.generate_latency)
+                    server.completions += 1
+                self._send_json({
+                    "choices": [{
+                        "finish_reason": "stop",
+                        "message": {"content": json.dumps(FAKE_ANSWER, ensure_ascii=False)},
+                    }],
+                })
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    @contextmanager
+    def running(self) -> Iterator["FakeModelServer"]:
+        thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+
+class FakeRenderBackend:
+    """In-memory stand-in for ``RenderClient`` with per-call network latency."""
+
+    def __init__(self, jobs: list[dict[str, Any]], network_latency: float):
+        self.pending = list(jobs)
+        self.network_latency = network_latency
+        self.completed: list[int] = []
+        self.failed: list[tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def _round_trip(self) -> None:
+        time.sleep(self.network_latency)
+
+    def enqueue_periodic_jobs(self, languages=None) -> dict:
+        self._round_trip()
+        return {}
+
+    def claim_jobs(self, worker_name: str, limit: int = 1, **_kwargs) -> list[dict]:
+        self._round_trip()
+        with self._lock:
+            claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        return [{**job, "claimed_at": "2026-05-15T08:00:00+00:00"} for job in claimed]
+
+    def start_job(self, job_id: int, **_payload) -> dict:
+        self._round_trip()
+        return {}
+
+    def complete_job(self, job_id: int, **_payload) -> dict:
+        self._round_trip()
+        with self._lock:
+            self.completed.append(job_id)
+        return {}
+
+    def fail_job(self, job_id: int, error_message: str, **_payload) -> dict:
+        self._round_trip()
+        with self._lock:
+            self.failed.append((job_id, error_message))
+        return {}
+
+
+def build_jobs(count: int, duplicate_ratio: float) -> list[dict[str, Any]]:
+    """Daily-analysis jobs; a share of them repeat an earlier job's evidence."""
+
+    unique_count = max(1, count - int(count * max(0.0, min(1.0, duplicate_ratio))))
+    jobs = []
+    for index in range(count):
+        evidence_index = index % unique_count
+        jobs.append({
+            "id": index + 1,
+            "job_type": "production_daily_analysis",
+            "scope": {"trigger": "hourly", "language": "ko"},
+            "input_payload": {"briefing": {"used_data": [f"evidence-revision-{evidence_index}"]}},
+        })
+    return jobs
+
+
+def run_benchmark(
+    *,
+    jobs: int = 20,
+    generate_latency: float = 0.5,
+    network_latency: float = 0.2,
+    duplicate_ratio: float = 0.0,
+    pipelined: bool = False,
+    use_cache: bool = False,
+    max_in_flight: int = 2,
+    generate_concurrency: int = 1,
+    submit_concurrency: int = 1,
+) -> dict[str, Any]:
+    model_server = FakeModelServer(generate_latency)
+    backend = FakeRenderBackend(build_jobs(jobs, duplicate_ratio), network_latency)
+    # Per-job "completed" lines would drown out the report.
+    with tempfile.TemporaryDirectory() as cache_dir, model_server.running(), redirect_stdout(io.StringIO()):
+        llm = LocalLlmClient(
+            model_server.base_url,
+            FAKE_MODEL,
+            timeout=max(5, int(generate_latency * 10) + 5),
+            response_cache=LlmResponseCache(cache_dir) if use_cache else None,
+        )
+        started = time.monotonic()
+        if pipelined:
+            pipeline = PipelinedWorker(
+                backend,
+                "benchmark-worker",
+                True,
+                llm,
+                FAKE_MODEL,
+                True,
+                poll_interval=0.01,
+                max_in_flight=max_in_flight,
+                generate_concurrency=generate_concurrency,
+                submit_concurrency=submit_concurrency,
+            )
+            pipeline.start()
+            while pipeline.processed < jobs:
+                time.sleep(0.005)
+            elapsed = time.monotonic() - started
+            pipeline.stop()
+        else:
+            report = RunOnceReport()
+            while run_once(backend, "benchmark-worker", True, llm, FAKE_MODEL, True, False, report=report):
+                pass
+            elapsed = time.monotonic() - started
+    return {
+        "mode": ("pipelined" if pipelined else "sequential") + ("+cache" if use_cache else ""),
+        "jobs": jobs,
+        "completed": len(backend.completed),
+        "failed": len(backend.failed),
+        "model_requests": model_server.completions,
+        "elapsed_seconds": round(elapsed, 3),
+        "jobs_per_minute": round(jobs * 60 / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--generate-latency", type=float, default=0.5, help="seconds per model completion")
+    parser.add_argument("--network-latency", type=float, default=0.2, help="seconds per backend API call")
+    parser.add_argument("--duplicates", type=float, default=0.5, help="share of jobs that repeat earlier evidence")
+    parser.add_argument("--max-in-flight", type=int, default=2)
+    parser.add_argument("--generate-concurrency", type=int, default=1)
+    parser.add_argument("--submit-concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    for pipelined, use_cache in ((False, False), (True, False), (False, True), (True, True)):
+        result = run_benchmark(
+            jobs=args.jobs,
+            generate_latency=args.generate_latency,
+            network_latency=args.network_latency,
+            duplicate_ratio=args.duplicates,
+            pipelined=pipelined,
+            use_cache=use_cache,
+            max_in_flight=args.max_in_flight,
+            generate_concurrency=args.generate_concurrency,
+            submit_concurrency=args.submit_concurrency,
+        )
+        print(
+            f"{result['mode']:<20} {result['jobs_per_minute']:>8.1f} jobs/min "
+            f"({result['completed']}/{result['jobs']} completed, "
+            f"{result['model_requests']} model requests, {result['elapsed_seconds']}s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import json
+import threading
 from ipaddress import ip_address
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
 
+try:
+    from .response_cache import LlmResponseCache, response_cache_key
+except ImportError:
+    from response_cache import LlmResponseCache, response_cache_key
+
 
 def extract_json_object(text: str) -> dict[str, Any]:
     try:
@@ -32,6 +38,7 @@ class LocalLlmClient:
         model: str,
         timeout: int = 120,
         model_family: str = "qwen",
+        response_cache: LlmResponseCache | None = None,
     ):
         normalized_base_url = base_url.rstrip("/")
         parsed = urlparse(normalized_base_url)
@@ -51,6 +58,10 @@ class LocalLlmClient:
         self.model = model
         self.timeout = timeout
         self.model_family = model_family
+        self.response_cache = response_cache
+        # Cache keys answered for the job running on the current thread, so a
+        # rejected answer can be dropped instead of replayed on the retry.
+        self._job_cache_keys = threading.local()
 
     def is_ready(self, timeout: int = 3) -> bool:
         try:
@@ -72,6 +83,23 @@ class LocalLlmClient:
         except (requests.RequestException, ValueError):
             return False
 
+    def _recent_cache_keys(self) -> list[str]:
+        keys = getattr(self._job_cache_keys, "keys", None)
+        if keys is None:
+            keys = self._job_cache_keys.keys = []
+        return keys
+
+    def begin_cached_job(self) -> None:
+        self._job_cache_keys.keys = []
+
+    def discard_cached_job_responses(self) -> int:
+        keys = self._recent_cache_keys()
+        discarded = 0
+        if self.response_cache is not None:
+            discarded = sum(1 for key in keys if self.response_cache.discard(key))
+        self._job_cache_keys.keys = []
+        return discarded
+
     def structured_analysis(
         self,
         system_prompt: str,
@@ -147,6 +175,14 @@ class LocalLlmClient:
             # Opt in per bounded handler so other local-model workflows keep
             # their existing request contract.
             request_payload["response_format"] = {"type": "json_object"}
+        cache_key = ""
+        # Image URLs are not content-addressed, so vision requests stay uncached.
+        if self.response_cache is not None and not image_urls:
+            cache_key = response_cache_key(request_payload)
+            self._recent_cache_keys().append(cache_key)
+            cached_content = self.response_cache.get(cache_key)
+            if cached_content is not None:
+                return extract_json_object(cached_content)
         response = requests.post(
             f"{self.base_url}/chat/completions",
             json=request_payload,
@@ -165,4 +201,10 @@ class LocalLlmClient:
         content = message.get("content")
         if not isinstance(content, str) or not content.strip():
             raise ValueError("LLM response did not contain final answer content.")
-        return extract_json_object(content)
+        parsed = extract_json_object(content)
+        if cache_key:
+            try:
+                self.response_cache.set(cache_key, content, model=self.model)
+            except OSError:
+                pass
+        return parsed
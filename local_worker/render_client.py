@@ -23,6 +23,7 @@ class RenderClient:
         job_types: list[str] | None = None,
         worker_version: str = WORKER_VERSION,
         available_model_ids: list[str] | None = None,
+        wait_seconds: int = 0,
     ) -> list[dict]:
         payload: dict = {
             "worker_name": worker_name,
@@ -32,10 +33,13 @@ class RenderClient:
         }
         if job_types:
             payload["job_types"] = job_types
+        if wait_seconds > 0:
+            payload["wait_seconds"] = wait_seconds
         response = self.session.post(
             f"{self.api_base_url}/ai/jobs/claim/",
             json=payload,
-            timeout=self.timeout,
+            # The server may hold a long-poll claim for up to wait_seconds.
+            timeout=self.timeout + max(0, wait_seconds),
         )
         response.raise_for_status()
         return response.json().get("jobs", [])
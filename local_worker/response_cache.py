@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def response_cache_key(request_payload: dict[str, Any]) -> str:
+    """Key a chat-completions request by (model, prompt hash, generation params).
+
+    Everything except ``model`` and ``messages`` is treated as a generation
+    parameter, so changing temperature, token budget, thinking mode, or the
+    response format never reuses an answer produced under other settings.
+    """
+
+    prompt_sha256 = hashlib.sha256(
+        _canonical_json(request_payload.get("messages") or []).encode("utf-8")
+    ).hexdigest()
+    params = {
+        key: value
+        for key, value in request_payload.items()
+        if key not in {"model", "messages"}
+    }
+    return hashlib.sha256(
+        _canonical_json({
+            "model": request_payload.get("model") or "",
+            "prompt_sha256": prompt_sha256,
+            "params": params,
+        }).encode("utf-8")
+    ).hexdigest()
+
+
+class LlmResponseCache:
+    """Persistent on-disk cache of final local-model answers.
+
+    Entries live under ``<root>/<key[:2]>/<key>.json`` and are written
+    atomically, so a crashed worker never leaves a half-written answer that a
+    later run would trust.
+    """
+
+    def __init__(self, root: str | Path, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.root = Path(root)
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        content = entry.get("content") if isinstance(entry, dict) else None
+        created_at = entry.get("created_at") if isinstance(entry, dict) else None
+        if not isinstance(content, str) or not isinstance(created_at, (int, float)):
+            self.discard(key)
+            return None
+        if self.max_age_seconds and time.time() - created_at > self.max_age_seconds:
+            self.discard(key)
+            return None
+        return content
+
+    def set(self, key: str, content: str, *, model: str = "") -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f".{path.name}.{uuid.uuid4().hex}.partial")
+        try:
+            partial.write_text(
+                json.dumps({"model": model, "content": content, "created_at": time.time()}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(partial, path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+    def discard(self, key: str) -> bool:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def prune(self) -> int:
+        """Delete expired entries and return how many were removed."""
+
+        if not self.max_age_seconds or not self.root.is_dir():
+            return 0
+        cutoff = time.time() - self.max_age_seconds
+        removed = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -5,9 +6,11 @@ try:
     from . import llm_client as llm_client_module
     from . import render_client as render_client_module
     from . import worker as worker_module
+    from .benchmark_pipeline import run_benchmark
     from .job_handlers import production_daily_analysis, production_machine_analysis, production_question_analysis
     from .llm_client import LocalLlmClient
     from .render_client import RenderClient
+    from .response_cache import LlmResponseCache, response_cache_key
     from .skills.production_analyst import build_skill_payload, insert_verified_metrics, select_analysis_mode
     from .worker import (
         RunOnceReport,
@@ -24,9 +27,11 @@ except ImportError:
     import llm_client as llm_client_module
     import render_client as render_client_module
     import worker as worker_module
+    from benchmark_pipeline import run_benchmark
     from job_handlers import production_daily_analysis, production_machine_analysis, production_question_analysis
     from llm_client import LocalLlmClient
     from render_client import RenderClient
+    from response_cache import LlmResponseCache, response_cache_key
     from skills.production_analyst import build_skill_payload, insert_verified_metrics, select_analysis_mode
     from worker import (
         RunOnceReport,
@@ -1547,6 +1552,80 @@ class LocalLlmReadinessTests(unittest.TestCase):
                 self.client.structured_analysis("system", {"question": "status"})
 
 
+class LlmResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.cache = LlmResponseCache(self.cache_dir.name)
+        self.client = LocalLlmClient(
+            "http://127.0.0.1:8080/v1",
+            "/private/models/Qwen3.5-35B-A3B-4bit",
+            response_cache=self.cache,
+        )
+
+    @staticmethod
+    def response(content='{"title":"생산 분석","summary":"검증된 답변"}'):
+        response = MagicMock()
+        response.json.return_value = {
+            "choices": [{"finish_reason": "stop", "message": {"content": content}}],
+        }
+        return response
+
+    def test_key_covers_model_prompt_and_generation_params(self):
+        base = {"model": "qwen", "temperature": 0.1, "messages": [{"role": "user", "content": "a"}]}
+        key = response_cache_key(base)
+
+        self.assertEqual(key, response_cache_key(dict(reversed(list(base.items())))))
+        self.assertNotEqual(key, response_cache_key({**base, "model": "gemma"}))
+        self.assertNotEqual(key, response_cache_key({**base, "temperature": 0.2}))
+        self.assertNotEqual(key, response_cache_key({**base, "messages": [{"role": "user", "content": "b"}]}))
+
+    def test_identical_prompt_is_answered_from_disk(self):
+        with patch.object(llm_client_module.requests, "post", return_value=self.response()) as post:
+            first = self.client.structured_analysis("system", {"question": "status"})
+            second = LocalLlmClient(
+                "http://127.0.0.1:8080/v1",
+                "/private/models/Qwen3.5-35B-A3B-4bit",
+                response_cache=LlmResponseCache(self.cache_dir.name),
+            ).structured_analysis("system", {"question": "status"})
+            self.client.structured_analysis("system", {"question": "status"}, max_tokens=600)
+
+        self.assertEqual(first, second)
+        self.assertEqual(post.call_count, 2)
+
+    def test_rejected_job_responses_are_discarded(self):
+        with patch.object(llm_client_module.requests, "post", return_value=self.response()) as post:
+            self.client.begin_cached_job()
+            self.client.structured_analysis("system", {"question": "status"})
+            self.assertEqual(self.client.discard_cached_job_responses(), 1)
+            self.client.structured_analysis("system", {"question": "status"})
+
+        self.assertEqual(post.call_count, 2)
+
+    def test_unparseable_and_vision_responses_are_not_cached(self):
+        with patch.object(llm_client_module.requests, "post", return_value=self.response("not json")):
+            with self.assertRaises(ValueError):
+                self.client.structured_analysis("system", {"question": "status"})
+        with patch.object(llm_client_module.requests, "post", return_value=self.response()) as post:
+            for _ in range(2):
+                self.client.structured_analysis(
+                    "system",
+                    {"question": "status"},
+                    image_urls=["https://example.com/a.jpg"],
+                )
+
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(list(self.cache.root.glob("*/*.json")), [])
+
+    def test_expired_entry_is_a_miss(self):
+        self.cache.set("ab" * 32, '{"status":"ok"}')
+        expired = LlmResponseCache(self.cache_dir.name, max_age_seconds=1)
+        with patch("time.time", return_value=10**12):
+            self.assertIsNone(expired.get("ab" * 32))
+        # An expired read deletes the entry for every reader.
+        self.assertIsNone(self.cache.get("ab" * 32))
+
+
 class RenderClientCompatibilityTests(unittest.TestCase):
     def test_claim_request_sends_current_worker_version(self):
         response = MagicMock()
@@ -1811,6 +1890,39 @@ class WorkerRunReportingTests(unittest.TestCase):
         self.assertIn("local generation failed", report.summary())
         self.assertTrue(client.completed[0][1]["result_payload"]["llm_fallback"])
 
+    def test_fallback_result_discards_cached_model_responses(self):
+        llm = MagicMock()
+        with patch.object(
+            worker_module,
+            "handle_job",
+            return_value=({"llm_fallback": True, "llm_error": "grounding"}, "prompt-v1"),
+        ):
+            outcome = worker_module.generate_job_outcome(
+                self.Client(),
+                self.daily_job(),
+                "worker",
+                True,
+                llm,
+                "model",
+                True,
+                RunOnceReport(),
+            )
+
+        self.assertEqual(outcome.error, "")
+        llm.begin_cached_job.assert_called_once_with()
+        llm.discard_cached_job_responses.assert_called_once_with()
+
+    def test_pipeline_overlaps_network_with_generation(self):
+        options = {"jobs": 6, "generate_latency": 0.08, "network_latency": 0.04}
+        sequential = run_benchmark(**options)
+        pipelined = run_benchmark(**options, pipelined=True)
+        cached = run_benchmark(**options, pipelined=True, use_cache=True, duplicate_ratio=0.5)
+
+        for result in (sequential, pipelined, cached):
+            self.assertEqual((result["completed"], result["failed"]), (6, 0))
+        self.assertGreater(pipelined["jobs_per_minute"], sequential["jobs_per_minute"])
+        self.assertEqual(cached["model_requests"], 3)
+
     def test_once_returns_nonzero_when_job_fails(self):
         client = self.Client(self.daily_job(), complete_error=RuntimeError("complete unavailable"))
         with (
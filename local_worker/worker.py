@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 import os
+import queue
 import re
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
@@ -23,6 +25,7 @@ try:
     )
     from .llm_client import LocalLlmClient
     from .render_client import RenderClient, WORKER_VERSION
+    from .response_cache import LlmResponseCache
 except ImportError:
     from job_handlers import (
         production_daily_analysis,
@@ -33,6 +36,7 @@ except ImportError:
     )
     from llm_client import LocalLlmClient
     from render_client import RenderClient, WORKER_VERSION
+    from response_cache import LlmResponseCache
 
 
 HANDLERS = {
@@ -1367,6 +1371,188 @@ def handle_job(
     return deterministic, handler.PROMPT_VERSION
 
 
+@dataclass
+class JobOutcome:
+    job_id: int
+    claim_timestamp: str
+    model_id: str
+    model_name: str
+    result: dict[str, Any] | None = None
+    prompt_version: str = ""
+    error: str = ""
+
+
+def claim_model_ids_for(
+    use_llm: bool,
+    model_targets: dict[str, LocalModelTarget] | None,
+    available_model_ids: list[str] | None,
+) -> list[str]:
+    if available_model_ids is not None:
+        return available_model_ids
+    if model_targets is None:
+        return []
+    return [
+        model_id
+        for model_id, target in model_targets.items()
+        if use_llm and target.client is not None
+    ]
+
+
+def _discard_rejected_responses(llm: Any) -> None:
+    # A cached answer that ended in a fallback would otherwise be replayed
+    # verbatim when the job is retried.
+    discard = getattr(llm, "discard_cached_job_responses", None)
+    if callable(discard):
+        discard()
+
+
+def generate_job_outcome(
+    client: RenderClient,
+    job: dict,
+    worker_name: str,
+    use_llm: bool,
+    llm: LocalLlmClient | None,
+    model_name: str,
+    fallback_to_deterministic: bool,
+    report: RunOnceReport,
+    model_targets: dict[str, LocalModelTarget] | None = None,
+    default_model_id: str = QWEN_MODEL_ID,
+) -> JobOutcome:
+    """Select the model, mark the job running, and produce its result."""
+
+    job_id = int(job["id"])
+    claim_timestamp = str(job.get("claimed_at") or "")
+    handler = handler_for_job(job)
+    allow_unavailable_fallback = bool(
+        fallback_to_deterministic
+        and handler
+        and getattr(handler, "ALLOW_UNAVAILABLE_MODEL_FALLBACK", False)
+    )
+    selected_llm = llm
+    selected_model_name = model_name
+    selected_model_id = default_model_id
+    model_unavailable_error = ""
+    try:
+        selected_model_id = requested_model_id(job, default_model_id)
+        if model_targets is not None:
+            target = model_targets.get(selected_model_id)
+            if target is None:
+                if not allow_unavailable_fallback:
+                    raise ValueError(f"Local AI model is not configured: {selected_model_id}")
+                selected_llm = None
+                selected_model_name = ""
+                model_unavailable_error = f"Local AI model is not configured: {selected_model_id}"
+            else:
+                selected_llm = target.client
+                selected_model_name = target.model_name
+        job_use_llm = use_llm
+        if use_llm and not model_unavailable_error:
+            if selected_llm is None:
+                model_unavailable_error = f"Local AI model is not configured: {selected_model_id}"
+            else:
+                readiness_check = getattr(selected_llm, "is_ready", None)
+                if callable(readiness_check) and not readiness_check(timeout=3):
+                    model_unavailable_error = f"Local AI model is unavailable: {selected_model_id}"
+            if model_unavailable_error:
+                if not allow_unavailable_fallback:
+                    raise RuntimeError(model_unavailable_error)
+                job_use_llm = False
+        client.start_job(
+            job_id,
+            worker_name=worker_name,
+            claim_timestamp=claim_timestamp,
+        )
+        begin_cached_job = getattr(selected_llm, "begin_cached_job", None)
+        if job_use_llm and callable(begin_cached_job):
+            begin_cached_job()
+        try:
+            result, prompt_version = handle_job(
+                job,
+                job_use_llm,
+                selected_llm,
+                selected_model_name,
+                fallback_to_deterministic,
+            )
+        except Exception:
+            if job_use_llm:
+                _discard_rejected_responses(selected_llm)
+            raise
+        if job_use_llm and result.get("llm_fallback"):
+            _discard_rejected_responses(selected_llm)
+        if model_unavailable_error:
+            result.update({
+                "llm_fallback": True,
+                "llm_attempted": True,
+                "llm_attempts": 0,
+                "llm_fallback_code": "model_unavailable",
+                "llm_error": model_unavailable_error,
+                "model_name": selected_model_name,
+                "source": "local_llm_guarded_fallback",
+            })
+        result["model_id"] = selected_model_id
+        if result.get("llm_fallback") and result.get("llm_error"):
+            fallback_code = result.get("llm_fallback_code") or "model_error"
+            fallback_message = f"ai job {job_id} LLM fallback [{fallback_code}]: {result['llm_error']}"
+            report.add(fallback_message)
+            print(fallback_message, file=sys.stderr)
+        return JobOutcome(
+            job_id=job_id,
+            claim_timestamp=claim_timestamp,
+            model_id=selected_model_id,
+            model_name=selected_model_name,
+            result=result,
+            prompt_version=prompt_version,
+        )
+    except Exception as exc:
+        return JobOutcome(
+            job_id=job_id,
+            claim_timestamp=claim_timestamp,
+            model_id=selected_model_id,
+            model_name=selected_model_name,
+            error=str(exc),
+        )
+
+
+def submit_job_outcome(
+    client: RenderClient,
+    outcome: JobOutcome,
+    worker_name: str,
+    report: RunOnceReport,
+) -> bool:
+    """Complete or fail the job on the backend; return whether it completed."""
+
+    job_id = outcome.job_id
+    error = outcome.error
+    if not error and outcome.result is not None:
+        try:
+            client.complete_job(
+                job_id,
+                result_payload=outcome.result,
+                model_name=outcome.result.get("model_name") or outcome.model_name,
+                prompt_version=outcome.prompt_version,
+                worker_name=worker_name,
+                claim_timestamp=outcome.claim_timestamp,
+            )
+            print(f"completed ai job {job_id} with {outcome.model_id}")
+            return True
+        except Exception as exc:
+            error = str(exc)
+    message = f"ai job {job_id} failed: {error}"
+    report.add(message, failure=True)
+    try:
+        client.fail_job(
+            job_id,
+            error,
+            model_name=outcome.model_name,
+            worker_name=worker_name,
+            claim_timestamp=outcome.claim_timestamp,
+        )
+    except Exception as fail_exc:
+        report.add(f"ai job {job_id} fail transition failed: {fail_exc}", failure=True)
+    print(message, file=sys.stderr)
+    return False
+
+
 def run_once(
     client: RenderClient,
     worker_name: str,
@@ -1379,6 +1565,7 @@ def run_once(
     model_targets: dict[str, LocalModelTarget] | None = None,
     default_model_id: str = QWEN_MODEL_ID,
     available_model_ids: list[str] | None = None,
+    claim_wait_seconds: int = 0,
 ) -> int:
     report = report if report is not None else RunOnceReport()
     if enqueue_periodic:
@@ -1388,113 +1575,208 @@ def run_once(
             message = f"periodic enqueue failed: {exc}"
             report.add(message, failure=True)
             print(message, file=sys.stderr)
-    claim_model_ids = available_model_ids
-    if claim_model_ids is None:
-        claim_model_ids = [
-            model_id
-            for model_id, target in model_targets.items()
-            if use_llm and target.client is not None
-        ] if model_targets is not None else []
     jobs = client.claim_jobs(
         worker_name,
         limit=1,
         job_types=list(HANDLERS.keys()),
         worker_version=WORKER_VERSION,
-        available_model_ids=claim_model_ids,
+        available_model_ids=claim_model_ids_for(use_llm, model_targets, available_model_ids),
+        wait_seconds=claim_wait_seconds,
     )
     if not jobs:
         return 0
 
     for job in jobs:
-        job_id = int(job["id"])
-        claim_timestamp = str(job.get("claimed_at") or "")
-        handler = handler_for_job(job)
-        allow_unavailable_fallback = bool(
-            fallback_to_deterministic
-            and handler
-            and getattr(handler, "ALLOW_UNAVAILABLE_MODEL_FALLBACK", False)
+        outcome = generate_job_outcome(
+            client,
+            job,
+            worker_name,
+            use_llm,
+            llm,
+            model_name,
+            fallback_to_deterministic,
+            report,
+            model_targets=model_targets,
+            default_model_id=default_model_id,
         )
-        selected_llm = llm
-        selected_model_name = model_name
-        selected_model_id = default_model_id
-        model_unavailable_error = ""
-        try:
-            selected_model_id = requested_model_id(job, default_model_id)
-            if model_targets is not None:
-                target = model_targets.get(selected_model_id)
-                if target is None:
-                    if not allow_unavailable_fallback:
-                        raise ValueError(f"Local AI model is not configured: {selected_model_id}")
-                    selected_llm = None
-                    selected_model_name = ""
-                    model_unavailable_error = f"Local AI model is not configured: {selected_model_id}"
-                else:
-                    selected_llm = target.client
-                    selected_model_name = target.model_name
-            job_use_llm = use_llm
-            if use_llm and not model_unavailable_error:
-                if selected_llm is None:
-                    model_unavailable_error = f"Local AI model is not configured: {selected_model_id}"
-                else:
-                    readiness_check = getattr(selected_llm, "is_ready", None)
-                    if callable(readiness_check) and not readiness_check(timeout=3):
-                        model_unavailable_error = f"Local AI model is unavailable: {selected_model_id}"
-                if model_unavailable_error:
-                    if not allow_unavailable_fallback:
-                        raise RuntimeError(model_unavailable_error)
-                    job_use_llm = False
-            client.start_job(
-                job_id,
-                worker_name=worker_name,
-                claim_timestamp=claim_timestamp,
-            )
-            result, prompt_version = handle_job(
-                job,
-                job_use_llm,
-                selected_llm,
-                selected_model_name,
-                fallback_to_deterministic,
-            )
-            if model_unavailable_error:
-                result.update({
-                    "llm_fallback": True,
-                    "llm_attempted": True,
-                    "llm_attempts": 0,
-                    "llm_fallback_code": "model_unavailable",
-                    "llm_error": model_unavailable_error,
-                    "model_name": selected_model_name,
-                    "source": "local_llm_guarded_fallback",
-                })
-            result["model_id"] = selected_model_id
-            if result.get("llm_fallback") and result.get("llm_error"):
-                fallback_code = result.get("llm_fallback_code") or "model_error"
-                fallback_message = f"ai job {job_id} LLM fallback [{fallback_code}]: {result['llm_error']}"
-                report.add(fallback_message)
-                print(fallback_message, file=sys.stderr)
-            client.complete_job(
-                job_id,
-                result_payload=result,
-                model_name=result.get("model_name") or selected_model_name,
-                prompt_version=prompt_version,
-                worker_name=worker_name,
-                claim_timestamp=claim_timestamp,
-            )
-            print(f"completed ai job {job_id} with {selected_model_id}")
-        except Exception as exc:
-            message = f"ai job {job_id} failed: {exc}"
-            report.add(message, failure=True)
+        submit_job_outcome(client, outcome, worker_name, report)
+    return len(jobs)
+
+
+class PipelinedWorker:
+    """Overlap claim, generation, and submit so the model server stays busy.
+
+    One claim thread long-polls the backend whenever fewer than
+    ``max_in_flight`` jobs are claimed but not yet submitted.
+    ``generate_concurrency`` threads run ``generate_job_outcome`` and hand
+    results to ``submit_concurrency`` threads that post them back.  The
+    in-flight bound keeps claimed jobs from aging past the backend's stale
+    timeout while they wait for the model.
+    """
+
+    def __init__(
+        self,
+        client: RenderClient,
+        worker_name: str,
+        use_llm: bool,
+        llm: LocalLlmClient | None,
+        model_name: str,
+        fallback_to_deterministic: bool,
+        *,
+        model_targets: dict[str, LocalModelTarget] | None = None,
+        default_model_id: str = QWEN_MODEL_ID,
+        available_model_ids: list[str] | None = None,
+        claim_wait_seconds: int = 0,
+        poll_interval: float = 5,
+        max_in_flight: int = 2,
+        generate_concurrency: int = 1,
+        submit_concurrency: int = 1,
+    ):
+        self.client = client
+        self.worker_name = worker_name
+        self.use_llm = use_llm
+        self.llm = llm
+        self.model_name = model_name
+        self.fallback_to_deterministic = fallback_to_deterministic
+        self.model_targets = model_targets
+        self.default_model_id = default_model_id
+        # The heartbeat loop replaces this list as model readiness changes.
+        self.available_model_ids = available_model_ids
+        self.claim_wait_seconds = max(0, int(claim_wait_seconds))
+        self.poll_interval = max(0.0, float(poll_interval))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.generate_concurrency = max(1, int(generate_concurrency))
+        self.submit_concurrency = max(1, int(submit_concurrency))
+        self.report = RunOnceReport()
+        self.completed = 0
+        self.failed = 0
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._generate_queue: queue.Queue[dict | None] = queue.Queue()
+        self._submit_queue: queue.Queue[JobOutcome | None] = queue.Queue()
+        self._counter_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def started(self) -> bool:
+        return bool(self._threads)
+
+    def take_report(self) -> RunOnceReport:
+        report, self.report = self.report, RunOnceReport()
+        return report
+
+    def start(self) -> None:
+        stages = (
+            [("claim", self._claim_loop)]
+            + [(f"generate-{index}", self._generate_loop) for index in range(self.generate_concurrency)]
+            + [(f"submit-{index}", self._submit_loop) for index in range(self.submit_concurrency)]
+        )
+        for name, target in stages:
+            thread = threading.Thread(target=target, name=f"ai-worker-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop claiming, then drain every claimed job before returning."""
+
+        self._stop.set()
+        self._threads[0].join(timeout)
+        for _ in range(self.generate_concurrency):
+            self._generate_queue.put(None)
+        for thread in self._threads[1:1 + self.generate_concurrency]:
+            thread.join(timeout)
+        for _ in range(self.submit_concurrency):
+            self._submit_queue.put(None)
+        for thread in self._threads[1 + self.generate_concurrency:]:
+            thread.join(timeout)
+
+    @property
+    def processed(self) -> int:
+        with self._counter_lock:
+            return self.completed + self.failed
+
+    def _claim_loop(self) -> None:
+        while not self._stop.is_set():
+            if not self._slots.acquire(timeout=0.5):
+                continue
+            free = 1
+            while free < self.max_in_flight and self._slots.acquire(blocking=False):
+                free += 1
+            claim_started = time.monotonic()
             try:
-                client.fail_job(
-                    job_id,
-                    str(exc),
-                    model_name=selected_model_name,
-                    worker_name=worker_name,
-                    claim_timestamp=claim_timestamp,
+                jobs = self.client.claim_jobs(
+                    self.worker_name,
+                    limit=free,
+                    job_types=list(HANDLERS.keys()),
+                    worker_version=WORKER_VERSION,
+                    available_model_ids=claim_model_ids_for(
+                        self.use_llm,
+                        self.model_targets,
+                        self.available_model_ids,
+                    ),
+                    wait_seconds=self.claim_wait_seconds,
                 )
-            except Exception as fail_exc:
-                report.add(f"ai job {job_id} fail transition failed: {fail_exc}", failure=True)
-            print(message, file=sys.stderr)
-    return len(jobs)
+            except Exception as exc:
+                for _ in range(free):
+                    self._slots.release()
+                self.report.add(f"worker polling failed: {exc}", failure=True)
+                print(f"worker polling failed: {exc}", file=sys.stderr)
+                self._stop.wait(self.poll_interval)
+                continue
+            jobs = jobs[:free]
+            for _ in range(free - len(jobs)):
+                self._slots.release()
+            for job in jobs:
+                self._generate_queue.put(job)
+            returned_early = time.monotonic() - claim_started < 1
+            if not jobs and (not self.claim_wait_seconds or returned_early):
+                self._stop.wait(self.poll_interval)
+
+    def _generate_loop(self) -> None:
+        while True:
+            job = self._generate_queue.get()
+            if job is None:
+                return
+            try:
+                outcome = generate_job_outcome(
+                    self.client,
+                    job,
+                    self.worker_name,
+                    self.use_llm,
+                    self.llm,
+                    self.model_name,
+                    self.fallback_to_deterministic,
+                    self.report,
+                    model_targets=self.model_targets,
+                    default_model_id=self.default_model_id,
+                )
+            except Exception as exc:
+                outcome = JobOutcome(
+                    job_id=int(job.get("id") or 0),
+                    claim_timestamp=str(job.get("claimed_at") or ""),
+                    model_id="",
+                    model_name=self.model_name,
+                    error=str(exc),
+                )
+            self._submit_queue.put(outcome)
+
+    def _submit_loop(self) -> None:
+        while True:
+            outcome = self._submit_queue.get()
+            if outcome is None:
+                return
+            try:
+                completed = submit_job_outcome(self.client, outcome, self.worker_name, self.report)
+            except Exception as exc:
+                completed = False
+                self.report.add(f"ai job {outcome.job_id} submit failed: {exc}", failure=True)
+            finally:
+                self._slots.release()
+            with self._counter_lock:
+                if completed:
+                    self.completed += 1
+                else:
+                    self.failed += 1
 
 
 def main() -> int:
@@ -1510,6 +1792,9 @@ def main() -> int:
     worker_token = os.getenv("AI_WORKER_TOKEN", "")
     worker_name = os.getenv("WORKER_NAME", "mac-studio-local-ai")
     poll_interval = max(1, int(os.getenv("POLL_INTERVAL_SECONDS", "5") or 5))
+    # Long-poll claims return as soon as a job is queued, so the loop does not
+    # sleep between them. Keep this below the heartbeat interval.
+    claim_wait_seconds = max(0, min(25, int(os.getenv("AI_WORKER_CLAIM_WAIT_SECONDS", "20") or 0)))
     periodic_check_interval = max(60, int(os.getenv("PERIODIC_ENQUEUE_CHECK_SECONDS", "60") or 60))
     heartbeat_interval = max(15, int(os.getenv("AI_WORKER_HEARTBEAT_SECONDS", "30") or 30))
     use_llm = truthy(os.getenv("AI_WORKER_USE_LLM"))
@@ -1534,12 +1819,26 @@ def main() -> int:
     # Heartbeats share this single-threaded loop with inference. Keep the LLM timeout
     # below the backend's 180-second stale threshold, leaving time for API transitions.
     llm_timeout = min(120, max(5, int(os.getenv("LOCAL_LLM_TIMEOUT_SECONDS", "45") or 45)))
+    pipeline_enabled = truthy(os.getenv("AI_WORKER_PIPELINE"))
+    # The backend accepts at most ten jobs per claim.
+    max_in_flight = max(1, min(10, int(os.getenv("AI_WORKER_MAX_IN_FLIGHT", "2") or 2)))
+    generate_concurrency = max(1, int(os.getenv("AI_WORKER_GENERATE_CONCURRENCY", "1") or 1))
+    submit_concurrency = max(1, int(os.getenv("AI_WORKER_SUBMIT_CONCURRENCY", "1") or 1))
+    response_cache_dir = os.getenv("AI_WORKER_RESPONSE_CACHE_DIR", "").strip()
+    response_cache_max_age_hours = max(0, int(os.getenv("AI_WORKER_RESPONSE_CACHE_MAX_AGE_HOURS", "168") or 0))
 
     if not worker_token:
         print("AI_WORKER_TOKEN is required.", file=sys.stderr)
         return 2
 
     client = RenderClient(api_base_url=api_base_url, worker_token=worker_token)
+    response_cache = None
+    if response_cache_dir:
+        response_cache = LlmResponseCache(
+            Path(response_cache_dir).expanduser(),
+            max_age_seconds=response_cache_max_age_hours * 3600,
+        )
+        response_cache.prune()
     llm = None
     model_targets: dict[str, LocalModelTarget] = {}
     if use_llm:
@@ -1548,18 +1847,21 @@ def main() -> int:
             model=qwen_model,
             timeout=llm_timeout,
             model_family="qwen",
+            response_cache=response_cache,
         )
         qwen38_llm = LocalLlmClient(
             base_url=os.getenv("LOCAL_QWEN38_BASE_URL", "http://127.0.0.1:8082/v1"),
             model=qwen38_model,
             timeout=llm_timeout,
             model_family="qwen",
+            response_cache=response_cache,
         )
         gemma_llm = LocalLlmClient(
             base_url=os.getenv("LOCAL_GEMMA_BASE_URL", "http://127.0.0.1:8081/v1"),
             model=gemma_model,
             timeout=llm_timeout,
             model_family="gemma4",
+            response_cache=response_cache,
         )
         model_targets = {
             QWEN_MODEL_ID: LocalModelTarget(QWEN_MODEL_ID, qwen_llm, qwen_model),
@@ -1591,6 +1893,24 @@ def main() -> int:
     last_worker_error = ""
     last_available_model_ids: list[str] = []
     default_target = model_targets.get(default_model_id)
+    pipeline = None
+    if pipeline_enabled and not args.once:
+        pipeline = PipelinedWorker(
+            client,
+            worker_name,
+            use_llm,
+            llm,
+            default_target.model_name if default_target else "",
+            fallback_to_deterministic,
+            model_targets=model_targets if use_llm else None,
+            default_model_id=default_model_id,
+            available_model_ids=last_available_model_ids,
+            claim_wait_seconds=claim_wait_seconds,
+            poll_interval=poll_interval,
+            max_in_flight=max_in_flight,
+            generate_concurrency=generate_concurrency,
+            submit_concurrency=submit_concurrency,
+        )
     while True:
         monotonic_now = time.monotonic()
         should_enqueue_periodic = enqueue_periodic and monotonic_now >= next_periodic_check
@@ -1620,9 +1940,30 @@ def main() -> int:
             except Exception as exc:
                 print(f"worker heartbeat failed: {exc}", file=sys.stderr)
             next_heartbeat = monotonic_now + heartbeat_interval
+        if pipeline is not None:
+            # Claim, generation, and submit run on the pipeline threads; this
+            # thread only keeps heartbeats and periodic enqueue on schedule.
+            pipeline.available_model_ids = last_available_model_ids
+            if not pipeline.started:
+                pipeline.start()
+            if should_enqueue_periodic:
+                try:
+                    client.enqueue_periodic_jobs()
+                except Exception as exc:
+                    pipeline.report.add(f"periodic enqueue failed: {exc}", failure=True)
+                    print(f"periodic enqueue failed: {exc}", file=sys.stderr)
+                next_periodic_check = monotonic_now + periodic_check_interval
+            pipeline_report = pipeline.take_report()
+            if pipeline_report.messages:
+                last_worker_error = pipeline_report.summary()
+            time.sleep(1)
+            continue
+        poll_failed = False
+        claimed_count = 0
+        claim_started = time.monotonic()
         try:
             run_report = RunOnceReport()
-            run_once(
+            claimed_count = run_once(
                 client,
                 worker_name,
                 use_llm,
@@ -1634,12 +1975,14 @@ def main() -> int:
                 model_targets=model_targets if use_llm else None,
                 default_model_id=default_model_id,
                 available_model_ids=last_available_model_ids,
+                claim_wait_seconds=0 if args.once else claim_wait_seconds,
             )
             if run_report.messages:
                 last_worker_error = run_report.summary()
             if args.once and run_report.had_failure:
                 return 1
         except Exception as exc:
+            poll_failed = True
             last_worker_error = str(exc)[:500]
             print(f"worker polling failed: {exc}", file=sys.stderr)
             if args.once:
@@ -1648,7 +1991,11 @@ def main() -> int:
             next_periodic_check = monotonic_now + periodic_check_interval
         if args.once:
             return 0
-        time.sleep(poll_interval)
+        # A server that answers an empty long-poll immediately (older backend
+        # or waits disabled) must not turn this loop into a busy poll.
+        returned_early = not claimed_count and time.monotonic() - claim_started < 1
+        if poll_failed or not claim_wait_seconds or returned_early:
+            time.sleep(poll_interval)
 
 
 if __name__ == "__main__":
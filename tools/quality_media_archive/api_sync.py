@@ -16,7 +16,8 @@ import socket
 import urllib.error
 import urllib.parse
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Mapping, Protocol, Sequence
 
@@ -33,13 +34,19 @@ try:
         _NoRedirectHandler,
         _copy_stream_to_staging,
         apply_plan,
+        archive_lock,
+        atomic_write_json,
         canonical_json_bytes,
         ensure_lower_hex_sha256,
         fetch_cloudinary_to_staging,
         find_existing_archived_candidates,
+        initialize_layout,
+        iso_utc,
         normalize_aware_iso_datetime,
         object_relative_path,
+        read_json_object,
         sha256_bytes,
+        utc_now,
         validate_cloudinary_quality_url,
         validate_layout,
     )
@@ -56,13 +63,19 @@ except ImportError:
         _NoRedirectHandler,
         _copy_stream_to_staging,
         apply_plan,
+        archive_lock,
+        atomic_write_json,
         canonical_json_bytes,
         ensure_lower_hex_sha256,
         fetch_cloudinary_to_staging,
         find_existing_archived_candidates,
+        initialize_layout,
+        iso_utc,
         normalize_aware_iso_datetime,
         object_relative_path,
+        read_json_object,
         sha256_bytes,
+        utc_now,
         validate_cloudinary_quality_url,
         validate_layout,
     )
@@ -75,6 +88,13 @@ IMPORT_ASSETS_PATH = "/api/quality/archive/assets/"
 MAX_JSON_RESPONSE_BYTES = 20 * 1024 * 1024
 MAX_API_PAGES = 10_000
 MAX_API_ROWS = 1_000_000
+WATERMARK_SCHEMA_VERSION = "quality-media-archive.api-sync-watermark.v1"
+WATERMARK_STATE_NAME = "api_sync_watermark.json"
+# Incremental runs re-read this much before the stored watermark so rows whose
+# transaction committed late (or a skewed clock) are not skipped.
+FEED_OVERLAP = timedelta(minutes=10)
+# A full pass re-checks every report and pending asset at least this often.
+FULL_RECONCILE_INTERVAL = timedelta(days=7)
 
 
 class SyncTransport(Protocol):
@@ -99,6 +119,9 @@ class ApiSnapshot:
     marks: Mapping[str, MarkSpec]
     report_count: int
     pending_asset_count: int
+    mode: str = "full"
+    # Newest server ``updated_at`` seen per feed; empty for a full pass.
+    watermarks: Mapping[str, str] = field(default_factory=dict)
 
 
 def validate_api_base_url(raw_url: Any) -> str:
@@ -287,16 +310,65 @@ def _unique_plan(candidates: Sequence[SourceCandidate], warnings: Sequence[str])
     return ArchivePlan(candidates=unique, warnings=list(dict.fromkeys(warnings)))
 
 
-def collect_api_snapshot(transport: SyncTransport, base_url: str) -> ApiSnapshot:
-    """Fetch a complete, internally consistent API snapshot before writing."""
+def _follow_changed_feed(
+    transport: SyncTransport,
+    base_url: str,
+    path: str,
+    *,
+    updated_since: str,
+    query: Mapping[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """Read every row of a changed-since feed by following its keyset cursors."""
 
-    reports = _paginate(transport, base_url, REPORTS_PATH)
-    assets = _paginate(
-        transport,
-        base_url,
-        IMPORT_ASSETS_PATH,
-        query={"mirror_state": "pending"},
-    )
+    expected_query = {"page_size": "200", "updated_since": updated_since, **dict(query or {})}
+    url: str | None = _list_url(base_url, path, expected_query)
+    seen_urls: set[str] = set()
+    rows: list[dict[str, Any]] = []
+    page_number = 0
+    while url is not None:
+        url = _absolute_api_url(base_url, url, exact_path=path, allow_query=True)
+        try:
+            parsed_query = urllib.parse.parse_qs(
+                urllib.parse.urlsplit(url).query,
+                strict_parsing=True,
+            )
+        except ValueError as exc:
+            raise SourceValidationError("quality API feed query is malformed") from exc
+        if any(key not in {"cursor", *expected_query.keys()} for key in parsed_query):
+            raise SourceValidationError("quality API feed added an unexpected query parameter")
+        for key, expected_value in expected_query.items():
+            if parsed_query.get(key) != [expected_value]:
+                raise SourceValidationError("quality API feed changed a required filter")
+        if page_number and len(parsed_query.get("cursor", [])) != 1:
+            raise SourceValidationError("quality API feed next link has no cursor")
+        if url in seen_urls or page_number >= MAX_API_PAGES:
+            raise SourceValidationError("quality API feed loop or page limit detected")
+        seen_urls.add(url)
+        page_number += 1
+        payload = transport.get_json(url)
+        if not isinstance(payload, Mapping):
+            raise SourceValidationError("quality API page must be a JSON object")
+        results = payload.get("results")
+        if not isinstance(results, list) or any(not isinstance(row, dict) for row in results):
+            raise SourceValidationError("quality API page has invalid results")
+        rows.extend(results)
+        if len(rows) > MAX_API_ROWS:
+            raise SourceValidationError("quality API feed exceeded the row limit")
+        next_url = payload.get("next")
+        if next_url is not None and not isinstance(next_url, str):
+            raise SourceValidationError("quality API next link must be a URL or null")
+        url = next_url
+    return rows
+
+
+def _build_snapshot(
+    base_url: str,
+    reports: Sequence[Mapping[str, Any]],
+    assets: Sequence[Mapping[str, Any]],
+    *,
+    mode: str,
+    watermarks: Mapping[str, str],
+) -> ApiSnapshot:
     candidates: list[SourceCandidate] = []
     marks: dict[str, MarkSpec] = {}
     warnings = [
@@ -398,7 +470,112 @@ def collect_api_snapshot(transport: SyncTransport, base_url: str) -> ApiSnapshot
         marks=marks,
         report_count=len(reports),
         pending_asset_count=len(assets),
+        mode=mode,
+        watermarks=dict(watermarks),
+    )
+
+
+def collect_api_snapshot(transport: SyncTransport, base_url: str) -> ApiSnapshot:
+    """Fetch a complete, internally consistent API snapshot before writing."""
+
+    reports = _paginate(transport, base_url, REPORTS_PATH)
+    assets = _paginate(
+        transport,
+        base_url,
+        IMPORT_ASSETS_PATH,
+        query={"mirror_state": "pending"},
+    )
+    return _build_snapshot(base_url, reports, assets, mode="full", watermarks={})
+
+
+def _newest_updated_at(rows: Sequence[Mapping[str, Any]], label: str, previous: str) -> str:
+    newest = previous
+    for row in rows:
+        updated_at = normalize_aware_iso_datetime(row.get("updated_at"), f"{label} updated_at")
+        if _parse_iso(updated_at) > _parse_iso(newest):
+            newest = updated_at
+    return newest
+
+
+def collect_changed_api_snapshot(
+    transport: SyncTransport,
+    base_url: str,
+    *,
+    watermark: Mapping[str, str],
+) -> ApiSnapshot:
+    """Plan only reports and pending assets changed since the stored watermark."""
+
+    reports = _follow_changed_feed(
+        transport,
+        base_url,
+        REPORTS_PATH,
+        updated_since=_feed_since(watermark["reports_updated_since"]),
     )
+    assets = _follow_changed_feed(
+        transport,
+        base_url,
+        IMPORT_ASSETS_PATH,
+        updated_since=_feed_since(watermark["assets_updated_since"]),
+        query={"mirror_state": "pending"},
+    )
+    watermarks = {
+        "reports_updated_since": _newest_updated_at(
+            reports, "quality report", watermark["reports_updated_since"]
+        ),
+        "assets_updated_since": _newest_updated_at(
+            assets, "quality import asset", watermark["assets_updated_since"]
+        ),
+    }
+    return _build_snapshot(base_url, reports, assets, mode="incremental", watermarks=watermarks)
+
+
+def _parse_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+def _feed_since(watermark: str) -> str:
+    return iso_utc(_parse_iso(watermark) - FEED_OVERLAP)
+
+
+def watermark_path(layout: ArchiveLayout) -> Path:
+    return layout.state / WATERMARK_STATE_NAME
+
+
+def read_sync_watermark(layout: ArchiveLayout) -> dict[str, str] | None:
+    """Stored incremental watermark, or ``None`` when a full pass is required.
+
+    A missing, unreadable or foreign state file is treated as absent: the
+    next run reconciles everything and writes a fresh one.
+    """
+
+    path = watermark_path(layout)
+    if not path.exists():
+        return None
+    try:
+        payload = read_json_object(path)
+        if payload.get("schema_version") != WATERMARK_SCHEMA_VERSION:
+            return None
+        return {
+            key: normalize_aware_iso_datetime(payload.get(key), f"watermark {key}")
+            for key in ("reports_updated_since", "assets_updated_since", "full_reconciled_at")
+        }
+    except ArchiveError:
+        return None
+
+
+def write_sync_watermark(layout: ArchiveLayout, watermark: Mapping[str, str]) -> None:
+    initialize_layout(layout)
+    with archive_lock(layout, exclusive=True, create=True):
+        atomic_write_json(
+            watermark_path(layout),
+            {"schema_version": WATERMARK_SCHEMA_VERSION, **watermark},
+        )
+
+
+def _full_reconcile_due(watermark: Mapping[str, str] | None, now: datetime) -> bool:
+    if watermark is None:
+        return True
+    return now - _parse_iso(watermark["full_reconciled_at"]) >= FULL_RECONCILE_INTERVAL
 
 
 def _verify_archived_item(layout: ArchiveLayout, item: Mapping[str, Any], mark: MarkSpec) -> str:
@@ -430,8 +607,44 @@ def run_api_sync(
     *,
     base_url: str,
     transport: SyncTransport,
+    full_reconcile: bool = False,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Archive changed rows since the stored watermark, or everything when due.
+
+    A full pass runs on the first sync, when the watermark is unreadable,
+    every ``FULL_RECONCILE_INTERVAL`` and on request.  The watermark only
+    advances after a run without failures, so failed rows are offered again.
+    """
+
+    started = now or utc_now()
+    watermark = read_sync_watermark(layout)
+    if full_reconcile or _full_reconcile_due(watermark, started):
+        snapshot = collect_api_snapshot(transport, base_url)
+        next_watermark = {
+            "reports_updated_since": iso_utc(started),
+            "assets_updated_since": iso_utc(started),
+            "full_reconciled_at": iso_utc(started),
+        }
+    else:
+        snapshot = collect_changed_api_snapshot(transport, base_url, watermark=watermark)
+        next_watermark = {
+            **snapshot.watermarks,
+            "full_reconciled_at": watermark["full_reconciled_at"],
+        }
+    result = _archive_snapshot(layout, snapshot, transport)
+    result["sync_mode"] = snapshot.mode
+    result["watermark_advanced"] = result["status"] == "ok"
+    if result["watermark_advanced"]:
+        write_sync_watermark(layout, next_watermark)
+    return result
+
+
+def _archive_snapshot(
+    layout: ArchiveLayout,
+    snapshot: ApiSnapshot,
+    transport: SyncTransport,
 ) -> dict[str, Any]:
-    snapshot = collect_api_snapshot(transport, base_url)
     if not snapshot.plan.candidates:
         return {
             "status": "ok",
@@ -439,7 +652,7 @@ def run_api_sync(
             "network_accessed": True,
             "archive_root": str(layout.root),
             "report_count": snapshot.report_count,
-            "pending_asset_count": 0,
+            "pending_asset_count": snapshot.pending_asset_count,
             "candidate_count": 0,
             "archived_count": 0,
             "deduplicated_count": 0,
@@ -522,8 +735,10 @@ def run_api_sync(
     }
 
 
-def api_sync_dry_run(layout: ArchiveLayout) -> dict[str, Any]:
+def api_sync_dry_run(layout: ArchiveLayout, *, full_reconcile: bool = False) -> dict[str, Any]:
     validate_layout(layout, for_write=True)
+    watermark = read_sync_watermark(layout)
+    full = full_reconcile or _full_reconcile_due(watermark, utc_now())
     return {
         "status": "dry_run",
         "dry_run": True,
@@ -535,6 +750,8 @@ def api_sync_dry_run(layout: ArchiveLayout) -> dict[str, Any]:
             REPORTS_PATH,
             f"{IMPORT_ASSETS_PATH}?mirror_state=pending",
         ],
+        "planned_sync_mode": "full" if full else "incremental",
+        "watermark": watermark,
         "behavior": "--apply is required before environment credentials are read or any network request is made",
     }
 
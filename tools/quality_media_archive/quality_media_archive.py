@@ -73,13 +73,18 @@ def build_parser() -> argparse.ArgumentParser:
 
     sync_parser = subparsers.add_parser(
         "sync",
-        help="sync complete quality API pages to Ted_SSD; defaults to no-network dry-run",
+        help="sync changed quality API rows to Ted_SSD; defaults to no-network dry-run",
     )
     sync_parser.add_argument(
         "--apply",
         action="store_true",
         help="read API configuration from environment, download, archive, then acknowledge mirrors",
     )
+    sync_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="re-read every report and pending asset instead of only rows changed since the watermark",
+    )
 
     subparsers.add_parser("status", help="check the fixed drive/root contract without writing")
     subparsers.add_parser("verify", help="hash every manifested object and check archive integrity")
@@ -113,13 +118,14 @@ def main(argv: Sequence[str] | None = None) -> int:
             result = apply_plan(plan, layout) if args.apply else dry_run_summary(plan, layout)
         elif args.command == "sync":
             if not args.apply:
-                result = api_sync_dry_run(layout)
+                result = api_sync_dry_run(layout, full_reconcile=args.full)
             else:
                 base_url, token = read_api_configuration()
                 result = run_api_sync(
                     layout,
                     base_url=base_url,
                     transport=AuthenticatedApiTransport(base_url, token),
+                    full_reconcile=args.full,
                 )
         else:  # pragma: no cover - argparse enforces known commands.
             raise ArchiveError(f"unsupported command: {args.command}")
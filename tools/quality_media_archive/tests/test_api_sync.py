@@ -8,6 +8,7 @@ import tempfile
 import unittest
 import urllib.error
 import urllib.parse
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest import mock
 
@@ -20,15 +21,19 @@ from api_sync import (  # noqa: E402
     API_BEARER_TOKEN_ENV,
     AuthenticatedApiTransport,
     SourceValidationError,
+    FULL_RECONCILE_INTERVAL,
     api_sync_dry_run,
     collect_api_snapshot,
+    collect_changed_api_snapshot,
     read_api_configuration,
+    read_sync_watermark,
     run_api_sync,
     validate_api_base_url,
 )
 from archive_core import (  # noqa: E402
     ArchiveLayout,
     StagedBlob,
+    iso_utc,
     object_relative_path,
 )
 
@@ -41,19 +46,62 @@ JPEG_BYTES = b"\xff\xd8\xff\xe0" + b"cloudinary-report"
 PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"embedded-media"
 
 
+CHANGED_REPORTS = [
+    {
+        "id": 11,
+        "updated_at": "2026-08-15T09:00:00+08:00",
+        "image1": CLOUDINARY_URL.replace("report-1", "report-11"),
+    },
+    {
+        "id": 12,
+        "updated_at": "2026-08-15T10:00:00+08:00",
+        "image1": CLOUDINARY_URL.replace("report-1", "report-12"),
+    },
+]
+
+
 class FakeTransport:
-    def __init__(self, *, wrong_media_bytes: bool = False, incomplete_reports: bool = False):
+    def __init__(
+        self,
+        *,
+        wrong_media_bytes: bool = False,
+        incomplete_reports: bool = False,
+        changed_reports: list[dict] | None = None,
+        feed_drops_filter: bool = False,
+    ):
         self.calls: list[tuple[str, str]] = []
         self.posts: list[tuple[str, dict]] = []
         self.wrong_media_bytes = wrong_media_bytes
         self.incomplete_reports = incomplete_reports
+        self.changed_reports = changed_reports or []
+        self.feed_drops_filter = feed_drops_filter
         self.media_sha = hashlib.sha256(PNG_BYTES).hexdigest()
 
+    def changed_feed(self, path: str, query) -> dict:
+        """Serve the changed-since feed one row per page, like a keyset cursor."""
+
+        rows = self.changed_reports if path == "/api/quality/archive/reports/" else []
+        position = int(query.get("cursor", ["0"])[0])
+        next_link = None
+        if position + 1 < len(rows):
+            next_query = {"page_size": "200", "updated_since": query["updated_since"][0]}
+            if "mirror_state" in query:
+                next_query["mirror_state"] = "pending"
+            if self.feed_drops_filter:
+                del next_query["updated_since"]
+            next_query["cursor"] = str(position + 1)
+            next_link = f"{path}?{urllib.parse.urlencode(next_query)}"
+        return {"next": next_link, "results": rows[position:position + 1]}
+
     def get_json(self, url: str):
         self.calls.append(("GET", url))
         parsed = urllib.parse.urlsplit(url)
         query = urllib.parse.parse_qs(parsed.query)
         page = query.get("page", ["1"])[0]
+        if "updated_since" in query:
+            if parsed.path == "/api/quality/archive/assets/":
+                self.assert_pending_query(query)
+            return self.changed_feed(parsed.path, query)
         if parsed.path == "/api/quality/archive/reports/":
             if page == "1":
                 return {
@@ -274,12 +322,17 @@ class QualityApiSyncTests(unittest.TestCase):
         self.assertIn("quality_import_api_asset", manifest_text)
         self.assertNotIn("quality_import_source", manifest_text)
 
-    def test_second_daily_sync_uses_verified_local_objects_without_redownloading(self) -> None:
+    def test_full_reconciliation_uses_verified_local_objects_without_redownloading(self) -> None:
         first_transport = FakeTransport()
         run_api_sync(self.layout, base_url=BASE_URL, transport=first_transport)
         second_transport = FakeTransport()
 
-        result = run_api_sync(self.layout, base_url=BASE_URL, transport=second_transport)
+        result = run_api_sync(
+            self.layout,
+            base_url=BASE_URL,
+            transport=second_transport,
+            full_reconcile=True,
+        )
 
         self.assertEqual(result["status"], "ok")
         self.assertEqual(result["candidate_count"], 2)
@@ -307,6 +360,84 @@ class QualityApiSyncTests(unittest.TestCase):
         self.assertFalse(self.root.exists())
         self.assertEqual(transport.posts, [])
 
+    def test_incremental_sync_reads_only_rows_changed_since_the_watermark(self) -> None:
+        first_run = datetime(2026, 8, 14, 16, 0, tzinfo=timezone.utc)
+        first = run_api_sync(self.layout, base_url=BASE_URL, transport=FakeTransport(), now=first_run)
+        self.assertEqual(first["sync_mode"], "full")
+        self.assertTrue(first["watermark_advanced"])
+        self.assertEqual(read_sync_watermark(self.layout)["reports_updated_since"], "2026-08-14T16:00:00Z")
+
+        transport = FakeTransport(changed_reports=CHANGED_REPORTS)
+        result = run_api_sync(
+            self.layout,
+            base_url=BASE_URL,
+            transport=transport,
+            now=first_run + timedelta(days=1),
+        )
+
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["sync_mode"], "incremental")
+        self.assertEqual(result["report_count"], 2)
+        self.assertEqual(result["candidate_count"], 2)
+        self.assertEqual(result["archived_count"] + result["deduplicated_count"], 2)
+        self.assertEqual(transport.posts, [])
+        gets = [urllib.parse.urlsplit(url) for method, url in transport.calls if method == "GET"]
+        self.assertTrue(all("updated_since" in urllib.parse.parse_qs(url.query) for url in gets))
+        self.assertFalse(any("page" in urllib.parse.parse_qs(url.query) for url in gets))
+        self.assertEqual(
+            urllib.parse.parse_qs(gets[0].query)["updated_since"],
+            ["2026-08-14T15:50:00Z"],
+        )
+        watermark = read_sync_watermark(self.layout)
+        self.assertEqual(watermark["reports_updated_since"], "2026-08-15T02:00:00Z")
+        self.assertEqual(watermark["assets_updated_since"], "2026-08-14T16:00:00Z")
+        self.assertEqual(watermark["full_reconciled_at"], "2026-08-14T16:00:00Z")
+
+    def test_full_reconciliation_runs_when_due_or_requested(self) -> None:
+        first_run = datetime(2026, 8, 14, 16, 0, tzinfo=timezone.utc)
+        run_api_sync(self.layout, base_url=BASE_URL, transport=FakeTransport(), now=first_run)
+
+        for full_reconcile, now in (
+            (False, first_run + FULL_RECONCILE_INTERVAL),
+            (True, first_run + FULL_RECONCILE_INTERVAL + timedelta(hours=1)),
+        ):
+            with self.subTest(full_reconcile=full_reconcile):
+                transport = FakeTransport()
+                result = run_api_sync(
+                    self.layout,
+                    base_url=BASE_URL,
+                    transport=transport,
+                    full_reconcile=full_reconcile,
+                    now=now,
+                )
+                self.assertEqual(result["sync_mode"], "full")
+                self.assertTrue(any("page=2" in url for method, url in transport.calls if method == "GET"))
+                self.assertEqual(read_sync_watermark(self.layout)["full_reconciled_at"], iso_utc(now))
+
+    def test_failed_run_keeps_the_previous_watermark(self) -> None:
+        first_run = datetime(2026, 8, 14, 16, 0, tzinfo=timezone.utc)
+
+        result = run_api_sync(
+            self.layout,
+            base_url=BASE_URL,
+            transport=FakeTransport(wrong_media_bytes=True),
+            now=first_run,
+        )
+
+        self.assertEqual(result["status"], "partial_failure")
+        self.assertFalse(result["watermark_advanced"])
+        self.assertIsNone(read_sync_watermark(self.layout))
+
+    def test_changed_feed_rejects_a_next_link_that_drops_the_filter(self) -> None:
+        transport = FakeTransport(changed_reports=CHANGED_REPORTS, feed_drops_filter=True)
+        watermark = {
+            "reports_updated_since": "2026-08-14T16:00:00Z",
+            "assets_updated_since": "2026-08-14T16:00:00Z",
+        }
+
+        with self.assertRaises(SourceValidationError):
+            collect_changed_api_snapshot(transport, BASE_URL, watermark=watermark)
+
     def test_configuration_is_environment_only_and_token_is_redacted_from_validation(self) -> None:
         token = "secret-token-that-must-not-be-printed"
         base_url, loaded = read_api_configuration(